@@ -0,0 +1,82 @@
+"""judge_v1_lightweight と evaluate_utilization の1回あたりの実行時間を比較するマイクロベンチマーク。
+
+使い方:
+    uv run python scripts/bench_judge_lightweight.py
+    uv run python scripts/bench_judge_lightweight.py --number=20000
+"""
+
+from __future__ import annotations
+
+import timeit
+
+import fire
+from src.bridge_agentic_generate.designer.models import (
+    BridgeDesign,
+    Components,
+    CrossbeamSection,
+    Deck,
+    Dimensions,
+    GirderSection,
+    Sections,
+)
+from src.bridge_agentic_generate.judge.models import JudgeInput
+from src.bridge_agentic_generate.judge.services import evaluate_utilization, judge_v1_lightweight
+
+
+def _sample_judge_input(num_girders: int) -> JudgeInput:
+    """L=30m, B=10m のサンプル設計から JudgeInput を作成する。"""
+    overhang = 1000.0
+    total_width = 10000.0
+    design = BridgeDesign(
+        dimensions=Dimensions(
+            bridge_length=30000.0,
+            total_width=total_width,
+            num_girders=num_girders,
+            girder_spacing=(total_width - 2 * overhang) / (num_girders - 1),
+            panel_length=5000.0,
+            num_panels=6,
+        ),
+        sections=Sections(
+            girder_standard=GirderSection(
+                web_height=1400.0,
+                web_thickness=16.0,
+                top_flange_width=350.0,
+                top_flange_thickness=25.0,
+                bottom_flange_width=450.0,
+                bottom_flange_thickness=30.0,
+            ),
+            crossbeam_standard=CrossbeamSection(
+                total_height=1120.0,
+                web_thickness=10.0,
+                flange_width=280.0,
+                flange_thickness=12.0,
+            ),
+        ),
+        components=Components(deck=Deck(thickness=217.0)),
+    )
+    return JudgeInput(bridge_design=design)
+
+
+def _per_call_us(func: object, judge_input: JudgeInput, number: int, repeat: int) -> float:
+    """最良の repeat 回から1回あたりの時間 [µs] を返す。"""
+    timer = timeit.Timer(lambda: func(judge_input))  # type: ignore[operator]
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e6
+
+
+def main(number: int = 5000, repeat: int = 5) -> None:
+    """主桁本数ごとに両関数の1回あたりの時間を表示する。
+
+    Args:
+        number: 1計測あたりの呼び出し回数
+        repeat: 計測回数（最良値を採用）
+    """
+    print(f"{'num_girders':>11} | {'judge_v1_lightweight':>20} | {'evaluate_utilization':>20} | {'speedup':>7}")
+    for num_girders in (4, 8, 16):
+        judge_input = _sample_judge_input(num_girders)
+        full_us = _per_call_us(judge_v1_lightweight, judge_input, number, repeat)
+        fast_us = _per_call_us(evaluate_utilization, judge_input, number, repeat)
+        print(f"{num_girders:>11} | {full_us:>17.1f} µs | {fast_us:>17.1f} µs | {full_us / fast_us:>6.1f}x")
+
+
+if __name__ == "__main__":
+    fire.Fire(main)
@@ -26,6 +26,9 @@ class AppConfig(BaseModel):
     rag_index_dir_pymupdf: Path
     env_file: Path
     evaluation_dir: Path
+    design_library_path: Path
+    conversion_cache_dir: Path
+    benchmark_dir: Path
 
 
 @lru_cache(maxsize=1)
@@ -52,6 +55,9 @@ def get_app_config() -> AppConfig:
         rag_index_dir_pymupdf=project_root / "rag_index" / "pymupdf",
         env_file=project_root / ".env",
         evaluation_dir=project_root / "data" / "evaluation",
+        design_library_path=project_root / "data" / "design_library.json",
+        conversion_cache_dir=project_root / "data" / "conversion_cache",
+        benchmark_dir=project_root / "data" / "benchmark",
     )
 
 
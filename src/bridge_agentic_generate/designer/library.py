@@ -0,0 +1,354 @@
+"""収束設計ライブラリによるウォームスタート。
+
+過去の修正ループで収束した最終設計を (L, B) で索引し、
+最近傍の設計を新しい橋長・幅員にスケーリングして初期設計として提供する。
+
+ライブラリは評価の出力ディレクトリ（EvaluationRunner が保存する最終設計・最終照査結果）から
+build_design_library で構築する（CLI: `src.bridge_agentic_generate.main build_library`）。
+修正ループの実行中にライブラリへ追加することはしない。
+"""
+
+from __future__ import annotations
+
+import math
+from pathlib import Path
+from typing import Sequence
+
+from src.bridge_agentic_generate.designer.models import (
+    BridgeDesign,
+    Components,
+    CrossbeamSection,
+    DesignerInput,
+    DesignerRagLog,
+    DesignLibrary,
+    DesignLibraryEntry,
+    DesignResult,
+    Dimensions,
+    GirderSection,
+    Sections,
+)
+from src.bridge_agentic_generate.judge.models import JudgeReport, MaterialsSteel
+from src.bridge_agentic_generate.judge.services import (
+    MAX_APPLICABLE_SPAN_M,
+    MAX_PANEL_LENGTH_MM,
+    apply_dependency_rules,
+    calc_overhang,
+    calc_required_deck_thickness,
+    get_min_web_thickness,
+)
+from src.bridge_agentic_generate.logger_config import logger
+
+# 評価出力ディレクトリ内のサブディレクトリ名（EvaluationRunner の出力構成）
+EVALUATION_DESIGNS_DIRNAME = "designs"
+EVALUATION_JUDGES_DIRNAME = "judges"
+EVALUATION_RAGLOGS_DIRNAME = "raglogs"
+
+# 主桁本数の下限
+MIN_NUM_GIRDERS = 2
+# 腹板高・横桁高の丸め単位 [mm]
+HEIGHT_ROUNDING_MM = 10
+# 床版厚の丸め単位 [mm]（apply_patch_plan の切り上げと同じ）
+DECK_ROUNDING_MM = 10
+# フランジ幅の丸め単位 [mm]
+FLANGE_WIDTH_ROUNDING_MM = 10
+# スケーリング比（新しい L, B / 元の L, B）の許容範囲。外れる場合は外挿とみなしウォームスタートしない
+MIN_SCALE_RATIO = 0.5
+MAX_SCALE_RATIO = 2.0
+
+# ウォームスタート設計の RAG ログに記録するクエリ名
+WARM_START_RAG_QUERY = "design_library"
+
+
+def _ceil_to(value: float, unit: float) -> float:
+    """value を unit 単位で切り上げる。"""
+    return math.ceil(value / unit) * unit
+
+
+# =============================================================================
+# ライブラリの構築・保存
+# =============================================================================
+
+
+def _build_entry(
+    design: BridgeDesign,
+    report: JudgeReport,
+    rag_log: DesignerRagLog | None,
+    source: str,
+) -> DesignLibraryEntry:
+    """最終設計・最終照査結果からエントリを作成する。"""
+    return DesignLibraryEntry(
+        bridge_length_m=design.dimensions.bridge_length / 1000,
+        total_width_m=design.dimensions.total_width / 1000,
+        design=design,
+        final_max_util=report.utilization.max_util,
+        dependency_rules=rag_log.dependency_rules if rag_log is not None else [],
+        source=source,
+    )
+
+
+def build_design_library(evaluation_dirs: Sequence[Path]) -> DesignLibrary:
+    """評価出力ディレクトリ群から収束設計のライブラリを構築する。
+
+    各ディレクトリの designs/{trial_id}.json（最終設計）と judges/{trial_id}.json（最終照査結果）を読み込み、
+    合格している設計のみを登録する。raglogs/{trial_id}.json があれば依存関係ルールも取り込む。
+
+    Args:
+        evaluation_dirs: EvaluationRunner の出力ディレクトリのリスト
+
+    Returns:
+        DesignLibrary
+    """
+    entries: list[DesignLibraryEntry] = []
+    for evaluation_dir in evaluation_dirs:
+        designs_dir = evaluation_dir / EVALUATION_DESIGNS_DIRNAME
+        for design_path in sorted(designs_dir.glob("*.json")):
+            trial_id = design_path.stem
+            judge_path = evaluation_dir / EVALUATION_JUDGES_DIRNAME / f"{trial_id}.json"
+            if not judge_path.exists():
+                logger.warning("build_design_library: 照査結果がないためスキップ %s", design_path)
+                continue
+
+            report = JudgeReport.model_validate_json(judge_path.read_text(encoding="utf-8"))
+            if not report.pass_fail:
+                continue
+
+            raglog_path = evaluation_dir / EVALUATION_RAGLOGS_DIRNAME / f"{trial_id}.json"
+            rag_log = (
+                DesignerRagLog.model_validate_json(raglog_path.read_text(encoding="utf-8"))
+                if raglog_path.exists()
+                else None
+            )
+            design = BridgeDesign.model_validate_json(design_path.read_text(encoding="utf-8"))
+            entries.append(
+                _build_entry(design=design, report=report, rag_log=rag_log, source=f"{evaluation_dir.name}/{trial_id}")
+            )
+
+    logger.info("build_design_library: %d 件の収束設計を登録", len(entries))
+    return DesignLibrary(entries=entries)
+
+
+def save_design_library(library: DesignLibrary, output_path: Path) -> None:
+    """ライブラリを JSON に保存する。
+
+    Args:
+        library: 保存するライブラリ
+        output_path: 出力先パス
+    """
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(library.model_dump_json(indent=2, ensure_ascii=False), encoding="utf-8")
+    logger.info("save_design_library: %d 件を %s に保存", len(library.entries), output_path)
+
+
+def load_design_library(library_path: Path) -> DesignLibrary:
+    """JSON からライブラリを読み込む。
+
+    Args:
+        library_path: ライブラリ JSON のパス
+
+    Returns:
+        DesignLibrary
+    """
+    return DesignLibrary.model_validate_json(library_path.read_text(encoding="utf-8"))
+
+
+# =============================================================================
+# 最近傍検索とスケーリング
+# =============================================================================
+
+
+def find_nearest_entry(
+    library: DesignLibrary,
+    bridge_length_m: float,
+    total_width_m: float,
+) -> DesignLibraryEntry | None:
+    """(L, B) が最も近いエントリを返す。
+
+    距離は橋長・幅員それぞれの相対差の二乗和とする（スケールの違う L と B を同等に扱うため）。
+    同距離の場合は先に登録されたエントリを返す。
+
+    Args:
+        library: 検索対象のライブラリ
+        bridge_length_m: 橋長 L [m]
+        total_width_m: 幅員 B [m]
+
+    Returns:
+        最近傍のエントリ。ライブラリが空の場合は None。
+    """
+    if not library.entries:
+        return None
+
+    def distance(entry: DesignLibraryEntry) -> float:
+        d_length = (entry.bridge_length_m - bridge_length_m) / bridge_length_m
+        d_width = (entry.total_width_m - total_width_m) / total_width_m
+        return d_length**2 + d_width**2
+
+    return min(library.entries, key=distance)
+
+
+def scale_design(entry: DesignLibraryEntry, bridge_length_m: float, total_width_m: float) -> BridgeDesign:
+    """収束設計を新しい橋長・幅員にスケーリングする。
+
+    - 桁配置: 張り出し幅を維持し、元の主桁間隔に最も近くなる本数で幅員を割り付ける
+    - 横桁配置: 元のパネル長以下となる最小のパネル数で橋長を等分する
+    - 主桁断面: 腹板高は橋長に比例させる。フランジ断面積は曲げモーメント/(桁高) ∝ L·b に比例させ、
+      フランジ幅と厚さに √(L·b の比) ずつ配分する（幅厚比を維持）
+    - 腹板厚・床版厚: 元の値を下限とし、幅厚比・必要床版厚を満たすよう切り上げる
+    - 横桁高: 腹板高と同じ比率でスケーリングし、エントリの依存関係ルールがあればそれを適用する
+
+    Args:
+        entry: スケーリング元のエントリ
+        bridge_length_m: 新しい橋長 L [m]
+        total_width_m: 新しい幅員 B [m]
+
+    Returns:
+        スケーリング後の BridgeDesign
+    """
+    src_dims = entry.design.dimensions
+    src_girder = entry.design.sections.girder_standard
+    src_crossbeam = entry.design.sections.crossbeam_standard
+
+    bridge_length = bridge_length_m * 1000
+    total_width = total_width_m * 1000
+
+    # 桁配置（張り出し幅を維持）
+    overhang = calc_overhang(src_dims.total_width, src_dims.num_girders, src_dims.girder_spacing)
+    if total_width - 2 * overhang <= 0:
+        overhang = overhang * total_width / src_dims.total_width
+    girder_span = total_width - 2 * overhang
+    num_girders = max(MIN_NUM_GIRDERS, round(girder_span / src_dims.girder_spacing) + 1)
+    girder_spacing = girder_span / (num_girders - 1)
+
+    # 横桁配置（元のパネル長以下で等分）
+    num_panels = max(1, math.ceil(bridge_length / src_dims.panel_length))
+    panel_length = bridge_length / num_panels
+
+    # 主桁断面
+    length_ratio = bridge_length / src_dims.bridge_length
+    spacing_ratio = girder_spacing / src_dims.girder_spacing
+    flange_ratio = math.sqrt(length_ratio * spacing_ratio)
+    web_height = _ceil_to(src_girder.web_height * length_ratio, HEIGHT_ROUNDING_MM)
+    web_thickness = max(
+        src_girder.web_thickness,
+        math.ceil(get_min_web_thickness(MaterialsSteel().grade, web_height)),
+    )
+    girder = GirderSection(
+        web_height=web_height,
+        web_thickness=web_thickness,
+        top_flange_width=_ceil_to(src_girder.top_flange_width * flange_ratio, FLANGE_WIDTH_ROUNDING_MM),
+        top_flange_thickness=math.ceil(src_girder.top_flange_thickness * flange_ratio),
+        bottom_flange_width=_ceil_to(src_girder.bottom_flange_width * flange_ratio, FLANGE_WIDTH_ROUNDING_MM),
+        bottom_flange_thickness=math.ceil(src_girder.bottom_flange_thickness * flange_ratio),
+    )
+
+    crossbeam = CrossbeamSection(
+        total_height=_ceil_to(src_crossbeam.total_height * web_height / src_girder.web_height, HEIGHT_ROUNDING_MM),
+        web_thickness=src_crossbeam.web_thickness,
+        flange_width=src_crossbeam.flange_width,
+        flange_thickness=src_crossbeam.flange_thickness,
+    )
+
+    deck = entry.design.components.deck.model_copy(
+        update={
+            "thickness": max(
+                entry.design.components.deck.thickness,
+                _ceil_to(calc_required_deck_thickness(girder_spacing), DECK_ROUNDING_MM),
+            )
+        }
+    )
+
+    design = BridgeDesign(
+        dimensions=Dimensions(
+            bridge_length=bridge_length,
+            total_width=total_width,
+            num_girders=num_girders,
+            girder_spacing=girder_spacing,
+            panel_length=panel_length,
+            num_panels=num_panels,
+        ),
+        sections=Sections(girder_standard=girder, crossbeam_standard=crossbeam),
+        components=Components(deck=deck),
+    )
+    return apply_dependency_rules(design, entry.dependency_rules, verbose=False)
+
+
+def check_scaled_design(entry: DesignLibraryEntry, design: BridgeDesign) -> list[str]:
+    """スケーリング後の設計が寸法の適用範囲内かを確認する。
+
+    Args:
+        entry: スケーリング元のエントリ
+        design: scale_design の結果
+
+    Returns:
+        範囲外の項目の説明のリスト。空なら適用範囲内。
+    """
+    dims = design.dimensions
+    girder = design.sections.girder_standard
+    crossbeam = design.sections.crossbeam_standard
+    violations: list[str] = []
+
+    length_ratio = dims.bridge_length / entry.design.dimensions.bridge_length
+    width_ratio = dims.total_width / entry.design.dimensions.total_width
+    for name, ratio in (("橋長", length_ratio), ("幅員", width_ratio)):
+        if not MIN_SCALE_RATIO <= ratio <= MAX_SCALE_RATIO:
+            violations.append(f"{name}の比 {ratio:.2f} が範囲 [{MIN_SCALE_RATIO}, {MAX_SCALE_RATIO}] 外")
+    if dims.bridge_length > MAX_APPLICABLE_SPAN_M * 1000:
+        violations.append(f"橋長 {dims.bridge_length:.0f}mm が適用上限 {MAX_APPLICABLE_SPAN_M * 1000:.0f}mm を超過")
+    if dims.panel_length > MAX_PANEL_LENGTH_MM:
+        violations.append(f"パネル長 {dims.panel_length:.0f}mm が上限 {MAX_PANEL_LENGTH_MM:.0f}mm を超過")
+    if girder.web_thickness < get_min_web_thickness(MaterialsSteel().grade, girder.web_height):
+        violations.append(f"腹板厚 {girder.web_thickness:.0f}mm が幅厚比の下限未満")
+    if max(girder.top_flange_width, girder.bottom_flange_width) >= dims.girder_spacing:
+        violations.append(f"フランジ幅が主桁間隔 {dims.girder_spacing:.0f}mm 以上")
+    if crossbeam.total_height > girder.web_height:
+        violations.append(f"横桁高 {crossbeam.total_height:.0f}mm が腹板高 {girder.web_height:.0f}mm を超過")
+    if design.components.deck.thickness < calc_required_deck_thickness(dims.girder_spacing):
+        violations.append(f"床版厚 {design.components.deck.thickness:.0f}mm が必要厚未満")
+    return violations
+
+
+def build_warm_start_design(library: DesignLibrary, inputs: DesignerInput) -> DesignResult | None:
+    """ライブラリの最近傍設計から初期設計（DesignResult）を作成する。
+
+    LLM は呼び出さない。RAG ログには出典エントリを記録する。
+    スケーリング結果が check_scaled_design の範囲外の場合は None を返し、Designer に任せる。
+
+    Args:
+        library: 設計ライブラリ
+        inputs: 橋長・幅員
+
+    Returns:
+        DesignResult。ライブラリが空の場合、またはスケーリング結果が適用範囲外の場合は None。
+    """
+    entry = find_nearest_entry(library, inputs.bridge_length_m, inputs.total_width_m)
+    if entry is None:
+        return None
+
+    design = scale_design(entry, inputs.bridge_length_m, inputs.total_width_m)
+    violations = check_scaled_design(entry, design)
+    if violations:
+        logger.warning(
+            "build_warm_start_design: %s のスケーリング結果が適用範囲外のため使用しません: %s",
+            entry.source,
+            "; ".join(violations),
+        )
+        return None
+    logger.info(
+        "build_warm_start_design: %s (L=%.0fm, B=%.1fm) → L=%.0fm, B=%.1fm にスケーリング",
+        entry.source,
+        entry.bridge_length_m,
+        entry.total_width_m,
+        inputs.bridge_length_m,
+        inputs.total_width_m,
+    )
+    rag_log = DesignerRagLog(
+        query=WARM_START_RAG_QUERY,
+        top_k=0,
+        hits=[],
+        reasoning=(
+            f"設計ライブラリの収束設計 {entry.source}（L={entry.bridge_length_m:.0f}m, "
+            f"B={entry.total_width_m:.1f}m）を L={inputs.bridge_length_m:.0f}m, "
+            f"B={inputs.total_width_m:.1f}m にスケーリングした初期設計。"
+        ),
+        dependency_rules=entry.dependency_rules,
+    )
+    return DesignResult(design=design, rag_log=rag_log, dependency_rules=entry.dependency_rules)
@@ -101,6 +101,20 @@ class DesignerRagLog(BaseModel):
     )
 
 
+class DesignerContexts(BaseModel):
+    """Designer プロンプトに埋め込む RAG コンテキスト（検索結果）。
+
+    LLM の設計呼び出しとは独立しているため、同じ入力の試行間で共有できる。
+    """
+
+    dimensions: str = Field(default="", description="全体寸法・桁配置のコンテキスト")
+    girder_layout: str = Field(default="", description="主桁本数・間隔のコンテキスト")
+    girder_section: str = Field(default="", description="主桁断面のコンテキスト")
+    deck: str = Field(default="", description="床版のコンテキスト")
+    crossbeam: str = Field(default="", description="横桁のコンテキスト")
+    rag_log: DesignerRagLog = Field(..., description="検索結果の RAG ログ（reasoning 等は未設定）")
+
+
 class DesignResult(BaseModel):
     """設計結果とRAGログを含むレスポンスモデル。"""
 
@@ -235,3 +249,36 @@ class DesignerOutput(BaseModel):
         ...,
         description="生成された橋梁断面 (BridgeDesign)。",
     )
+
+
+class WarmStartMode(StrEnum):
+    """設計ライブラリによるウォームスタートの利用方法。
+
+    - off: 使用しない（Designer の出力のみ）
+    - replace: 近傍の収束設計をスケーリングして初期設計とする（Designer の LLM 呼び出しなし）
+    - candidate: Designer の出力とライブラリ設計の両方を照査し、良い方を初期設計とする
+    """
+
+    OFF = "off"
+    REPLACE = "replace"
+    CANDIDATE = "candidate"
+
+
+class DesignLibraryEntry(BaseModel):
+    """設計ライブラリの 1 件（過去の修正ループで収束した最終設計）。"""
+
+    bridge_length_m: float = Field(..., description="橋長 L [m]")
+    total_width_m: float = Field(..., description="幅員 B [m]")
+    design: BridgeDesign = Field(..., description="収束した最終設計")
+    final_max_util: float = Field(..., description="最終設計の max_util")
+    dependency_rules: list[DependencyRule] = Field(
+        default_factory=list,
+        description="初期設計生成時の依存関係ルール（あれば）。",
+    )
+    source: str = Field(..., description="出典（試行ID など）")
+
+
+class DesignLibrary(BaseModel):
+    """収束設計のライブラリ。(L, B) の最近傍検索に使用する。"""
+
+    entries: list[DesignLibraryEntry] = Field(default_factory=list, description="収束設計の一覧")
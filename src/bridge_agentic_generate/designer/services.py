@@ -1,5 +1,9 @@
+import threading
+from typing import Callable
+
 from src.bridge_agentic_generate.designer.models import (
     BridgeDesign,
+    DesignerContexts,
     DesignerInput,
     DesignerOutput,
     DesignerRagLog,
@@ -12,6 +16,10 @@ from src.bridge_agentic_generate.rag.search import (
     SearchResult,
     search_text,
 )
+from src.bridge_agentic_generate.stage_timer import Stage, stage
+
+# RAG コンテキストの取得関数（入力, top_k）→ DesignerContexts
+DesignContextProvider = Callable[[DesignerInput, int], DesignerContexts]
 
 # RAG 検索で使用するクエリ
 DEFAULT_RAG_QUERY: str = "プレートガーダー 桁 床版 厚さ 桁高 腹板 フランジ"
@@ -53,11 +61,146 @@ def generate_design(
     return result.design
 
 
+def retrieve_design_contexts(inputs: DesignerInput, top_k: int) -> DesignerContexts:
+    """マルチクエリ RAG で Designer プロンプト用のコンテキストを検索する。
+
+    Args:
+        inputs: 橋長・幅員などの入力パラメータ
+        top_k: クエリごとに取得するチャンク数
+
+    Returns:
+        DesignerContexts: 各コンテキストと RAG ログ
+    """
+    client = get_llm_client()
+
+    # 1) マルチクエリRAG
+    rag_results_dimensions = search_text(
+        query=(
+            f"鋼プレートガーダー橋 橋長{inputs.bridge_length_m}m 幅員{inputs.total_width_m}m "
+            "桁配置 主桁本数 桁間隔 パネル長"
+        ),
+        client=client,
+        top_k=top_k,
+    )
+
+    rag_results_girder_layout = search_text(
+        query="並列I桁 主桁間隔 幅員と主桁本数の関係 標準断面 主桁本数",
+        client=client,
+        top_k=top_k,
+    )
+
+    rag_results_girder = search_text(
+        query=(
+            f"プレートガーダー橋 橋長{inputs.bridge_length_m}m "
+            "主桁断面 桁高 腹板厚さ フランジ幅 フランジ厚さ 経済的桁高 h/L"
+        ),
+        client=client,
+        top_k=top_k,
+    )
+
+    rag_results_deck = search_text(
+        query="RC床版合成桁 床版厚さ 最小床版厚 床版厚と支間の比",
+        client=client,
+        top_k=top_k,
+    )
+
+    rag_results_crossbeam = search_text(
+        query="横桁 対傾構 横構 設計",
+        client=client,
+        top_k=top_k,
+    )
+
+    # 2) プロンプト用コンテキスト組み立て
+    def _join_chunks(results: list[SearchResult], start_index: int = 1) -> str:
+        parts: list[str] = []
+        for i, res in enumerate(results, start=start_index):
+            c = res.chunk
+            parts.append(f"--- Reference {i} ---\n[source={c.source}, page={c.page}]\n{c.text}\n")
+        return "\n".join(parts)
+
+    dimensions_context = _join_chunks(rag_results_dimensions, start_index=1)
+    girder_layout_context = _join_chunks(
+        rag_results_girder_layout,
+        start_index=1 + len(rag_results_dimensions),
+    )
+    girder_context = _join_chunks(
+        rag_results_girder,
+        start_index=1 + len(rag_results_dimensions) + len(rag_results_girder_layout),
+    )
+    deck_context = _join_chunks(
+        rag_results_deck,
+        start_index=(1 + len(rag_results_dimensions) + len(rag_results_girder_layout) + len(rag_results_girder)),
+    )
+    crossbeam_context = _join_chunks(
+        rag_results_crossbeam,
+        start_index=(
+            1
+            + len(rag_results_dimensions)
+            + len(rag_results_girder_layout)
+            + len(rag_results_girder)
+            + len(rag_results_deck)
+        ),
+    )
+
+    # 3) 全ヒットをまとめて RAGログを作る（rank を通し番号にする）
+    all_results: list[SearchResult] = (
+        rag_results_dimensions
+        + rag_results_girder_layout
+        + rag_results_girder
+        + rag_results_deck
+        + rag_results_crossbeam
+    )
+    rag_query = "multi: dimensions/girder_layout/girder/deck/crossbeam"
+    rag_log = _build_rag_log(
+        query=rag_query,
+        top_k=len(all_results),
+        results=all_results,
+    )
+    return DesignerContexts(
+        dimensions=dimensions_context,
+        girder_layout=girder_layout_context,
+        girder_section=girder_context,
+        deck=deck_context,
+        crossbeam=crossbeam_context,
+        rag_log=rag_log,
+    )
+
+
+class CachedDesignContextProvider:
+    """(橋長, 幅員, top_k) ごとに RAG 検索を1回だけ行い、結果を共有する context provider。
+
+    同じキーの同時呼び出しは最初の1件の検索完了を待つ（スレッドセーフ）。
+    """
+
+    def __init__(self, provider: DesignContextProvider | None = None):
+        """初期化。
+
+        Args:
+            provider: 実際の検索を行う provider（None の場合は retrieve_design_contexts）
+        """
+        self._provider = provider
+        self._cache: dict[tuple[float, float, int], DesignerContexts] = {}
+        self._key_locks: dict[tuple[float, float, int], threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, inputs: DesignerInput, top_k: int) -> DesignerContexts:
+        """キャッシュ済みのコンテキストを返す（未計算なら検索する）。"""
+        key = (inputs.bridge_length_m, inputs.total_width_m, top_k)
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            if key not in self._cache:
+                provider = self._provider or retrieve_design_contexts
+                self._cache[key] = provider(inputs, top_k)
+            return self._cache[key]
+
+
 def generate_design_with_rag_log(
     inputs: DesignerInput,
     top_k: int,
     model_name: LlmModel,
     use_rag: bool = True,
+    context_provider: DesignContextProvider | None = None,
 ) -> DesignResult:
     """RAG コンテキストのログも含めて設計を生成する。
 
@@ -66,121 +209,36 @@ def generate_design_with_rag_log(
         top_k: RAG で取得するチャンク数
         model_name: 使用する LLM モデル
         use_rag: RAG 検索を使用するかどうか（False の場合は空コンテキスト）
+        context_provider: RAG コンテキストの取得関数（None の場合は retrieve_design_contexts で毎回検索）
 
     Returns:
         DesignResult: 設計結果とRAGログ + （あれば）使用ルール一覧
     """
-    client = get_llm_client()
-
     if use_rag:
-        # 1) マルチクエリRAG
-        rag_results_dimensions = search_text(
-            query=(
-                f"鋼プレートガーダー橋 橋長{inputs.bridge_length_m}m 幅員{inputs.total_width_m}m "
-                "桁配置 主桁本数 桁間隔 パネル長"
-            ),
-            client=client,
-            top_k=top_k,
-        )
-
-        rag_results_girder_layout = search_text(
-            query="並列I桁 主桁間隔 幅員と主桁本数の関係 標準断面 主桁本数",
-            client=client,
-            top_k=top_k,
-        )
-
-        rag_results_girder = search_text(
-            query=(
-                f"プレートガーダー橋 橋長{inputs.bridge_length_m}m "
-                "主桁断面 桁高 腹板厚さ フランジ幅 フランジ厚さ 経済的桁高 h/L"
-            ),
-            client=client,
-            top_k=top_k,
-        )
-
-        rag_results_deck = search_text(
-            query="RC床版合成桁 床版厚さ 最小床版厚 床版厚と支間の比",
-            client=client,
-            top_k=top_k,
-        )
-
-        rag_results_crossbeam = search_text(
-            query="横桁 対傾構 横構 設計",
-            client=client,
-            top_k=top_k,
-        )
-
-        # 2) プロンプト用コンテキスト組み立て
-        def _join_chunks(results: list[SearchResult], start_index: int = 1) -> str:
-            parts: list[str] = []
-            for i, res in enumerate(results, start=start_index):
-                c = res.chunk
-                parts.append(f"--- Reference {i} ---\n[source={c.source}, page={c.page}]\n{c.text}\n")
-            return "\n".join(parts)
-
-        dimensions_context = _join_chunks(rag_results_dimensions, start_index=1)
-        girder_layout_context = _join_chunks(
-            rag_results_girder_layout,
-            start_index=1 + len(rag_results_dimensions),
-        )
-        girder_context = _join_chunks(
-            rag_results_girder,
-            start_index=1 + len(rag_results_dimensions) + len(rag_results_girder_layout),
-        )
-        deck_context = _join_chunks(
-            rag_results_deck,
-            start_index=(1 + len(rag_results_dimensions) + len(rag_results_girder_layout) + len(rag_results_girder)),
-        )
-        crossbeam_context = _join_chunks(
-            rag_results_crossbeam,
-            start_index=(
-                1
-                + len(rag_results_dimensions)
-                + len(rag_results_girder_layout)
-                + len(rag_results_girder)
-                + len(rag_results_deck)
-            ),
-        )
-
-        # 3) 全ヒットをまとめて RAGログを作る（rank を通し番号にする）
-        all_results: list[SearchResult] = (
-            rag_results_dimensions
-            + rag_results_girder_layout
-            + rag_results_girder
-            + rag_results_deck
-            + rag_results_crossbeam
-        )
-        rag_query = "multi: dimensions/girder_layout/girder/deck/crossbeam"
-        rag_log = _build_rag_log(
-            query=rag_query,
-            top_k=len(all_results),
-            results=all_results,
-        )
+        contexts = (context_provider or retrieve_design_contexts)(inputs, top_k)
     else:
         # RAG なしの場合: 空のコンテキストを使用
-        dimensions_context = ""
-        girder_layout_context = ""
-        girder_context = ""
-        deck_context = ""
-        crossbeam_context = ""
-        rag_log = DesignerRagLog(query="no_rag", top_k=0, hits=[])
+        contexts = DesignerContexts(rag_log=DesignerRagLog(query="no_rag", top_k=0, hits=[]))
+    # 共有されたコンテキストのログを汚さないようにコピーしてから追記する
+    rag_log = contexts.rag_log.model_copy(deep=True)
 
     # 4) プロンプト組み立て
     prompt = build_designer_prompt(
         inputs=inputs,
-        dimensions_context=dimensions_context,
-        girder_layout_context=girder_layout_context,
-        girder_section_context=girder_context,
-        deck_context=deck_context,
-        crossbeam_context=crossbeam_context,
+        dimensions_context=contexts.dimensions,
+        girder_layout_context=contexts.girder_layout,
+        girder_section_context=contexts.girder_section,
+        deck_context=contexts.deck,
+        crossbeam_context=contexts.crossbeam,
     )
 
     # 5) LLM呼び出し
-    designer_output: DesignerOutput = call_llm_with_structured_output(
-        input=prompt,
-        model=model_name,
-        text_format=DesignerOutput,
-    )
+    with stage(Stage.DESIGNER_LLM):
+        designer_output: DesignerOutput = call_llm_with_structured_output(
+            input=prompt,
+            model=model_name,
+            text_format=DesignerOutput,
+        )
 
     # 6) ログに reasoning, rules, dependency_rules を追加
     rag_log.reasoning = designer_output.reasoning
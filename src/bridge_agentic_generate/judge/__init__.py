@@ -20,7 +20,9 @@ from src.bridge_agentic_generate.judge.models import (
     PatchActionOp,
     PatchPlan,
     RepairContext,
+    UtilDerivatives,
     Utilization,
+    UtilSensitivities,
 )
 from src.bridge_agentic_generate.judge.services import apply_patch_plan, judge_v1
 
@@ -41,7 +43,9 @@ __all__ = [
     "PatchActionOp",
     "PatchPlan",
     "RepairContext",
+    "UtilDerivatives",
     "Utilization",
+    "UtilSensitivities",
     "apply_patch_plan",
     "judge_v1",
 ]
@@ -6,10 +6,11 @@
 from __future__ import annotations
 
 from enum import StrEnum
+from typing import Any, NamedTuple
 
 from pydantic import BaseModel, Field
 
-from src.bridge_agentic_generate.designer.models import BridgeDesign, DesignerRagLog
+from src.bridge_agentic_generate.designer.models import BridgeDesign, DesignerRagLog, DesignResult
 
 # =============================================================================
 # 例外クラス
@@ -160,6 +161,49 @@ class Utilization(BaseModel):
     governing_check: GoverningCheck = Field(..., description="支配的なチェック項目")
 
 
+class UtilValues(NamedTuple):
+    """軽量評価の結果（pydantic を介さない素の値）。
+
+    候補評価・スイープなど max_util だけを繰り返し参照する用途向け（evaluate_utilization の結果の values）。
+
+    Attributes:
+        deck: 床版厚 util
+        bend: 曲げ応力度 util
+        shear: せん断応力度 util
+        deflection: たわみ util
+        web_slenderness: 腹板幅厚比 util
+        max_util: 最大 util
+        governing_check: 支配的なチェック項目
+        crossbeam_layout_ok: 横桁配置の整合性
+    """
+
+    deck: float
+    bend: float
+    shear: float
+    deflection: float
+    web_slenderness: float
+    max_util: float
+    governing_check: GoverningCheck
+    crossbeam_layout_ok: bool
+
+    @property
+    def pass_fail(self) -> bool:
+        """合否（全 util ≤ 1.0 かつ crossbeam_layout_ok）。"""
+        return self.max_util <= 1.0 and self.crossbeam_layout_ok
+
+    def to_utilization(self) -> Utilization:
+        """Utilization モデルに変換する。"""
+        return Utilization(
+            deck=self.deck,
+            bend=self.bend,
+            shear=self.shear,
+            deflection=self.deflection,
+            web_slenderness=self.web_slenderness,
+            max_util=self.max_util,
+            governing_check=self.governing_check,
+        )
+
+
 # =============================================================================
 # 荷重計算結果モデル（死荷重・活荷重統合）
 # =============================================================================
@@ -239,6 +283,49 @@ class LoadEffectsResult(BaseModel):
     V_total_max: float = Field(..., description="最大合計せん断力 [N]")
 
 
+class UtilDerivatives(BaseModel):
+    """1つの設計パラメータに対する各 util の偏微分。
+
+    Attributes:
+        deck: ∂util_deck/∂p
+        bend: ∂util_bend/∂p
+        shear: ∂util_shear/∂p
+        deflection: ∂util_deflection/∂p
+        web_slenderness: ∂util_web_slenderness/∂p
+    """
+
+    deck: float = Field(default=0.0, description="∂util_deck/∂p")
+    bend: float = Field(default=0.0, description="∂util_bend/∂p")
+    shear: float = Field(default=0.0, description="∂util_shear/∂p")
+    deflection: float = Field(default=0.0, description="∂util_deflection/∂p")
+    web_slenderness: float = Field(default=0.0, description="∂util_web_slenderness/∂p")
+
+
+class UtilSensitivities(BaseModel):
+    """PatchActionOp の対象パラメータごとの util 感度。
+
+    断面寸法は 1mm あたりの解析微分（降伏点の板厚区分・governing 桁の切り替わりは考慮しない局所的な線形化）。
+    num_girders は微分ではなく、apply_patch_plan で主桁を1本増やした設計を再評価した util の差分。
+
+    Attributes:
+        web_height: 腹板高に対する感度 [1/mm]
+        web_thickness: 腹板厚に対する感度 [1/mm]
+        top_flange_thickness: 上フランジ厚に対する感度 [1/mm]
+        bottom_flange_thickness: 下フランジ厚に対する感度 [1/mm]
+        top_flange_width: 上フランジ幅に対する感度 [1/mm]
+        bottom_flange_width: 下フランジ幅に対する感度 [1/mm]
+        num_girders: 主桁を1本増やした場合の util の変化量
+    """
+
+    web_height: UtilDerivatives = Field(..., description="腹板高に対する感度 [1/mm]")
+    web_thickness: UtilDerivatives = Field(..., description="腹板厚に対する感度 [1/mm]")
+    top_flange_thickness: UtilDerivatives = Field(..., description="上フランジ厚に対する感度 [1/mm]")
+    bottom_flange_thickness: UtilDerivatives = Field(..., description="下フランジ厚に対する感度 [1/mm]")
+    top_flange_width: UtilDerivatives = Field(..., description="上フランジ幅に対する感度 [1/mm]")
+    bottom_flange_width: UtilDerivatives = Field(..., description="下フランジ幅に対する感度 [1/mm]")
+    num_girders: UtilDerivatives = Field(..., description="主桁を1本増やした場合の util の変化量")
+
+
 class Diagnostics(BaseModel):
     """Judge の中間計算量（デバッグ・説明用）。
 
@@ -342,6 +429,7 @@ class JudgeReport(BaseModel):
         diagnostics: 中間計算量
         patch_plan: 修正計画
         evaluated_candidates: 評価済み候補リスト（不合格時のみ）
+        sensitivities: util 感度（不合格時のみ。修正戦略が変更量の推定に使う）
     """
 
     pass_fail: bool = Field(..., description="合否")
@@ -351,6 +439,7 @@ class JudgeReport(BaseModel):
     evaluated_candidates: list["EvaluatedCandidate"] | None = Field(
         default=None, description="評価済み候補リスト（不合格時のみ）"
     )
+    sensitivities: UtilSensitivities | None = Field(default=None, description="util 感度（不合格時のみ）")
 
 
 # =============================================================================
@@ -392,6 +481,9 @@ class RepairContext(BaseModel):
     current_design: CurrentDesignValues = Field(..., description="現在の設計値")
     allowed_actions: list[AllowedActionSpec] = Field(..., description="許可されるアクション")
     deck_thickness_required: float = Field(..., description="必要床版厚 [mm]")
+    sensitivities: UtilSensitivities | None = Field(
+        default=None, description="util の感度（PatchActionOp の対象パラメータごと）"
+    )
     priorities: str = Field(
         default="1. 安全: すべての util ≤ 1.0。2. 施工性: 急激な変更を避ける。3. 鋼重最小: 同等なら軽い案。",
         description="修正の優先順位",
@@ -435,6 +527,62 @@ class RepairLoopResult(BaseModel):
     rag_log: DesignerRagLog = Field(..., description="初期設計生成時の RAG ログ")
 
 
+class RepairCheckpoint(BaseModel):
+    """修正ループの1イテレーション分のチェックポイント。
+
+    Attributes:
+        iteration: このイテレーションの結果（照査前の設計と照査結果）
+        next_design: 修正案を適用した次イテレーションの設計（None の場合、このイテレーションでループ終了）
+    """
+
+    iteration: RepairIteration = Field(..., description="このイテレーションの結果")
+    next_design: BridgeDesign | None = Field(default=None, description="修正案適用後の設計（None: ループ終了）")
+
+
+class InitialCheckpoint(BaseModel):
+    """修正ループの初期設計のチェックポイント。
+
+    Attributes:
+        run_params: チェックポイントを作成した実行パラメータ（一致する場合のみ再開に使う）
+        result: 初期設計（design / rag_log / dependency_rules）
+    """
+
+    run_params: dict[str, Any] = Field(..., description="チェックポイントを作成した実行パラメータ")
+    result: DesignResult = Field(..., description="初期設計")
+
+
+# =============================================================================
+# 修正計画の探索（ビームサーチ）
+# =============================================================================
+
+
+class RepairStrategy(StrEnum):
+    """修正ループの戦略。
+
+    - greedy: 毎イテレーション LLM の候補から1手先で最良の案を選ぶ
+    - beam: 決定論的 Judge で複数手先までビームサーチし、最短で収束する修正列を一括適用する
+    """
+
+    GREEDY = "greedy"
+    BEAM = "beam"
+
+
+class RepairSequence(BaseModel):
+    """ビームサーチで選ばれた修正列。
+
+    Attributes:
+        plans: 順に適用する PatchPlan のリスト
+        predicted_utilization: 修正列を適用した後の予測 util
+        converged: 修正列の適用で合格すると予測されるか
+        num_evaluations: 探索で評価した設計数
+    """
+
+    plans: list[PatchPlan] = Field(default_factory=list, description="順に適用する PatchPlan のリスト")
+    predicted_utilization: Utilization = Field(..., description="修正列適用後の予測 util")
+    converged: bool = Field(..., description="修正列の適用で合格すると予測されるか")
+    num_evaluations: int = Field(default=0, description="探索で評価した設計数")
+
+
 # =============================================================================
 # PatchPlan 複数候補方式モデル
 # =============================================================================
@@ -0,0 +1,344 @@
+"""修正計画のビームサーチ（複数手先読み）。
+
+greedy な修正ループは毎イテレーション LLM を呼び、1手先で最良の案だけを採用する。
+ここでは許可アクションを決定論的 Judge（evaluate_utilization）で horizon 手先まで展開し、
+最も早く合格する修正列を選ぶ。LLM はシード候補の生成に最大1回だけ使う。
+照査で計算した util 感度があれば、1手で目標 util に届く推定変更量の PatchPlan も1手目に加える。
+"""
+
+from __future__ import annotations
+
+from typing import NamedTuple, Sequence
+
+from src.bridge_agentic_generate.designer.models import BridgeDesign, DependencyRule
+from src.bridge_agentic_generate.judge.models import (
+    JudgeInput,
+    PatchAction,
+    PatchActionOp,
+    PatchPlan,
+    RepairSequence,
+    Utilization,
+    UtilSensitivities,
+    UtilValues,
+)
+from src.bridge_agentic_generate.judge.prompts import (
+    MAX_CANDIDATES_PER_REQUEST,
+    TARGET_MAX_UTIL,
+    build_repair_system_prompt,
+    build_repair_user_prompt,
+    request_candidates,
+)
+from src.bridge_agentic_generate.judge.services import (
+    ALLOWED_ACTIONS,
+    SECTION_SENSITIVITY_FIELDS,
+    SENSITIVITY_FIELD_BY_OP,
+    UTIL_CHECK_FIELDS,
+    apply_dependency_rules,
+    apply_patch_plan,
+    build_repair_context,
+    calc_girder_section_area,
+    calc_required_deck_thickness,
+    estimate_delta_to_target,
+    evaluate_utilization,
+    judge_v1_lightweight,
+)
+from src.bridge_agentic_generate.llm_client import LlmModel
+from src.bridge_agentic_generate.logger_config import logger
+
+# 各深さで残す候補数
+DEFAULT_BEAM_WIDTH = 4
+# 先読みする手数（1手 = 1件の PatchPlan）
+DEFAULT_HORIZON = 4
+
+# 展開するアクションの対象フィールドパス
+ACTION_PATHS: dict[PatchActionOp, str] = {
+    PatchActionOp.INCREASE_WEB_HEIGHT: "sections.girder_standard.web_height",
+    PatchActionOp.INCREASE_WEB_THICKNESS: "sections.girder_standard.web_thickness",
+    PatchActionOp.INCREASE_TOP_FLANGE_THICKNESS: "sections.girder_standard.top_flange_thickness",
+    PatchActionOp.INCREASE_BOTTOM_FLANGE_THICKNESS: "sections.girder_standard.bottom_flange_thickness",
+    PatchActionOp.INCREASE_TOP_FLANGE_WIDTH: "sections.girder_standard.top_flange_width",
+    PatchActionOp.INCREASE_BOTTOM_FLANGE_WIDTH: "sections.girder_standard.bottom_flange_width",
+    PatchActionOp.SET_DECK_THICKNESS_TO_REQUIRED: "components.deck.thickness",
+    PatchActionOp.FIX_CROSSBEAM_LAYOUT: "dimensions.num_panels",
+    PatchActionOp.INCREASE_NUM_GIRDERS: "dimensions.num_girders",
+}
+
+# 展開したアクションの reason
+BEAM_SEARCH_REASON = "ビームサーチによる展開"
+# util 感度から作成したアクションの reason
+SENSITIVITY_REASON = "util 感度からの推定変更量"
+# util 感度から作成する PatchPlan のアクション数の上限（LLM の PatchPlan と同じ）
+MAX_SENSITIVITY_PLAN_ACTIONS = 3
+
+
+class _BeamNode(NamedTuple):
+    """探索木のノード。"""
+
+    design: BridgeDesign
+    plans: tuple[PatchPlan, ...]
+    util: UtilValues
+    steel_cost: float
+
+
+def _steel_cost(design: BridgeDesign) -> float:
+    """鋼重の代理指標（主桁断面積 × 本数）[mm²] を返す。"""
+    return calc_girder_section_area(design.sections.girder_standard) * design.dimensions.num_girders
+
+
+def _design_key(design: BridgeDesign) -> tuple[float, ...]:
+    """重複展開を避けるための設計のキー。"""
+    girder = design.sections.girder_standard
+    dims = design.dimensions
+    return (
+        girder.web_height,
+        girder.web_thickness,
+        girder.top_flange_width,
+        girder.top_flange_thickness,
+        girder.bottom_flange_width,
+        girder.bottom_flange_thickness,
+        dims.num_girders,
+        dims.num_panels or 0,
+        design.components.deck.thickness,
+    )
+
+
+def _rank_key(node: _BeamNode) -> tuple[bool, float, float]:
+    """ビームの順位付けキー（横桁配置 OK → max_util 小 → 鋼重小）。"""
+    return (not node.util.crossbeam_layout_ok, node.util.max_util, node.steel_cost)
+
+
+def build_expansion_plans(util: UtilValues) -> list[PatchPlan]:
+    """現在の util から展開する1手分の PatchPlan を列挙する。
+
+    ALLOWED_ACTIONS の各操作・各刻みを1件ずつの PatchPlan にする。
+    床版厚の設定は util_deck > 1.0、横桁配置の修正は配置 NG の場合のみ展開する。
+
+    Args:
+        util: 現在の util
+
+    Returns:
+        PatchPlan のリスト
+    """
+    plans: list[PatchPlan] = []
+    for spec in ALLOWED_ACTIONS:
+        if spec.op == PatchActionOp.SET_DECK_THICKNESS_TO_REQUIRED and util.deck <= 1.0:
+            continue
+        if spec.op == PatchActionOp.FIX_CROSSBEAM_LAYOUT and util.crossbeam_layout_ok:
+            continue
+        for delta in spec.allowed_deltas:
+            action = PatchAction(op=spec.op, path=ACTION_PATHS[spec.op], delta_mm=delta, reason=BEAM_SEARCH_REASON)
+            plans.append(PatchPlan(actions=[action]))
+    return plans
+
+
+def _split_into_allowed_deltas(required: float, allowed_deltas: Sequence[float]) -> list[float] | None:
+    """必要変更量を許可された刻みの和（最大 MAX_SENSITIVITY_PLAN_ACTIONS 個）に切り上げて分割する。"""
+    largest = max(allowed_deltas)
+    deltas: list[float] = []
+    remaining = required
+    while remaining > largest:
+        deltas.append(largest)
+        remaining -= largest
+    deltas.append(min(delta for delta in allowed_deltas if delta >= remaining))
+    return deltas if len(deltas) <= MAX_SENSITIVITY_PLAN_ACTIONS else None
+
+
+def build_sensitivity_plans(
+    design: BridgeDesign,
+    utilization: Utilization,
+    sensitivities: UtilSensitivities,
+) -> list[PatchPlan]:
+    """util 感度から、単独の断面変更で目標 util に届く推定変更量の PatchPlan を作成する。
+
+    TARGET_MAX_UTIL を超えている全 util を下げられる断面寸法ごとに、estimate_delta_to_target の最大値を
+    許可された刻みで切り上げ、同じ操作のアクション列（最大 MAX_SENSITIVITY_PLAN_ACTIONS 件）にする。
+    感度は局所的な線形化のため、実際に合格するかはビームサーチの評価で確かめる。
+
+    Args:
+        design: 現在の設計
+        utilization: 現在の util
+        sensitivities: 現在の設計の util 感度
+
+    Returns:
+        PatchPlan のリスト
+    """
+    girder = design.sections.girder_standard
+    over_target = [check for check in UTIL_CHECK_FIELDS if getattr(utilization, check) > TARGET_MAX_UTIL]
+    if not over_target:
+        return []
+
+    plans: list[PatchPlan] = []
+    for spec in ALLOWED_ACTIONS:
+        field = SENSITIVITY_FIELD_BY_OP.get(spec.op)
+        if field not in SECTION_SENSITIVITY_FIELDS:
+            continue
+        estimates = [
+            estimate_delta_to_target(
+                util=getattr(utilization, check),
+                derivative=getattr(getattr(sensitivities, field), check),
+                current_value=getattr(girder, field),
+            )
+            for check in over_target
+        ]
+        if any(estimate is None for estimate in estimates):
+            continue
+        deltas = _split_into_allowed_deltas(max(e for e in estimates if e is not None), spec.allowed_deltas)
+        if deltas is None:
+            continue
+        actions = [
+            PatchAction(op=spec.op, path=ACTION_PATHS[spec.op], delta_mm=delta, reason=SENSITIVITY_REASON)
+            for delta in deltas
+        ]
+        plans.append(PatchPlan(actions=actions))
+    return plans
+
+
+def apply_repair_step(
+    design: BridgeDesign,
+    plan: PatchPlan,
+    dependency_rules: list[DependencyRule],
+    verbose: bool = True,
+) -> BridgeDesign:
+    """PatchPlan と依存関係ルールを適用する（修正ループの1手と同じ処理）。
+
+    Args:
+        design: 適用前の設計
+        plan: 適用する PatchPlan
+        dependency_rules: 依存関係ルール
+        verbose: False の場合、適用ログを DEBUG レベルに落とす
+
+    Returns:
+        適用後の設計
+    """
+    deck_thickness_required = calc_required_deck_thickness(design.dimensions.girder_spacing)
+    design = apply_patch_plan(design, plan, deck_thickness_required=deck_thickness_required, verbose=verbose)
+    return apply_dependency_rules(design, dependency_rules, verbose=verbose)
+
+
+def plan_repair_sequence(
+    design: BridgeDesign,
+    dependency_rules: list[DependencyRule],
+    judge_input_base: JudgeInput | None = None,
+    seed_plans: Sequence[PatchPlan] = (),
+    beam_width: int = DEFAULT_BEAM_WIDTH,
+    horizon: int = DEFAULT_HORIZON,
+    sensitivities: UtilSensitivities | None = None,
+) -> RepairSequence:
+    """ビームサーチで最短で合格する修正列を探す。
+
+    各深さで、ビーム内の各設計に build_expansion_plans の全アクション（深さ0のみ seed_plans と、
+    sensitivities がある場合は build_sensitivity_plans の推定変更量も）を適用し、
+    evaluate_utilization で評価する。合格する設計が現れた深さで探索を終え、その中で鋼重最小の修正列を返す。
+    horizon 手以内に合格しない場合は、探索した中で max_util が最小の修正列を返す。
+
+    Args:
+        design: 現在の設計
+        dependency_rules: 各手の後に適用する依存関係ルール
+        judge_input_base: 照査パラメータ・材料の指定（None の場合はデフォルト）
+        seed_plans: 1手目に追加で展開する PatchPlan（LLM の提案など）
+        beam_width: 各深さで残す候補数
+        horizon: 先読みする手数
+        sensitivities: 照査で計算済みの現在の設計の util 感度
+
+    Returns:
+        RepairSequence
+
+    Raises:
+        ValueError: beam_width または horizon が 1 未満の場合
+    """
+    if beam_width < 1 or horizon < 1:
+        raise ValueError(f"beam_width と horizon は 1 以上である必要があります: {beam_width=}, {horizon=}")
+
+    judge_input_base = judge_input_base or JudgeInput(bridge_design=design)
+    root_util = evaluate_utilization(judge_input_base.model_copy(update={"bridge_design": design})).values
+    root = _BeamNode(design=design, plans=(), util=root_util, steel_cost=_steel_cost(design))
+    if root_util.pass_fail:
+        return RepairSequence(plans=[], predicted_utilization=root_util.to_utilization(), converged=True)
+
+    if sensitivities is not None:
+        seed_plans = [*seed_plans, *build_sensitivity_plans(design, root_util.to_utilization(), sensitivities)]
+
+    beam = [root]
+    best = root
+    seen = {_design_key(design)}
+    num_evaluations = 0
+
+    for depth in range(horizon):
+        children: list[_BeamNode] = []
+        for node in beam:
+            options = build_expansion_plans(node.util)
+            if depth == 0:
+                options = [*seed_plans, *options]
+            for plan in options:
+                try:
+                    child_design = apply_repair_step(node.design, plan, dependency_rules, verbose=False)
+                    key = _design_key(child_design)
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    child_util = evaluate_utilization(
+                        judge_input_base.model_copy(update={"bridge_design": child_design})
+                    ).values
+                except ValueError as e:
+                    # pydantic の ValidationError・受け持ち幅 0 以下などの無効な設計はスキップ
+                    logger.debug("plan_repair_sequence: 無効な展開をスキップ (%s)", e)
+                    continue
+                num_evaluations += 1
+                children.append(
+                    _BeamNode(
+                        design=child_design,
+                        plans=(*node.plans, plan),
+                        util=child_util,
+                        steel_cost=_steel_cost(child_design),
+                    )
+                )
+
+        if not children:
+            break
+
+        converged = [child for child in children if child.util.pass_fail]
+        if converged:
+            best = min(converged, key=lambda child: child.steel_cost)
+            break
+
+        children.sort(key=_rank_key)
+        beam = children[:beam_width]
+        if _rank_key(beam[0]) < _rank_key(best):
+            best = beam[0]
+
+    logger.info(
+        "plan_repair_sequence: %d手 / 評価 %d 件, max_util=%.3f→%.3f, converged=%s",
+        len(best.plans),
+        num_evaluations,
+        root_util.max_util,
+        best.util.max_util,
+        best.util.pass_fail,
+    )
+    return RepairSequence(
+        plans=list(best.plans),
+        predicted_utilization=best.util.to_utilization(),
+        converged=best.util.pass_fail,
+        num_evaluations=num_evaluations,
+    )
+
+
+def request_seed_plans(judge_input: JudgeInput, model: LlmModel, num_candidates: int) -> list[PatchPlan]:
+    """ビームサーチの1手目に加える PatchPlan を LLM に1回だけ提案させる。
+
+    Args:
+        judge_input: 現在の設計の Judge 入力
+        model: 使用する LLM モデル
+        num_candidates: 提案させる候補数（MAX_CANDIDATES_PER_REQUEST で頭打ち）
+
+    Returns:
+        PatchPlan のリスト
+    """
+    utilization, diagnostics = judge_v1_lightweight(judge_input)
+    context = build_repair_context(judge_input, utilization, diagnostics, diagnostics.deck_thickness_required)
+    count = min(num_candidates, MAX_CANDIDATES_PER_REQUEST)
+    candidates = request_candidates(
+        f"{build_repair_system_prompt(count)}\n\n---\n\n{build_repair_user_prompt(context)}",
+        model,
+    )
+    logger.info("request_seed_plans: LLM から %d 案のシードを取得", len(candidates.candidates))
+    return [candidate.plan for candidate in candidates.candidates]
@@ -5,28 +5,52 @@
 
 from __future__ import annotations
 
+import contextvars
+import math
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
 from src.bridge_agentic_generate.designer.models import BridgeDesign
 from src.bridge_agentic_generate.judge.models import (
     EvaluatedCandidate,
     JudgeInput,
+    PatchActionOp,
     PatchPlan,
+    PatchPlanCandidate,
     PatchPlanCandidates,
     RepairContext,
 )
 from src.bridge_agentic_generate.llm_client import LlmModel, call_llm_with_structured_output
 from src.bridge_agentic_generate.logger_config import logger
+from src.bridge_agentic_generate.stage_timer import Stage, stage, stage_scope
+
+# 1イテレーションで評価する PatchPlan 候補数（デフォルト）
+DEFAULT_NUM_CANDIDATES = 3
+# 1回の LLM リクエストで生成させる候補数の上限（PatchPlanCandidates.max_length と一致させる）
+MAX_CANDIDATES_PER_REQUEST = 5
+# 目標 max_util（これ以下の候補が見つかれば残りのリクエストを待たずに打ち切る）
+TARGET_MAX_UTIL = 0.98
 
 
-def build_repair_system_prompt() -> str:
-    return """あなたは鋼プレートガーダー橋の設計を、照査結果に基づいて修正する担当です。
-目的は「全util ≤ 1.0（できれば0.98以下）に最短で入れる」ことです。
+def build_repair_system_prompt(num_candidates: int = DEFAULT_NUM_CANDIDATES) -> str:
+    """PatchPlan 生成用のシステムプロンプトを構築する。
+
+    Args:
+        num_candidates: 1回のリクエストで提示させる候補数
+
+    Returns:
+        システムプロンプト文字列
+    """
+    return f"""あなたは鋼プレートガーダー橋の設計を、照査結果に基づいて修正する担当です。
+目的は「全util ≤ 1.0（できれば{TARGET_MAX_UTIL}以下）に最短で入れる」ことです。
 
 ## あなたの役割
 あなたは修正案の探索者です。次のイテレーションで max_util を最も下げる PatchPlan を提案してください。
-3案を提示し、それぞれ異なるアプローチを取ってください。
+{num_candidates}案を提示し、それぞれ異なるアプローチを取ってください。
 
 ## 判断の方針
 - 診断値（sigma_top, sigma_bottom, tau_avg, delta, I 等）に基づいて判断する
+- 「util 感度から推定した必要変更量」は解析微分に基づく推定値。
+  allowed_deltas からこれ以上で最小の刻みを選ぶと1回で目標に届きやすい
 - 曲げが支配なら、sigma_top と sigma_bottom の大きい側を見て、効く変更を選ぶ
 - たわみが支配なら、I（断面二次モーメント）を増やす方向を優先する
 - せん断が支配なら、web_thickness を優先する
@@ -46,7 +70,7 @@ def build_repair_system_prompt() -> str:
 - 同じ目的の変更を1つの案に重ねない（例: web+100 と web+200 を同時に入れない）
 
 ## 出力
-PatchPlanCandidates（3案のリスト）をJSONで返す。
+PatchPlanCandidates（{num_candidates}案のリスト）をJSONで返す。
 各案の approach_summary には「何を支配と見て、どれくらい下げる狙いか」を短く書く。
 """
 
@@ -113,11 +137,13 @@ def build_repair_user_prompt(context: RepairContext) -> str:
 - delta: {diag.delta:.2f} mm (allow: {diag.delta_allow:.2f} mm)
 - web_thickness_min_required: {diag.web_thickness_min_required:.2f} mm"""
     bend_side = "top" if abs(diag.sigma_top) >= abs(diag.sigma_bottom) else "bottom"
-    extra = f"- bend_governing_side: {bend_side}\n- target_util: 0.98\n"
+    extra = f"- bend_governing_side: {bend_side}\n- target_util: {TARGET_MAX_UTIL}\n"
 
     # diag_info の末尾とかに追加
     diag_info += "\n" + extra
 
+    sensitivity_info = _build_sensitivity_info(context)
+
     # 許可されるアクション
     actions_info = "## 許可されるアクション\n"
     for action_spec in context.allowed_actions:
@@ -133,94 +159,248 @@ def build_repair_user_prompt(context: RepairContext) -> str:
 
 {diag_info}
 
+{sensitivity_info}
+
 {actions_info}
 {priorities_info}
 
 上記の情報を元に、合格（全 util ≤ 1.0 かつ crossbeam_layout_ok = true）となる PatchPlan を提案してください。"""
 
 
+def _build_sensitivity_info(context: RepairContext) -> str:
+    """target_util を超えている util ごとに、各アクションの推定必要変更量を列挙する。
+
+    断面寸法は解析微分からの推定量、主桁本数は1本増やした設計を再評価した util を示す。
+
+    Args:
+        context: RepairContext
+
+    Returns:
+        プロンプトの感度セクション文字列（感度がない場合は空文字列）
+    """
+    # services は prompts を import するため遅延 import
+    from src.bridge_agentic_generate.judge.services import (
+        SENSITIVITY_FIELD_BY_OP,
+        UTIL_CHECK_FIELDS,
+        estimate_delta_to_target,
+    )
+
+    sensitivities = context.sensitivities
+    if sensitivities is None:
+        return ""
+
+    lines = [
+        f"## util 感度から推定した必要変更量（単独適用で target_util={TARGET_MAX_UTIL} に到達する量。"
+        "increase_num_girders は +1本で再評価した util）"
+    ]
+    for check in UTIL_CHECK_FIELDS:
+        util = getattr(context.utilization, check)
+        if util <= TARGET_MAX_UTIL:
+            continue
+        estimates = []
+        for op, field in SENSITIVITY_FIELD_BY_OP.items():
+            derivative = getattr(getattr(sensitivities, field), check)
+            if op == PatchActionOp.INCREASE_NUM_GIRDERS:
+                if derivative < 0:
+                    estimates.append(f"{op} +1 → {util + derivative:.4f}")
+                continue
+            delta = estimate_delta_to_target(
+                util=util,
+                derivative=derivative,
+                current_value=getattr(context.current_design, field),
+            )
+            if delta is not None:
+                estimates.append(f"{op} +{delta:.1f}")
+        lines.append(f"- {check} ({util:.4f}): " + (", ".join(estimates) if estimates else "断面変更では下がらない"))
+    return "\n".join(lines)
+
+
+def _split_candidate_counts(num_candidates: int) -> list[int]:
+    """候補数を LLM リクエストごとの候補数に分割する。
+
+    Args:
+        num_candidates: 全体の候補数
+
+    Returns:
+        リクエストごとの候補数のリスト（例: 7 → [4, 3]）
+
+    Raises:
+        ValueError: num_candidates が 1 未満の場合
+    """
+    if num_candidates < 1:
+        raise ValueError(f"num_candidates は 1 以上である必要があります: {num_candidates}")
+    num_requests = math.ceil(num_candidates / MAX_CANDIDATES_PER_REQUEST)
+    base, remainder = divmod(num_candidates, num_requests)
+    return [base + 1 if i < remainder else base for i in range(num_requests)]
+
+
+def request_candidates(full_prompt: str, model: LlmModel) -> PatchPlanCandidates:
+    """LLM に PatchPlanCandidates を1回リクエストする。
+
+    Args:
+        full_prompt: システムプロンプトとユーザープロンプトを連結した入力
+        model: 使用する LLM モデル
+
+    Returns:
+        PatchPlanCandidates
+    """
+    with stage(Stage.PATCH_PLAN_LLM):
+        return call_llm_with_structured_output(
+            input=full_prompt,
+            model=model,
+            text_format=PatchPlanCandidates,
+        )
+
+
+def _evaluate_candidate(
+    candidate: PatchPlanCandidate,
+    context: RepairContext,
+    design: BridgeDesign,
+    judge_input_base: JudgeInput,
+) -> EvaluatedCandidate:
+    """候補を仮適用して max_util を評価する。
+
+    Args:
+        candidate: 評価対象の候補
+        context: RepairContext
+        design: 現在の BridgeDesign
+        judge_input_base: 評価用の JudgeInput ベース
+
+    Returns:
+        EvaluatedCandidate
+    """
+    # 循環インポート回避のため遅延インポート
+    from src.bridge_agentic_generate.judge.services import apply_patch_plan, evaluate_utilization
+
+    simulated_design = apply_patch_plan(
+        design=design,
+        patch_plan=candidate.plan,
+        deck_thickness_required=context.deck_thickness_required,
+    )
+    simulated_input = judge_input_base.model_copy(update={"bridge_design": simulated_design})
+    simulated_util = evaluate_utilization(simulated_input)
+    return EvaluatedCandidate(
+        candidate=candidate,
+        simulated_max_util=simulated_util.max_util,
+        simulated_utilization=simulated_util.to_utilization(),
+        improvement=context.utilization.max_util - simulated_util.max_util,
+    )
+
+
 def generate_patch_plan(
     context: RepairContext,
     model: LlmModel,
     design: BridgeDesign,
     judge_input_base: JudgeInput,
+    num_candidates: int = DEFAULT_NUM_CANDIDATES,
 ) -> tuple[PatchPlan, list[EvaluatedCandidate]]:
     """LLM を使用して PatchPlan を生成する（複数候補方式）。
 
-    1. LLMに PatchPlanCandidates（3案）を生成させる
-    2. 各案を apply_patch_plan → judge_v1_lightweight で評価
+    1. num_candidates 案を最大 MAX_CANDIDATES_PER_REQUEST 案ずつに分割し、LLM へ並行リクエストする
+    2. 応答が届いた順に各案を apply_patch_plan → evaluate_utilization で評価する
+       （max_util ≤ TARGET_MAX_UTIL の案が見つかった時点で残りのリクエストを放棄する。
+       未開始のリクエストは取り消すが、実行中のリクエストは LLM 側で最後まで処理され課金される）
     3. max_util が最も低い案を採用
 
+    失敗したリクエストはログに記録して残りのリクエストの評価を続け、全リクエストが失敗した場合のみ例外を送出する。
+
     Args:
         context: RepairContext
         model: 使用する LLM モデル
         design: 現在の BridgeDesign
         judge_input_base: 評価用の JudgeInput ベース
+        num_candidates: 評価する候補数
 
     Returns:
-        (PatchPlan, list[EvaluatedCandidate]) のタプル。最良案と全候補の評価結果。
+        (PatchPlan, list[EvaluatedCandidate]) のタプル。最良案と評価済み全候補（リクエスト順）。
 
     Raises:
         ValueError: LLM が有効な出力を返さなかった場合
+        Exception: 全リクエストが失敗した場合（最初に失敗したリクエストの例外）
     """
-    # 循環インポート回避のため遅延インポート
-    from src.bridge_agentic_generate.judge.services import apply_patch_plan, judge_v1_lightweight
-
-    system_prompt = build_repair_system_prompt()
+    candidate_counts = _split_candidate_counts(num_candidates)
     user_prompt = build_repair_user_prompt(context)
 
-    full_prompt = f"{system_prompt}\n\n---\n\n{user_prompt}"
-
-    logger.info("PatchPlan 生成: LLM 呼び出し開始 (model=%s)", model)
-    logger.debug("RepairContext: governing=%s, max_util=%.3f", context.governing_check, context.utilization.max_util)
-
-    # 1. LLMに3案を生成させる
-    candidates = call_llm_with_structured_output(
-        input=full_prompt,
-        model=model,
-        text_format=PatchPlanCandidates,
+    logger.info(
+        "PatchPlan 生成: LLM 呼び出し開始 (model=%s, num_candidates=%d, requests=%d)",
+        model,
+        num_candidates,
+        len(candidate_counts),
     )
+    logger.debug("RepairContext: governing=%s, max_util=%.3f", context.governing_check, context.utilization.max_util)
 
-    logger.info("PatchPlan 候補: %d案を生成", len(candidates.candidates))
-
-    # 2. 各案を評価
+    # 1. LLM に候補を並行生成させる
     current_max_util = context.utilization.max_util
-    evaluated: list[EvaluatedCandidate] = []
-
-    for i, candidate in enumerate(candidates.candidates):
-        # 仮適用
-        simulated_design = apply_patch_plan(
-            design=design,
-            patch_plan=candidate.plan,
-            deck_thickness_required=context.deck_thickness_required,
-        )
-        simulated_input = judge_input_base.model_copy(update={"bridge_design": simulated_design})
-        simulated_util, _ = judge_v1_lightweight(simulated_input)
-        improvement = current_max_util - simulated_util.max_util
-
-        evaluated.append(
-            EvaluatedCandidate(
-                candidate=candidate,
-                simulated_max_util=simulated_util.max_util,
-                simulated_utilization=simulated_util,
-                improvement=improvement,
-            )
-        )
-
-        logger.info(
-            "  候補%d (%s): max_util=%.3f→%.3f (improvement=%.3f)",
-            i + 1,
-            candidate.approach_summary,
-            current_max_util,
-            simulated_util.max_util,
-            improvement,
-        )
-
-    # 3. 最良案を選択（improvement最大 = max_util最小）
+    evaluated_by_request: dict[int, list[EvaluatedCandidate]] = {}
+    errors: list[Exception] = []
+    target_reached = False
+
+    # 放棄したリクエストが後から終わっても、その所要時間・トークン数は記録しない
+    with stage_scope():
+        executor = ThreadPoolExecutor(max_workers=len(candidate_counts))
+        try:
+            pending: dict[Future[PatchPlanCandidates], int] = {
+                # ステージ計測の記録先を引き継ぐため、呼び出し元のコンテキストで実行する
+                executor.submit(
+                    contextvars.copy_context().run,
+                    request_candidates,
+                    f"{build_repair_system_prompt(count)}\n\n---\n\n{user_prompt}",
+                    model,
+                ): request_index
+                for request_index, count in enumerate(candidate_counts)
+            }
+
+            # 2. 届いた応答から順に評価
+            while pending and not target_reached:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    request_index = pending.pop(future)
+                    try:
+                        candidates = future.result()
+                    except Exception as e:
+                        logger.warning("PatchPlan 候補: リクエスト%d が失敗: %s", request_index + 1, e)
+                        errors.append(e)
+                        continue
+                    logger.info(
+                        "PatchPlan 候補: リクエスト%d で %d案を生成", request_index + 1, len(candidates.candidates)
+                    )
+
+                    evaluated_by_request[request_index] = []
+                    for candidate in candidates.candidates:
+                        evaluated_candidate = _evaluate_candidate(candidate, context, design, judge_input_base)
+                        evaluated_by_request[request_index].append(evaluated_candidate)
+                        logger.info(
+                            "  候補 (%s): max_util=%.3f→%.3f (improvement=%.3f)",
+                            candidate.approach_summary,
+                            current_max_util,
+                            evaluated_candidate.simulated_max_util,
+                            evaluated_candidate.improvement,
+                        )
+                        if evaluated_candidate.simulated_max_util <= TARGET_MAX_UTIL:
+                            target_reached = True
+
+            if pending:
+                logger.info(
+                    "PatchPlan 生成: max_util ≤ %.2f の候補が見つかったため残り %d リクエストを放棄"
+                    "（実行中のリクエストは完了まで課金される）",
+                    TARGET_MAX_UTIL,
+                    len(pending),
+                )
+        finally:
+            # 未開始のリクエストのみ取り消される。実行中の LLM 呼び出しは中断できないため応答を待たずに捨てる
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    if errors and not evaluated_by_request:
+        raise errors[0]
+
+    evaluated = [e for request_index in sorted(evaluated_by_request) for e in evaluated_by_request[request_index]]
+
+    # 3. 最良案を選択（improvement最大 = max_util最小、同点ならリクエスト順で先の案）
     best = max(evaluated, key=lambda e: e.improvement)
     logger.info(
-        "PatchPlan 選択: 候補%d (%s) を採用, max_util=%.3f→%.3f",
+        "PatchPlan 選択: 候補%d/%d (%s) を採用, max_util=%.3f→%.3f",
         evaluated.index(best) + 1,
+        len(evaluated),
         best.candidate.approach_summary,
         current_max_util,
         best.simulated_max_util,
@@ -6,6 +6,8 @@
 from __future__ import annotations
 
 import math
+from functools import cached_property
+from typing import NamedTuple
 
 from src.bridge_agentic_generate.designer.models import (
     BridgeDesign,
@@ -25,14 +27,18 @@ from src.bridge_agentic_generate.judge.models import (
     JudgeReport,
     LoadEffectsResult,
     NotApplicableError,
+    PatchAction,
     PatchActionOp,
     PatchPlan,
     RepairContext,
     SteelGrade,
+    UtilDerivatives,
     Utilization,
+    UtilSensitivities,
+    UtilValues,
     get_fy,
 )
-from src.bridge_agentic_generate.judge.prompts import generate_patch_plan
+from src.bridge_agentic_generate.judge.prompts import DEFAULT_NUM_CANDIDATES, TARGET_MAX_UTIL, generate_patch_plan
 from src.bridge_agentic_generate.llm_client import LlmModel
 from src.bridge_agentic_generate.logger_config import logger
 
@@ -257,6 +263,53 @@ def calc_gamma(L_m: float, D_m: float) -> float:
     return D_m * (2 * L_m - D_m) / (L_m**2)
 
 
+def _calc_girder_forces(
+    b_i_mm: float,
+    bridge_length_mm: float,
+    p_eq_M: float,
+    p_eq_V: float,
+    w_steel: float,
+    deck_thickness_mm: float,
+    gamma_concrete: float,
+) -> tuple[float, float, float, float, float, float, float, float]:
+    """1本の主桁の死荷重・活荷重断面力を計算する（単純桁の最大値）。
+
+    Args:
+        b_i_mm: 受け持ち幅 [mm]
+        bridge_length_mm: 橋長 [mm]
+        p_eq_M: 曲げ用等価面圧 [kN/m²]
+        p_eq_V: せん断用等価面圧 [kN/m²]
+        w_steel: 鋼桁自重 [N/mm]
+        deck_thickness_mm: 床版厚 [mm]
+        gamma_concrete: コンクリートの単位体積重量 [N/mm³]
+
+    Returns:
+        (w_dead, M_dead, V_dead, b_eff_m, w_M, w_V, M_live, V_live) のタプル
+    """
+    L_m = bridge_length_mm / 1000
+
+    # 死荷重
+    w_deck = gamma_concrete * deck_thickness_mm * b_i_mm
+    w_dead = w_deck + w_steel  # [N/mm]
+    M_dead = w_dead * bridge_length_mm**2 / 8  # [N·mm]
+    V_dead = w_dead * bridge_length_mm / 2  # [N]
+
+    # 活荷重
+    b_eff_m = calc_beff(b_i_mm / 1000)
+    w_M = p_eq_M * b_eff_m  # [kN/m]
+    w_V = p_eq_V * b_eff_m  # [kN/m]
+
+    # 単純梁の最大断面力
+    M_live_kn_m = w_M * L_m**2 / 8  # [kN·m]
+    V_live_kn = w_V * L_m / 2  # [kN]
+
+    # 単位変換: kN·m → N·mm, kN → N
+    M_live = M_live_kn_m * 1e6  # [N·mm]
+    V_live = V_live_kn * 1e3  # [N]
+
+    return w_dead, M_dead, V_dead, b_eff_m, w_M, w_V, M_live, V_live
+
+
 def calc_girder_load_effects(
     bridge_length_mm: float,
     total_width_mm: float,
@@ -327,24 +380,15 @@ def calc_girder_load_effects(
         if b_i_m <= 0:
             raise ValueError(f"主桁 {i} の受け持ち幅が0以下です: b_i_m={b_i_m}")
 
-        # 死荷重
-        w_deck = gamma_concrete * deck_thickness_mm * b_i_mm
-        w_dead = w_deck + w_steel  # [N/mm]
-        M_dead = w_dead * bridge_length_mm**2 / 8  # [N·mm]
-        V_dead = w_dead * bridge_length_mm / 2  # [N]
-
-        # 活荷重
-        b_eff_m = calc_beff(b_i_m)
-        w_M = p_eq_M * b_eff_m  # [kN/m]
-        w_V = p_eq_V * b_eff_m  # [kN/m]
-
-        # 単純梁の最大断面力
-        M_live_kn_m = w_M * L_m**2 / 8  # [kN·m]
-        V_live_kn = w_V * L_m / 2  # [kN]
-
-        # 単位変換: kN·m → N·mm, kN → N
-        M_live = M_live_kn_m * 1e6  # [N·mm]
-        V_live = V_live_kn * 1e3  # [N]
+        w_dead, M_dead, V_dead, b_eff_m, w_M, w_V, M_live, V_live = _calc_girder_forces(
+            b_i_mm=b_i_mm,
+            bridge_length_mm=bridge_length_mm,
+            p_eq_M=p_eq_M,
+            p_eq_V=p_eq_V,
+            w_steel=w_steel,
+            deck_thickness_mm=deck_thickness_mm,
+            gamma_concrete=gamma_concrete,
+        )
 
         # 合計
         M_total = M_dead + M_live
@@ -484,152 +528,352 @@ def calc_allowable_deflection(bridge_length_mm: float) -> float:
 
 
 # =============================================================================
-# 計算ロジック抽出
+# util 感度（解析微分）
 # =============================================================================
 
+# PatchActionOp と UtilSensitivities のフィールドの対応（delta_mm を持つ操作のみ）
+SENSITIVITY_FIELD_BY_OP: dict[PatchActionOp, str] = {
+    PatchActionOp.INCREASE_WEB_HEIGHT: "web_height",
+    PatchActionOp.INCREASE_WEB_THICKNESS: "web_thickness",
+    PatchActionOp.INCREASE_TOP_FLANGE_THICKNESS: "top_flange_thickness",
+    PatchActionOp.INCREASE_BOTTOM_FLANGE_THICKNESS: "bottom_flange_thickness",
+    PatchActionOp.INCREASE_TOP_FLANGE_WIDTH: "top_flange_width",
+    PatchActionOp.INCREASE_BOTTOM_FLANGE_WIDTH: "bottom_flange_width",
+    PatchActionOp.INCREASE_NUM_GIRDERS: "num_girders",
+}
+
+# 断面寸法の感度フィールド（GirderSection のフィールド名と一致）
+SECTION_SENSITIVITY_FIELDS = (
+    "web_height",
+    "web_thickness",
+    "top_flange_thickness",
+    "bottom_flange_thickness",
+    "top_flange_width",
+    "bottom_flange_width",
+)
+
+# 感度を持つ util 項目（Utilization / UtilDerivatives のフィールド名と一致）
+UTIL_CHECK_FIELDS = ("deck", "bend", "shear", "deflection", "web_slenderness")
 
-def _calculate_utilization_and_diagnostics(
+
+def _calc_section_derivatives(section: GirderSection, field: str) -> tuple[float, float, float, float]:
+    """断面諸量の偏微分を計算する。
+
+    calc_girder_section_properties と同じ3部材（下フランジ・ウェブ・上フランジ）分割で、
+    I = Σi_k + ΣA_k·y_k² − S²/A（S = ΣA_k·y_k）を微分する。
+
+    Args:
+        section: 主桁断面
+        field: 微分するフィールド名（SECTION_SENSITIVITY_FIELDS のいずれか）
+
+    Returns:
+        (∂A, ∂ybar, ∂I, ∂total_height) のタプル
+    """
+    tb, wb = section.bottom_flange_thickness, section.bottom_flange_width
+    h, tw = section.web_height, section.web_thickness
+    tt, wt = section.top_flange_thickness, section.top_flange_width
+
+    # (面積, 図心位置) を下フランジ・ウェブ・上フランジの順に
+    areas = (wb * tb, h * tw, wt * tt)
+    centroids = (tb / 2, tb + h / 2, tb + h + tt / 2)
+
+    # 各部材の (∂A_k, ∂y_k, ∂i_k) と ∂total_height
+    if field == "web_height":
+        parts = ((0.0, 0.0, 0.0), (tw, 0.5, tw * h**2 / 4), (0.0, 1.0, 0.0))
+        d_height = 1.0
+    elif field == "web_thickness":
+        parts = ((0.0, 0.0, 0.0), (h, 0.0, h**3 / 12), (0.0, 0.0, 0.0))
+        d_height = 0.0
+    elif field == "top_flange_thickness":
+        parts = ((0.0, 0.0, 0.0), (0.0, 0.0, 0.0), (wt, 0.5, wt * tt**2 / 4))
+        d_height = 1.0
+    elif field == "bottom_flange_thickness":
+        parts = ((wb, 0.5, wb * tb**2 / 4), (0.0, 1.0, 0.0), (0.0, 1.0, 0.0))
+        d_height = 1.0
+    elif field == "top_flange_width":
+        parts = ((0.0, 0.0, 0.0), (0.0, 0.0, 0.0), (tt, 0.0, tt**3 / 12))
+        d_height = 0.0
+    elif field == "bottom_flange_width":
+        parts = ((tb, 0.0, tb**3 / 12), (0.0, 0.0, 0.0), (0.0, 0.0, 0.0))
+        d_height = 0.0
+    else:
+        raise ValueError(f"未対応のフィールドです: {field}")
+
+    total_area = sum(areas)
+    first_moment = sum(a * y for a, y in zip(areas, centroids))
+    ybar = first_moment / total_area
+
+    d_area = sum(d_a for d_a, _, _ in parts)
+    d_first_moment = sum(d_a * y + a * d_y for (d_a, d_y, _), a, y in zip(parts, areas, centroids))
+    d_second_moment = sum(d_a * y**2 + 2 * a * y * d_y for (d_a, d_y, _), a, y in zip(parts, areas, centroids))
+    d_self_inertia = sum(d_i for _, _, d_i in parts)
+
+    d_ybar = (d_first_moment - ybar * d_area) / total_area
+    d_inertia = (
+        d_self_inertia
+        + d_second_moment
+        - 2 * first_moment * d_first_moment / total_area
+        + first_moment**2 * d_area / total_area**2
+    )
+    return d_area, d_ybar, d_inertia, d_height
+
+
+def _calc_num_girders_step(judge_input: JudgeInput, utilization: Utilization) -> UtilDerivatives:
+    """主桁を1本増やした場合の util の変化量を計算する。
+
+    主桁本数は離散量のため微分せず、apply_patch_plan で INCREASE_NUM_GIRDERS（+1本）を適用した設計を
+    evaluate_utilization で再評価する（張り出し幅の維持・床版厚の連動も実際の操作と同じ）。
+
+    Args:
+        judge_input: Judge 入力
+        utilization: 現在の util
+
+    Returns:
+        UtilDerivatives [1/本]
+    """
+    design = judge_input.bridge_design
+    if design.dimensions.num_girders < 2:
+        return UtilDerivatives()
+
+    plan = PatchPlan(
+        actions=[
+            PatchAction(
+                op=PatchActionOp.INCREASE_NUM_GIRDERS,
+                path="dimensions.num_girders",
+                delta_mm=1.0,
+                reason="util 感度の計算",
+            )
+        ]
+    )
+    stepped_design = apply_patch_plan(design, plan, verbose=False)
+    stepped = evaluate_utilization(judge_input.model_copy(update={"bridge_design": stepped_design})).values
+    return UtilDerivatives(
+        **{check: getattr(stepped, check) - getattr(utilization, check) for check in UTIL_CHECK_FIELDS}
+    )
+
+
+def calc_util_sensitivities(
     judge_input: JudgeInput,
-) -> tuple[Utilization, Diagnostics, bool]:
-    """util と diagnostics を計算する（LLM呼び出しなし）。
+    utilization: Utilization,
+    diagnostics: Diagnostics,
+) -> UtilSensitivities:
+    """PatchActionOp の対象パラメータごとに util の感度を計算する。
+
+    断面寸法は _calculate_utilization_and_diagnostics の中間量を再利用した解析偏微分で、降伏点の板厚区分と
+    governing 桁の切り替わりは固定とした局所的な感度である。主桁本数は1本増やした設計を再評価した差分。
+    照査のたびには計算せず、不合格の照査（judge_v1・ビームサーチ戦略の照査）でだけ計算する。
 
     Args:
         judge_input: Judge 入力
+        utilization: 現在の util
+        diagnostics: 現在の中間計算量
 
     Returns:
-        (Utilization, Diagnostics, pass_fail) のタプル
+        UtilSensitivities
     """
     design = judge_input.bridge_design
-    params = judge_input.judge_params
+    girder = design.sections.girder_standard
     steel = judge_input.materials_steel
-    concrete = judge_input.materials_concrete
+    bridge_length = design.dimensions.bridge_length
 
-    # 寸法・断面
-    dims = design.dimensions
-    girder = design.sections.girder_standard
-    deck_thickness = design.components.deck.thickness
+    m_total = diagnostics.M_total
+    v_total = diagnostics.V_total
+    moment_of_inertia = diagnostics.moment_of_inertia
+    web_area = girder.web_height * girder.web_thickness
 
-    # -------------------------------------------------------------------------
-    # 1. 荷重計算（死荷重・活荷重統合、桁別計算）
-    # -------------------------------------------------------------------------
-    load_effects = calc_girder_load_effects(
-        bridge_length_mm=dims.bridge_length,
-        total_width_mm=dims.total_width,
-        num_girders=dims.num_girders,
-        girder_spacing_mm=dims.girder_spacing,
-        girder_section=girder,
-        deck_thickness_mm=deck_thickness,
-        gamma_steel=steel.unit_weight,
-        gamma_concrete=concrete.unit_weight,
+    # 曲げは util の大きい側（上縁 / 下縁）で微分する
+    util_bend_top = abs(diagnostics.sigma_top) / diagnostics.sigma_allow_top
+    util_bend_bottom = abs(diagnostics.sigma_bottom) / diagnostics.sigma_allow_bottom
+    top_governs = util_bend_top >= util_bend_bottom
+
+    # 最小腹板厚 = web_height × slenderness_ratio
+    slenderness_ratio = get_min_web_thickness(steel.grade, 1.0)
+
+    derivatives: dict[str, UtilDerivatives] = {}
+    for field in SECTION_SENSITIVITY_FIELDS:
+        d_area, d_ybar, d_inertia, d_height = _calc_section_derivatives(girder, field)
+
+        # 鋼重の変化による死荷重断面力の変化
+        d_m = steel.unit_weight * d_area * bridge_length**2 / 8
+        d_v = steel.unit_weight * d_area * bridge_length / 2
+
+        if top_governs:
+            y, d_y, sigma_allow = diagnostics.y_top, d_height - d_ybar, diagnostics.sigma_allow_top
+        else:
+            y, d_y, sigma_allow = diagnostics.y_bottom, d_ybar, diagnostics.sigma_allow_bottom
+        d_sigma = (d_m * y + m_total * d_y) / moment_of_inertia - m_total * y * d_inertia / moment_of_inertia**2
+
+        if field == "web_height":
+            d_web_area = girder.web_thickness
+            d_slenderness = slenderness_ratio / girder.web_thickness
+        elif field == "web_thickness":
+            d_web_area = girder.web_height
+            d_slenderness = -slenderness_ratio * girder.web_height / girder.web_thickness**2
+        else:
+            d_web_area = 0.0
+            d_slenderness = 0.0
+        d_tau = d_v / web_area - v_total * d_web_area / web_area**2
+
+        derivatives[field] = UtilDerivatives(
+            deck=0.0,
+            bend=d_sigma / sigma_allow,
+            shear=d_tau / diagnostics.tau_allow,
+            deflection=-utilization.deflection * d_inertia / moment_of_inertia,
+            web_slenderness=d_slenderness,
+        )
+
+    return UtilSensitivities(
+        **derivatives,
+        num_girders=_calc_num_girders_step(judge_input, utilization),
     )
 
-    # governing 桁の断面力を取得
-    governing_bend_result = load_effects.girder_results[load_effects.governing_girder_index_bend]
-    governing_shear_result = load_effects.girder_results[load_effects.governing_girder_index_shear]
-    m_total = governing_bend_result.M_total
-    v_total = governing_shear_result.V_total
 
-    # -------------------------------------------------------------------------
-    # 4. 断面諸量
-    # -------------------------------------------------------------------------
-    ybar, moment_of_inertia, y_top, y_bottom, _ = calc_girder_section_properties(girder)
+def estimate_delta_to_target(
+    util: float,
+    derivative: float,
+    current_value: float,
+    target: float = TARGET_MAX_UTIL,
+) -> float | None:
+    """util 感度から、target に到達するのに必要な変更量を推定する。
+
+    曲げ・たわみ util は断面寸法のべき乗に反比例するため、単純な線形外挿では変更量を過小評価する。
+    局所弾性率 k = (∂util/∂p)·p/util を用いて util ∝ p^k と近似し、p' = p·(target/util)^(1/k) から変更量を求める。
+
+    Args:
+        util: 現在の util
+        derivative: util の偏微分（UtilDerivatives の値）
+        current_value: 現在のパラメータ値（web_height [mm]、num_girders [本] など）
+        target: 目標 util
+
+    Returns:
+        必要な変更量（既に target 以下なら 0.0）。この変更で util が下がらない場合は None。
+    """
+    if util <= target:
+        return 0.0
+    if derivative >= 0:
+        return None
+    if current_value <= 0:
+        # 弾性率が定義できない場合は線形外挿
+        return (util - target) / -derivative
+    elasticity = derivative * current_value / util
+    return current_value * (target / util) ** (1 / elasticity) - current_value
+
+
+# =============================================================================
+# 計算ロジック抽出
+# =============================================================================
+
+
+class _UtilTerms(NamedTuple):
+    """_calc_util_terms の結果（util と Diagnostics 用の中間量、素の float）。"""
+
+    ybar: float
+    moment_of_inertia: float
+    y_top: float
+    y_bottom: float
+    sigma_top: float
+    sigma_bottom: float
+    tau_avg: float
+    delta: float
+    delta_allow: float
+    fy_top: float
+    fy_bottom: float
+    fy_web: float
+    sigma_allow_top: float
+    sigma_allow_bottom: float
+    tau_allow: float
+    deck_thickness_required: float
+    web_thickness_min_required: float
+    utils: UtilValues
+
+
+def _calc_util_terms(judge_input: JudgeInput, m_total: float, v_total: float, m_live_max: float) -> _UtilTerms:
+    """governing 桁の断面力から各 util を計算する（pydantic モデルを生成しない共通カーネル）。
+
+    _calculate_utilization_and_diagnostics（Diagnostics 付き）と evaluate_utilization（util のみ）の
+    両方がこの関数で util を計算する。
+
+    Args:
+        judge_input: Judge 入力
+        m_total: governing 桁の合計曲げモーメント [N·mm]
+        v_total: governing 桁の合計せん断力 [N]
+        m_live_max: 活荷重曲げモーメントの最大値（たわみ照査用）[N·mm]
+
+    Returns:
+        _UtilTerms
+    """
+    design = judge_input.bridge_design
+    params = judge_input.judge_params
+    steel = judge_input.materials_steel
+    dims = design.dimensions
+    girder = design.sections.girder_standard
+    bridge_length = dims.bridge_length
 
     # -------------------------------------------------------------------------
-    # 5. 部材ごとの降伏点を計算
+    # 断面諸量・部材ごとの降伏点
     # -------------------------------------------------------------------------
+    ybar, moment_of_inertia, y_top, y_bottom, _ = calc_girder_section_properties(girder)
     fy_top = get_fy(steel.grade, girder.top_flange_thickness)
     fy_bottom = get_fy(steel.grade, girder.bottom_flange_thickness)
     fy_web = get_fy(steel.grade, girder.web_thickness)
 
     # -------------------------------------------------------------------------
-    # 6. 応力度（曲げ: 上下フランジ別）
+    # 応力度（曲げ: 上下フランジ別）
     # -------------------------------------------------------------------------
     sigma_top = m_total * y_top / moment_of_inertia
     sigma_bottom = m_total * y_bottom / moment_of_inertia
-
     sigma_allow_top = params.alpha_bend * fy_top
     sigma_allow_bottom = params.alpha_bend * fy_bottom
-
-    util_bend_top = abs(sigma_top) / sigma_allow_top
-    util_bend_bottom = abs(sigma_bottom) / sigma_allow_bottom
-    util_bend = max(util_bend_top, util_bend_bottom)
+    util_bend = max(abs(sigma_top) / sigma_allow_top, abs(sigma_bottom) / sigma_allow_bottom)
 
     # -------------------------------------------------------------------------
-    # 7. せん断（平均、ウェブの降伏点を使用）
+    # せん断（平均、ウェブの降伏点を使用）
     # -------------------------------------------------------------------------
     tau_avg = v_total / (girder.web_thickness * girder.web_height)
     tau_allow = params.alpha_shear * (fy_web / math.sqrt(3))
     util_shear = abs(tau_avg) / tau_allow
 
     # -------------------------------------------------------------------------
-    # 8. たわみ（活荷重のみ・道路橋示方書準拠）
+    # たわみ（活荷重のみ・道路橋示方書準拠）
     # -------------------------------------------------------------------------
-    # M_live が最大の桁を選定（たわみ照査は活荷重のみ）
-    m_live_max = max(gr.M_live for gr in load_effects.girder_results)
-    w_eq_live = 8 * m_live_max / (dims.bridge_length**2)
-    delta = 5 * w_eq_live * dims.bridge_length**4 / (384 * steel.E * moment_of_inertia)
-    delta_allow = calc_allowable_deflection(dims.bridge_length)
+    w_eq_live = 8 * m_live_max / (bridge_length**2)
+    delta = 5 * w_eq_live * bridge_length**4 / (384 * steel.E * moment_of_inertia)
+    delta_allow = calc_allowable_deflection(bridge_length)
     util_deflection = delta / delta_allow
 
     # -------------------------------------------------------------------------
-    # 9. 床版厚 util
+    # 床版厚・腹板幅厚比
     # -------------------------------------------------------------------------
     deck_thickness_required = calc_required_deck_thickness(dims.girder_spacing)
-    util_deck = deck_thickness_required / deck_thickness
-
-    # -------------------------------------------------------------------------
-    # 9.5. 腹板幅厚比 util
-    # -------------------------------------------------------------------------
+    util_deck = deck_thickness_required / design.components.deck.thickness
     web_thickness_min_required = get_min_web_thickness(steel.grade, girder.web_height)
     util_web_slenderness = web_thickness_min_required / girder.web_thickness
 
     # -------------------------------------------------------------------------
-    # 10. 横桁配置チェック
+    # 横桁配置チェック（panel_length = crossbeam_spacing）
     # -------------------------------------------------------------------------
-    # panel_length = crossbeam_spacing（仕様書の通り）
-    panel_length = dims.panel_length
     num_panels = dims.num_panels if dims.num_panels is not None else 0
-    layout_error = abs(panel_length * num_panels - dims.bridge_length)
-    crossbeam_layout_ok = (layout_error <= CROSSBEAM_LAYOUT_TOL_MM) and (panel_length <= MAX_PANEL_LENGTH_MM)
+    layout_error = abs(dims.panel_length * num_panels - bridge_length)
+    crossbeam_layout_ok = (layout_error <= CROSSBEAM_LAYOUT_TOL_MM) and (dims.panel_length <= MAX_PANEL_LENGTH_MM)
 
     # -------------------------------------------------------------------------
-    # 11. governing_check と max_util
+    # governing_check と max_util（同値の場合は先の項目）
     # -------------------------------------------------------------------------
-    util_map = {
-        GoverningCheck.DECK: util_deck,
-        GoverningCheck.BEND: util_bend,
-        GoverningCheck.SHEAR: util_shear,
-        GoverningCheck.DEFLECTION: util_deflection,
-        GoverningCheck.WEB_SLENDERNESS: util_web_slenderness,
-    }
-    max_util = max(util_map.values())
-    governing_check = max(util_map, key=lambda k: util_map[k])
+    max_util, governing_check = util_deck, GoverningCheck.DECK
+    for util, check in (
+        (util_bend, GoverningCheck.BEND),
+        (util_shear, GoverningCheck.SHEAR),
+        (util_deflection, GoverningCheck.DEFLECTION),
+        (util_web_slenderness, GoverningCheck.WEB_SLENDERNESS),
+    ):
+        if util > max_util:
+            max_util, governing_check = util, check
 
     # 横桁配置 NG の場合は governing_check を上書き
     if not crossbeam_layout_ok:
         governing_check = GoverningCheck.CROSSBEAM_LAYOUT
 
-    # -------------------------------------------------------------------------
-    # 12. pass_fail
-    # -------------------------------------------------------------------------
-    pass_fail = (max_util <= 1.0) and crossbeam_layout_ok
-
-    # -------------------------------------------------------------------------
-    # 13. Utilization / Diagnostics
-    # -------------------------------------------------------------------------
-    utilization = Utilization(
-        deck=util_deck,
-        bend=util_bend,
-        shear=util_shear,
-        deflection=util_deflection,
-        web_slenderness=util_web_slenderness,
-        max_util=max_util,
-        governing_check=governing_check,
-    )
-
-    diagnostics = Diagnostics(
-        M_total=m_total,
-        V_total=v_total,
+    return _UtilTerms(
         ybar=ybar,
         moment_of_inertia=moment_of_inertia,
         y_top=y_top,
@@ -639,22 +883,107 @@ def _calculate_utilization_and_diagnostics(
         tau_avg=tau_avg,
         delta=delta,
         delta_allow=delta_allow,
-        fy_top_flange=fy_top,
-        fy_bottom_flange=fy_bottom,
+        fy_top=fy_top,
+        fy_bottom=fy_bottom,
         fy_web=fy_web,
         sigma_allow_top=sigma_allow_top,
         sigma_allow_bottom=sigma_allow_bottom,
         tau_allow=tau_allow,
         deck_thickness_required=deck_thickness_required,
         web_thickness_min_required=web_thickness_min_required,
-        crossbeam_layout_ok=crossbeam_layout_ok,
+        utils=UtilValues(
+            deck=util_deck,
+            bend=util_bend,
+            shear=util_shear,
+            deflection=util_deflection,
+            web_slenderness=util_web_slenderness,
+            max_util=max_util,
+            governing_check=governing_check,
+            crossbeam_layout_ok=crossbeam_layout_ok,
+        ),
+    )
+
+
+def _calculate_utilization_and_diagnostics(
+    judge_input: JudgeInput,
+) -> tuple[Utilization, Diagnostics, bool]:
+    """util と diagnostics を計算する（LLM呼び出しなし）。
+
+    Args:
+        judge_input: Judge 入力
+
+    Returns:
+        (Utilization, Diagnostics, pass_fail) のタプル
+    """
+    design = judge_input.bridge_design
+    dims = design.dimensions
+
+    # 荷重計算（死荷重・活荷重統合、桁別計算）
+    load_effects = calc_girder_load_effects(
+        bridge_length_mm=dims.bridge_length,
+        total_width_mm=dims.total_width,
+        num_girders=dims.num_girders,
+        girder_spacing_mm=dims.girder_spacing,
+        girder_section=design.sections.girder_standard,
+        deck_thickness_mm=design.components.deck.thickness,
+        gamma_steel=judge_input.materials_steel.unit_weight,
+        gamma_concrete=judge_input.materials_concrete.unit_weight,
+    )
+
+    # governing 桁の断面力（たわみ照査は M_live が最大の桁）
+    m_total = load_effects.girder_results[load_effects.governing_girder_index_bend].M_total
+    v_total = load_effects.girder_results[load_effects.governing_girder_index_shear].V_total
+    m_live_max = max(gr.M_live for gr in load_effects.girder_results)
+
+    terms = _calc_util_terms(judge_input, m_total, v_total, m_live_max)
+    utils = terms.utils
+    diagnostics = _build_diagnostics(terms, m_total, v_total, load_effects)
+    return utils.to_utilization(), diagnostics, utils.pass_fail
+
+
+def _build_diagnostics(
+    terms: _UtilTerms,
+    m_total: float,
+    v_total: float,
+    load_effects: LoadEffectsResult,
+) -> Diagnostics:
+    """_calc_util_terms の中間量と荷重計算結果から Diagnostics を作成する。
+
+    Args:
+        terms: _calc_util_terms の結果
+        m_total: governing 桁の合計曲げモーメント [N·mm]
+        v_total: governing 桁の合計せん断力 [N]
+        load_effects: 荷重計算結果
+
+    Returns:
+        Diagnostics
+    """
+    return Diagnostics(
+        M_total=m_total,
+        V_total=v_total,
+        ybar=terms.ybar,
+        moment_of_inertia=terms.moment_of_inertia,
+        y_top=terms.y_top,
+        y_bottom=terms.y_bottom,
+        sigma_top=terms.sigma_top,
+        sigma_bottom=terms.sigma_bottom,
+        tau_avg=terms.tau_avg,
+        delta=terms.delta,
+        delta_allow=terms.delta_allow,
+        fy_top_flange=terms.fy_top,
+        fy_bottom_flange=terms.fy_bottom,
+        fy_web=terms.fy_web,
+        sigma_allow_top=terms.sigma_allow_top,
+        sigma_allow_bottom=terms.sigma_allow_bottom,
+        tau_allow=terms.tau_allow,
+        deck_thickness_required=terms.deck_thickness_required,
+        web_thickness_min_required=terms.web_thickness_min_required,
+        crossbeam_layout_ok=terms.utils.crossbeam_layout_ok,
         load_effects=load_effects,
         governing_girder_index_bend=load_effects.governing_girder_index_bend,
         governing_girder_index_shear=load_effects.governing_girder_index_shear,
     )
 
-    return utilization, diagnostics, pass_fail
-
 
 def judge_v1_lightweight(judge_input: JudgeInput) -> tuple[Utilization, Diagnostics]:
     """軽量版Judge（LLM呼び出しなし）。PatchPlanの仮適用評価用。
@@ -669,19 +998,140 @@ def judge_v1_lightweight(judge_input: JudgeInput) -> tuple[Utilization, Diagnost
     return utilization, diagnostics
 
 
+class UtilEvaluation:
+    """evaluate_utilization の結果。
+
+    util は素の値（values）として保持し、Diagnostics は初回アクセス時に計算済みの _calc_util_terms の
+    中間量から作成する（追加で計算するのは Diagnostics に含める桁別の荷重計算結果のみ）。
+
+    Attributes:
+        values: 各 util・合否の素の値
+    """
+
+    def __init__(self, judge_input: JudgeInput, terms: _UtilTerms, m_total: float, v_total: float):
+        """初期化。
+
+        Args:
+            judge_input: 評価した Judge 入力
+            terms: _calc_util_terms の結果
+            m_total: governing 桁の合計曲げモーメント [N·mm]
+            v_total: governing 桁の合計せん断力 [N]
+        """
+        self.values = terms.utils
+        self._judge_input = judge_input
+        self._terms = terms
+        self._m_total = m_total
+        self._v_total = v_total
+
+    @property
+    def max_util(self) -> float:
+        """最大 util。"""
+        return self.values.max_util
+
+    @property
+    def pass_fail(self) -> bool:
+        """合否（全 util ≤ 1.0 かつ crossbeam_layout_ok）。"""
+        return self.values.pass_fail
+
+    def to_utilization(self) -> Utilization:
+        """Utilization モデルに変換する。"""
+        return self.values.to_utilization()
+
+    @cached_property
+    def diagnostics(self) -> Diagnostics:
+        """Diagnostics（初回アクセス時に作成してキャッシュする）。"""
+        design = self._judge_input.bridge_design
+        dims = design.dimensions
+        load_effects = calc_girder_load_effects(
+            bridge_length_mm=dims.bridge_length,
+            total_width_mm=dims.total_width,
+            num_girders=dims.num_girders,
+            girder_spacing_mm=dims.girder_spacing,
+            girder_section=design.sections.girder_standard,
+            deck_thickness_mm=design.components.deck.thickness,
+            gamma_steel=self._judge_input.materials_steel.unit_weight,
+            gamma_concrete=self._judge_input.materials_concrete.unit_weight,
+        )
+        return _build_diagnostics(self._terms, self._m_total, self._v_total, load_effects)
+
+
+def evaluate_utilization(judge_input: JudgeInput) -> UtilEvaluation:
+    """util を計算する高速版（Diagnostics は必要になるまで作成しない）。
+
+    荷重は受け持ち幅が端桁・中間桁の2種類しかないため、桁ごとのループを2回の計算で済ませ、
+    util は _calculate_utilization_and_diagnostics と同じ _calc_util_terms で計算する。
+    候補評価・スイープなど max_util を繰り返し参照する用途向けで、
+    Diagnostics が必要になった場合は結果の diagnostics を参照する。
+
+    Args:
+        judge_input: Judge 入力
+
+    Returns:
+        UtilEvaluation
+
+    Raises:
+        NotApplicableError: L > 80m の場合
+        ValueError: L <= 0 または b_i <= 0 の場合
+    """
+    design = judge_input.bridge_design
+    dims = design.dimensions
+    bridge_length = dims.bridge_length
+    num_girders = dims.num_girders
+
+    # 荷重（calc_girder_load_effects と同じ適用範囲チェック）
+    L_m = bridge_length / 1000
+    if L_m <= 0:
+        raise ValueError(f"支間長は正の値である必要があります: L_m={L_m}")
+    if L_m > MAX_APPLICABLE_SPAN_M:
+        raise NotApplicableError(f"支間長 {L_m}m は適用範囲外です（上限: {MAX_APPLICABLE_SPAN_M}m）")
+    gamma = calc_gamma(L_m, min(MAX_LOADING_LENGTH_M, L_m))
+    p_eq_M = P2_KN_M2 + P1_M_KN_M2 * gamma
+    p_eq_V = P2_KN_M2 + P1_V_KN_M2 * gamma
+    overhang = calc_overhang(dims.total_width, num_girders, dims.girder_spacing)
+    w_steel = judge_input.materials_steel.unit_weight * calc_girder_section_area(design.sections.girder_standard)
+
+    # 端桁（0）と中間桁（1, 3本以上の場合のみ）
+    m_total = v_total = m_live_max = -math.inf
+    for i in (0, 1) if num_girders > 2 else (0,):
+        b_i = calc_tributary_width(i, num_girders, overhang, dims.girder_spacing)
+        if b_i <= 0:
+            raise ValueError(f"主桁 {i} の受け持ち幅が0以下です: b_i_m={b_i / 1000}")
+        _, m_dead, v_dead, _, _, _, m_live, v_live = _calc_girder_forces(
+            b_i_mm=b_i,
+            bridge_length_mm=bridge_length,
+            p_eq_M=p_eq_M,
+            p_eq_V=p_eq_V,
+            w_steel=w_steel,
+            deck_thickness_mm=design.components.deck.thickness,
+            gamma_concrete=judge_input.materials_concrete.unit_weight,
+        )
+        m_total = max(m_total, m_dead + m_live)
+        v_total = max(v_total, v_dead + v_live)
+        m_live_max = max(m_live_max, m_live)
+
+    terms = _calc_util_terms(judge_input, m_total, v_total, m_live_max)
+    return UtilEvaluation(judge_input, terms, m_total, v_total)
+
+
 # =============================================================================
 # メイン照査関数
 # =============================================================================
 
 
-def judge_v1(judge_input: JudgeInput, model: LlmModel) -> JudgeReport:
+def judge_v1(
+    judge_input: JudgeInput,
+    model: LlmModel,
+    num_candidates: int = DEFAULT_NUM_CANDIDATES,
+) -> JudgeReport:
     """Judge v1 メイン関数。
 
     決定論的に util を計算し、合否判定・PatchPlan 生成を行う。
+    不合格の場合は util 感度も計算し、修正プロンプトと JudgeReport の両方に渡す。
 
     Args:
         judge_input: Judge 入力
         model: PatchPlan 生成に使用する LLM モデル
+        num_candidates: 不合格時に評価する PatchPlan 候補数
 
     Returns:
         JudgeReport
@@ -715,22 +1165,26 @@ def judge_v1(judge_input: JudgeInput, model: LlmModel) -> JudgeReport:
     # 2. PatchPlan 生成
     # -------------------------------------------------------------------------
     evaluated_candidates = None
+    sensitivities = None
     if pass_fail:
         # 合格の場合は空の PatchPlan
         patch_plan = PatchPlan(actions=[])
     else:
-        # 不合格の場合は LLM で PatchPlan を生成
-        repair_context = _build_repair_context(
-            design=design,
+        # 不合格の場合は util 感度を計算し、LLM で PatchPlan を生成
+        sensitivities = calc_util_sensitivities(judge_input, utilization, diagnostics)
+        repair_context = build_repair_context(
+            judge_input=judge_input,
             utilization=utilization,
             diagnostics=diagnostics,
             deck_thickness_required=diagnostics.deck_thickness_required,
+            sensitivities=sensitivities,
         )
         patch_plan, evaluated_candidates = generate_patch_plan(
             context=repair_context,
             model=model,
             design=design,
             judge_input_base=judge_input,
+            num_candidates=num_candidates,
         )
 
         # フォールバック: pass_fail = False かつ actions が空の場合はエラー
@@ -743,26 +1197,30 @@ def judge_v1(judge_input: JudgeInput, model: LlmModel) -> JudgeReport:
         diagnostics=diagnostics,
         patch_plan=patch_plan,
         evaluated_candidates=evaluated_candidates,
+        sensitivities=sensitivities,
     )
 
 
-def _build_repair_context(
-    design: BridgeDesign,
+def build_repair_context(
+    judge_input: JudgeInput,
     utilization: Utilization,
     diagnostics: Diagnostics,
     deck_thickness_required: float,
+    sensitivities: UtilSensitivities | None = None,
 ) -> RepairContext:
     """RepairContext を構築する。
 
     Args:
-        design: BridgeDesign
+        judge_input: 現在の設計の Judge 入力
         utilization: Utilization
         diagnostics: Diagnostics
         deck_thickness_required: 必要床版厚 [mm]
+        sensitivities: 照査時に計算済みの util 感度（None の場合はここで計算する）
 
     Returns:
         RepairContext
     """
+    design = judge_input.bridge_design
     girder = design.sections.girder_standard
     dims = design.dimensions
 
@@ -789,6 +1247,7 @@ def _build_repair_context(
         current_design=current_design,
         allowed_actions=ALLOWED_ACTIONS,
         deck_thickness_required=deck_thickness_required,
+        sensitivities=sensitivities or calc_util_sensitivities(judge_input, utilization, diagnostics),
     )
 
 
@@ -801,6 +1260,7 @@ def apply_patch_plan(
     design: BridgeDesign,
     patch_plan: PatchPlan,
     deck_thickness_required: float | None = None,
+    verbose: bool = True,
 ) -> BridgeDesign:
     """PatchPlan を BridgeDesign に適用する。
 
@@ -808,10 +1268,13 @@ def apply_patch_plan(
         design: 元の BridgeDesign
         patch_plan: 適用する PatchPlan
         deck_thickness_required: 必要床版厚 [mm]（SET_DECK_THICKNESS_TO_REQUIRED 用）
+        verbose: False の場合、適用ログを DEBUG レベルに落とす（探索で大量に仮適用する場合）
 
     Returns:
         修正後の新しい BridgeDesign
     """
+    log = logger.info if verbose else logger.debug
+
     # 現在の値を取り出す
     dims = design.dimensions
     girder = design.sections.girder_standard
@@ -825,29 +1288,27 @@ def apply_patch_plan(
 
         if op == PatchActionOp.INCREASE_WEB_HEIGHT:
             girder = girder.model_copy(update={"web_height": girder.web_height + delta})
-            logger.info("apply_patch_plan: web_height += %.0f → %.0f", delta, girder.web_height)
+            log("apply_patch_plan: web_height += %.0f → %.0f", delta, girder.web_height)
 
         elif op == PatchActionOp.INCREASE_WEB_THICKNESS:
             girder = girder.model_copy(update={"web_thickness": girder.web_thickness + delta})
-            logger.info("apply_patch_plan: web_thickness += %.0f → %.0f", delta, girder.web_thickness)
+            log("apply_patch_plan: web_thickness += %.0f → %.0f", delta, girder.web_thickness)
 
         elif op == PatchActionOp.INCREASE_TOP_FLANGE_THICKNESS:
             girder = girder.model_copy(update={"top_flange_thickness": girder.top_flange_thickness + delta})
-            logger.info("apply_patch_plan: top_flange_thickness += %.0f → %.0f", delta, girder.top_flange_thickness)
+            log("apply_patch_plan: top_flange_thickness += %.0f → %.0f", delta, girder.top_flange_thickness)
 
         elif op == PatchActionOp.INCREASE_BOTTOM_FLANGE_THICKNESS:
             girder = girder.model_copy(update={"bottom_flange_thickness": girder.bottom_flange_thickness + delta})
-            logger.info(
-                "apply_patch_plan: bottom_flange_thickness += %.0f → %.0f", delta, girder.bottom_flange_thickness
-            )
+            log("apply_patch_plan: bottom_flange_thickness += %.0f → %.0f", delta, girder.bottom_flange_thickness)
 
         elif op == PatchActionOp.INCREASE_TOP_FLANGE_WIDTH:
             girder = girder.model_copy(update={"top_flange_width": girder.top_flange_width + delta})
-            logger.info("apply_patch_plan: top_flange_width += %.0f → %.0f", delta, girder.top_flange_width)
+            log("apply_patch_plan: top_flange_width += %.0f → %.0f", delta, girder.top_flange_width)
 
         elif op == PatchActionOp.INCREASE_BOTTOM_FLANGE_WIDTH:
             girder = girder.model_copy(update={"bottom_flange_width": girder.bottom_flange_width + delta})
-            logger.info("apply_patch_plan: bottom_flange_width += %.0f → %.0f", delta, girder.bottom_flange_width)
+            log("apply_patch_plan: bottom_flange_width += %.0f → %.0f", delta, girder.bottom_flange_width)
 
         elif op == PatchActionOp.SET_DECK_THICKNESS_TO_REQUIRED:
             if deck_thickness_required is None:
@@ -855,7 +1316,7 @@ def apply_patch_plan(
             # 10mm単位で切り上げて余裕を持たせる
             new_thickness = math.ceil(deck_thickness_required / 10) * 10
             deck = deck.model_copy(update={"thickness": new_thickness})
-            logger.info(
+            log(
                 "apply_patch_plan: deck.thickness = %.0f (required=%.1f, 10mm切り上げ)",
                 new_thickness,
                 deck_thickness_required,
@@ -865,7 +1326,7 @@ def apply_patch_plan(
             # num_panels を調整する方式（仕様推奨）
             new_num_panels = round(dims.bridge_length / dims.panel_length)
             dims = dims.model_copy(update={"num_panels": new_num_panels})
-            logger.info(
+            log(
                 "apply_patch_plan: num_panels = round(%.0f / %.0f) = %d",
                 dims.bridge_length,
                 dims.panel_length,
@@ -886,7 +1347,7 @@ def apply_patch_plan(
                     "girder_spacing": new_girder_spacing,
                 }
             )
-            logger.info(
+            log(
                 "apply_patch_plan: num_girders += %d → %d, girder_spacing = %.1f mm (overhang=%.1f mm)",
                 int(delta),
                 new_num_girders,
@@ -899,7 +1360,7 @@ def apply_patch_plan(
             if deck.thickness < new_required:
                 new_thickness = math.ceil(new_required / 10) * 10
                 deck = deck.model_copy(update={"thickness": new_thickness})
-                logger.info(
+                log(
                     "apply_patch_plan: deck.thickness 連動更新 %.0f → %.0f mm (required=%.1f)",
                     design.components.deck.thickness,
                     new_thickness,
@@ -932,6 +1393,7 @@ def apply_patch_plan(
 def apply_dependency_rules(
     design: BridgeDesign,
     dependency_rules: list[DependencyRule],
+    verbose: bool = True,
 ) -> BridgeDesign:
     """PatchPlan 適用後に依存関係ルールを適用する。
 
@@ -941,6 +1403,7 @@ def apply_dependency_rules(
     Args:
         design: 元の BridgeDesign
         dependency_rules: 適用する依存関係ルールのリスト
+        verbose: False の場合、適用ログを DEBUG レベルに落とす
 
     Returns:
         修正後の新しい BridgeDesign
@@ -948,6 +1411,8 @@ def apply_dependency_rules(
     if not dependency_rules:
         return design
 
+    log = logger.info if verbose else logger.debug
+
     # 現在の値を取り出す
     girder = design.sections.girder_standard
     crossbeam = design.sections.crossbeam_standard
@@ -967,7 +1432,7 @@ def apply_dependency_rules(
                 flange_thickness=crossbeam.flange_thickness,
             )
             changed = True
-            logger.info(
+            log(
                 "apply_dependency_rules: %s = %.0f × %.2f = %.0f",
                 rule.target_field,
                 source_value,
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import threading
+import time
+from contextlib import contextmanager
 from enum import StrEnum
 from functools import lru_cache
-from typing import Any, Type, TypeVar
+from typing import Any, Iterator, Type, TypeVar
 
 from dotenv import load_dotenv
 from openai import OpenAI
@@ -10,6 +13,7 @@ from pydantic import BaseModel
 
 from src.bridge_agentic_generate.config import app_config
 from src.bridge_agentic_generate.logger_config import logger
+from src.bridge_agentic_generate.stage_timer import add_tokens
 
 T = TypeVar("T", bound=BaseModel)
 
@@ -21,6 +25,73 @@ class LlmModel(StrEnum):
     GPT_5_1 = "gpt-5.1"
 
 
+class LlmRateLimiter:
+    """LLM 呼び出しの同時実行数と毎分リクエスト数を制限する（プロセス内の全スレッドで共有）。
+
+    Responses API（call_llm_*）と RAG 検索の Embeddings API の呼び出しが同じ枠を使う。
+    """
+
+    def __init__(self, max_concurrent: int | None = None, requests_per_minute: float | None = None):
+        """初期化。
+
+        Args:
+            max_concurrent: 同時に実行できるリクエスト数（None の場合は無制限）
+            requests_per_minute: 毎分のリクエスト数の上限（None の場合は無制限）。開始時刻を等間隔に均す。
+        """
+        if max_concurrent is not None and max_concurrent < 1:
+            raise ValueError(f"max_concurrent は 1 以上である必要があります: {max_concurrent}")
+        if requests_per_minute is not None and requests_per_minute <= 0:
+            raise ValueError(f"requests_per_minute は正の値である必要があります: {requests_per_minute}")
+        self.max_concurrent = max_concurrent
+        self.requests_per_minute = requests_per_minute
+        self._semaphore = threading.BoundedSemaphore(max_concurrent) if max_concurrent else None
+        self._interval = 60.0 / requests_per_minute if requests_per_minute else 0.0
+        self._lock = threading.Lock()
+        self._next_start = 0.0
+
+    @contextmanager
+    def acquire(self) -> Iterator[None]:
+        """リクエスト1件分の枠を確保する（枠が空くまでブロックする）。"""
+        if self._semaphore is not None:
+            self._semaphore.acquire()
+        try:
+            if self._interval:
+                with self._lock:
+                    now = time.monotonic()
+                    start = max(now, self._next_start)
+                    self._next_start = start + self._interval
+                if start > now:
+                    time.sleep(start - now)
+            yield
+        finally:
+            if self._semaphore is not None:
+                self._semaphore.release()
+
+
+_rate_limiter = LlmRateLimiter()
+
+
+def configure_rate_limit(max_concurrent: int | None = None, requests_per_minute: float | None = None) -> None:
+    """全 LLM 呼び出しで共有するレート制限を設定する。
+
+    Args:
+        max_concurrent: 同時に実行できるリクエスト数（None の場合は無制限）
+        requests_per_minute: 毎分のリクエスト数の上限（None の場合は無制限）
+    """
+    global _rate_limiter
+    _rate_limiter = LlmRateLimiter(max_concurrent=max_concurrent, requests_per_minute=requests_per_minute)
+    logger.info(
+        "configure_rate_limit: max_concurrent=%s, requests_per_minute=%s",
+        max_concurrent,
+        requests_per_minute,
+    )
+
+
+def get_rate_limiter() -> LlmRateLimiter:
+    """現在の共有レート制限を返す。"""
+    return _rate_limiter
+
+
 @lru_cache(maxsize=1)
 def get_llm_client() -> OpenAI:
     """共通の OpenAI クライアントを返す。
@@ -33,6 +104,13 @@ def get_llm_client() -> OpenAI:
     return OpenAI()
 
 
+def _record_usage(response: Any) -> None:
+    """レスポンスのトークン使用量を実行中のステージに加算する。"""
+    usage = getattr(response, "usage", None)
+    if usage is not None:
+        add_tokens(getattr(usage, "input_tokens", 0) or 0, getattr(usage, "output_tokens", 0) or 0)
+
+
 def call_llm_and_get_response(
     input: str,
     model: LlmModel,
@@ -50,11 +128,13 @@ def call_llm_and_get_response(
     """
     client = get_llm_client()
     logger.debug("Calling OpenAI responses.create with model=%s", model)
-    response = client.responses.create(
-        model=model,
-        input=input,
-        **kwargs,
-    )
+    with get_rate_limiter().acquire():
+        response = client.responses.create(
+            model=model,
+            input=input,
+            **kwargs,
+        )
+    _record_usage(response)
     return response.output_text
 
 
@@ -81,12 +161,14 @@ def call_llm_with_structured_output(
         model,
         text_format,
     )
-    response = client.responses.parse(
-        model=model,
-        input=input,
-        text_format=text_format,
-        **kwargs,
-    )
+    with get_rate_limiter().acquire():
+        response = client.responses.parse(
+            model=model,
+            input=input,
+            text_format=text_format,
+            **kwargs,
+        )
+    _record_usage(response)
     if response.output_parsed is None:
         raise ValueError("LLM did not return a valid structured output.")
     return response.output_parsed
@@ -2,27 +2,39 @@
 
 from __future__ import annotations
 
+import hashlib
 from datetime import datetime
+from pathlib import Path
 from typing import Sequence
 
 import fire
 
 from src.bridge_agentic_generate.config import app_config
-from src.bridge_agentic_generate.designer.models import DesignerInput
-from src.bridge_agentic_generate.designer.services import generate_design_with_rag_log
-from src.bridge_agentic_generate.judge.models import (
-    JudgeInput,
-    RepairIteration,
-    RepairLoopResult,
+from src.bridge_agentic_generate.designer.library import (
+    build_design_library,
+    build_warm_start_design,
+    save_design_library,
 )
-from src.bridge_agentic_generate.judge.services import (
-    apply_dependency_rules,
-    apply_patch_plan,
-    judge_v1,
+from src.bridge_agentic_generate.designer.models import (
+    DesignerInput,
+    DesignLibrary,
+    DesignResult,
+    WarmStartMode,
 )
+from src.bridge_agentic_generate.designer.services import generate_design_with_rag_log
+from src.bridge_agentic_generate.judge.models import JudgeInput, RepairLoopResult, RepairStrategy
+from src.bridge_agentic_generate.judge.planner import DEFAULT_BEAM_WIDTH, DEFAULT_HORIZON
+from src.bridge_agentic_generate.judge.prompts import DEFAULT_NUM_CANDIDATES
+from src.bridge_agentic_generate.judge.services import evaluate_utilization, judge_v1
 from src.bridge_agentic_generate.llm_client import LlmModel
 from src.bridge_agentic_generate.logger_config import logger
 from src.bridge_agentic_generate.rag.embedding_config import TOP_K
+from src.bridge_agentic_generate.repair_loop import (
+    BeamRepairStepper,
+    GreedyRepairStepper,
+    RepairStepper,
+    run_repair_engine,
+)
 
 DEFAULT_BRIDGE_LENGTH_M: float = 50.0
 DEFAULT_BRIDGE_LENGTHS_M: Sequence[float] = (30.0, 40.0, 50.0, 60.0, 70.0)
@@ -97,128 +109,137 @@ def run_single_case(
         logger.info("Judge result: pass_fail=%s, max_util=%.3f", report.pass_fail, report.utilization.max_util)
 
 
+def _is_lightweight_pass(result: DesignResult) -> tuple[bool, float]:
+    """設計を LLM なしで照査し、(合否, max_util) を返す。"""
+    util_values = evaluate_utilization(JudgeInput(bridge_design=result.design))
+    return util_values.pass_fail, util_values.max_util
+
+
+def generate_initial_design(
+    inputs: DesignerInput,
+    top_k: int,
+    model_name: LlmModel,
+    design_library: DesignLibrary | None = None,
+    warm_start: WarmStartMode = WarmStartMode.OFF,
+) -> DesignResult:
+    """修正ループの初期設計を生成する。
+
+    warm_start に応じて、Designer（LLM）の出力・設計ライブラリのスケーリング設計を使い分ける。
+
+    - off: Designer の出力
+    - replace: ライブラリ設計（LLM 呼び出しなし）。ライブラリが空、またはスケーリング結果が適用範囲外なら
+      Designer にフォールバック
+    - candidate: 両方を軽量照査し、合格する方（両方合格なら Designer、両方不合格なら max_util の小さい方）
+
+    Args:
+        inputs: 橋長・幅員
+        top_k: RAG で取得するチャンク数
+        model_name: 使用する LLM モデル名
+        design_library: 設計ライブラリ（warm_start=off の場合は不要）
+        warm_start: ウォームスタートの利用方法
+
+    Returns:
+        DesignResult
+    """
+    warm_result = None
+    if warm_start != WarmStartMode.OFF and design_library is not None:
+        warm_result = build_warm_start_design(design_library, inputs)
+        if warm_result is None:
+            logger.warning("generate_initial_design: 使用できるライブラリ設計がないため Designer を使用します")
+
+    if warm_start == WarmStartMode.REPLACE and warm_result is not None:
+        return warm_result
+
+    designer_result = generate_design_with_rag_log(inputs=inputs, top_k=top_k, model_name=model_name)
+    if warm_result is None:
+        return designer_result
+
+    designer_pass, designer_max_util = _is_lightweight_pass(designer_result)
+    warm_pass, warm_max_util = _is_lightweight_pass(warm_result)
+    use_warm = (not designer_pass) and (warm_pass or warm_max_util < designer_max_util)
+    logger.info(
+        "generate_initial_design: Designer max_util=%.3f, ライブラリ max_util=%.3f → %s を採用",
+        designer_max_util,
+        warm_max_util,
+        "ライブラリ設計" if use_warm else "Designer 設計",
+    )
+    return warm_result if use_warm else designer_result
+
+
 def run_with_repair_loop(
     bridge_length_m: float,
     total_width_m: float,
     model_name: LlmModel,
     top_k: int = TOP_K,
     max_iterations: int = DEFAULT_MAX_ITERATIONS,
+    num_candidates: int = DEFAULT_NUM_CANDIDATES,
+    design_library: DesignLibrary | None = None,
+    warm_start: WarmStartMode = WarmStartMode.OFF,
+    repair_strategy: RepairStrategy = RepairStrategy.GREEDY,
+    beam_width: int = DEFAULT_BEAM_WIDTH,
+    horizon: int = DEFAULT_HORIZON,
+    llm_seed: bool = True,
+    run_dir: Path | None = None,
 ) -> RepairLoopResult:
     """Designer → Judge → (必要なら修正) のループを実行する。
 
+    ループ本体は run_repair_engine。run_dir を指定すると各イテレーションをチェックポイントとして保存し、
+    同じ run_dir で再実行すると最後に完了したイテレーションの次から再開する。
+
     Args:
         bridge_length_m: 橋長 L [m]
         total_width_m: 幅員 B [m]
         model_name: 使用する LLM モデル名
         top_k: RAG で取得するチャンク数
         max_iterations: 最大反復回数
+        num_candidates: 1イテレーションで評価する PatchPlan 候補数（beam の場合はシード候補数）
+        design_library: ウォームスタートに使う設計ライブラリ
+        warm_start: ウォームスタートの利用方法
+        repair_strategy: 修正戦略（greedy: 毎回 LLM / beam: ビームサーチで修正列を一括適用）
+        beam_width: beam 戦略で各深さに残す候補数
+        horizon: beam 戦略で先読みする手数
+        llm_seed: beam 戦略で LLM のシード候補を使うか
+        run_dir: チェックポイントのディレクトリ（None の場合は保存・再開しない）
 
     Returns:
         RepairLoopResult: 全イテレーションの結果を含む結果オブジェクト
     """
-    iterations: list[RepairIteration] = []
-
-    # 1. 初期設計を生成
     inputs = DesignerInput(bridge_length_m=bridge_length_m, total_width_m=total_width_m)
-    result = generate_design_with_rag_log(inputs=inputs, top_k=top_k, model_name=model_name)
-    design = result.design
-    rag_log = result.rag_log
-    dependency_rules = result.dependency_rules
-
-    logger.info(
-        "run_with_repair_loop: 初期設計生成完了 L=%.0fm, B=%.0fm (dependency_rules=%d件)",
-        bridge_length_m,
-        total_width_m,
-        len(dependency_rules),
-    )
-
-    # 2. Judge → 修正ループ
-    for iteration in range(max_iterations):
-        logger.info("run_with_repair_loop: イテレーション %d/%d", iteration + 1, max_iterations)
-
-        # 照査
-        judge_input = JudgeInput(bridge_design=design)
-        report = judge_v1(judge_input, model=model_name)
-
-        # イテレーション結果を記録
-        iterations.append(
-            RepairIteration(
-                iteration=iteration,
-                design=design.model_copy(deep=True),
-                report=report,
-            )
-        )
-
-        # 合格なら終了
-        if report.pass_fail:
-            logger.info(
-                "run_with_repair_loop: 合格（max_util=%.3f, iteration=%d）",
-                report.utilization.max_util,
-                iteration + 1,
-            )
-            return RepairLoopResult(
-                converged=True,
-                iterations=iterations,
-                final_design=design,
-                final_report=report,
-                rag_log=rag_log,
-            )
-
-        # 不合格かつ PatchPlan が空の場合は ValueError（サービス層で送出済み）
-        # ここに到達する場合は patch_plan.actions が空でないことが保証されている
-
-        # PatchPlan を適用
-        deck_thickness_required = report.diagnostics.deck_thickness_required
-        design = apply_patch_plan(
-            design=design,
-            patch_plan=report.patch_plan,
-            deck_thickness_required=deck_thickness_required,
-        )
-
-        # 依存関係ルールを適用（横桁高さの連動など）
-        design = apply_dependency_rules(design=design, dependency_rules=dependency_rules)
-
-        logger.info(
-            "run_with_repair_loop: PatchPlan 適用完了（%d アクション）",
-            len(report.patch_plan.actions),
-        )
-
-    # 最大イテレーション後も収束しなかった場合
-    # 最後の照査結果を取得
-    judge_input = JudgeInput(bridge_design=design)
-    final_report = judge_v1(judge_input, model=model_name)
-
-    # 最終イテレーション結果を記録
-    iterations.append(
-        RepairIteration(
-            iteration=max_iterations,
-            design=design.model_copy(deep=True),
-            report=final_report,
-        )
-    )
-
-    if final_report.pass_fail:
-        logger.info("run_with_repair_loop: 最終照査で合格")
-        return RepairLoopResult(
-            converged=True,
-            iterations=iterations,
-            final_design=design,
-            final_report=final_report,
-            rag_log=rag_log,
+    stepper: RepairStepper
+    if repair_strategy == RepairStrategy.BEAM:
+        stepper = BeamRepairStepper(
+            model_name=model_name,
+            num_candidates=num_candidates,
+            beam_width=beam_width,
+            horizon=horizon,
+            llm_seed=llm_seed,
         )
+    else:
+        stepper = GreedyRepairStepper(model_name=model_name, num_candidates=num_candidates)
 
-    logger.warning(
-        "run_with_repair_loop: %d 回の修正で収束しませんでした。 max_util=%.3f, governing_check=%s",
-        max_iterations,
-        final_report.utilization.max_util,
-        final_report.utilization.governing_check,
-    )
-    return RepairLoopResult(
-        converged=False,
-        iterations=iterations,
-        final_design=design,
-        final_report=final_report,
-        rag_log=rag_log,
+    return run_repair_engine(
+        initial_design=lambda: generate_initial_design(
+            inputs=inputs,
+            top_k=top_k,
+            model_name=model_name,
+            design_library=design_library,
+            warm_start=warm_start,
+        ),
+        stepper=stepper,
+        max_iterations=max_iterations,
+        run_dir=run_dir,
+        log_prefix=f"run_with_repair_loop[{repair_strategy}]",
+        run_params={
+            "bridge_length_m": bridge_length_m,
+            "total_width_m": total_width_m,
+            "top_k": top_k,
+            "warm_start": warm_start,
+            "design_library_sha256": (
+                hashlib.sha256(design_library.model_dump_json().encode("utf-8")).hexdigest()
+                if design_library is not None
+                else None
+            ),
+        },
     )
 
 
@@ -235,6 +256,9 @@ class CLI:
         # バッチ実行
         uv run python -m src.bridge_agentic_generate.main batch
 
+        # 評価結果から収束設計ライブラリを構築
+        uv run python -m src.bridge_agentic_generate.main build_library --evaluation_dirs='["data/evaluation_v4"]'
+
     Note:
         修正ループ付き実行（run_with_repair）は src.main の統合 CLI を使用してください。
         uv run python -m src.main run_with_repair --bridge_length_m=50 --total_width_m=10
@@ -284,6 +308,20 @@ class CLI:
             top_k=top_k,
         )
 
+    def build_library(
+        self,
+        evaluation_dirs: Sequence[str],
+        output_path: str | None = None,
+    ) -> None:
+        """評価結果から収束設計ライブラリを構築して保存する。
+
+        Args:
+            evaluation_dirs: EvaluationRunner の出力ディレクトリのリスト
+            output_path: 出力先（None の場合は app_config.design_library_path）
+        """
+        library = build_design_library([Path(d) for d in evaluation_dirs])
+        save_design_library(library, Path(output_path) if output_path else app_config.design_library_path)
+
 
 def main() -> None:
     """CLI エントリーポイント。"""
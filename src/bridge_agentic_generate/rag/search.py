@@ -6,7 +6,7 @@ from typing import Sequence
 import numpy as np
 from openai import OpenAI
 
-from src.bridge_agentic_generate.llm_client import get_llm_client
+from src.bridge_agentic_generate.llm_client import get_llm_client, get_rate_limiter
 from src.bridge_agentic_generate.logger_config import logger
 from src.bridge_agentic_generate.rag.embedding_config import (
     EmbeddingModel,
@@ -16,6 +16,7 @@ from src.bridge_agentic_generate.rag.embedding_config import (
     SearchResult,
     get_embedding_config,
 )
+from src.bridge_agentic_generate.stage_timer import Stage, add_tokens, stage
 
 _RAG_INDEX: RagIndex | None = None
 
@@ -70,6 +71,8 @@ def _embed_query(
 ) -> np.ndarray:
     """クエリ1本を embedding ベクトルに変換する。
 
+    LLM 呼び出しと同じ共有レート制限（llm_client.get_rate_limiter）を通す。
+
     Args:
         query: クエリ文字列。
         client: OpenAI クライアント。
@@ -78,7 +81,10 @@ def _embed_query(
     Returns:
         np.ndarray: shape=(D,) のベクトル。
     """
-    response = client.embeddings.create(model=model.value, input=query)
+    with stage(Stage.EMBEDDING), get_rate_limiter().acquire():
+        response = client.embeddings.create(model=model.value, input=query)
+        if response.usage is not None:
+            add_tokens(response.usage.prompt_tokens)
     vector = np.array(response.data[0].embedding, dtype=np.float32)
     return vector
 
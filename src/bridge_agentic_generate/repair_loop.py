@@ -0,0 +1,449 @@
+"""再開可能な修正ループエンジン。
+
+Designer → Judge → (必要なら修正) のループを1か所に集約する。
+各イテレーションの結果を run_dir にアトミックに書き出し、同じ run_dir で再実行すると
+最後に完了したイテレーションの次から再開する（支払い済みの LLM 呼び出しを捨てない）。
+
+実行パラメータ（最大反復回数・修正戦略・初期設計の入力）は initial.json に記録し、
+異なるパラメータで作られた run_dir のチェックポイントは破棄して最初からやり直す。
+
+run_dir のレイアウト:
+    initial.json        実行パラメータと初期設計（InitialCheckpoint）
+    iter_000.json       イテレーション 0 の RepairCheckpoint
+    iter_001.json       ...
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Callable, Protocol
+
+from pydantic import BaseModel, ValidationError
+
+from src.bridge_agentic_generate.designer.models import BridgeDesign, DependencyRule, DesignResult
+from src.bridge_agentic_generate.judge.models import (
+    InitialCheckpoint,
+    JudgeInput,
+    JudgeReport,
+    PatchPlan,
+    RepairCheckpoint,
+    RepairIteration,
+    RepairLoopResult,
+)
+from src.bridge_agentic_generate.judge.planner import (
+    DEFAULT_BEAM_WIDTH,
+    DEFAULT_HORIZON,
+    apply_repair_step,
+    plan_repair_sequence,
+    request_seed_plans,
+)
+from src.bridge_agentic_generate.judge.prompts import DEFAULT_NUM_CANDIDATES
+from src.bridge_agentic_generate.judge.services import (
+    apply_dependency_rules,
+    apply_patch_plan,
+    calc_util_sensitivities,
+    judge_v1,
+    judge_v1_lightweight,
+)
+from src.bridge_agentic_generate.llm_client import LlmModel
+from src.bridge_agentic_generate.logger_config import logger
+from src.bridge_agentic_generate.stage_timer import Stage, stage
+
+# 初期設計のチェックポイントファイル名
+INITIAL_CHECKPOINT_FILENAME = "initial.json"
+# イテレーションのチェックポイントファイル名
+ITERATION_CHECKPOINT_TEMPLATE = "iter_{:03d}.json"
+
+
+class RepairStepper(Protocol):
+    """修正ループの1イテレーション分の処理（修正戦略）。"""
+
+    def params(self) -> dict[str, Any]:
+        """チェックポイントの再利用可否の判定に使う戦略のパラメータを返す。"""
+        ...
+
+    def judge(
+        self,
+        design: BridgeDesign,
+        dependency_rules: list[DependencyRule],
+        iteration: int,
+        final: bool,
+    ) -> JudgeReport:
+        """設計を照査し、不合格なら修正案を含む JudgeReport を返す。
+
+        Args:
+            design: 照査する設計
+            dependency_rules: 依存関係ルール
+            iteration: イテレーション番号
+            final: 最大反復後の最終照査か（修正案は適用されない）
+
+        Returns:
+            JudgeReport
+        """
+        ...
+
+    def apply(
+        self,
+        design: BridgeDesign,
+        report: JudgeReport,
+        dependency_rules: list[DependencyRule],
+    ) -> BridgeDesign:
+        """直前の judge が返した修正案を適用した設計を返す。
+
+        Args:
+            design: 照査した設計
+            report: judge の結果
+            dependency_rules: 依存関係ルール
+
+        Returns:
+            修正後の設計
+        """
+        ...
+
+
+class GreedyRepairStepper:
+    """毎イテレーション LLM の PatchPlan 候補から最良の案を適用する戦略。"""
+
+    def __init__(self, model_name: LlmModel, num_candidates: int = DEFAULT_NUM_CANDIDATES):
+        """初期化。
+
+        Args:
+            model_name: PatchPlan 生成に使用する LLM モデル名
+            num_candidates: 1イテレーションで評価する PatchPlan 候補数
+        """
+        self.model_name = model_name
+        self.num_candidates = num_candidates
+
+    def params(self) -> dict[str, Any]:
+        """戦略のパラメータ（モデル名・候補数）を返す。"""
+        return {"model_name": self.model_name, "num_candidates": self.num_candidates}
+
+    def judge(
+        self,
+        design: BridgeDesign,
+        dependency_rules: list[DependencyRule],
+        iteration: int,
+        final: bool,
+    ) -> JudgeReport:
+        """judge_v1 で照査する（最終照査でも従来どおり PatchPlan を生成する）。"""
+        return judge_v1(JudgeInput(bridge_design=design), model=self.model_name, num_candidates=self.num_candidates)
+
+    def apply(
+        self,
+        design: BridgeDesign,
+        report: JudgeReport,
+        dependency_rules: list[DependencyRule],
+    ) -> BridgeDesign:
+        """PatchPlan と依存関係ルール（横桁高さの連動など）を適用する。"""
+        design = apply_patch_plan(
+            design=design,
+            patch_plan=report.patch_plan,
+            deck_thickness_required=report.diagnostics.deck_thickness_required,
+        )
+        return apply_dependency_rules(design=design, dependency_rules=dependency_rules)
+
+
+class BeamRepairStepper:
+    """ビームサーチで選んだ修正列をまとめて適用する戦略。
+
+    LLM は1イテレーション目のシード候補の生成にのみ使う（llm_seed=True の場合）。
+    記録する JudgeReport の patch_plan は、そのイテレーションで適用する修正列の全アクション。
+    """
+
+    def __init__(
+        self,
+        model_name: LlmModel,
+        num_candidates: int = DEFAULT_NUM_CANDIDATES,
+        beam_width: int = DEFAULT_BEAM_WIDTH,
+        horizon: int = DEFAULT_HORIZON,
+        llm_seed: bool = True,
+    ):
+        """初期化。
+
+        Args:
+            model_name: シード生成に使用する LLM モデル名
+            num_candidates: シードとして LLM に提案させる候補数
+            beam_width: 各深さで残す候補数
+            horizon: 先読みする手数
+            llm_seed: LLM のシード候補を使うか
+        """
+        self.model_name = model_name
+        self.num_candidates = num_candidates
+        self.beam_width = beam_width
+        self.horizon = horizon
+        self.llm_seed = llm_seed
+        self._pending_plans: list[PatchPlan] = []
+
+    def params(self) -> dict[str, Any]:
+        """戦略のパラメータ（モデル名・候補数・ビーム幅・先読み手数・シード有無）を返す。"""
+        return {
+            "model_name": self.model_name,
+            "num_candidates": self.num_candidates,
+            "beam_width": self.beam_width,
+            "horizon": self.horizon,
+            "llm_seed": self.llm_seed,
+        }
+
+    def judge(
+        self,
+        design: BridgeDesign,
+        dependency_rules: list[DependencyRule],
+        iteration: int,
+        final: bool,
+    ) -> JudgeReport:
+        """LLM なしで照査し、不合格ならビームサーチで修正列を計画する。
+
+        Raises:
+            ValueError: 適用可能な修正列が見つからない場合
+        """
+        judge_input = JudgeInput(bridge_design=design)
+        report = _judge_without_llm(judge_input, PatchPlan(actions=[]))
+        if report.pass_fail or final:
+            return report
+
+        seed_plans = (
+            request_seed_plans(judge_input, self.model_name, self.num_candidates)
+            if self.llm_seed and iteration == 0
+            else []
+        )
+        sequence = plan_repair_sequence(
+            design=design,
+            dependency_rules=dependency_rules,
+            judge_input_base=judge_input,
+            seed_plans=seed_plans,
+            beam_width=self.beam_width,
+            horizon=self.horizon,
+            sensitivities=report.sensitivities,
+        )
+        if not sequence.plans:
+            raise ValueError("BeamRepairStepper: 適用可能な修正列が見つかりませんでした。")
+
+        self._pending_plans = sequence.plans
+        logger.info(
+            "BeamRepairStepper: 修正列 %d 手を計画（予測 max_util=%.3f）",
+            len(sequence.plans),
+            sequence.predicted_utilization.max_util,
+        )
+        return report.model_copy(
+            update={"patch_plan": PatchPlan(actions=[action for plan in sequence.plans for action in plan.actions])}
+        )
+
+    def apply(
+        self,
+        design: BridgeDesign,
+        report: JudgeReport,
+        dependency_rules: list[DependencyRule],
+    ) -> BridgeDesign:
+        """計画した修正列を1手ずつ（依存関係ルール込みで）適用する。"""
+        for plan in self._pending_plans:
+            design = apply_repair_step(design, plan, dependency_rules)
+        self._pending_plans = []
+        return design
+
+
+def _judge_without_llm(judge_input: JudgeInput, patch_plan: PatchPlan) -> JudgeReport:
+    """LLM を呼ばずに照査し、指定の PatchPlan を持つ JudgeReport を作成する（不合格なら util 感度も計算する）。"""
+    utilization, diagnostics = judge_v1_lightweight(judge_input)
+    pass_fail = utilization.max_util <= 1.0 and diagnostics.crossbeam_layout_ok
+    return JudgeReport(
+        pass_fail=pass_fail,
+        utilization=utilization,
+        diagnostics=diagnostics,
+        patch_plan=patch_plan,
+        sensitivities=None if pass_fail else calc_util_sensitivities(judge_input, utilization, diagnostics),
+    )
+
+
+def _write_atomic(path: Path, model: BaseModel) -> None:
+    """一時ファイルに書き出してから置き換え、途中で落ちても壊れたファイルを残さない。"""
+    with stage(Stage.SERIALIZATION):
+        tmp_path = path.with_name(f"{path.name}.tmp")
+        tmp_path.write_text(model.model_dump_json(indent=2, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+
+def _build_run_params(
+    stepper: RepairStepper,
+    max_iterations: int,
+    run_params: dict[str, Any] | None,
+) -> dict[str, Any]:
+    """チェックポイントに記録する実行パラメータを JSON 互換の dict として作成する。"""
+    params = {
+        "max_iterations": max_iterations,
+        "stepper": {"type": type(stepper).__name__, **stepper.params()},
+        "inputs": run_params or {},
+    }
+    return json.loads(json.dumps(params, sort_keys=True))
+
+
+def _read_initial_checkpoint(initial_path: Path) -> InitialCheckpoint | None:
+    """初期設計のチェックポイントを読み込む。読めない（旧形式を含む）場合は None を返す。"""
+    try:
+        return InitialCheckpoint.model_validate_json(initial_path.read_text(encoding="utf-8"))
+    except ValidationError:
+        return None
+
+
+def _clear_checkpoints(run_dir: Path) -> None:
+    """run_dir の初期設計・イテレーションのチェックポイントを削除する。"""
+    (run_dir / INITIAL_CHECKPOINT_FILENAME).unlink(missing_ok=True)
+    for path in run_dir.glob("iter_*.json"):
+        path.unlink()
+
+
+def _load_or_create_initial(
+    initial_design: Callable[[], DesignResult],
+    run_dir: Path | None,
+    run_params: dict[str, Any],
+    log_prefix: str,
+) -> DesignResult:
+    """初期設計をチェックポイントから読み込む。なければ生成して保存する。
+
+    チェックポイントの実行パラメータが run_params と異なる場合は、run_dir のチェックポイントを
+    すべて破棄して初期設計から作り直す。
+    """
+    if run_dir is None:
+        return initial_design()
+
+    initial_path = run_dir / INITIAL_CHECKPOINT_FILENAME
+    if initial_path.exists():
+        checkpoint = _read_initial_checkpoint(initial_path)
+        if checkpoint is not None and checkpoint.run_params == run_params:
+            logger.info("%s: 初期設計をチェックポイントから読み込み %s", log_prefix, initial_path)
+            return checkpoint.result
+        logger.warning(
+            "%s: 実行パラメータが異なるためチェックポイントを破棄して最初からやり直します (run_dir=%s)",
+            log_prefix,
+            run_dir,
+        )
+        _clear_checkpoints(run_dir)
+
+    result = initial_design()
+    run_dir.mkdir(parents=True, exist_ok=True)
+    _write_atomic(initial_path, InitialCheckpoint(run_params=run_params, result=result))
+    return result
+
+
+def load_checkpoints(run_dir: Path) -> list[RepairCheckpoint]:
+    """run_dir から連続したイテレーションのチェックポイントを読み込む。
+
+    Args:
+        run_dir: チェックポイントのディレクトリ
+
+    Returns:
+        iteration 0 から欠番の直前までの RepairCheckpoint のリスト
+    """
+    checkpoints: list[RepairCheckpoint] = []
+    while (path := run_dir / ITERATION_CHECKPOINT_TEMPLATE.format(len(checkpoints))).exists():
+        checkpoints.append(RepairCheckpoint.model_validate_json(path.read_text(encoding="utf-8")))
+        if checkpoints[-1].next_design is None:
+            break
+    return checkpoints
+
+
+def _build_result(iterations: list[RepairIteration], result: DesignResult) -> RepairLoopResult:
+    """最後のイテレーションを最終結果とする RepairLoopResult を作成する。"""
+    last = iterations[-1]
+    return RepairLoopResult(
+        converged=last.report.pass_fail,
+        iterations=iterations,
+        final_design=last.design,
+        final_report=last.report,
+        rag_log=result.rag_log,
+    )
+
+
+def run_repair_engine(
+    initial_design: Callable[[], DesignResult],
+    stepper: RepairStepper,
+    max_iterations: int,
+    run_dir: Path | None = None,
+    log_prefix: str = "run_repair_engine",
+    run_params: dict[str, Any] | None = None,
+) -> RepairLoopResult:
+    """Designer → Judge → (必要なら修正) のループを実行する。
+
+    run_dir を指定すると、初期設計と各イテレーションをチェックポイントとして保存し、
+    既存のチェックポイントがあればそこから再開する。ループが終了済みなら照査を呼ばずに結果を返す。
+    再開するのは max_iterations・stepper のパラメータ・run_params がチェックポイント作成時と
+    一致する場合のみで、異なる場合はチェックポイントを破棄して最初からやり直す。
+
+    Args:
+        initial_design: 初期設計を生成する関数（チェックポイントがない場合のみ呼ぶ）
+        stepper: 照査・修正の戦略
+        max_iterations: 最大反復回数
+        run_dir: チェックポイントのディレクトリ（None の場合は保存・再開しない）
+        log_prefix: ログの接頭辞
+        run_params: 初期設計の入力など、チェックポイントの再利用可否の判定に加えるパラメータ（JSON 互換）
+
+    Returns:
+        RepairLoopResult: 全イテレーションの結果を含む結果オブジェクト
+    """
+    params = _build_run_params(stepper, max_iterations, run_params)
+    result = _load_or_create_initial(initial_design, run_dir, params, log_prefix)
+    design = result.design
+    dependency_rules = result.dependency_rules
+
+    checkpoints = load_checkpoints(run_dir) if run_dir is not None else []
+    iterations = [checkpoint.iteration for checkpoint in checkpoints]
+    if checkpoints:
+        if checkpoints[-1].next_design is None:
+            logger.info("%s: 終了済みのチェックポイントを読み込み（%d イテレーション）", log_prefix, len(iterations))
+            return _build_result(iterations, result)
+        design = checkpoints[-1].next_design
+        logger.info("%s: イテレーション %d から再開 (run_dir=%s)", log_prefix, len(iterations), run_dir)
+    else:
+        logger.info(
+            "%s: 初期設計 L=%.0fm, B=%.0fm (dependency_rules=%d件)",
+            log_prefix,
+            design.dimensions.bridge_length / 1000,
+            design.dimensions.total_width / 1000,
+            len(dependency_rules),
+        )
+
+    def _record(iteration: RepairIteration, next_design: BridgeDesign | None) -> None:
+        iterations.append(iteration)
+        if run_dir is not None:
+            checkpoint = RepairCheckpoint(iteration=iteration, next_design=next_design)
+            _write_atomic(run_dir / ITERATION_CHECKPOINT_TEMPLATE.format(iteration.iteration), checkpoint)
+
+    for iteration in range(len(iterations), max_iterations):
+        logger.info("%s: イテレーション %d/%d", log_prefix, iteration + 1, max_iterations)
+
+        with stage(Stage.JUDGE):
+            report = stepper.judge(design, dependency_rules, iteration, final=False)
+        record = RepairIteration(iteration=iteration, design=design.model_copy(deep=True), report=report)
+
+        if report.pass_fail:
+            _record(record, next_design=None)
+            logger.info(
+                "%s: 合格（max_util=%.3f, iteration=%d）", log_prefix, report.utilization.max_util, iteration + 1
+            )
+            return _build_result(iterations, result)
+
+        with stage(Stage.JUDGE):
+            design = stepper.apply(design, report, dependency_rules)
+        _record(record, next_design=design)
+        logger.info("%s: PatchPlan 適用完了（%d アクション）", log_prefix, len(report.patch_plan.actions))
+
+    # 最大イテレーション後の最終照査
+    with stage(Stage.JUDGE):
+        final_report = stepper.judge(design, dependency_rules, len(iterations), final=True)
+    _record(
+        RepairIteration(iteration=len(iterations), design=design.model_copy(deep=True), report=final_report),
+        next_design=None,
+    )
+
+    if final_report.pass_fail:
+        logger.info("%s: 最終照査で合格", log_prefix)
+    else:
+        logger.warning(
+            "%s: %d 回の修正で収束しませんでした。 max_util=%.3f, governing_check=%s",
+            log_prefix,
+            max_iterations,
+            final_report.utilization.max_util,
+            final_report.utilization.governing_check,
+        )
+    return _build_result(iterations, result)
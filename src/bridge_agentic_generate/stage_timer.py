@@ -0,0 +1,195 @@
+"""処理段階（ステージ）ごとの所要時間・トークン数の計測。
+
+record_stages() のブロック内で実行された stage() の区間を StageRecorder に集計する。
+計測は contextvars で現在の記録先を引き回すため、並列実行中の試行どうしで混ざらない。
+記録先がない場合（通常の CLI 実行など）は stage() / add_tokens() は何もしない。
+
+ステージが入れ子になった場合、外側のステージの時間には内側のステージの時間を含めない（自己時間）。
+スレッドプールへ処理を渡す場合は contextvars.copy_context().run 経由で投入すると、同じ記録先に集計される。
+打ち切って待たずに残したスレッドの区間は、stage_scope() のブロックを抜けた後に終わったものを記録しない。
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import StrEnum
+from typing import Iterator
+
+from pydantic import BaseModel, Field
+
+
+class Stage(StrEnum):
+    """計測するステージ。"""
+
+    DESIGNER_LLM = "designer_llm"
+    PATCH_PLAN_LLM = "patch_plan_llm"
+    EMBEDDING = "embedding"
+    JUDGE = "judge"
+    SERIALIZATION = "serialization"
+    IFC = "ifc"
+
+
+class StageStats(BaseModel):
+    """1ステージの集計値。"""
+
+    seconds: float = Field(default=0.0, description="累積所要時間 [s]（並列実行された区間は合算）")
+    calls: int = Field(default=0, description="区間の実行回数")
+    input_tokens: int = Field(default=0, description="入力トークン数")
+    output_tokens: int = Field(default=0, description="出力トークン数")
+
+
+class StageRecorder:
+    """ステージごとの集計値を保持する（スレッドセーフ）。"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._stats: dict[Stage, StageStats] = {}
+
+    def add(
+        self,
+        stage_name: Stage,
+        seconds: float = 0.0,
+        calls: int = 0,
+        input_tokens: int = 0,
+        output_tokens: int = 0,
+    ) -> None:
+        """集計値を加算する。"""
+        with self._lock:
+            stats = self._stats.setdefault(stage_name, StageStats())
+            stats.seconds += seconds
+            stats.calls += calls
+            stats.input_tokens += input_tokens
+            stats.output_tokens += output_tokens
+
+    def snapshot(self) -> dict[str, StageStats]:
+        """現時点の集計値のコピーを返す（ステージ定義順）。"""
+        with self._lock:
+            return {str(name): self._stats[name].model_copy() for name in Stage if name in self._stats}
+
+
+class _StageFrame:
+    """実行中のステージ区間（入れ子の子区間の時間を差し引くため）。
+
+    name が None のフレームはステージではなく、計測の範囲（record_stages / stage_scope のブロック）を表す。
+    子区間は別スレッドで終わることがあるため、子区間の時間の加算と終了はロックで保護する。
+    """
+
+    def __init__(self, name: Stage | None, parent: _StageFrame | None):
+        self.name = name
+        self.parent = parent
+        self.child_seconds = 0.0
+        self.closed = False
+        self._lock = threading.Lock()
+
+    def add_child(self, seconds: float) -> bool:
+        """子区間の時間を加算する（終了済みの場合は加算せずに False を返す）。"""
+        with self._lock:
+            if self.closed:
+                return False
+            self.child_seconds += seconds
+            return True
+
+    def close(self) -> float:
+        """区間を終了し、子区間の合計時間を返す。"""
+        with self._lock:
+            self.closed = True
+            return self.child_seconds
+
+    def is_open(self) -> bool:
+        """この区間と外側の区間がすべて終了していないか。"""
+        frame: _StageFrame | None = self
+        while frame is not None:
+            if frame.closed:
+                return False
+            frame = frame.parent
+        return True
+
+
+_recorder: ContextVar[StageRecorder | None] = ContextVar("stage_recorder", default=None)
+_frame: ContextVar[_StageFrame | None] = ContextVar("stage_frame", default=None)
+
+
+@contextmanager
+def record_stages() -> Iterator[StageRecorder]:
+    """ブロック内のステージ計測を新しい StageRecorder に集計する。
+
+    Yields:
+        StageRecorder: 集計先
+    """
+    recorder = StageRecorder()
+    root = _StageFrame(None, None)
+    recorder_token = _recorder.set(recorder)
+    frame_token = _frame.set(root)
+    try:
+        yield recorder
+    finally:
+        root.close()
+        _frame.reset(frame_token)
+        _recorder.reset(recorder_token)
+
+
+@contextmanager
+def stage_scope() -> Iterator[None]:
+    """ブロック内で始まったステージのうち、ブロックを抜けるまでに終わったものだけを記録する。
+
+    打ち切って待たずに残したスレッドの区間など、ブロックを抜けた後に終わった区間は記録しない
+    （記録先がなければ何もしない）。
+    """
+    if _recorder.get() is None:
+        yield
+        return
+
+    parent = _frame.get()
+    scope = _StageFrame(None, parent)
+    token = _frame.set(scope)
+    try:
+        yield
+    finally:
+        _frame.reset(token)
+        child_seconds = scope.close()
+        if parent is not None and parent.is_open():
+            parent.add_child(child_seconds)
+
+
+@contextmanager
+def stage(name: Stage) -> Iterator[None]:
+    """ブロックの所要時間をステージ name に加算する（記録先がなければ何もしない）。
+
+    Args:
+        name: ステージ
+    """
+    recorder = _recorder.get()
+    if recorder is None:
+        yield
+        return
+
+    parent = _frame.get()
+    frame = _StageFrame(name, parent)
+    token = _frame.set(frame)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        _frame.reset(token)
+        child_seconds = frame.close()
+        # 外側の区間が終了済み（打ち切られたスレッドなど）の場合は記録しない
+        if parent is None or (parent.is_open() and parent.add_child(elapsed)):
+            recorder.add(name, seconds=max(elapsed - child_seconds, 0.0), calls=1)
+
+
+def add_tokens(input_tokens: int, output_tokens: int = 0) -> None:
+    """実行中のステージにトークン数を加算する（ステージ外・記録先なしの場合は何もしない）。
+
+    Args:
+        input_tokens: 入力トークン数
+        output_tokens: 出力トークン数
+    """
+    recorder = _recorder.get()
+    frame = _frame.get()
+    if recorder is None or frame is None or frame.name is None or not frame.is_open():
+        return
+    recorder.add(frame.name, input_tokens=input_tokens, output_tokens=output_tokens)
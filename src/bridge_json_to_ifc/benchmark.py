@@ -0,0 +1,479 @@
+"""Senkei → IFC 変換のベンチマーク。
+
+convert_simple_to_senkei でパラメトリックな BridgeDesign（主桁本数 × パネル数 × 支間長のグリッド）を生成し、
+IFC までの変換ごとに所要時間・最大常駐メモリ・IFC エンティティ数・ファイルサイズを記録する。
+結果は JSON に保存し、ベースラインとの比較とケース間のスケーリング（IFC エンティティ数に対する所要時間の
+両対数の傾き）で、DefBridge とその部材生成関数の超線形な劣化を検出する。
+
+使い方:
+    # 既定のグリッドを実行し、data/benchmark/ifc_baseline.json があれば比較する
+    uv run python -m src.bridge_json_to_ifc.benchmark run
+
+    # 結果をベースラインとして保存する
+    uv run python -m src.bridge_json_to_ifc.benchmark run --update_baseline
+
+    # グリッドを絞って実行する
+    uv run python -m src.bridge_json_to_ifc.benchmark run --num_girders "[3,6]" --num_panels "[4,16]" --spans_m "[20]"
+
+    # 保存済みの結果をベースラインと比較する
+    uv run python -m src.bridge_json_to_ifc.benchmark compare data/benchmark/ifc_benchmark_20260101_120000.json
+"""
+
+from __future__ import annotations
+
+import os
+import platform
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import fire
+import ifcopenshell
+import numpy as np
+from pydantic import BaseModel, Field
+
+from src.bridge_agentic_generate.config import app_config
+from src.bridge_agentic_generate.designer.models import (
+    BridgeDesign,
+    Components,
+    CrossbeamSection,
+    Deck,
+    Dimensions,
+    GirderSection,
+    Sections,
+)
+from src.bridge_agentic_generate.logger_config import logger
+from src.bridge_json_to_ifc.convert_simple_to_senkei_json import convert_simple_to_senkei
+from src.bridge_json_to_ifc.ifc_utils_new.core import DefBridge
+from src.bridge_json_to_ifc.run_convert import senkei_spec_dict
+from src.process_context import worker_context
+
+# 既定のグリッド（主桁本数 × パネル数 × 支間長）
+DEFAULT_NUM_GIRDERS = [3, 4, 6, 8, 10]
+DEFAULT_NUM_PANELS = [4, 8, 16, 24, 40]
+DEFAULT_SPANS_M = [20.0, 40.0, 60.0, 80.0]
+
+# 設計の固定寸法 [mm]
+GIRDER_SPACING = 2500.0
+OVERHANG = 1000.0
+
+# ベースラインのファイル名（app_config.benchmark_dir 直下）
+BASELINE_FILENAME = "ifc_baseline.json"
+
+# ベースラインより所要時間がこの比率を超えて増えたケースを劣化とする
+DEFAULT_TIME_TOLERANCE = 0.5
+# スケーリングの指数がベースラインよりこの値を超えて増えた場合を劣化とする
+DEFAULT_EXPONENT_TOLERANCE = 0.15
+# 指数を求めるのに必要なケース数
+MIN_SCALING_POINTS = 3
+
+# ワーカープロセスで forkserver が事前に import するモジュール（CLI として実行した本モジュールは含めない。
+# forkserver がない環境では spawn でワーカーを起動し、ワーカーごとに import する）
+WORKER_PRELOAD_MODULES = ["src.bridge_json_to_ifc.ifc_utils_new.core.DefBridge"]
+
+
+class BenchmarkCase(BaseModel):
+    """ベンチマークケース（グリッドの1点）。
+
+    Attributes:
+        case_id: ケースID（例: "G6_P16_L40"）
+        num_girders: 主桁本数
+        num_panels: パネル数
+        span_m: 支間長（橋長）[m]
+    """
+
+    case_id: str = Field(..., description="ケースID（例: G6_P16_L40）")
+    num_girders: int = Field(..., description="主桁本数")
+    num_panels: int = Field(..., description="パネル数")
+    span_m: float = Field(..., description="支間長（橋長）[m]")
+
+
+class BenchmarkResult(BaseModel):
+    """ベンチマークケース1件の計測結果。
+
+    Attributes:
+        case: ベンチマークケース
+        senkei_seconds: BridgeDesign → SenkeiSpec の所要時間 [s]（試行の最小値）
+        ifc_seconds: SenkeiSpec → IFC の所要時間 [s]（フェーズの合計、試行の最小値）
+        phase_seconds: フェーズ名 → 所要時間 [s]（ifc_seconds が最小の試行）
+        phase_entities: フェーズ名 → 作成した IFC エンティティ数
+        peak_rss_mb: 変換したワーカープロセスの最大常駐メモリ [MB]（取得できない環境では None）
+        entity_count: IFC エンティティ数
+        element_count: 生成された要素（IfcBeam）数
+        file_size_bytes: IFC ファイルサイズ [byte]
+    """
+
+    case: BenchmarkCase = Field(..., description="ベンチマークケース")
+    senkei_seconds: float = Field(..., description="BridgeDesign → SenkeiSpec の所要時間 [s]")
+    ifc_seconds: float = Field(..., description="SenkeiSpec → IFC の所要時間 [s]")
+    phase_seconds: dict[str, float] = Field(default_factory=dict, description="フェーズ名 → 所要時間 [s]")
+    phase_entities: dict[str, int] = Field(default_factory=dict, description="フェーズ名 → 作成したエンティティ数")
+    peak_rss_mb: float | None = Field(default=None, description="ワーカープロセスの最大常駐メモリ [MB]")
+    entity_count: int = Field(..., description="IFC エンティティ数")
+    element_count: int = Field(..., description="生成された要素数")
+    file_size_bytes: int = Field(..., description="IFC ファイルサイズ [byte]")
+
+
+class BenchmarkReport(BaseModel):
+    """ベンチマーク全体の結果（ベースラインと同じ形式）。
+
+    Attributes:
+        created_at: 実行日時（ISO 8601）
+        environment: 実行環境（Python・ifcopenshell・numpy のバージョン、プラットフォーム、CPU 数）
+        repeats: ケースごとの試行回数
+        results: ケースごとの計測結果
+        scaling: "total" / フェーズ名 → IFC エンティティ数に対する所要時間の両対数の傾き
+    """
+
+    created_at: str = Field(..., description="実行日時（ISO 8601）")
+    environment: dict[str, str] = Field(default_factory=dict, description="実行環境")
+    repeats: int = Field(..., description="ケースごとの試行回数")
+    results: list[BenchmarkResult] = Field(default_factory=list, description="ケースごとの計測結果")
+    scaling: dict[str, float] = Field(default_factory=dict, description="所要時間のスケーリング指数")
+
+
+def benchmark_cases(
+    num_girders: list[int] | None = None,
+    num_panels: list[int] | None = None,
+    spans_m: list[float] | None = None,
+) -> list[BenchmarkCase]:
+    """グリッドのベンチマークケースを返す。
+
+    Args:
+        num_girders: 主桁本数のリスト（None の場合は DEFAULT_NUM_GIRDERS）
+        num_panels: パネル数のリスト（None の場合は DEFAULT_NUM_PANELS）
+        spans_m: 支間長 [m] のリスト（None の場合は DEFAULT_SPANS_M）
+
+    Returns:
+        主桁本数 → パネル数 → 支間長の順に並べたケース
+    """
+    return [
+        BenchmarkCase(case_id=f"G{g}_P{p}_L{span:g}", num_girders=g, num_panels=p, span_m=span)
+        for g in num_girders or DEFAULT_NUM_GIRDERS
+        for p in num_panels or DEFAULT_NUM_PANELS
+        for span in spans_m or DEFAULT_SPANS_M
+    ]
+
+
+def benchmark_design(case: BenchmarkCase) -> BridgeDesign:
+    """ベンチマークケースの BridgeDesign を返す。
+
+    主桁間隔・張り出しは固定し、桁高は支間長の 1/20（横桁は主桁の 0.8 倍）とする。
+
+    Args:
+        case: ベンチマークケース
+
+    Returns:
+        BridgeDesign
+    """
+    bridge_length = case.span_m * 1000.0
+    web_height = bridge_length / 20.0
+    return BridgeDesign(
+        dimensions=Dimensions(
+            bridge_length=bridge_length,
+            total_width=GIRDER_SPACING * (case.num_girders - 1) + 2 * OVERHANG,
+            num_girders=case.num_girders,
+            girder_spacing=GIRDER_SPACING,
+            panel_length=bridge_length / case.num_panels,
+            num_panels=case.num_panels,
+        ),
+        sections=Sections(
+            girder_standard=GirderSection(
+                web_height=web_height,
+                web_thickness=16.0,
+                top_flange_width=450.0,
+                top_flange_thickness=28.0,
+                bottom_flange_width=600.0,
+                bottom_flange_thickness=40.0,
+            ),
+            crossbeam_standard=CrossbeamSection(
+                total_height=web_height * 0.8,
+                web_thickness=10.0,
+                flange_width=300.0,
+                flange_thickness=14.0,
+            ),
+        ),
+        components=Components(deck=Deck(thickness=230.0)),
+    )
+
+
+def run_case(case: BenchmarkCase, work_dir: Path, repeats: int = 1) -> BenchmarkResult:
+    """1ケースを BridgeDesign から IFC まで変換して計測する。
+
+    Args:
+        case: ベンチマークケース
+        work_dir: IFC の出力先ディレクトリ
+        repeats: 試行回数（所要時間は最小値を使う）
+
+    Returns:
+        計測結果
+    """
+    design = benchmark_design(case)
+    output_path = work_dir / f"{case.case_id}.ifc"
+    best = None
+    senkei_seconds = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        spec = senkei_spec_dict(convert_simple_to_senkei(design))
+        senkei_seconds = min(senkei_seconds, time.perf_counter() - start)
+
+        ctx = DefBridge.BuildBridge(spec, str(work_dir) + "/", str(output_path), profile=True)
+        report = ctx.profiler.report()
+        if best is None or report["total_seconds"] < best["total_seconds"]:
+            best = report
+
+    return BenchmarkResult(
+        case=case,
+        senkei_seconds=senkei_seconds,
+        ifc_seconds=best["total_seconds"],
+        phase_seconds={phase["name"]: phase["seconds"] for phase in best["phases"]},
+        phase_entities={phase["name"]: phase["entities_created"] for phase in best["phases"]},
+        peak_rss_mb=best["peak_rss_mb"],
+        entity_count=best["entity_count"],
+        element_count=best["element_count"],
+        file_size_bytes=output_path.stat().st_size,
+    )
+
+
+def scaling_exponents(results: list[BenchmarkResult]) -> dict[str, float]:
+    """IFC エンティティ数に対する所要時間の両対数の傾きを返す。
+
+    傾きが 1 の場合は線形、1 を超える場合は超線形に増える。フェーズごとの傾きは、
+    そのフェーズが作成したエンティティ数に対して求める。
+
+    Args:
+        results: ケースごとの計測結果
+
+    Returns:
+        "total" / フェーズ名 → 傾き（エンティティ数の異なるケースが MIN_SCALING_POINTS 未満の場合は含めない）
+    """
+    series: dict[str, list[tuple[float, float]]] = {"total": []}
+    for result in results:
+        series["total"].append((result.entity_count, result.ifc_seconds))
+        for name, entities in result.phase_entities.items():
+            series.setdefault(name, []).append((entities, result.phase_seconds.get(name, 0.0)))
+
+    exponents = {}
+    for name, points in series.items():
+        points = [(x, y) for x, y in points if x > 0 and y > 0]
+        if len({x for x, _ in points}) < MIN_SCALING_POINTS:
+            continue
+        x, y = np.log(np.array(points)).T
+        exponents[name] = float(np.polyfit(x, y, 1)[0])
+    return exponents
+
+
+def _run_case_in_worker(case: dict[str, Any], work_dir: str, repeats: int) -> dict[str, Any]:
+    """ワーカープロセスで run_case を実行する（ケース・結果は辞書で受け渡す）。
+
+    部材ごとの進捗表示（標準出力）は捨てる。
+    """
+    with open(os.devnull, "w", encoding="utf-8") as devnull, redirect_stdout(devnull):
+        return run_case(BenchmarkCase.model_validate(case), Path(work_dir), repeats).model_dump()
+
+
+def run_benchmark(
+    cases: list[BenchmarkCase],
+    work_dir: Path,
+    repeats: int = 1,
+    isolate: bool = True,
+) -> BenchmarkReport:
+    """ベンチマークケースを順に実行する。
+
+    isolate=True の場合はケースごとに新しいワーカープロセスで変換するため、最大常駐メモリが
+    前のケースの影響を受けない。ケースは並列に実行しない（所要時間が互いに影響しないように）。
+
+    Args:
+        cases: ベンチマークケース
+        work_dir: IFC の出力先ディレクトリ
+        repeats: ケースごとの試行回数
+        isolate: ケースごとに別プロセスで実行するか（False の場合は同じプロセスで実行する）
+
+    Returns:
+        ベンチマーク全体の結果
+    """
+    work_dir.mkdir(parents=True, exist_ok=True)
+    results = []
+    if isolate:
+        context = worker_context(WORKER_PRELOAD_MODULES)
+        with ProcessPoolExecutor(max_workers=1, mp_context=context, max_tasks_per_child=1) as executor:
+            for case in cases:
+                result = executor.submit(_run_case_in_worker, case.model_dump(), str(work_dir), repeats).result()
+                results.append(BenchmarkResult.model_validate(result))
+                _log_result(results[-1])
+    else:
+        for case in cases:
+            results.append(run_case(case, work_dir, repeats))
+            _log_result(results[-1])
+
+    return BenchmarkReport(
+        created_at=datetime.now().isoformat(timespec="seconds"),
+        environment={
+            "python": platform.python_version(),
+            "ifcopenshell": ifcopenshell.version,
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "cpu_count": str(os.cpu_count()),
+        },
+        repeats=repeats,
+        results=results,
+        scaling=scaling_exponents(results),
+    )
+
+
+def compare_reports(
+    current: BenchmarkReport,
+    baseline: BenchmarkReport,
+    time_tolerance: float = DEFAULT_TIME_TOLERANCE,
+    exponent_tolerance: float = DEFAULT_EXPONENT_TOLERANCE,
+) -> list[str]:
+    """ベンチマーク結果をベースラインと比較し、劣化・変化の一覧を返す。
+
+    Args:
+        current: 今回の結果
+        baseline: ベースライン
+        time_tolerance: 所要時間の許容増加率（0.5 の場合は 1.5 倍まで許容）
+        exponent_tolerance: スケーリング指数の許容増加量
+
+    Returns:
+        劣化・変化の説明のリスト（空の場合は劣化なし）
+    """
+    findings = []
+    baseline_results = {result.case.case_id: result for result in baseline.results}
+    for result in current.results:
+        base = baseline_results.get(result.case.case_id)
+        if base is None:
+            continue
+        if result.entity_count != base.entity_count:
+            findings.append(
+                f"{result.case.case_id}: IFC エンティティ数が変化 ({base.entity_count} → {result.entity_count})"
+            )
+        if result.ifc_seconds > base.ifc_seconds * (1 + time_tolerance):
+            findings.append(
+                f"{result.case.case_id}: 所要時間が増加 ({base.ifc_seconds:.3f}s → {result.ifc_seconds:.3f}s)"
+            )
+
+    for name, exponent in current.scaling.items():
+        base_exponent = baseline.scaling.get(name)
+        if base_exponent is not None and exponent > base_exponent + exponent_tolerance:
+            findings.append(f"{name}: スケーリング指数が増加 ({base_exponent:.2f} → {exponent:.2f})")
+    return findings
+
+
+def save_report(report: BenchmarkReport, path: Path) -> None:
+    """ベンチマーク結果を JSON に保存する。"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(report.model_dump_json(indent=2), encoding="utf-8")
+
+
+def load_report(path: Path) -> BenchmarkReport:
+    """JSON からベンチマーク結果を読み込む。"""
+    return BenchmarkReport.model_validate_json(path.read_text(encoding="utf-8"))
+
+
+def _log_result(result: BenchmarkResult) -> None:
+    """ケース1件の計測結果をログに出力する。"""
+    logger.info(
+        "%s: ifc=%.3fs senkei=%.3fs entities=%d elements=%d size=%.2fMB rss=%s",
+        result.case.case_id,
+        result.ifc_seconds,
+        result.senkei_seconds,
+        result.entity_count,
+        result.element_count,
+        result.file_size_bytes / 1e6,
+        "-" if result.peak_rss_mb is None else f"{result.peak_rss_mb:.0f}MB",
+    )
+
+
+def _log_comparison(
+    current: BenchmarkReport, baseline_path: Path, time_tolerance: float, exponent_tolerance: float
+) -> None:
+    """ベースラインとの比較結果をログに出力し、劣化があれば終了コード 1 で終了する。"""
+    findings = compare_reports(current, load_report(baseline_path), time_tolerance, exponent_tolerance)
+    if not findings:
+        logger.info("ベースライン %s との比較: 劣化なし", baseline_path)
+        return
+    logger.warning("ベースライン %s との比較: %d 件", baseline_path, len(findings))
+    for finding in findings:
+        logger.warning("  %s", finding)
+    raise SystemExit(1)
+
+
+class BenchmarkCLI:
+    """Senkei → IFC 変換のベンチマーク CLI。"""
+
+    def run(
+        self,
+        num_girders: list[int] | None = None,
+        num_panels: list[int] | None = None,
+        spans_m: list[float] | None = None,
+        repeats: int = 1,
+        output_path: str | None = None,
+        baseline_path: str | None = None,
+        update_baseline: bool = False,
+        time_tolerance: float = DEFAULT_TIME_TOLERANCE,
+        exponent_tolerance: float = DEFAULT_EXPONENT_TOLERANCE,
+    ) -> None:
+        """グリッドのベンチマークを実行し、結果を保存してベースラインと比較する。
+
+        Args:
+            num_girders: 主桁本数のリスト（省略時は DEFAULT_NUM_GIRDERS）
+            num_panels: パネル数のリスト（省略時は DEFAULT_NUM_PANELS）
+            spans_m: 支間長 [m] のリスト（省略時は DEFAULT_SPANS_M）
+            repeats: ケースごとの試行回数（所要時間は最小値を使う）
+            output_path: 結果の出力先（省略時は data/benchmark/ifc_benchmark_<日時>.json）
+            baseline_path: ベースラインのパス（省略時は data/benchmark/ifc_baseline.json）
+            update_baseline: True の場合、結果をベースラインとして保存する（比較はしない）
+            time_tolerance: 所要時間の許容増加率
+            exponent_tolerance: スケーリング指数の許容増加量
+        """
+        cases = benchmark_cases(num_girders, num_panels, spans_m)
+        logger.info("BenchmarkCLI.run: %d ケース, repeats=%d", len(cases), repeats)
+        with tempfile.TemporaryDirectory() as work_dir:
+            report = run_benchmark(cases, Path(work_dir), repeats)
+
+        for name, exponent in report.scaling.items():
+            logger.info("スケーリング指数 %s: %.2f", name, exponent)
+
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        output = Path(output_path) if output_path else app_config.benchmark_dir / f"ifc_benchmark_{timestamp}.json"
+        save_report(report, output)
+        logger.info("結果を保存: %s", output)
+
+        baseline = Path(baseline_path) if baseline_path else app_config.benchmark_dir / BASELINE_FILENAME
+        if update_baseline:
+            save_report(report, baseline)
+            logger.info("ベースラインを保存: %s", baseline)
+        elif baseline.exists():
+            _log_comparison(report, baseline, time_tolerance, exponent_tolerance)
+
+    def compare(
+        self,
+        results_path: str,
+        baseline_path: str | None = None,
+        time_tolerance: float = DEFAULT_TIME_TOLERANCE,
+        exponent_tolerance: float = DEFAULT_EXPONENT_TOLERANCE,
+    ) -> None:
+        """保存済みの結果をベースラインと比較する。
+
+        Args:
+            results_path: ベンチマーク結果の JSON
+            baseline_path: ベースラインのパス（省略時は data/benchmark/ifc_baseline.json）
+            time_tolerance: 所要時間の許容増加率
+            exponent_tolerance: スケーリング指数の許容増加量
+        """
+        baseline = Path(baseline_path) if baseline_path else app_config.benchmark_dir / BASELINE_FILENAME
+        _log_comparison(load_report(Path(results_path)), baseline, time_tolerance, exponent_tolerance)
+
+
+def main() -> None:
+    """CLI エントリーポイント。"""
+    fire.Fire(BenchmarkCLI)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+"""BridgeDesign → Senkei JSON / IFC 変換のコンテンツアドレス型キャッシュ。
+
+キーは BridgeDesign の正規化 JSON と変換器のバージョン（変換コードと ifcopenshell のバージョン）のハッシュ。
+同じ設計の2回目以降の変換では、ジオメトリを再生成せずにキャッシュ済みのファイルをコピーする
+（出力先を直接編集してもキャッシュは壊れない）。
+登録のたびに、最後に使われてから max_age_s を過ぎたエントリと、合計サイズが max_bytes を超えた分の
+古いエントリを削除する。
+
+キャッシュのレイアウト:
+    <cache_dir>/<key[:2]>/<key>/senkei.json
+    <cache_dir>/<key[:2]>/<key>/model.ifc
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import time
+from functools import lru_cache
+from pathlib import Path
+
+import ifcopenshell
+
+from src.bridge_agentic_generate.designer.models import BridgeDesign
+from src.bridge_agentic_generate.logger_config import logger
+
+CACHE_SENKEI_FILENAME = "senkei.json"
+CACHE_IFC_FILENAME = "model.ifc"
+
+# キャッシュの合計サイズの上限 [byte]
+DEFAULT_MAX_BYTES = 2 * 1024**3
+# 最後に使われてからエントリを残す期間 [s]
+DEFAULT_MAX_AGE_S = 30 * 24 * 3600.0
+
+# 変換器のソースコードのルート（この配下の .py が変わるとキャッシュキーが変わる）
+_CONVERTER_SOURCE_DIR = Path(__file__).resolve().parent
+
+
+@lru_cache(maxsize=1)
+def converter_version() -> str:
+    """変換器のバージョン（bridge_json_to_ifc 配下のソースと ifcopenshell のバージョンのハッシュ）を返す。"""
+    digest = hashlib.sha256(ifcopenshell.version.encode())
+    for path in sorted(_CONVERTER_SOURCE_DIR.rglob("*.py")):
+        digest.update(path.relative_to(_CONVERTER_SOURCE_DIR).as_posix().encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def design_cache_key(design: BridgeDesign) -> str:
+    """BridgeDesign の正規化 JSON と変換器のバージョンからキャッシュキーを作る。
+
+    Args:
+        design: 変換する設計
+
+    Returns:
+        キャッシュキー（SHA-256 の16進文字列）
+    """
+    canonical = json.dumps(design.model_dump(mode="json"), sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(f"{converter_version()}\n{canonical}".encode()).hexdigest()
+
+
+def copy_atomic(src: Path, dst: Path) -> None:
+    """src を dst にコピーする。
+
+    一時ファイルを経由して置き換えるため、既存の dst（他のファイルとリンクしている場合も含む）の中身は書き換えない。
+
+    Args:
+        src: 元ファイル
+        dst: 出力先（既存のファイルは置き換える）
+    """
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = dst.with_name(f"{dst.name}.{os.getpid()}.tmp")
+    tmp_path.unlink(missing_ok=True)
+    shutil.copy2(src, tmp_path)
+    os.replace(tmp_path, dst)
+
+
+class ConversionCache:
+    """変換結果（Senkei JSON / IFC）のキャッシュ。
+
+    複数プロセスから同時に使える（書き込みは一時ファイル経由で置き換え、IFC を最後に置く）。
+    登録時・取り出し時ともにコピーするため、出力先を編集・置き換えてもキャッシュは壊れない。
+    エントリの最終使用時刻は IFC の更新時刻で表し、取り出すたびに更新する。
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_age_s: float = DEFAULT_MAX_AGE_S,
+    ):
+        """初期化。
+
+        Args:
+            cache_dir: キャッシュのルートディレクトリ
+            max_bytes: キャッシュの合計サイズの上限 [byte]
+            max_age_s: 最後に使われてからエントリを残す期間 [s]
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.max_age_s = max_age_s
+
+    def _entry_dir(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / key
+
+    def contains(self, key: str, with_senkei: bool = True) -> bool:
+        """キーの変換結果がキャッシュにあるかを返す。
+
+        Args:
+            key: キャッシュキー
+            with_senkei: Senkei JSON もキャッシュにあることを要求するかどうか
+        """
+        entry_dir = self._entry_dir(key)
+        if with_senkei and not (entry_dir / CACHE_SENKEI_FILENAME).is_file():
+            return False
+        return (entry_dir / CACHE_IFC_FILENAME).is_file()
+
+    def restore(self, key: str, senkei_path: Path | None, ifc_path: Path) -> bool:
+        """キャッシュ済みの変換結果を出力先にコピーする。
+
+        コピー中に他のプロセスがエントリを削除した場合はキャッシュミスとして扱う。
+
+        Args:
+            key: キャッシュキー
+            senkei_path: Senkei JSON の出力先（None の場合は IFC のみ）
+            ifc_path: IFC の出力先
+
+        Returns:
+            キャッシュヒットした場合 True
+        """
+        if not self.contains(key, with_senkei=senkei_path is not None):
+            return False
+        entry_dir = self._entry_dir(key)
+        try:
+            if senkei_path is not None:
+                copy_atomic(entry_dir / CACHE_SENKEI_FILENAME, senkei_path)
+            copy_atomic(entry_dir / CACHE_IFC_FILENAME, ifc_path)
+            os.utime(entry_dir / CACHE_IFC_FILENAME)
+        except FileNotFoundError:
+            logger.info("ConversionCache: 取り出し中にエントリが削除されました %s", key[:12])
+            return False
+        logger.info("ConversionCache: ヒット %s → %s", key[:12], ifc_path)
+        return True
+
+    def save(self, key: str, senkei_path: Path | None, ifc_path: Path) -> None:
+        """変換結果をキャッシュに登録し、期限切れ・上限超過のエントリを削除する。
+
+        Args:
+            key: キャッシュキー
+            senkei_path: 生成済みの Senkei JSON（None の場合は IFC のみ登録する）
+            ifc_path: 生成済みの IFC
+        """
+        entry_dir = self._entry_dir(key)
+        if senkei_path is not None:
+            copy_atomic(senkei_path, entry_dir / CACHE_SENKEI_FILENAME)
+        copy_atomic(ifc_path, entry_dir / CACHE_IFC_FILENAME)
+        os.utime(entry_dir / CACHE_IFC_FILENAME)
+        self.prune(keep=key)
+
+    def prune(self, keep: str | None = None) -> None:
+        """最後に使われてから max_age_s を過ぎたエントリと、合計サイズが max_bytes を超えた分を古い順に削除する。
+
+        Args:
+            keep: 削除しないエントリのキー（登録直後のエントリ）
+        """
+        entries: list[tuple[float, int, Path]] = []
+        for entry_dir in self.cache_dir.glob("*/*"):
+            try:
+                last_used = (entry_dir / CACHE_IFC_FILENAME).stat().st_mtime
+                size = sum(path.stat().st_size for path in entry_dir.iterdir())
+            except FileNotFoundError:
+                # 登録途中（IFC がまだない）または他のプロセスが削除中のエントリ
+                continue
+            entries.append((last_used, size, entry_dir))
+
+        now = time.time()
+        total_bytes = sum(size for _, size, _ in entries)
+        for last_used, size, entry_dir in sorted(entries, key=lambda entry: entry[0]):
+            if entry_dir.name == keep:
+                continue
+            if now - last_used <= self.max_age_s and total_bytes <= self.max_bytes:
+                break
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            total_bytes -= size
+            logger.info("ConversionCache: エントリを削除 %s", entry_dir.name[:12])
@@ -2,33 +2,84 @@
 
 from __future__ import annotations
 
+import copy
 from pathlib import Path
+from typing import Any
 
 import fire
 
 from src.bridge_agentic_generate.logger_config import logger
-from src.bridge_json_to_ifc.ifc_utils_new.core import DefBridge, DefIFC
+from src.bridge_json_to_ifc.ifc_utils_new.core import DefBridge
+from src.bridge_json_to_ifc.ifc_utils_new.core.DefProfile import PhaseProfiler
 
 
-def convert_senkei_to_ifc(input_path: Path, output_path: Path) -> int:
+def convert_senkei_to_ifc(
+    input_path: Path,
+    output_path: Path,
+    profile: bool = False,
+    profile_stats: bool = False,
+) -> int:
     """SenkeiSpec JSON を IFC に変換。
 
     Args:
         input_path: 入力JSONファイルパス
         output_path: 出力IFCファイルパス
+        profile: True の場合、フェーズごとの処理時間・メモリ・IFCエンティティ数を計測し、
+            出力IFCと同じ場所に <IFC名>.profile.json を出力する
+        profile_stats: True の場合、フェーズごとの cProfile 統計（<IFC名>.<フェーズ名>.prof）も出力する
 
     Returns:
         生成された要素数
     """
-    DefIFC.clear_generated_element_names()
-
-    DefBridge.RunBridge(
+    ctx = DefBridge.RunBridge(
         str(input_path.parent) + "/",
         input_path.name,
         str(output_path),
+        profile=profile,
+        profile_stats=profile_stats,
+    )
+
+    element_count = len(ctx.generated_element_names)
+    logger.info(f"IFC生成完了: {element_count}個の要素")
+    if ctx.profiler is not None:
+        _log_profile(ctx.profiler)
+    return element_count
+
+
+def _log_profile(profiler: PhaseProfiler) -> None:
+    """フェーズごとの計測結果をログに出力する。"""
+    for phase in profiler.phases:
+        logger.info(
+            f"  {phase['name']}: {phase['seconds']:.3f}s, "
+            f"エンティティ {phase['entities_created']}個, 要素 {phase['elements_created']}個"
+        )
+    logger.info(f"計測レポート: {profiler.report_path}")
+
+
+def build_ifc_from_spec(
+    spec: dict[str, Any],
+    output_path: Path,
+    damage_info: dict[str, Any] | None = None,
+) -> int:
+    """SenkeiSpec の辞書から直接 IFC を生成する（Senkei JSON ファイルを経由しない）。
+
+    Args:
+        spec: SenkeiSpec の辞書（SenkeiSpec.model_dump(mode="json", by_alias=True, exclude_none=True) の形式）
+        output_path: 出力IFCファイルパス
+        damage_info: damage_info.json と同じ構造の損傷情報（省略時は損傷情報なし）
+
+    Returns:
+        生成された要素数
+    """
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    ctx = DefBridge.BuildBridge(
+        copy.deepcopy(spec),
+        str(output_path.parent) + "/",
+        str(output_path),
+        damage_info=DefBridge.parse_damage_info(damage_info) if damage_info else None,
     )
 
-    element_count = len(DefIFC.get_generated_element_names())
+    element_count = len(ctx.generated_element_names)
     logger.info(f"IFC生成完了: {element_count}個の要素")
     return element_count
 
@@ -36,12 +87,16 @@ def convert_senkei_to_ifc(input_path: Path, output_path: Path) -> int:
 def convert(
     input_path: str,
     output_path: str | None = None,
+    profile: bool = False,
+    profile_stats: bool = False,
 ) -> None:
     """CLI エントリーポイント。
 
     Args:
         input_path: 入力JSONファイルパス
         output_path: 出力IFCファイルパス（省略時は入力と同名.ifc）
+        profile: フェーズごとの計測レポート（<IFC名>.profile.json）を出力するか
+        profile_stats: フェーズごとの cProfile 統計（<IFC名>.<フェーズ名>.prof）も出力するか
     """
     input_p = Path(input_path)
 
@@ -55,7 +110,7 @@ def convert(
     logger.info(f"入力: {input_p}")
     logger.info(f"出力: {output_p}")
 
-    convert_senkei_to_ifc(input_p, output_p)
+    convert_senkei_to_ifc(input_p, output_p, profile=profile, profile_stats=profile_stats)
 
 
 def main() -> None:
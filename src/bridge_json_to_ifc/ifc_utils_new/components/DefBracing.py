@@ -15,7 +15,7 @@ from src.bridge_json_to_ifc.ifc_utils_new.components.DefGusset import Calculate_
 
 # DefSlot.pyの関数をインポート
 from src.bridge_json_to_ifc.ifc_utils_new.components.DefSlot import Draw_3Dsolid_Slot
-from src.bridge_json_to_ifc.ifc_utils_new.core import DefIFC, DefMath
+from src.bridge_json_to_ifc.ifc_utils_new.core import DefContext, DefIFC, DefMath
 from src.bridge_json_to_ifc.ifc_utils_new.io import DefStrings
 
 # DefBridgeUtils.pyの関数をインポート
@@ -27,17 +27,12 @@ from src.bridge_json_to_ifc.ifc_utils_new.utils.DefBridgeUtils import (
     Load_Coordinate_PolLine,
 )
 
-# グローバル変数: ログファイル出力関数（DefBridge.pyから設定される）
-log_print_func = None
-
-
 def _log_print(*args, **kwargs):
     """ログファイル出力関数（DEBUG_MODE時のみ出力）"""
-    if log_print_func:
-        try:
-            log_print_func(*args, **kwargs)
-        except Exception:
-            pass  # ログ出力エラーは無視
+    try:
+        DefContext.log_print(*args, **kwargs)
+    except Exception:
+        pass  # ログ出力エラーは無視
 
 
 def Find_number_block_MainPanel_Have_Vstiff(Senkei_data, Data_MainPanel, Sec_SubPanel):
@@ -575,18 +570,35 @@ def Draw_3DSolid_Bolt_Yokokou(ifc_all, arCoord_hole, gap_cen_to_head, gap_cen_to
 
     for i in range(len(arCoord_hole)):
         for i_1 in range(len(arCoord_hole[i])):
-            solid_bolt = DefIFC.Draw_Solid_Bolt(
-                ifc_file, arCoord_hole[i][i_1], 26.5, gap_cen_to_head, gap_cen_to_nut, p1_3d, pz, p2_3d
-            )
-            shape_representation = ifc_file.createIfcShapeRepresentation(
-                ContextOfItems=geom_context,
-                RepresentationIdentifier="Body",
-                RepresentationType="Brep",
-                Items=[solid_bolt],
+            shape_representation = DefIFC.Draw_Mapped_Bolt(
+                ifc_file,
+                geom_context,
+                arCoord_hole[i][i_1],
+                26.5,
+                gap_cen_to_head,
+                gap_cen_to_nut,
+                p1_3d,
+                pz,
+                p2_3d,
             )
             DefIFC.Add_shape_representation_in_Beam(ifc_file, bridge_span, shape_representation, "Bolt")
 
 
+def _Hole_Grid(ps_lineV, pe_lineV, ps_lineH, pe_lineH):
+    """
+    縦線と横線の交点（ボルト孔の中心）を縦線ごとのリストにする
+
+    Args:
+        ps_lineV, pe_lineV: 縦線の始点・終点の配列 (N, 2)
+        ps_lineH, pe_lineH: 横線の始点・終点の配列 (M, 2)
+
+    Returns:
+        孔中心のリストのリスト（[縦線][横線]。交点がない孔は None）
+    """
+    grid = DefMath.Intersec_line_line_grid(ps_lineV, pe_lineV, ps_lineH, pe_lineH)
+    return [[None if np.isnan(p[0]) else p for p in row] for row in grid]
+
+
 def Caculate_Coord_Hole_Yokokou(infor_hole, pointbase_hole, pos):
     d_hole, pitchX_hole, pitchY_hole = infor_hole
     pointdirX_hole = pointbase_hole.copy()
@@ -600,27 +612,13 @@ def Caculate_Coord_Hole_Yokokou(infor_hole, pointbase_hole, pos):
     arpitchY_hole = DefStrings.process_array(arpitchY_hole)
     total_pitchY = sum(arpitchY_hole)
     ps_linebH, pe_linebH = DefMath.Offset_Line(pointbase_hole[:2], pointdirX_hole[:2], total_pitchY / 2)
-    arCoor_hole = []
-    sumx = 0
-    for i in range(len(arpitchX_hole)):
-        sumx += float(arpitchX_hole[i])
-        if pos == "S":
-            ps_lineV, pe_lineV = DefMath.Offset_Line(pointbase_hole[:2], pointdirY_hole[:2], -sumx)
-        elif pos == "E":
-            ps_lineV, pe_lineV = DefMath.Offset_Line(pointbase_hole[:2], pointdirY_hole[:2], -sumx)
-        arCoor_hole_Y = []
-        sumy = 0
-        for i_1 in range(len(arpitchY_hole) - 1):
-            sumy += arpitchY_hole[i_1]
-            ps_lineH, pe_lineH = DefMath.Offset_Line(ps_linebH, pe_linebH, -sumy)
-
-            p = DefMath.Intersec_line_line(ps_lineV, pe_lineV, ps_lineH, pe_lineH)
 
-            arCoor_hole_Y.append(p)
-
-        arCoor_hole.append(arCoor_hole_Y)
-
-    return arCoor_hole
+    # 縦線（X方向のピッチ）と横線（Y方向のピッチ）の交点をまとめて計算する
+    sumx = np.cumsum([float(pitch) for pitch in arpitchX_hole])
+    sumy = np.cumsum(arpitchY_hole[:-1])
+    ps_lineV, pe_lineV = DefMath.Offset_Line_batch(pointbase_hole[:2], pointdirY_hole[:2], -sumx)
+    ps_lineH, pe_lineH = DefMath.Offset_Line_batch(ps_linebH, pe_linebH, -sumy)
+    return _Hole_Grid(ps_lineV, pe_lineV, ps_lineH, pe_lineH)
 
 
 def Calculate_Pse_Shape(pitchmod_shape, psmod, pemod, dirpitch="XY"):
@@ -646,11 +644,6 @@ def Calculate_Pse_Shape(pitchmod_shape, psmod, pemod, dirpitch="XY"):
     return ps_shape, pe_shape
 
 
-# グローバル変数（DefBridge.pyから設定される）
-start_point_bridge = None
-unit_vector_bridge = None
-
-
 def Calculate_edge_Guss_P(MainPanel_data, Senkei_data, nameWeb_mainpanel, pbase, pplan1, pplan2):
     for panel in MainPanel_data:
         if panel["Name"] == nameWeb_mainpanel:
@@ -774,6 +767,8 @@ def Calculate_PointMod_Guss_follow_Yokokou(shape_yokokou, arCoordPoint_Yokokou,
 def Calculate_Face_Guss_follow_Yokokou(
     shape_yokokou, arCoordPoint_Yokokou, type_yokokou, namepoint_guss, distedge_face, p1_fb, p2_fb, pos
 ):
+    # 橋軸（実行中の BridgeContext から取得）
+    start_point_bridge, unit_vector_bridge = DefContext.bridge_axis()
     for shape in shape_yokokou:
         name_shape = shape["Name"]
         infor_shape = shape["Infor"]
@@ -990,6 +985,8 @@ def Calculate_Point_Vstiff_Taikeikou(width_vstiff, pb1_tai, pb2_tai, pb3_tai, pb
 def Calculate_Face_Base_Guss_follow_Yokokou(
     shape_yokokou, arCoordPoint_Yokokou, type_yokokou, coordpoint_guss, distedge_face
 ):
+    # 橋軸（実行中の BridgeContext から取得）
+    start_point_bridge, unit_vector_bridge = DefContext.bridge_axis()
     psL_shape = psR_shape = peL_shape = peR_shape = None
 
     for shape in shape_yokokou:
@@ -3283,8 +3280,9 @@ def Draw_3DSolid_Bolt_Taikeikou(ifc_all, arCoord_hole, gap_cen_to_head, gap_cen_
         if not arCoord_hole[i] or len(arCoord_hole[i]) == 0:
             continue
         for i_1 in range(len(arCoord_hole[i])):
-            solid_bolt = DefIFC.Draw_Solid_Bolt(
+            shape_representation = DefIFC.Draw_Mapped_Bolt(
                 ifc_file,
+                geom_context,
                 arCoord_hole[i][i_1],
                 26.5,
                 gap_cen_to_head,
@@ -3293,12 +3291,6 @@ def Draw_3DSolid_Bolt_Taikeikou(ifc_all, arCoord_hole, gap_cen_to_head, gap_cen_
                 p1_3d + 100 * DefMath.Normal_vector(p1_3d, p2_3d, p3_3d),
                 p2_3d,
             )
-            shape_representation = ifc_file.createIfcShapeRepresentation(
-                ContextOfItems=geom_context,
-                RepresentationIdentifier="Body",
-                RepresentationType="Brep",
-                Items=[solid_bolt],
-            )
             DefIFC.Add_shape_representation_in_Beam(ifc_file, bridge_span, shape_representation, "Bolt")
 
 
@@ -3387,30 +3379,16 @@ def Caculate_Coord_Hole_Taikeikou(infor_hole, pointbase_hole, pos):
     arpitchY_hole = str(pitchY_hole).split("/")
     arpitchY_hole = DefStrings.process_array(arpitchY_hole)
 
-    arCoor_hole = []
-    sumx = 0
-    for i in range(len(arpitchX_hole)):
-        sumx += float(arpitchX_hole[i])
-        if pos == "TL" or pos == "BL":
-            ps_lineV, pe_lineV = DefMath.Offset_Line(pointbase_hole[:2], pointdirY_hole[:2], sumx)
-        elif pos == "TR" or pos == "BR":
-            ps_lineV, pe_lineV = DefMath.Offset_Line(pointbase_hole[:2], pointdirY_hole[:2], -sumx)
-
-        arCoor_hole_Y = []
-        sumy = 0
-        for i_1 in range(len(arpitchY_hole)):
-            sumy += arpitchY_hole[i_1]
-            if pos == "TL" or pos == "TR":
-                ps_lineH, pe_lineH = DefMath.Offset_Line(pointbase_hole[:2], pointdirX_hole[:2], -sumy)
-            elif pos == "BL" or pos == "BR":
-                ps_lineH, pe_lineH = DefMath.Offset_Line(pointbase_hole[:2], pointdirX_hole[:2], sumy)
-
-            p = DefMath.Intersec_line_line(ps_lineV, pe_lineV, ps_lineH, pe_lineH)
-            arCoor_hole_Y.append(p)
-
-        arCoor_hole.append(arCoor_hole_Y)
-
-    return arCoor_hole
+    # 縦線（X方向のピッチ）と横線（Y方向のピッチ）の交点をまとめて計算する
+    sumx = np.cumsum([float(pitch) for pitch in arpitchX_hole])
+    sumy = np.cumsum(arpitchY_hole)
+    if pos == "TR" or pos == "BR":
+        sumx = -sumx
+    if pos == "TL" or pos == "TR":
+        sumy = -sumy
+    ps_lineV, pe_lineV = DefMath.Offset_Line_batch(pointbase_hole[:2], pointdirY_hole[:2], sumx)
+    ps_lineH, pe_lineH = DefMath.Offset_Line_batch(pointbase_hole[:2], pointdirX_hole[:2], sumy)
+    return _Hole_Grid(ps_lineV, pe_lineV, ps_lineH, pe_lineH)
 
 
 def Calculate_DistModX_Shape(vstiff_taikeikou, guss_taikeikou, gau_guss, gau_shape, size_shape, type_shape):
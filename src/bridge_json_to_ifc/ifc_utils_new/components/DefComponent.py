@@ -6,17 +6,12 @@
 import numpy as np
 import pandas as pd
 
-from src.bridge_json_to_ifc.ifc_utils_new.core import DefIFC, DefMath
+from src.bridge_json_to_ifc.ifc_utils_new.core import DefContext, DefIFC, DefMath
 from src.bridge_json_to_ifc.ifc_utils_new.utils import DefBridgeUtils
 
-# グローバル変数: ログファイル出力関数（DefBridge.pyから設定される）
-log_print_func = None
-
-
 def _log_print(*args, **kwargs):
     """ログファイル出力関数（DEBUG_MODE時のみ出力）"""
-    if log_print_func:
-        log_print_func(*args, **kwargs)
+    DefContext.log_print(*args, **kwargs)
 
 
 def _calculate_x_break_positions(break_x, x_min, x_max, Senkei_data, sec_shouban):
@@ -905,7 +900,7 @@ def Draw_Corner(ifc_file, corner, pcorner, pdirX, pdirY):
         trans_profile = ifc_file.createIfcArbitraryClosedProfileDef("AREA", None, trans_polyline)
 
         # 移動したプロファイルでsolid extrusionを作成
-        extrusion_dir = ifc_file.createIfcDirection(normalvector)
+        extrusion_dir = DefIFC.create_direction(ifc_file, normalvector)
         solid_corner = ifc_file.createIfcExtrudedAreaSolid(trans_profile, None, extrusion_dir, 100)
 
     return solid_corner
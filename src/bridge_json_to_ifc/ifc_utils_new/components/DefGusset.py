@@ -5,22 +5,13 @@
 
 import numpy as np
 
-from src.bridge_json_to_ifc.ifc_utils_new.core import DefIFC, DefMath
+from src.bridge_json_to_ifc.ifc_utils_new.core import DefContext, DefIFC, DefMath
 from src.bridge_json_to_ifc.ifc_utils_new.io import DefStrings
 from src.bridge_json_to_ifc.ifc_utils_new.utils import DefBridgeUtils
 
-# グローバル変数: ログファイル出力関数（DefBridge.pyから設定される）
-log_print_func = None
-
-# グローバル変数: 橋梁の方向ベクトル（DefBridge.pyから設定される）
-start_point_bridge = None
-unit_vector_bridge = None
-
-
 def _log_print(*args, **kwargs):
     """ログファイル出力関数（DEBUG_MODE時のみ出力）"""
-    if log_print_func:
-        log_print_func(*args, **kwargs)
+    DefContext.log_print(*args, **kwargs)
 
 
 def Calculate_edge_Guss_Constant(
@@ -214,6 +205,8 @@ def Calculate_Face_Guss_follow_Yokokou(
 ):
     # Lazy import to avoid circular dependency
     from src.bridge_json_to_ifc.ifc_utils_new.core.DefBridge import Calculate_Point_Cross_Yokokou, Calculate_Pse_Shape
+    # 橋軸（実行中の BridgeContext から取得）
+    start_point_bridge, unit_vector_bridge = DefContext.bridge_axis()
 
     for shape in shape_yokokou:
         name_shape = shape["Name"]
@@ -348,6 +341,8 @@ def Calculate_Face_Base_Guss_follow_Yokokou(
 ):
     # Lazy import to avoid circular dependency
     from src.bridge_json_to_ifc.ifc_utils_new.core.DefBridge import Calculate_Point_Cross_Yokokou, Calculate_Pse_Shape
+    # 橋軸（実行中の BridgeContext から取得）
+    start_point_bridge, unit_vector_bridge = DefContext.bridge_axis()
 
     psL_shape = psR_shape = peL_shape = peR_shape = None
 
@@ -8,20 +8,15 @@ import math
 
 import numpy as np
 
-from src.bridge_json_to_ifc.ifc_utils_new.core import DefIFC, DefMath
+from src.bridge_json_to_ifc.ifc_utils_new.core import DefContext, DefIFC, DefMath
 from src.bridge_json_to_ifc.ifc_utils_new.io import DefStrings
 
 # DefBridgeUtils.pyの関数をインポート
 from src.bridge_json_to_ifc.ifc_utils_new.utils.DefBridgeUtils import Calculate_Extend_Coord, Load_Coordinate_Panel
 
-# グローバル変数: ログファイル出力関数（DefBridge.pyから設定される）
-log_print_func = None
-
-
 def _log_print(*args, **kwargs):
     """ログファイル出力関数（DEBUG_MODE時のみ出力）"""
-    if log_print_func:
-        log_print_func(*args, **kwargs)
+    DefContext.log_print(*args, **kwargs)
 
 
 # ---------------パネルブレークケース------------------------------
@@ -129,12 +124,15 @@ def Devide_Coord_FLG_mainpanel_break(arCoordLines_Mod, arLength_panel):
             - arCoordLines_Mod_new: 分割点が挿入された座標線の配列
             - ar_pos: 分割位置のインデックス配列
     """
-    _log_print(f"    [BREAK DEBUG] Devide_Coord_FLG_mainpanel_break開始: arLength_panel={arLength_panel}")
-    _log_print(
-        f"    [BREAK DEBUG] 座標線の数={len(arCoordLines_Mod)}, 最初の線の点の数={len(arCoordLines_Mod[0]) if len(arCoordLines_Mod) > 0 else 0}"
-    )
-    if len(arCoordLines_Mod) > 0 and len(arCoordLines_Mod[0]) > 0:
-        _log_print(f"    [BREAK DEBUG] 最初の点={arCoordLines_Mod[0][0]}, 最後の点={arCoordLines_Mod[0][-1]}")
+    # 分割の経過を出力するデバッグログはログ出力が有効な場合のみ作成する
+    debug_log = DefContext.log_enabled()
+    if debug_log:
+        _log_print(f"    [BREAK DEBUG] Devide_Coord_FLG_mainpanel_break開始: arLength_panel={arLength_panel}")
+        _log_print(
+            f"    [BREAK DEBUG] 座標線の数={len(arCoordLines_Mod)}, 最初の線の点の数={len(arCoordLines_Mod[0]) if len(arCoordLines_Mod) > 0 else 0}"
+        )
+        if len(arCoordLines_Mod) > 0 and len(arCoordLines_Mod[0]) > 0:
+            _log_print(f"    [BREAK DEBUG] 最初の点={arCoordLines_Mod[0][0]}, 最後の点={arCoordLines_Mod[0][-1]}")
 
     arCoordLines_Mod_new = copy.deepcopy(arCoordLines_Mod)
     pitch_length = ""
@@ -160,19 +158,23 @@ def Devide_Coord_FLG_mainpanel_break(arCoordLines_Mod, arLength_panel):
             (np.array(arCoordLines_Mod_new[0][i + 1]) + np.array(arCoordLines_Mod_new[-1][i + 1])) / 2,
         )
 
-    _log_print(f"    [BREAK DEBUG] 全体の長さ（分割前）: {length_pitch:.2f}mm")
+    if debug_log:
+        _log_print(f"    [BREAK DEBUG] 全体の長さ（分割前）: {length_pitch:.2f}mm")
     pitch_length = DefStrings.Xu_Ly_Pitch_va_Tim_X(pitch_length, length_pitch)
-    _log_print(f"    [BREAK DEBUG] 調整後のpitch_length: {pitch_length}")
 
     ar_pitch_length = pitch_length.split("/")
-    _log_print(f"    [BREAK DEBUG] ar_pitch_length: {ar_pitch_length}")
+    if debug_log:
+        _log_print(f"    [BREAK DEBUG] 調整後のpitch_length: {pitch_length}")
+        _log_print(f"    [BREAK DEBUG] ar_pitch_length: {ar_pitch_length}")
     length_pitch = 0
     ar_pos = []
     for i in range(0, len(ar_pitch_length) - 1):
         length_pitch += float(ar_pitch_length[i])
-        _log_print(
-            f"    [BREAK DEBUG] 分割[{i}]: 目標累積距離={length_pitch:.2f}mm (区間長={float(ar_pitch_length[i]):.2f}mm)"
-        )
+        if debug_log:
+            _log_print(
+                f"    [BREAK DEBUG] 分割[{i}]: 目標累積距離={length_pitch:.2f}mm "
+                f"(区間長={float(ar_pitch_length[i]):.2f}mm)"
+            )
         len_pl = 0
         # 分割点を挿入した後、座標線が更新されるため、更新された座標線を使用する
         for i_1 in range(0, len(arCoordLines_Mod_new[0]) - 1):
@@ -195,12 +197,13 @@ def Devide_Coord_FLG_mainpanel_break(arCoordLines_Mod, arLength_panel):
                 overshoot = len_pl - length_pitch
                 distance_in_segment = segment_len - overshoot
                 distance_from_current = length_pitch - len_pl_before
-                _log_print(
-                    f"    [BREAK DEBUG] 分割[{i}]: 位置{i_1 + 1}で分割点を挿入 "
-                    f"(segment_len={segment_len:.2f}mm, len_pl_before={len_pl_before:.2f}mm, "
-                    f"len_pl={len_pl:.2f}mm, 目標={length_pitch:.2f}mm, 差={overshoot:.2f}mm, "
-                    f"segment内距離={distance_in_segment:.2f}mm, start基準距離={distance_from_current:.2f}mm)"
-                )
+                if debug_log:
+                    _log_print(
+                        f"    [BREAK DEBUG] 分割[{i}]: 位置{i_1 + 1}で分割点を挿入 "
+                        f"(segment_len={segment_len:.2f}mm, len_pl_before={len_pl_before:.2f}mm, "
+                        f"len_pl={len_pl:.2f}mm, 目標={length_pitch:.2f}mm, 差={overshoot:.2f}mm, "
+                        f"segment内距離={distance_in_segment:.2f}mm, start基準距離={distance_from_current:.2f}mm)"
+                    )
                 ar_pos.append(i_1 + 1)
                 # 座標がNoneでないことを確認
                 if (
@@ -257,16 +260,20 @@ def Devide_Coord_FLG_mainpanel_break(arCoordLines_Mod, arLength_panel):
                 for i_2 in range(0, len(arCoordLines_Mod_new)):
                     arCoordLines_Mod_new[i_2].insert(i_1 + 1, coord[i_2])
 
-                inserted_mid = (np.array(coord[0]) + np.array(coord[-1])) / 2
-                _log_print(
-                    f"    [BREAK DEBUG] 分割[{i}]: 挿入点情報 -> "
-                    f"top={np.round(coord[0], 3).tolist()}, bottom={np.round(coord[-1], 3).tolist()}, "
-                    f"mid={np.round(inserted_mid, 3).tolist()}"
-                )
+                if debug_log:
+                    inserted_mid = (np.array(coord[0]) + np.array(coord[-1])) / 2
+                    _log_print(
+                        f"    [BREAK DEBUG] 分割[{i}]: 挿入点情報 -> "
+                        f"top={np.round(coord[0], 3).tolist()}, bottom={np.round(coord[-1], 3).tolist()}, "
+                        f"mid={np.round(inserted_mid, 3).tolist()}"
+                    )
 
                 break
     ar_pos.append(len(arCoordLines_Mod_new[0]) - 1)
 
+    if not debug_log:
+        return arCoordLines_Mod_new, ar_pos
+
     if len(arCoordLines_Mod_new) > 0:
         top_line = arCoordLines_Mod_new[0]
         bottom_line = arCoordLines_Mod_new[-1]
@@ -1000,8 +1007,9 @@ def Calculate_Yokogeta(ifc_all, Senkei_data, MainPanel_data, infor_yokogeta):
             _log_print("    [Yokogeta] エラー: 主桁の座標が取得できません")
             return
 
-        _log_print(f"    [Yokogeta] G1上: {p1_top}, G1下: {p1_bottom}")
-        _log_print(f"    [Yokogeta] G2上: {p2_top}, G2下: {p2_bottom}")
+        if DefContext.log_enabled():
+            _log_print(f"    [Yokogeta] G1上: {p1_top}, G1下: {p1_bottom}")
+            _log_print(f"    [Yokogeta] G2上: {p2_top}, G2下: {p2_bottom}")
 
         # 主桁上フランジの厚さを取得（Break.Thickから実際の厚さを取得）
         uf_thick1 = 0  # 上半分の厚さ
@@ -1065,7 +1073,8 @@ def Calculate_Yokogeta(ifc_all, Senkei_data, MainPanel_data, infor_yokogeta):
         # 幅方向（横桁の幅方向）
         dir_width = [dir_length[1], -dir_length[0], 0]
 
-        _log_print(f"    [Yokogeta] 長さ: {length:.2f}, 方向: {dir_length}")
+        if DefContext.log_enabled():
+            _log_print(f"    [Yokogeta] 長さ: {length:.2f}, 方向: {dir_length}")
 
         # 分割情報の取得（厚さ方向の分割）
         break_count = break_info.get("Count", 1) if break_info else 1
@@ -3,18 +3,13 @@
 スロット（切り欠き）生成関連関数
 """
 
-from src.bridge_json_to_ifc.ifc_utils_new.core import DefIFC, DefMath
+from src.bridge_json_to_ifc.ifc_utils_new.core import DefContext, DefIFC, DefMath
 from src.bridge_json_to_ifc.ifc_utils_new.io import DefStrings
 from src.bridge_json_to_ifc.ifc_utils_new.utils import DefBridgeUtils
 
-# グローバル変数: ログファイル出力関数（DefBridge.pyから設定される）
-log_print_func = None
-
-
 def _log_print(*args, **kwargs):
     """ログファイル出力関数（DEBUG_MODE時のみ出力）"""
-    if log_print_func:
-        log_print_func(*args, **kwargs)
+    DefContext.log_print(*args, **kwargs)
 
 
 def Draw_3DSolid_Slot_WebSection(
@@ -9,18 +9,13 @@ from math import cos, pi
 import numpy as np
 import pandas as pd
 
-from src.bridge_json_to_ifc.ifc_utils_new.core import DefIFC, DefMath
+from src.bridge_json_to_ifc.ifc_utils_new.core import DefContext, DefIFC, DefMath
 from src.bridge_json_to_ifc.ifc_utils_new.io import DefStrings
 from src.bridge_json_to_ifc.ifc_utils_new.utils import DefBridgeUtils
 
-# グローバル変数: ログファイル出力関数（DefBridge.pyから設定される）
-log_print_func = None
-
-
 def _log_print(*args, **kwargs):
     """ログファイル出力関数（DEBUG_MODE時のみ出力）"""
-    if log_print_func:
-        log_print_func(*args, **kwargs)
+    DefContext.log_print(*args, **kwargs)
 
 
 # ---------------------------Vstiff（垂直補剛材）---------------------------------------------------------------------------------------------
@@ -57,22 +52,22 @@ def Draw_3DSolid_Vstiff(ifc_file, Len, Width, ThickA, ThickF, SideStiff, pal1, p
     pal3_list = pal3_vector.tolist()
     axis2placement = ifc_file.createIfcAxis2Placement3D(
         DefIFC.create_cartesian_point(ifc_file, pal1_list),
-        ifc_file.createIfcDirection(pal2_list),
-        ifc_file.createIfcDirection(pal3_list),
+        DefIFC.create_direction(ifc_file, pal2_list),
+        DefIFC.create_direction(ifc_file, pal3_list),
     )
     if SideStiff == "L" or SideStiff == "A" or SideStiff == "T":
         solidA = ifc_file.createIfcExtrudedAreaSolid(
-            profile, axis2placement, ifc_file.createIfcDirection([0.0, 0.0, 1.0]), -ThickA
+            profile, axis2placement, DefIFC.create_direction(ifc_file, [0.0, 0.0, 1.0]), -ThickA
         )
         solidF = ifc_file.createIfcExtrudedAreaSolid(
-            profile, axis2placement, ifc_file.createIfcDirection([0.0, 0.0, 1.0]), ThickF
+            profile, axis2placement, DefIFC.create_direction(ifc_file, [0.0, 0.0, 1.0]), ThickF
         )
     elif SideStiff == "R" or SideStiff == "F" or SideStiff == "B":
         solidA = ifc_file.createIfcExtrudedAreaSolid(
-            profile, axis2placement, ifc_file.createIfcDirection([0.0, 0.0, 1.0]), ThickA
+            profile, axis2placement, DefIFC.create_direction(ifc_file, [0.0, 0.0, 1.0]), ThickA
         )
         solidF = ifc_file.createIfcExtrudedAreaSolid(
-            profile, axis2placement, ifc_file.createIfcDirection([0.0, 0.0, 1.0]), -ThickF
+            profile, axis2placement, DefIFC.create_direction(ifc_file, [0.0, 0.0, 1.0]), -ThickF
         )
 
     main_solid = ifc_file.createIfcBooleanResult("UNION", solidA, solidF)
@@ -883,15 +878,9 @@ def Calculate_SPL_SubPanel(
                             "S",
                         )
                         if Solid_Hole_SPL:
-                            for Solid_Hole in Solid_Hole_SPL:
-                                shape_representation = ifc_file.createIfcShapeRepresentation(
-                                    ContextOfItems=geom_context,
-                                    RepresentationIdentifier="Body",
-                                    RepresentationType="Brep",
-                                    Items=[Solid_Hole],
-                                )
+                            for bolt_representation in Solid_Hole_SPL:
                                 DefIFC.Add_shape_representation_in_Beam(
-                                    ifc_file, bridge_span, shape_representation, "Bolt"
+                                    ifc_file, bridge_span, bolt_representation, "Bolt"
                                 )
 
                     elif posJoint == "E":
@@ -914,15 +903,9 @@ def Calculate_SPL_SubPanel(
                             "E",
                         )
                         if Solid_Hole_SPL:
-                            for Solid_Hole in Solid_Hole_SPL:
-                                shape_representation = ifc_file.createIfcShapeRepresentation(
-                                    ContextOfItems=geom_context,
-                                    RepresentationIdentifier="Body",
-                                    RepresentationType="Brep",
-                                    Items=[Solid_Hole],
-                                )
+                            for bolt_representation in Solid_Hole_SPL:
                                 DefIFC.Add_shape_representation_in_Beam(
-                                    ifc_file, bridge_span, shape_representation, "Bolt"
+                                    ifc_file, bridge_span, bolt_representation, "Bolt"
                                 )
 
             # -----------------------------------------------------------------
@@ -1050,189 +1033,73 @@ def Draw_3DSolid_SPL(ifc_all, Pbase, result_load_infor_spl, Lenpj, pal1, pal2, p
 
 
 # ---------------------------Draw_Solid_Hole_SPL（SPL穴生成）---------------------------------------------------------------------------------------------
-def Draw_Solid_Hole_SPL(ifc_all, Pbase, result_load_infor_spl, Lenpj, pal1, pal2, pal3, posjoint="all"):
-    ifc_file, bridge_span, geom_context = ifc_all
-    Solid_HoleL_SPL = []
-    Solid_HoleR_SPL = []
+def Calculate_Coord_Hole_SPL(Pbase, result_load_infor_spl, Lenpj):
+    """
+    SPLのボルト孔の中心（2D座標）を計算する
+
+    縦方向（PL/PR）の各列の線と、横方向（PJ）の各行の線の交点をまとめて計算する。
+
+    Args:
+        Pbase: SPLの基準点（2D）
+        result_load_infor_spl: SPL情報 (infor, pitchj, pitchl, pitchr, out, dhole, solid)
+        Lenpj: 継手の長さ
+
+    Returns:
+        tuple: (左側の孔中心のリスト, 右側の孔中心のリスト)（孔を作成する順。交点がない孔は None）
+    """
     Lenpj = float(Lenpj)
     infor, pitchj, pitchl, pitchr, out, dhole, solid = result_load_infor_spl
-    Thick, Mat, Side, Angle, Gline = infor["Thick"], infor["Mat"], infor["Side"], infor["Ang"], infor["GLine"]
-    Angle = Angle.split("/")
-    outT, outB, outL, outR = out
-    dholeA, dholeF = dhole
+    Angle, Gline = infor["Ang"].split("/"), infor["GLine"]
     pitchl = DefStrings.process_array(pitchl)
     pitchr = DefStrings.process_array(pitchl)
 
     pitchj_str = "/".join(map(str, pitchj))
     pitchj_str = DefStrings.Xu_Ly_Pitch_va_Tim_X(pitchj_str, Lenpj)
     pitchj_new = pitchj_str.split("/")
-
-    if len(pitchj_new) == 1 and pitchj_new[0] == str(0):
-        pj1 = [0, 0]
-        pj1[0] = Pbase[0]
-        pj1[1] = Pbase[1]
-        pj2 = [0, 0]
-        pj2[0] = Pbase[0]
-        pj2[1] = Pbase[1] - 100
+    no_pitchj = len(pitchj_new) == 1 and pitchj_new[0] == str(0)
+
+    pj1 = [Pbase[0], Pbase[1]]
+    pj2 = [Pbase[0], Pbase[1] - (100 if no_pitchj else Lenpj)]
+
+    # 横方向の行の線（孔を作成する順）
+    tan_top = 100 * math.tan(math.radians(float(Angle[0]) - 90))
+    LineTop_L = [pj1[0] - 100, pj1[1] - tan_top]
+    LineTop_R = [pj1[0] + 100, pj1[1] + tan_top]
+    if Gline == "P":
+        SumLong = np.cumsum([float(pitch) for pitch in pitchj_new])
+        p1_long = [LineTop_L] + [[LineTop_L[0], LineTop_L[1] - sum_long] for sum_long in SumLong]
+        p2_long = [LineTop_R] + [[LineTop_R[0], LineTop_R[1] - sum_long] for sum_long in SumLong]
+    elif Gline == "T":
+        SumLong = np.cumsum([float(pitch) for pitch in pitchj_new[:-1]])
+        pbot = pj1 if no_pitchj else pj2
+        tan_bot = 100 * math.tan(math.radians(float(Angle[1]) - 90))
+        LineBot_L = [pbot[0] - 100, pbot[1] + tan_bot]
+        LineBot_R = [pbot[0] + 100, pbot[1] - tan_bot]
+        p1_long = [LineTop_L] + [[pj1[0] - 100, pj1[1] - sum_long] for sum_long in SumLong] + [LineBot_R]
+        p2_long = [LineTop_R] + [[pj1[0] + 100, pj1[1] - sum_long] for sum_long in SumLong] + [LineBot_L]
     else:
-        pj1 = [0, 0]
-        pj1[0] = Pbase[0]
-        pj1[1] = Pbase[1]
-        pj2 = [0, 0]
-        pj2[0] = Pbase[0]
-        pj2[1] = Pbase[1] - Lenpj
+        return [], []
 
-    SumTran = 0
-    for i in range(0, len(pitchl)):
-        SumTran += float(pitchl[i])
-        p1_tran, p2_tran = DefMath.Offset_Line(pj1, pj2, -SumTran)
-        if Gline == "P":
-            LineTop_L = [0, 0]
-            LineTop_R = [0, 0]
-            LineTop_R[0] = pj1[0] + 100
-            LineTop_R[1] = pj1[1] + 100 * math.tan(math.radians(float(Angle[0]) - 90))
-            LineTop_L[0] = pj1[0] - 100
-            LineTop_L[1] = pj1[1] - 100 * math.tan(math.radians(float(Angle[0]) - 90))
-
-            p1_long = LineTop_L.copy()
-            p2_long = LineTop_R.copy()
-            p = DefMath.Intersec_line_line(p1_long, p2_long, p1_tran, p2_tran)
-            solid_hole = DefIFC.Draw_Solid_Circle(ifc_file, p, dholeA, pal1, pal2, pal3)
-            Solid_HoleL_SPL.append(solid_hole)
-            SumLong = 0
-            for i_1 in range(0, len(pitchj_new)):
-                SumLong += float(pitchj_new[i_1])
-                p1_long = LineTop_L.copy()
-                p1_long[1] = LineTop_L[1] - SumLong
-                p2_long = LineTop_R.copy()
-                p2_long[1] = LineTop_R[1] - SumLong
-                p = DefMath.Intersec_line_line(p1_long, p2_long, p1_tran, p2_tran)
-                solid_hole = DefIFC.Draw_Solid_Circle(ifc_file, p, dholeA, pal1, pal2, pal3)
-                Solid_HoleL_SPL.append(solid_hole)
-
-        elif Gline == "T":
-            LineTop_L = [0, 0]
-            LineTop_R = [0, 0]
-            LineTop_R[0] = pj1[0] + 100
-            LineTop_R[1] = pj1[1] + 100 * math.tan(math.radians(float(Angle[0]) - 90))
-            LineTop_L[0] = pj1[0] - 100
-            LineTop_L[1] = pj1[1] - 100 * math.tan(math.radians(float(Angle[0]) - 90))
-
-            p1_long = LineTop_L.copy()
-            p2_long = LineTop_R.copy()
-            p = DefMath.Intersec_line_line(p1_long, p2_long, p1_tran, p2_tran)
-
-            solid_hole = DefIFC.Draw_Solid_Circle(ifc_file, p, dholeA, pal1, pal2, pal3)
-
-            Solid_HoleL_SPL.append(solid_hole)
-            SumLong = 0
-
-            for i_1 in range(0, len(pitchj_new) - 1):
-                SumLong += float(pitchj_new[i_1])
-                p1_long = pj1.copy()
-                p1_long[0] = pj1[0] - 100
-                p1_long[1] = pj1[1] - SumLong
-                p2_long = pj1.copy()
-                p2_long[0] = pj1[0] + 100
-                p2_long[1] = pj1[1] - SumLong
-                p = DefMath.Intersec_line_line(p1_long, p2_long, p1_tran, p2_tran)
-                solid_hole = DefIFC.Draw_Solid_Circle(ifc_file, p, dholeA, pal1, pal2, pal3)
-                Solid_HoleL_SPL.append(solid_hole)
-
-            if len(pitchj_new) == 1 and pitchj_new[0] == str(0):
-                LineBot_L = [0, 0]
-                LineBot_R = [0, 0]
-                LineBot_R[0] = pj1[0] + 100
-                LineBot_R[1] = pj1[1] - 100 * math.tan(math.radians(float(Angle[1]) - 90))
-                LineBot_L[0] = pj1[0] - 100
-                LineBot_L[1] = pj1[1] + 100 * math.tan(math.radians(float(Angle[1]) - 90))
-            else:
-                LineBot_L = [0, 0]
-                LineBot_R = [0, 0]
-                LineBot_R[0] = pj2[0] + 100
-                LineBot_R[1] = pj2[1] - 100 * math.tan(math.radians(float(Angle[1]) - 90))
-                LineBot_L[0] = pj2[0] - 100
-                LineBot_L[1] = pj2[1] + 100 * math.tan(math.radians(float(Angle[1]) - 90))
-
-            p = DefMath.Intersec_line_line(LineBot_R, LineBot_L, p1_tran, p2_tran)
-            solid_hole = DefIFC.Draw_Solid_Circle(ifc_file, p, dholeA, pal1, pal2, pal3)
-            Solid_HoleL_SPL.append(solid_hole)
-
-    SumTran = 0
-    for i in range(0, len(pitchr)):
-        SumTran += float(pitchr[i])
-        p1_tran, p2_tran = DefMath.Offset_Line(pj1, pj2, SumTran)
-        if Gline == "P":
-            LineTop_L = [0, 0]
-            LineTop_R = [0, 0]
-            LineTop_R[0] = pj1[0] + 100
-            LineTop_R[1] = pj1[1] + 100 * math.tan(math.radians(float(Angle[0]) - 90))
-            LineTop_L[0] = pj1[0] - 100
-            LineTop_L[1] = pj1[1] - 100 * math.tan(math.radians(float(Angle[0]) - 90))
-
-            p1_long = LineTop_L.copy()
-            p2_long = LineTop_R.copy()
-            p = DefMath.Intersec_line_line(p1_long, p2_long, p1_tran, p2_tran)
-            solid_hole = DefIFC.Draw_Solid_Circle(ifc_file, p, dholeA, pal1, pal2, pal3)
-            Solid_HoleR_SPL.append(solid_hole)
-            SumLong = 0
-            for i_1 in range(0, len(pitchj_new)):
-                SumLong += float(pitchj_new[i_1])
-                p1_long = LineTop_L.copy()
-                p1_long[1] = LineTop_L[1] - SumLong
-                p2_long = LineTop_R.copy()
-                p2_long[1] = LineTop_R[1] - SumLong
-                p = DefMath.Intersec_line_line(p1_long, p2_long, p1_tran, p2_tran)
-                solid_hole = DefIFC.Draw_Solid_Circle(ifc_file, p, dholeA, pal1, pal2, pal3)
-                Solid_HoleR_SPL.append(solid_hole)
-
-        elif Gline == "T":
-            LineTop_L = [0, 0]
-            LineTop_R = [0, 0]
-            LineTop_R[0] = pj1[0] + 100
-            LineTop_R[1] = pj1[1] + 100 * math.tan(math.radians(float(Angle[0]) - 90))
-            LineTop_L[0] = pj1[0] - 100
-            LineTop_L[1] = pj1[1] - 100 * math.tan(math.radians(float(Angle[0]) - 90))
-
-            p1_long = LineTop_L.copy()
-            p2_long = LineTop_R.copy()
-            p = DefMath.Intersec_line_line(p1_long, p2_long, p1_tran, p2_tran)
-
-            solid_hole = DefIFC.Draw_Solid_Circle(ifc_file, p, dholeA, pal1, pal2, pal3)
-
-            Solid_HoleR_SPL.append(solid_hole)
-            SumLong = 0
-
-            for i_1 in range(0, len(pitchj_new) - 1):
-                SumLong += float(pitchj_new[i_1])
-                p1_long = pj1.copy()
-                p1_long[0] = pj1[0] - 100
-                p1_long[1] = pj1[1] - SumLong
-                p2_long = pj1.copy()
-                p2_long[0] = pj1[0] + 100
-                p2_long[1] = pj1[1] - SumLong
-                p = DefMath.Intersec_line_line(p1_long, p2_long, p1_tran, p2_tran)
-                solid_hole = DefIFC.Draw_Solid_Circle(ifc_file, p, dholeA, pal1, pal2, pal3)
-                Solid_HoleR_SPL.append(solid_hole)
-
-            if len(pitchj_new) == 1 and pitchj_new[0] == str(0):
-                LineBot_L = [0, 0]
-                LineBot_R = [0, 0]
-                LineBot_R[0] = pj1[0] + 100
-                LineBot_R[1] = pj1[1] - 100 * math.tan(math.radians(float(Angle[1]) - 90))
-                LineBot_L[0] = pj1[0] - 100
-                LineBot_L[1] = pj1[1] + 100 * math.tan(math.radians(float(Angle[1]) - 90))
-            else:
-                LineBot_L = [0, 0]
-                LineBot_R = [0, 0]
-                LineBot_R[0] = pj2[0] + 100
-                LineBot_R[1] = pj2[1] - 100 * math.tan(math.radians(float(Angle[1]) - 90))
-                LineBot_L[0] = pj2[0] - 100
-                LineBot_L[1] = pj2[1] + 100 * math.tan(math.radians(float(Angle[1]) - 90))
+    arCoord_Hole = []
+    for pitch_tran, sign in ((pitchl, -1), (pitchr, 1)):
+        if not pitch_tran:
+            arCoord_Hole.append([])
+            continue
+        SumTran = np.cumsum([float(pitch) for pitch in pitch_tran])
+        p1_tran, p2_tran = DefMath.Offset_Line_batch(pj1, pj2, sign * SumTran)
+        # [行, 列] → 列ごとに行の順
+        centers = DefMath.Intersec_line_line_grid(p1_long, p2_long, p1_tran, p2_tran).transpose(1, 0, 2).reshape(-1, 2)
+        arCoord_Hole.append([None if np.isnan(center[0]) else center for center in centers])
+
+    return arCoord_Hole[0], arCoord_Hole[1]
 
-            p = DefMath.Intersec_line_line(LineBot_R, LineBot_L, p1_tran, p2_tran)
-            solid_hole = DefIFC.Draw_Solid_Circle(ifc_file, p, dholeA, pal1, pal2, pal3)
-            Solid_HoleR_SPL.append(solid_hole)
+
+def Draw_Solid_Hole_SPL(ifc_all, Pbase, result_load_infor_spl, Lenpj, pal1, pal2, pal3, posjoint="all"):
+    ifc_file, bridge_span, geom_context = ifc_all
+    dholeA, dholeF = result_load_infor_spl[5]
+    arCoord_HoleL, arCoord_HoleR = Calculate_Coord_Hole_SPL(Pbase, result_load_infor_spl, Lenpj)
+    Solid_HoleL_SPL = [DefIFC.Draw_Solid_Circle(ifc_file, p, dholeA, pal1, pal2, pal3) for p in arCoord_HoleL]
+    Solid_HoleR_SPL = [DefIFC.Draw_Solid_Circle(ifc_file, p, dholeA, pal1, pal2, pal3) for p in arCoord_HoleR]
 
     if posjoint == "all":
         return Solid_HoleL_SPL + Solid_HoleR_SPL
@@ -1249,193 +1116,15 @@ def Draw_Solid_Bolt_SPL(
     ifc_all, Pbase, result_load_infor_spl, Lenpj, gap_cen_to_head, gap_cen_to_nut, pal1, pal2, pal3, posjoint="all"
 ):
     ifc_file, bridge_span, geom_context = ifc_all
-    Solid_HoleL_SPL = []
-    Solid_HoleR_SPL = []
-    Lenpj = float(Lenpj)
-    infor, pitchj, pitchl, pitchr, out, dhole, solid = result_load_infor_spl
-    Thick, Mat, Side, Angle, Gline = infor["Thick"], infor["Mat"], infor["Side"], infor["Ang"], infor["GLine"]
-    Angle = Angle.split("/")
-    outT, outB, outL, outR = out
-    dholeA, dholeF = dhole
-    pitchl = DefStrings.process_array(pitchl)
-    pitchr = DefStrings.process_array(pitchl)
-
-    pitchj_str = "/".join(map(str, pitchj))
-    pitchj_str = DefStrings.Xu_Ly_Pitch_va_Tim_X(pitchj_str, Lenpj)
-    pitchj_new = pitchj_str.split("/")
-
-    if len(pitchj_new) == 1 and pitchj_new[0] == str(0):
-        pj1 = [0, 0]
-        pj1[0] = Pbase[0]
-        pj1[1] = Pbase[1]
-        pj2 = [0, 0]
-        pj2[0] = Pbase[0]
-        pj2[1] = Pbase[1] - 100
-    else:
-        pj1 = [0, 0]
-        pj1[0] = Pbase[0]
-        pj1[1] = Pbase[1]
-        pj2 = [0, 0]
-        pj2[0] = Pbase[0]
-        pj2[1] = Pbase[1] - Lenpj
-
-    SumTran = 0
-    for i in range(0, len(pitchl)):
-        SumTran += float(pitchl[i])
-        p1_tran, p2_tran = DefMath.Offset_Line(pj1, pj2, -SumTran)
-        if Gline == "P":
-            LineTop_L = [0, 0]
-            LineTop_R = [0, 0]
-            LineTop_R[0] = pj1[0] + 100
-            LineTop_R[1] = pj1[1] + 100 * math.tan(math.radians(float(Angle[0]) - 90))
-            LineTop_L[0] = pj1[0] - 100
-            LineTop_L[1] = pj1[1] - 100 * math.tan(math.radians(float(Angle[0]) - 90))
-
-            p1_long = LineTop_L.copy()
-            p2_long = LineTop_R.copy()
-            p = DefMath.Intersec_line_line(p1_long, p2_long, p1_tran, p2_tran)
-            solid_hole = DefIFC.Draw_Solid_Bolt(ifc_file, p, 26.5, gap_cen_to_head, gap_cen_to_nut, pal1, pal2, pal3)
-            Solid_HoleL_SPL.append(solid_hole)
-            SumLong = 0
-            for i_1 in range(0, len(pitchj_new)):
-                SumLong += float(pitchj_new[i_1])
-                p1_long = LineTop_L.copy()
-                p1_long[1] = LineTop_L[1] - SumLong
-                p2_long = LineTop_R.copy()
-                p2_long[1] = LineTop_R[1] - SumLong
-                p = DefMath.Intersec_line_line(p1_long, p2_long, p1_tran, p2_tran)
-                solid_hole = DefIFC.Draw_Solid_Bolt(
-                    ifc_file, p, 26.5, gap_cen_to_head, gap_cen_to_nut, pal1, pal2, pal3
-                )
-                Solid_HoleL_SPL.append(solid_hole)
-
-        elif Gline == "T":
-            LineTop_L = [0, 0]
-            LineTop_R = [0, 0]
-            LineTop_R[0] = pj1[0] + 100
-            LineTop_R[1] = pj1[1] + 100 * math.tan(math.radians(float(Angle[0]) - 90))
-            LineTop_L[0] = pj1[0] - 100
-            LineTop_L[1] = pj1[1] - 100 * math.tan(math.radians(float(Angle[0]) - 90))
-
-            p1_long = LineTop_L.copy()
-            p2_long = LineTop_R.copy()
-            p = DefMath.Intersec_line_line(p1_long, p2_long, p1_tran, p2_tran)
-            solid_hole = DefIFC.Draw_Solid_Bolt(ifc_file, p, 26.5, gap_cen_to_head, gap_cen_to_nut, pal1, pal2, pal3)
-
-            Solid_HoleL_SPL.append(solid_hole)
-            SumLong = 0
-
-            for i_1 in range(0, len(pitchj_new) - 1):
-                SumLong += float(pitchj_new[i_1])
-                p1_long = pj1.copy()
-                p1_long[0] = pj1[0] - 100
-                p1_long[1] = pj1[1] - SumLong
-                p2_long = pj1.copy()
-                p1_long[0] = pj1[0] + 100
-                p2_long[1] = pj1[1] - SumLong
-                p = DefMath.Intersec_line_line(p1_long, p2_long, p1_tran, p2_tran)
-                solid_hole = DefIFC.Draw_Solid_Bolt(
-                    ifc_file, p, 26.5, gap_cen_to_head, gap_cen_to_nut, pal1, pal2, pal3
-                )
-                Solid_HoleL_SPL.append(solid_hole)
-
-            if len(pitchj_new) == 1 and pitchj_new[0] == str(0):
-                LineBot_L = [0, 0]
-                LineBot_R = [0, 0]
-                LineBot_R[0] = pj1[0] + 100
-                LineBot_R[1] = pj1[1] - 100 * math.tan(math.radians(float(Angle[1]) - 90))
-                LineBot_L[0] = pj1[0] - 100
-                LineBot_L[1] = pj1[1] + 100 * math.tan(math.radians(float(Angle[1]) - 90))
-            else:
-                LineBot_L = [0, 0]
-                LineBot_R = [0, 0]
-                LineBot_R[0] = pj2[0] + 100
-                LineBot_R[1] = pj2[1] - 100 * math.tan(math.radians(float(Angle[1]) - 90))
-                LineBot_L[0] = pj2[0] - 100
-                LineBot_L[1] = pj2[1] + 100 * math.tan(math.radians(float(Angle[1]) - 90))
-
-            p = DefMath.Intersec_line_line(LineBot_R, LineBot_L, p1_tran, p2_tran)
-            solid_hole = DefIFC.Draw_Solid_Bolt(ifc_file, p, 26.5, gap_cen_to_head, gap_cen_to_nut, pal1, pal2, pal3)
-            Solid_HoleL_SPL.append(solid_hole)
-
-    SumTran = 0
-    for i in range(0, len(pitchr)):
-        SumTran += float(pitchr[i])
-        p1_tran, p2_tran = DefMath.Offset_Line(pj1, pj2, SumTran)
-        if Gline == "P":
-            LineTop_L = [0, 0]
-            LineTop_R = [0, 0]
-            LineTop_R[0] = pj1[0] + 100
-            LineTop_R[1] = pj1[1] + 100 * math.tan(math.radians(float(Angle[0]) - 90))
-            LineTop_L[0] = pj1[0] - 100
-            LineTop_L[1] = pj1[1] - 100 * math.tan(math.radians(float(Angle[0]) - 90))
-
-            p1_long = LineTop_L.copy()
-            p2_long = LineTop_R.copy()
-            p = DefMath.Intersec_line_line(p1_long, p2_long, p1_tran, p2_tran)
-            solid_hole = DefIFC.Draw_Solid_Bolt(ifc_file, p, 26.5, gap_cen_to_head, gap_cen_to_nut, pal1, pal2, pal3)
-            Solid_HoleR_SPL.append(solid_hole)
-            SumLong = 0
-            for i_1 in range(0, len(pitchj_new)):
-                SumLong += float(pitchj_new[i_1])
-                p1_long = LineTop_L.copy()
-                p1_long[1] = LineTop_L[1] - SumLong
-                p2_long = LineTop_R.copy()
-                p2_long[1] = LineTop_R[1] - SumLong
-                p = DefMath.Intersec_line_line(p1_long, p2_long, p1_tran, p2_tran)
-                solid_hole = DefIFC.Draw_Solid_Bolt(
-                    ifc_file, p, 26.5, gap_cen_to_head, gap_cen_to_nut, pal1, pal2, pal3
-                )
-                Solid_HoleR_SPL.append(solid_hole)
-
-        elif Gline == "T":
-            LineTop_L = [0, 0]
-            LineTop_R = [0, 0]
-            LineTop_R[0] = pj1[0] + 100
-            LineTop_R[1] = pj1[1] + 100 * math.tan(math.radians(float(Angle[0]) - 90))
-            LineTop_L[0] = pj1[0] - 100
-            LineTop_L[1] = pj1[1] - 100 * math.tan(math.radians(float(Angle[0]) - 90))
-
-            p1_long = LineTop_L.copy()
-            p2_long = LineTop_R.copy()
-            p = DefMath.Intersec_line_line(p1_long, p2_long, p1_tran, p2_tran)
-            solid_hole = DefIFC.Draw_Solid_Bolt(ifc_file, p, 26.5, gap_cen_to_head, gap_cen_to_nut, pal1, pal2, pal3)
-
-            Solid_HoleR_SPL.append(solid_hole)
-            SumLong = 0
-
-            for i_1 in range(0, len(pitchj_new) - 1):
-                SumLong += float(pitchj_new[i_1])
-                p1_long = pj1.copy()
-                p1_long[0] = pj1[0] - 100
-                p1_long[1] = pj1[1] - SumLong
-                p2_long = pj1.copy()
-                p1_long[0] = pj1[0] + 100
-                p2_long[1] = pj1[1] - SumLong
-                p = DefMath.Intersec_line_line(p1_long, p2_long, p1_tran, p2_tran)
-                solid_hole = DefIFC.Draw_Solid_Bolt(
-                    ifc_file, p, 26.5, gap_cen_to_head, gap_cen_to_nut, pal1, pal2, pal3
-                )
-                Solid_HoleR_SPL.append(solid_hole)
-
-            if len(pitchj_new) == 1 and pitchj_new[0] == str(0):
-                LineBot_L = [0, 0]
-                LineBot_R = [0, 0]
-                LineBot_R[0] = pj1[0] + 100
-                LineBot_R[1] = pj1[1] - 100 * math.tan(math.radians(float(Angle[1]) - 90))
-                LineBot_L[0] = pj1[0] - 100
-                LineBot_L[1] = pj1[1] + 100 * math.tan(math.radians(float(Angle[1]) - 90))
-            else:
-                LineBot_L = [0, 0]
-                LineBot_R = [0, 0]
-                LineBot_R[0] = pj2[0] + 100
-                LineBot_R[1] = pj2[1] - 100 * math.tan(math.radians(float(Angle[1]) - 90))
-                LineBot_L[0] = pj2[0] - 100
-                LineBot_L[1] = pj2[1] + 100 * math.tan(math.radians(float(Angle[1]) - 90))
-
-            p = DefMath.Intersec_line_line(LineBot_R, LineBot_L, p1_tran, p2_tran)
-            solid_hole = DefIFC.Draw_Solid_Bolt(ifc_file, p, 26.5, gap_cen_to_head, gap_cen_to_nut, pal1, pal2, pal3)
-            Solid_HoleR_SPL.append(solid_hole)
+    arCoord_HoleL, arCoord_HoleR = Calculate_Coord_Hole_SPL(Pbase, result_load_infor_spl, Lenpj)
+    Solid_HoleL_SPL = [
+        DefIFC.Draw_Mapped_Bolt(ifc_file, geom_context, p, 26.5, gap_cen_to_head, gap_cen_to_nut, pal1, pal2, pal3)
+        for p in arCoord_HoleL
+    ]
+    Solid_HoleR_SPL = [
+        DefIFC.Draw_Mapped_Bolt(ifc_file, geom_context, p, 26.5, gap_cen_to_head, gap_cen_to_nut, pal1, pal2, pal3)
+        for p in arCoord_HoleR
+    ]
 
     if posjoint == "all":
         return Solid_HoleL_SPL + Solid_HoleR_SPL
@@ -1660,15 +1349,9 @@ def Calculate_SPL_Rib(
                             "S",
                         )
                         if Solid_Hole_SPL:
-                            for Solid_Hole in Solid_Hole_SPL:
-                                shape_representation = ifc_file.createIfcShapeRepresentation(
-                                    ContextOfItems=geom_context,
-                                    RepresentationIdentifier="Body",
-                                    RepresentationType="Brep",
-                                    Items=[Solid_Hole],
-                                )
+                            for bolt_representation in Solid_Hole_SPL:
                                 DefIFC.Add_shape_representation_in_Beam(
-                                    ifc_file, bridge_span, shape_representation, "Bolt"
+                                    ifc_file, bridge_span, bolt_representation, "Bolt"
                                 )
 
                     elif posJoint == "E":
@@ -1691,15 +1374,9 @@ def Calculate_SPL_Rib(
                             "E",
                         )
                         if Solid_Hole_SPL:
-                            for Solid_Hole in Solid_Hole_SPL:
-                                shape_representation = ifc_file.createIfcShapeRepresentation(
-                                    ContextOfItems=geom_context,
-                                    RepresentationIdentifier="Body",
-                                    RepresentationType="Brep",
-                                    Items=[Solid_Hole],
-                                )
+                            for bolt_representation in Solid_Hole_SPL:
                                 DefIFC.Add_shape_representation_in_Beam(
-                                    ifc_file, bridge_span, shape_representation, "Bolt"
+                                    ifc_file, bridge_span, bolt_representation, "Bolt"
                                 )
 
             # -----------------------------------------------------------------
@@ -2545,15 +2222,9 @@ def Calculate_SPL(
                             "S",
                         )
                         if Solid_Hole_SPL:
-                            for Solid_Hole in Solid_Hole_SPL:
-                                shape_representation = ifc_file.createIfcShapeRepresentation(
-                                    ContextOfItems=geom_context,
-                                    RepresentationIdentifier="Body",
-                                    RepresentationType="Brep",
-                                    Items=[Solid_Hole],
-                                )
+                            for bolt_representation in Solid_Hole_SPL:
                                 DefIFC.Add_shape_representation_in_Beam(
-                                    ifc_file, bridge_span, shape_representation, "Bolt"
+                                    ifc_file, bridge_span, bolt_representation, "Bolt"
                                 )
 
                     elif posJoint == "E":
@@ -2576,15 +2247,9 @@ def Calculate_SPL(
                             "E",
                         )
                         if Solid_Hole_SPL:
-                            for Solid_Hole in Solid_Hole_SPL:
-                                shape_representation = ifc_file.createIfcShapeRepresentation(
-                                    ContextOfItems=geom_context,
-                                    RepresentationIdentifier="Body",
-                                    RepresentationType="Brep",
-                                    Items=[Solid_Hole],
-                                )
+                            for bolt_representation in Solid_Hole_SPL:
                                 DefIFC.Add_shape_representation_in_Beam(
-                                    ifc_file, bridge_span, shape_representation, "Bolt"
+                                    ifc_file, bridge_span, bolt_representation, "Bolt"
                                 )
 
             # -----------------------------------------------------------------
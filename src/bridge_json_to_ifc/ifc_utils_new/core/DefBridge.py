@@ -6,6 +6,7 @@ ExcelまたはJSONファイルから鋼橋の3Dモデルを読み込み、IFC形
 
 import json
 import os
+from contextlib import nullcontext
 
 import numpy as np
 import pandas as pd
@@ -45,13 +46,15 @@ from src.bridge_json_to_ifc.ifc_utils_new.components.DefStiffener import (
     Devide_Coord_LRib,
     Devide_Pitch_Vstiff,
 )
-from src.bridge_json_to_ifc.ifc_utils_new.core import DefIFC, DefMath
+from src.bridge_json_to_ifc.ifc_utils_new.core import DefContext, DefIFC, DefMath
+from src.bridge_json_to_ifc.ifc_utils_new.core.DefContext import BridgeContext
 
 # DefMainPanel.pyの関数をインポート
 from src.bridge_json_to_ifc.ifc_utils_new.core.DefMainPanel import (
     Draw_solid_FLG_mainpanel_break,
     Draw_solid_Web_mainpanel_break_FLG,
 )
+from src.bridge_json_to_ifc.ifc_utils_new.core.DefProfile import PhaseProfiler
 
 # DefSubPanel.pyの関数をインポート
 from src.bridge_json_to_ifc.ifc_utils_new.core.DefSubPanel import Calculate_Part_SubPanel
@@ -69,110 +72,24 @@ from src.bridge_json_to_ifc.ifc_utils_new.utils.DefBridgeUtils import (
     Load_Coordinate_Panel,
 )
 
-# グローバル変数: ログファイル出力関数
-log_print_func = None
-# デバッグモード（Trueの場合、詳細ログをファイルとコンソールに出力）
+# デバッグモードの既定値（Trueの場合、詳細ログをファイルに出力）
+# RunBridge の debug_mode 引数で実行ごとに上書きできる
 DEBUG_MODE = False
 
 
 def _log_print(*args, **kwargs):
     """通常ログ出力（コンソール出力なし、ファイルのみ）"""
-    if log_print_func and DEBUG_MODE:
-        log_print_func(*args, **kwargs)
+    DefContext.log_print(*args, **kwargs)
 
 
 def _debug_print(*args, **kwargs):
     """デバッグログ出力（DEBUG_MODE時のみ出力）"""
-    if DEBUG_MODE and log_print_func:
-        log_print_func(*args, **kwargs)
+    DefContext.log_print(*args, **kwargs)
 
 
 def _progress_print(*args, **kwargs):
-    """進捗ログ出力（常にコンソールとファイルに出力）"""
+    """進捗ログ出力（常にコンソールに出力）"""
     print(*args, **kwargs)
-    if log_print_func:
-        # log_print_funcはprintを含むのでファイルのみに出力
-        pass
-
-
-# =============================================================================
-# BridgeContext: 橋梁モデル生成に必要なコンテキストを保持するクラス
-# =============================================================================
-class BridgeContext:
-    """
-    橋梁IFCモデル生成に必要なコンテキストを保持するクラス
-
-    Attributes:
-        ifc_file: IFCファイルオブジェクト
-        bridge_span: 橋梁スパン
-        geom_context: ジオメトリコンテキスト
-        data_json: JSONから読み込んだ橋梁データ
-        side_export: エクスポート側の情報（1: 上側のみ, -1: 下側のみ, 2: 両側）
-        name_bridge: 橋梁名
-        location: ファイルディレクトリパス
-    """
-
-    def __init__(self, ifc_file, bridge_span, geom_context, data_json, location):
-        self.ifc_file = ifc_file
-        self.bridge_span = bridge_span
-        self.geom_context = geom_context
-        self.data_json = data_json
-        self.location = location
-
-        # 基本情報を抽出
-        infor_data = data_json.get("Infor", {})
-        self.name_bridge = infor_data.get("NameBridge", "")
-        self.side_export = infor_data.get("SideExport", 2)
-
-    @property
-    def ifc_all(self):
-        """ifc_file, bridge_span, geom_contextのタプルを返す（後方互換性のため）"""
-        return (self.ifc_file, self.bridge_span, self.geom_context)
-
-    # データアクセサ
-    @property
-    def senkei_data(self):
-        return self.data_json.get("Senkei", [])
-
-    @property
-    def main_panel_data(self):
-        return self.data_json.get("MainPanel", [])
-
-    @property
-    def sub_panel_data(self):
-        return self.data_json.get("SubPanel", [])
-
-    @property
-    def taikeikou_data(self):
-        return self.data_json.get("Taikeikou", [])
-
-    @property
-    def yokokou_data(self):
-        return self.data_json.get("Yokokou", [])
-
-    @property
-    def yokogeta_data(self):
-        return self.data_json.get("Yokogeta", [])
-
-    @property
-    def shouban_data(self):
-        return self.data_json.get("Shouban", [])
-
-    @property
-    def bearing_data(self):
-        return self.data_json.get("Bearing", [])
-
-    @property
-    def member_data(self):
-        return self.data_json.get("MemberData", {})
-
-    @property
-    def member_rib_data(self):
-        return self.data_json.get("MemberRib", {})
-
-    @property
-    def member_spl_data(self):
-        return self.data_json.get("MemberSPL", {})
 
 
 # =============================================================================
@@ -187,45 +104,22 @@ def _setup_logging(location, debug_mode):
         debug_mode: デバッグモードフラグ
 
     Returns:
-        log_file: ログファイルオブジェクト（DEBUG_MODEがFalseの場合はNone）
+        (log_file, log_print_func): ログファイルオブジェクトとログ出力関数（デバッグモードでない場合は (None, None)）
     """
-    global log_print_func
-
-    log_file = None
+    if not debug_mode:
+        return None, None
 
-    if debug_mode:
-        import datetime
+    import datetime
 
-        log_filename = location + "debug_log_" + datetime.datetime.now().strftime("%Y%m%d_%H%M%S") + ".txt"
-        log_file = open(log_filename, "w", encoding="utf-8")
+    log_filename = location + "debug_log_" + datetime.datetime.now().strftime("%Y%m%d_%H%M%S") + ".txt"
+    log_file = open(log_filename, "w", encoding="utf-8")
 
-        def log_print(*args, **kwargs):
-            """ログファイルのみに出力（コンソール出力なし）"""
-            print(*args, file=log_file, **kwargs)
-            log_file.flush()
+    def log_print(*args, **kwargs):
+        """ログファイルのみに出力（コンソール出力なし）"""
+        print(*args, file=log_file, **kwargs)
+        log_file.flush()
 
-        log_print_func = log_print
-
-        # 他モジュールのログ関数も設定
-        DefBridgeUtils.log_print_func = log_print
-        from src.bridge_json_to_ifc.ifc_utils_new.components import DefBracing, DefComponent, DefPanel
-
-        DefPanel.log_print_func = log_print
-        DefBracing.log_print_func = log_print
-        DefComponent.log_print_func = log_print
-        DefIFC.log_print_func = log_print
-    else:
-        # デバッグモードオフ：ログ関数を無効化
-        log_print_func = None
-        DefBridgeUtils.log_print_func = None
-        from src.bridge_json_to_ifc.ifc_utils_new.components import DefBracing, DefComponent, DefPanel
-
-        DefPanel.log_print_func = None
-        DefBracing.log_print_func = None
-        DefComponent.log_print_func = None
-        DefIFC.log_print_func = None
-
-    return log_file
+    return log_file, log_print
 
 
 # =============================================================================
@@ -254,6 +148,85 @@ def _load_bridge_data(location, name_file):
     return data_json
 
 
+def parse_damage_info(damage_data):
+    """
+    損傷情報（damage_info.json と同じ構造の辞書）を要素名をキーとした辞書に変換する
+
+    Args:
+        damage_data: 損傷情報（"DamageInformation" に要素ごとの点検履歴を持つ辞書）
+
+    Returns:
+        damage_info_dict: 要素名 → {"DamageItems": [...], "InspectionMeta": {...}}
+    """
+    damage_info_dict = {}
+
+    # 橋梁情報を表示（あれば）
+    if "BridgeInfo" in damage_data:
+        bridge_info = damage_data["BridgeInfo"]
+        bridge_name = bridge_info.get("BridgeName", "")
+        if bridge_name:
+            print(f"橋梁名: {bridge_name}")
+
+    if "DamageInformation" in damage_data:
+        for damage_entry in damage_data["DamageInformation"]:
+            element_name = damage_entry.get("ElementName", "")
+
+            # 新形式: InspectionHistoryから最新の点検結果を取得
+            inspection_history = damage_entry.get("InspectionHistory", [])
+            if inspection_history:
+                # 最新の点検結果（配列の最初）
+                latest_inspection = inspection_history[0]
+                damage_items = latest_inspection.get("DamageItems", [])
+
+                # 点検情報を損傷情報に追加
+                inspection_meta = {
+                    "InspectionDate": latest_inspection.get("InspectionDate", ""),
+                    "InspectionYear": latest_inspection.get("InspectionYear", ""),
+                    "Inspector": latest_inspection.get("Inspector", ""),
+                    "InspectionType": latest_inspection.get("InspectionType", ""),
+                    "RepairRecommendation": latest_inspection.get("RepairRecommendation", ""),
+                }
+
+                # 過去の点検履歴から経緯を作成
+                history_summary = []
+                for hist in inspection_history:
+                    year = hist.get("InspectionYear", "")
+                    items = hist.get("DamageItems", [])
+                    if items:
+                        levels = [f"{item.get('DamageType', '')}:{item.get('DamageLevel', '')}" for item in items]
+                        history_summary.append(f"{year}年({', '.join(levels)})")
+
+                inspection_meta["HistorySummary"] = " → ".join(reversed(history_summary)) if history_summary else ""
+
+                # 補修履歴
+                repair_history = damage_entry.get("RepairHistory", [])
+                if repair_history:
+                    repair_summary = [f"{r.get('RepairDate', '')}: {r.get('RepairType', '')}" for r in repair_history]
+                    inspection_meta["RepairHistory"] = "; ".join(repair_summary)
+                else:
+                    inspection_meta["RepairHistory"] = ""
+
+                if element_name and damage_items:
+                    damage_info_dict[element_name] = {
+                        "DamageItems": damage_items,
+                        "InspectionMeta": inspection_meta,
+                    }
+            else:
+                # 旧形式: DamageItemsを直接取得（後方互換）
+                damage_items = damage_entry.get("DamageItems", [])
+                if element_name and damage_items:
+                    damage_info_dict[element_name] = {"DamageItems": damage_items, "InspectionMeta": {}}
+
+        if damage_info_dict:
+            print(f"損傷情報を読み込みました: {len(damage_info_dict)}個の要素")
+            # デバッグ: 読み込まれた要素名を表示
+            for elem_name, elem_data in damage_info_dict.items():
+                damage_items = elem_data.get("DamageItems", [])
+                print(f"  - {elem_name}: {len(damage_items)}個の損傷項目")
+
+    return damage_info_dict
+
+
 def _load_damage_info(location):
     """
     損傷情報JSONファイルを読み込む
@@ -273,76 +246,7 @@ def _load_damage_info(location):
     try:
         with open(damage_info_file, "r", encoding="utf-8") as f:
             damage_data = json.load(f)
-
-            # 橋梁情報を表示（あれば）
-            if "BridgeInfo" in damage_data:
-                bridge_info = damage_data["BridgeInfo"]
-                bridge_name = bridge_info.get("BridgeName", "")
-                if bridge_name:
-                    print(f"橋梁名: {bridge_name}")
-
-            if "DamageInformation" in damage_data:
-                for damage_entry in damage_data["DamageInformation"]:
-                    element_name = damage_entry.get("ElementName", "")
-
-                    # 新形式: InspectionHistoryから最新の点検結果を取得
-                    inspection_history = damage_entry.get("InspectionHistory", [])
-                    if inspection_history:
-                        # 最新の点検結果（配列の最初）
-                        latest_inspection = inspection_history[0]
-                        damage_items = latest_inspection.get("DamageItems", [])
-
-                        # 点検情報を損傷情報に追加
-                        inspection_meta = {
-                            "InspectionDate": latest_inspection.get("InspectionDate", ""),
-                            "InspectionYear": latest_inspection.get("InspectionYear", ""),
-                            "Inspector": latest_inspection.get("Inspector", ""),
-                            "InspectionType": latest_inspection.get("InspectionType", ""),
-                            "RepairRecommendation": latest_inspection.get("RepairRecommendation", ""),
-                        }
-
-                        # 過去の点検履歴から経緯を作成
-                        history_summary = []
-                        for hist in inspection_history:
-                            year = hist.get("InspectionYear", "")
-                            items = hist.get("DamageItems", [])
-                            if items:
-                                levels = [
-                                    f"{item.get('DamageType', '')}:{item.get('DamageLevel', '')}" for item in items
-                                ]
-                                history_summary.append(f"{year}年({', '.join(levels)})")
-
-                        inspection_meta["HistorySummary"] = (
-                            " → ".join(reversed(history_summary)) if history_summary else ""
-                        )
-
-                        # 補修履歴
-                        repair_history = damage_entry.get("RepairHistory", [])
-                        if repair_history:
-                            repair_summary = [
-                                f"{r.get('RepairDate', '')}: {r.get('RepairType', '')}" for r in repair_history
-                            ]
-                            inspection_meta["RepairHistory"] = "; ".join(repair_summary)
-                        else:
-                            inspection_meta["RepairHistory"] = ""
-
-                        if element_name and damage_items:
-                            damage_info_dict[element_name] = {
-                                "DamageItems": damage_items,
-                                "InspectionMeta": inspection_meta,
-                            }
-                    else:
-                        # 旧形式: DamageItemsを直接取得（後方互換）
-                        damage_items = damage_entry.get("DamageItems", [])
-                        if element_name and damage_items:
-                            damage_info_dict[element_name] = {"DamageItems": damage_items, "InspectionMeta": {}}
-
-                if damage_info_dict:
-                    print(f"損傷情報を読み込みました: {len(damage_info_dict)}個の要素")
-                    # デバッグ: 読み込まれた要素名を表示
-                    for elem_name, elem_data in damage_info_dict.items():
-                        damage_items = elem_data.get("DamageItems", [])
-                        print(f"  - {elem_name}: {len(damage_items)}個の損傷項目")
+        damage_info_dict = parse_damage_info(damage_data)
     except Exception as e:
         import traceback
 
@@ -352,21 +256,20 @@ def _load_damage_info(location):
     return damage_info_dict
 
 
-def _setup_coordinate_system(data_json):
+def _setup_coordinate_system(ctx):
     """
-    座標系を設定する（グローバル変数の設定）
+    橋軸の座標系を BridgeContext に設定する
 
     Args:
-        data_json: 橋梁JSONデータ
+        ctx: BridgeContext オブジェクト
     """
-    global unit_vector_bridge, start_point_bridge, end_point_bridge
-
+    data_json = ctx.data_json
     if data_json.get("Senkei"):
         p1 = data_json["Senkei"][0]["Point"][0]
         p2 = data_json["Senkei"][0]["Point"][-1]
-        start_point_bridge = np.array([p1["X"], p1["Y"], p1["Z"]])
-        end_point_bridge = np.array([p2["X"], p2["Y"], p2["Z"]])
-        unit_vector_bridge = DefMath.calculate_unit_vector_bridge(start_point_bridge, end_point_bridge)
+        ctx.start_point_bridge = np.array([p1["X"], p1["Y"], p1["Z"]])
+        ctx.end_point_bridge = np.array([p2["X"], p2["Y"], p2["Z"]])
+        ctx.unit_vector_bridge = DefMath.calculate_unit_vector_bridge(ctx.start_point_bridge, ctx.end_point_bridge)
 
 
 def _process_calculate_lines(data_json):
@@ -1531,6 +1434,36 @@ def _generate_bearing(ctx):
             raise
 
 
+# 部材生成のフェーズ（この順に生成する）
+_GENERATION_PHASES = (
+    _generate_main_panels,
+    _generate_sub_panels,
+    _generate_taikeikou,
+    _generate_yokokou,
+    _generate_yokogeta,
+    _generate_shouban_and_guardrail,
+    _generate_bearing,
+)
+
+
+def _output_ifc_path(location, output_ifc_name):
+    """
+    出力IFCファイルのパスを返す
+
+    Args:
+        location: 出力ディレクトリパス
+        output_ifc_name: 出力IFCファイル名（絶対パスの場合はそのまま使用、省略時は'Girder.ifc'）
+
+    Returns:
+        str: 出力IFCファイルのパス
+    """
+    if output_ifc_name:
+        if os.path.isabs(output_ifc_name):
+            return output_ifc_name
+        return location + output_ifc_name
+    return location + "Girder.ifc"
+
+
 def _save_ifc_file(ctx, output_ifc_name):
     """
     IFCファイルを保存する
@@ -1540,95 +1473,193 @@ def _save_ifc_file(ctx, output_ifc_name):
         output_ifc_name: 出力IFCファイル名
     """
     ifc_file = ctx.ifc_file
-    location = ctx.location
-
-    if output_ifc_name:
-        if os.path.isabs(output_ifc_name):
-            output_file = output_ifc_name
-        else:
-            output_file = location + output_ifc_name
-    else:
-        output_file = location + "Girder.ifc"
-
-    _log_print("=" * 60)
-    all_beams = ifc_file.by_type("IfcBeam")
-    _log_print(f"IFCファイル内のIfcBeam数: {len(all_beams)}")
-    for beam in all_beams:
-        _log_print(
-            f"  - Beam: Name={beam.Name}, GlobalId={beam.GlobalId}, Representation={beam.Representation is not None}"
-        )
-        if beam.Representation:
+    output_file = _output_ifc_path(ctx.location, output_ifc_name)
+
+    # 部材一覧はログ出力が有効な場合のみ作成する（IfcBeam の走査を省略）
+    if DefContext.log_enabled():
+        _log_print("=" * 60)
+        all_beams = ifc_file.by_type("IfcBeam")
+        _log_print(f"IFCファイル内のIfcBeam数: {len(all_beams)}")
+        for beam in all_beams:
             _log_print(
-                f"    Representations数: {len(beam.Representation.Representations) if hasattr(beam.Representation, 'Representations') else 'N/A'}"
+                f"  - Beam: Name={beam.Name}, GlobalId={beam.GlobalId}, "
+                f"Representation={beam.Representation is not None}"
             )
+            if beam.Representation:
+                _log_print(
+                    f"    Representations数: {len(beam.Representation.Representations) if hasattr(beam.Representation, 'Representations') else 'N/A'}"
+                )
     ifc_file.write(output_file)
     _log_print(f"IFCファイル保存完了: {output_file}")
     _log_print("=" * 60)
 
 
+def _phase(ctx, name):
+    """
+    ctx.profiler が設定されている場合、ブロック内の処理をフェーズとして計測する
+
+    Args:
+        ctx: BridgeContext オブジェクト
+        name: フェーズ名
+    """
+    return ctx.profiler.phase(name) if ctx.profiler is not None else nullcontext()
+
+
 # =============================================================================
 # メイン処理関数（オーケストレーター）
 # =============================================================================
-def RunBridge(Location, NameFile, OutputIFCName=None):
+def BuildBridge(
+    Data_Json,
+    Location,
+    OutputIFCName=None,
+    damage_info=None,
+    debug_mode=None,
+    coordinate_precision=DefIFC.COORDINATE_PRECISION,
+    intern_entities=True,
+    profile=False,
+    profile_stats=False,
+):
     """
-    メイン処理関数（オーケストレーター）
-    ExcelまたはJSONファイルから鋼橋データを読み込み、IFCモデルを生成する
+    読み込み済みの橋梁データから IFC モデルを生成する（入力ファイルを読まない）
+
+    実行ごとの状態はすべて BridgeContext に保持するため、別スレッドから同時に呼び出せる。
+    Data_Json は計算線形の処理などで書き換えられるため、呼び出し側で再利用する場合はコピーを渡すこと。
 
     Args:
-        Location: ファイルのディレクトリパス
-        NameFile: ファイル名（.xlsxまたは.json）
+        Data_Json: 橋梁データ（Senkei JSON と同じ構造の辞書）
+        Location: 出力ディレクトリパス（相対パスの OutputIFCName・デバッグログの出力先）
         OutputIFCName: 出力IFCファイル名（省略時は'Girder.ifc'）
+        damage_info: 要素名をキーとした損傷情報（parse_damage_info の戻り値。省略時は損傷情報なし）
+        debug_mode: デバッグモード（省略時は DEBUG_MODE）
+        coordinate_precision: 座標値の丸め桁数（小数点以下）。丸めた座標が同じ点・方向は1つのエンティティを共有する
+        intern_entities: IfcCartesianPoint / IfcDirection を共有するか（Falseの場合は参照ごとに作成する）
+        profile: Trueの場合、フェーズごとの処理時間・最大常駐メモリ・作成したIFCエンティティ数を計測し、
+            IFCファイルと同じ場所に '<IFCファイル名>.profile.json' を出力する
+        profile_stats: Trueの場合、フェーズごとの cProfile 統計も '<IFCファイル名>.<フェーズ名>.prof' に出力する
+            （profile=True として扱う）
+
+    Returns:
+        BridgeContext: 生成に使用したコンテキスト（generated_element_names で生成された要素名、
+            profiler で計測結果を参照できる）
 
     処理フロー:
         1. ログ設定
         2. IFCファイルのセットアップ
-        3. データ読み込み
+        3. BridgeContextの作成
         4. 座標系設定
         5. 計算線形の処理
         6. 各部材の生成（メインパネル、サブパネル、対傾構、横構、横桁、床版、支承）
         7. IFCファイルの保存
+        8. 計測レポートの出力（profile=True の場合）
     """
-    global log_print_func, DEBUG_MODE
+    if debug_mode is None:
+        debug_mode = DEBUG_MODE
 
     # 1. ログ設定
-    log_file = _setup_logging(Location, DEBUG_MODE)
-
-    # 進捗メッセージ
-    print(f"IFCモデル生成開始: {Location}{NameFile}")
+    log_file, log_print_func = _setup_logging(Location, debug_mode)
 
     try:
         # 2. IFCファイルのセットアップ
         ifc_file, bridge_span, geom_context = DefIFC.SetupIFC()
 
-        # 3. データ読み込み
-        Data_Json = _load_bridge_data(Location, NameFile)
+        # 3. BridgeContextの作成（損傷情報は実行ごとに保持する）
+        ctx = BridgeContext(
+            ifc_file,
+            bridge_span,
+            geom_context,
+            Data_Json,
+            Location,
+            debug_mode=debug_mode,
+            log_print_func=log_print_func,
+            damage_info=damage_info,
+            coordinate_precision=coordinate_precision,
+            intern_entities=intern_entities,
+        )
+        output_stem = os.path.splitext(_output_ifc_path(Location, OutputIFCName))[0]
+        if profile or profile_stats:
+            stats_path_func = (lambda name: f"{output_stem}.{name}.prof") if profile_stats else None
+            ctx.profiler = PhaseProfiler(ctx, stats_path_func)
+
+        with DefContext.activate(ctx):
+            # 4. 座標系設定
+            with _phase(ctx, "_setup_coordinate_system"):
+                _setup_coordinate_system(ctx)
+
+            # 5. 計算線形の処理
+            with _phase(ctx, "_process_calculate_lines"):
+                _process_calculate_lines(Data_Json)
+
+            # 6. 各部材の生成
+            for generate in _GENERATION_PHASES:
+                with _phase(ctx, generate.__name__):
+                    generate(ctx)
+
+            # 7. IFCファイルの保存
+            with _phase(ctx, "_save_ifc_file"):
+                _save_ifc_file(ctx, OutputIFCName)
+
+        # 8. 計測レポートの出力
+        if ctx.profiler is not None:
+            ctx.profiler.write_report(f"{output_stem}.profile.json")
+            _progress_print(f"計測レポート保存完了: {ctx.profiler.report_path}")
+    finally:
+        # ログファイルを閉じる（デバッグモードの場合のみ）
+        if log_file is not None:
+            log_file.close()
 
-        # 4. BridgeContextの作成
-        ctx = BridgeContext(ifc_file, bridge_span, geom_context, Data_Json, Location)
+    return ctx
 
-        # 5. 損傷情報の読み込み
-        damage_info_dict = _load_damage_info(Location)
-        if damage_info_dict:
-            DefIFC.load_damage_info(damage_info_dict)
 
-        # 6. 座標系設定
-        _setup_coordinate_system(Data_Json)
+def RunBridge(
+    Location,
+    NameFile,
+    OutputIFCName=None,
+    debug_mode=None,
+    coordinate_precision=DefIFC.COORDINATE_PRECISION,
+    intern_entities=True,
+    profile=False,
+    profile_stats=False,
+):
+    """
+    メイン処理関数（オーケストレーター）
+    ExcelまたはJSONファイルから鋼橋データを読み込み、IFCモデルを生成する
 
-        # 7. 計算線形の処理
-        _process_calculate_lines(Data_Json)
+    Args:
+        Location: ファイルのディレクトリパス
+        NameFile: ファイル名（.xlsxまたは.json）
+        OutputIFCName: 出力IFCファイル名（省略時は'Girder.ifc'）
+        debug_mode: デバッグモード（省略時は DEBUG_MODE）
+        coordinate_precision: 座標値の丸め桁数（小数点以下）。丸めた座標が同じ点・方向は1つのエンティティを共有する
+        intern_entities: IfcCartesianPoint / IfcDirection を共有するか（Falseの場合は参照ごとに作成する）
+        profile: フェーズごとの計測レポートを出力するか（BuildBridge を参照）
+        profile_stats: フェーズごとの cProfile 統計も出力するか（BuildBridge を参照）
 
-        # 8. 各部材の生成
-        _generate_main_panels(ctx)
-        _generate_sub_panels(ctx)
-        _generate_taikeikou(ctx)
-        _generate_yokokou(ctx)
-        _generate_yokogeta(ctx)
-        _generate_shouban_and_guardrail(ctx)
-        _generate_bearing(ctx)
+    Returns:
+        BridgeContext: 生成に使用したコンテキスト（generated_element_names で生成された要素名を参照できる）
 
-        # 9. IFCファイルの保存
-        _save_ifc_file(ctx, OutputIFCName)
-    finally:
-        # ログファイルを閉じる（DEBUG_MODEがTrueの場合のみ）
-        if "log_file" in locals() and log_file is not None:
-            log_file.close()
+    処理フロー:
+        1. データ読み込み
+        2. 損傷情報の読み込み（Location に damage_info.json があれば）
+        3. IFCモデルの生成（BuildBridge）
+    """
+    # 進捗メッセージ
+    print(f"IFCモデル生成開始: {Location}{NameFile}")
+
+    # 1. データ読み込み
+    Data_Json = _load_bridge_data(Location, NameFile)
+
+    # 2. 損傷情報の読み込み
+    damage_info = _load_damage_info(Location)
+
+    # 3. IFCモデルの生成
+    return BuildBridge(
+        Data_Json,
+        Location,
+        OutputIFCName,
+        damage_info=damage_info,
+        debug_mode=debug_mode,
+        coordinate_precision=coordinate_precision,
+        intern_entities=intern_entities,
+        profile=profile,
+        profile_stats=profile_stats,
+    )
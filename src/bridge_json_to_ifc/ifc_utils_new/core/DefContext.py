@@ -0,0 +1,193 @@
+"""
+IFCモデル生成の実行コンテキスト
+1回の RunBridge 実行に固有の状態（ログ出力先・損傷情報・生成済み要素名・橋軸座標系・共有エンティティ・線形の索引・計測）
+を BridgeContext に保持する
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# 実行中の BridgeContext（スレッド・非同期タスクごとに独立）
+_current_context = ContextVar("bridge_context", default=None)
+
+
+# =============================================================================
+# BridgeContext: 橋梁モデル生成に必要なコンテキストを保持するクラス
+# =============================================================================
+class BridgeContext:
+    """
+    橋梁IFCモデル生成に必要なコンテキストを保持するクラス
+
+    モジュールのグローバル変数に状態を持たないため、同一プロセス内で複数の橋梁を
+    （スレッドを分けて）同時に変換できる。
+
+    Attributes:
+        ifc_file: IFCファイルオブジェクト
+        bridge_span: 橋梁スパン
+        geom_context: ジオメトリコンテキスト
+        data_json: JSONから読み込んだ橋梁データ
+        side_export: エクスポート側の情報（1: 上側のみ, -1: 下側のみ, 2: 両側）
+        name_bridge: 橋梁名
+        location: ファイルディレクトリパス
+        debug_mode: デバッグモード（Trueの場合、詳細ログをファイルに出力）
+        log_print_func: ログファイル出力関数（デバッグモードでない場合はNone）
+        damage_info: 要素名をキーとした損傷情報の辞書
+        generated_element_names: 生成された要素名のリスト
+        start_point_bridge: 橋軸の始点（Senkei 先頭線形の始点）
+        end_point_bridge: 橋軸の終点（Senkei 先頭線形の終点）
+        unit_vector_bridge: 橋軸方向の単位ベクトル
+        coordinate_precision: 座標値の丸め桁数（小数点以下）
+        entity_cache: 丸めた座標値をキーとした IfcCartesianPoint / IfcDirection の共有キャッシュ
+            （共有しない場合はNone）
+        senkei_index: 線形データの索引（DefBridgeUtils.Senkei_Index が初回の参照時に作成する）
+        profiler: フェーズごとの計測（DefProfile.PhaseProfiler。計測しない場合はNone）
+    """
+
+    def __init__(
+        self,
+        ifc_file,
+        bridge_span,
+        geom_context,
+        data_json,
+        location,
+        debug_mode=False,
+        log_print_func=None,
+        damage_info=None,
+        coordinate_precision=6,
+        intern_entities=True,
+    ):
+        self.ifc_file = ifc_file
+        self.bridge_span = bridge_span
+        self.geom_context = geom_context
+        self.data_json = data_json
+        self.location = location
+
+        # 基本情報を抽出
+        infor_data = data_json.get("Infor", {})
+        self.name_bridge = infor_data.get("NameBridge", "")
+        self.side_export = infor_data.get("SideExport", 2)
+
+        # 実行ごとの状態
+        self.debug_mode = debug_mode
+        self.log_print_func = log_print_func
+        self.damage_info = dict(damage_info or {})
+        self.generated_element_names = []
+        self.start_point_bridge = None
+        self.end_point_bridge = None
+        self.unit_vector_bridge = None
+        self.coordinate_precision = coordinate_precision
+        self.entity_cache = {} if intern_entities else None
+        self.senkei_index = None
+        self.profiler = None
+
+    @property
+    def ifc_all(self):
+        """ifc_file, bridge_span, geom_contextのタプルを返す（後方互換性のため）"""
+        return (self.ifc_file, self.bridge_span, self.geom_context)
+
+    # データアクセサ
+    @property
+    def senkei_data(self):
+        return self.data_json.get("Senkei", [])
+
+    @property
+    def main_panel_data(self):
+        return self.data_json.get("MainPanel", [])
+
+    @property
+    def sub_panel_data(self):
+        return self.data_json.get("SubPanel", [])
+
+    @property
+    def taikeikou_data(self):
+        return self.data_json.get("Taikeikou", [])
+
+    @property
+    def yokokou_data(self):
+        return self.data_json.get("Yokokou", [])
+
+    @property
+    def yokogeta_data(self):
+        return self.data_json.get("Yokogeta", [])
+
+    @property
+    def shouban_data(self):
+        return self.data_json.get("Shouban", [])
+
+    @property
+    def bearing_data(self):
+        return self.data_json.get("Bearing", [])
+
+    @property
+    def member_data(self):
+        return self.data_json.get("MemberData", {})
+
+    @property
+    def member_rib_data(self):
+        return self.data_json.get("MemberRib", {})
+
+    @property
+    def member_spl_data(self):
+        return self.data_json.get("MemberSPL", {})
+
+
+# =============================================================================
+# 実行中コンテキストへのアクセス
+# =============================================================================
+@contextmanager
+def activate(ctx):
+    """
+    ブロック内の部材生成関数が参照する BridgeContext を設定する
+
+    Args:
+        ctx: BridgeContext オブジェクト
+    """
+    token = _current_context.set(ctx)
+    try:
+        yield ctx
+    finally:
+        _current_context.reset(token)
+
+
+def current_context():
+    """
+    実行中の BridgeContext を返す
+
+    Returns:
+        BridgeContext（RunBridge の外から呼ばれた場合はNone）
+    """
+    return _current_context.get()
+
+
+def log_enabled():
+    """
+    実行中コンテキストでログファイル出力が有効かを返す
+
+    ループ内などメッセージの作成に時間がかかるログは、この判定の中で作成する
+    （デバッグモードでない通常の実行ではメッセージを作成しない）。
+
+    Returns:
+        True: デバッグモードでログ出力関数が設定されている
+    """
+    ctx = _current_context.get()
+    return ctx is not None and ctx.debug_mode and ctx.log_print_func is not None
+
+
+def log_print(*args, **kwargs):
+    """ログファイル出力関数（実行中コンテキストがデバッグモードの場合のみ出力）"""
+    ctx = _current_context.get()
+    if ctx is not None and ctx.debug_mode and ctx.log_print_func:
+        ctx.log_print_func(*args, **kwargs)
+
+
+def bridge_axis():
+    """
+    実行中コンテキストの橋軸（始点, 単位ベクトル）を返す
+
+    Returns:
+        (start_point_bridge, unit_vector_bridge)（未設定の場合は (None, None)）
+    """
+    ctx = _current_context.get()
+    if ctx is None:
+        return None, None
+    return ctx.start_point_bridge, ctx.unit_vector_bridge
@@ -9,22 +9,14 @@ import uuid
 import ifcopenshell
 import numpy as np
 
-from src.bridge_json_to_ifc.ifc_utils_new.core import DefMath
-
-# 生成された要素名を記録するグローバルリスト
-_generated_element_names = []
-
-# 損傷情報を格納するグローバル辞書（要素名をキーとする）
-_damage_info_dict = {}
-
-# グローバル変数: ログファイル出力関数（DefBridge.pyから設定される）
-log_print_func = None
+from src.bridge_json_to_ifc.ifc_utils_new.core import DefContext, DefMath
 
+# 座標値の丸め桁数（小数点以下）の既定値。IfcCartesianPoint / IfcDirection の共有判定にも使用する
+COORDINATE_PRECISION = 6
 
 def _log_print(*args, **kwargs):
     """ログファイル出力関数（DEBUG_MODE時のみ出力）"""
-    if log_print_func:
-        log_print_func(*args, **kwargs)
+    DefContext.log_print(*args, **kwargs)
 
 
 def SetupIFC():
@@ -86,7 +78,7 @@ def SetupIFC():
         CoordinateSpaceDimension=3,
         Precision=0.1,
         WorldCoordinateSystem=ifc_file.createIfcAxis2Placement3D(
-            Location=ifc_file.createIfcCartesianPoint((0.0, 0.0, 0.0)),
+            Location=create_cartesian_point(ifc_file, (0.0, 0.0, 0.0)),
         ),
         TrueNorth=None,
     )
@@ -104,10 +96,55 @@ def new_guid():
     return str(uuid.uuid1())
 
 
+def _round_coordinates(coordinates, precision):
+    """座標を実数に変換して precision 桁で丸める（-0.0 は 0.0 にそろえる）"""
+    return tuple(round(float(coord), precision) + 0.0 for coord in coordinates)
+
+
+def _interning_context(ifc_file):
+    """
+    ifc_file のエンティティ共有キャッシュを持つ実行中コンテキストを返す
+
+    Returns:
+        BridgeContext（RunBridge の外、別のIFCファイル、共有無効の場合はNone）
+    """
+    ctx = DefContext.current_context()
+    if ctx is None or ctx.ifc_file is not ifc_file or ctx.entity_cache is None:
+        return None
+    return ctx
+
+
+def _create_interned(ifc_file, entity_type, values):
+    """
+    丸めた座標値が同じエンティティを1つのIFCファイル内で共有して作成する
+
+    Args:
+        ifc_file: IFCファイルオブジェクト
+        entity_type: 'IfcCartesianPoint' または 'IfcDirection'
+        values: 座標値（CoordinatesまたはDirectionRatios）
+
+    Returns:
+        作成済み（または新規作成した）エンティティ
+    """
+    ctx = _interning_context(ifc_file)
+    if ctx is None:
+        return ifc_file.create_entity(entity_type, _round_coordinates(values, COORDINATE_PRECISION))
+
+    key = (entity_type, _round_coordinates(values, ctx.coordinate_precision))
+    entity = ctx.entity_cache.get(key)
+    if entity is None:
+        entity = ifc_file.create_entity(entity_type, key[1])
+        ctx.entity_cache[key] = entity
+    return entity
+
+
 def create_cartesian_point(ifc_file, coordinates):
     """
     座標リストからIfcCartesianPointを作成する
 
+    RunBridge の実行中は、丸めた座標が同じ点を同じIFCファイル内で共有する
+    （丸め桁数は BridgeContext.coordinate_precision）。
+
     Args:
         ifc_file: IFCファイルオブジェクト
         coordinates: 座標のリスト [x, y, z] または [x, y]
@@ -115,10 +152,23 @@ def create_cartesian_point(ifc_file, coordinates):
     Returns:
         IfcCartesianPointエンティティ
     """
-    # 各座標を文字列から実数に変換し、6桁で丸める
-    coordinates_new = [round(float(coord), 6) for coord in coordinates]
-    # IfcCartesianPointオブジェクトを作成
-    return ifc_file.createIfcCartesianPoint(coordinates_new)
+    return _create_interned(ifc_file, "IfcCartesianPoint", coordinates)
+
+
+def create_direction(ifc_file, ratios):
+    """
+    方向ベクトルからIfcDirectionを作成する
+
+    RunBridge の実行中は、丸めた成分が同じ方向を同じIFCファイル内で共有する。
+
+    Args:
+        ifc_file: IFCファイルオブジェクト
+        ratios: 方向ベクトルの成分 [x, y, z] または [x, y]
+
+    Returns:
+        IfcDirectionエンティティ
+    """
+    return _create_interned(ifc_file, "IfcDirection", ratios)
 
 
 def create_face_from_points(ifc_file, face_points):
@@ -417,9 +467,12 @@ def Create_brep_from_box_points(ifc_file, arCoordB, arCoordT):
     Returns:
         IfcFacetedBrep: 作成されたソリッド
     """
-    _log_print(
-        f"      [BREP DEBUG] Create_brep_from_box_points開始: arCoordBの数={len(arCoordB)}, arCoordTの数={len(arCoordT)}"
-    )
+    debug_log = DefContext.log_enabled()
+    if debug_log:
+        _log_print(
+            f"      [BREP DEBUG] Create_brep_from_box_points開始: "
+            f"arCoordBの数={len(arCoordB)}, arCoordTの数={len(arCoordT)}"
+        )
     if len(arCoordB) == 0 or len(arCoordT) == 0:
         _log_print("      [BREP DEBUG] 警告: 座標配列が空です")
         return None
@@ -479,18 +532,20 @@ def Create_brep_from_box_points(ifc_file, arCoordB, arCoordT):
         _log_print("      [BREP DEBUG] 警告: 面が作成されませんでした")
         return None
 
-    _log_print(f"      [BREP DEBUG] 面の数: {len(face_indices)}")
     faces = [create_face_from_points(ifc_file, indices) for indices in face_indices]
-    _log_print(f"      [BREP DEBUG] IfcFace作成完了: {len(faces)}個")
     shell = ifc_file.createIfcClosedShell(faces)
-    _log_print(
-        f"      [BREP DEBUG] IfcClosedShell作成完了: Faces数={len(shell.CfsFaces) if hasattr(shell, 'CfsFaces') else 'N/A'}"
-    )
     # result = ifc_file.createIfcManifoldSolidBrep(shell)
     result = ifc_file.createIfcFacetedBrep(shell)
-    _log_print(
-        f"      [BREP DEBUG] IfcFacetedBrep作成完了: Outer={result.Outer if hasattr(result, 'Outer') else 'N/A'}"
-    )
+    if debug_log:
+        _log_print(f"      [BREP DEBUG] 面の数: {len(face_indices)}")
+        _log_print(f"      [BREP DEBUG] IfcFace作成完了: {len(faces)}個")
+        _log_print(
+            f"      [BREP DEBUG] IfcClosedShell作成完了: "
+            f"Faces数={len(shell.CfsFaces) if hasattr(shell, 'CfsFaces') else 'N/A'}"
+        )
+        _log_print(
+            f"      [BREP DEBUG] IfcFacetedBrep作成完了: Outer={result.Outer if hasattr(result, 'Outer') else 'N/A'}"
+        )
 
     return result
 
@@ -516,10 +571,15 @@ def Add_shape_representation_in_Beam(
     # UUIDを追加しない（呼び出し側で完全な名前を渡す）
     # ただし、名前が既に完全な形式（T_X_Yなど）を含む場合はそのまま使用
     unique_name = NameBeam_str
-    _log_print(f"    [IFC DEBUG] Add_shape_representation_in_Beam: NameBeam={NameBeam_str}, unique_name={unique_name}")
-    _log_print(
-        f"    [IFC DEBUG] shape_representation type={type(shape_representation)}, Items数={len(shape_representation.Items) if hasattr(shape_representation, 'Items') else 'N/A'}"
-    )
+    # デバッグログはメッセージの作成（エンティティの文字列化など）ごと省略する
+    debug_log = DefContext.log_enabled()
+    if debug_log:
+        _log_print(
+            f"    [IFC DEBUG] Add_shape_representation_in_Beam: NameBeam={NameBeam_str}, unique_name={unique_name}"
+        )
+        _log_print(
+            f"    [IFC DEBUG] shape_representation type={type(shape_representation)}, Items数={len(shape_representation.Items) if hasattr(shape_representation, 'Items') else 'N/A'}"
+        )
 
     # オブジェクトにリンクするIfcProductDefinitionShapeを作成
     product_definition_shape = ifc_file.createIfcProductDefinitionShape(
@@ -527,7 +587,8 @@ def Add_shape_representation_in_Beam(
         Description=None,  # 製品定義の説明（不要な場合はNone）
         Representations=[shape_representation],  # 形状表現のリスト
     )
-    _log_print(f"    [IFC DEBUG] product_definition_shape作成完了: {product_definition_shape}")
+    if debug_log:
+        _log_print(f"    [IFC DEBUG] product_definition_shape作成完了: {product_definition_shape}")
 
     # オブジェクトの位置を定義するIfcLocalPlacementを作成
     # bridge_spanのObjectPlacementを取得して、それを参照にする
@@ -539,12 +600,13 @@ def Add_shape_representation_in_Beam(
     beam_placement = ifc_file.createIfcLocalPlacement(
         PlacementRelTo=parent_placement,  # 親オブジェクトの配置を参照
         RelativePlacement=ifc_file.createIfcAxis2Placement3D(
-            Location=ifc_file.createIfcCartesianPoint((0.0, 0.0, 0.0)),  # オブジェクトの位置 (0, 0, 0)
+            Location=create_cartesian_point(ifc_file, (0.0, 0.0, 0.0)),  # オブジェクトの位置 (0, 0, 0)
             Axis=None,  # 軸（不要な場合はNone）
             RefDirection=None,  # 参照方向（不要な場合はNone）
         ),
     )
-    _log_print(f"    [IFC DEBUG] beam_placement作成完了: parent_placement={parent_placement}")
+    if debug_log:
+        _log_print(f"    [IFC DEBUG] beam_placement作成完了: parent_placement={parent_placement}")
 
     # IfcBeamを属性と形状で作成
     beam_guid = new_guid()
@@ -573,13 +635,18 @@ def Add_shape_representation_in_Beam(
             pass
     if tag_value:
         beam.Tag = tag_value
-    _log_print(
-        f"    [IFC DEBUG] IfcBeam作成完了: GlobalId={beam_guid}, Name={unique_name}, ObjectPlacement={beam_placement}"
-    )
+    if debug_log:
+        _log_print(
+            f"    [IFC DEBUG] IfcBeam作成完了: GlobalId={beam_guid}, Name={unique_name}, "
+            f"ObjectPlacement={beam_placement}"
+        )
 
-    # 生成された要素名を記録（アンダースコアを保持）
+    # 生成された要素名を実行中のコンテキストに記録（アンダースコアを保持）
     # unique_nameは文字列としてそのまま記録されるため、アンダースコアは保持される
-    _generated_element_names.append(str(unique_name))
+    ctx = DefContext.current_context()
+    if ctx is not None:
+        ctx.generated_element_names.append(str(unique_name))
+    damage_info_dict = ctx.damage_info if ctx is not None else {}
 
     # プロパティセットを追加
     if pset_name and properties:
@@ -599,14 +666,16 @@ def Add_shape_representation_in_Beam(
                 _log_print(f"    [IFC WARNING] プロパティセットの追加に失敗しました: {e}")
 
     # 損傷情報をプロパティセットとして追加
-    _log_print(
-        f"    [DAMAGE DEBUG] 要素名チェック: unique_name='{unique_name}', 損傷情報辞書のキー数={len(_damage_info_dict)}"
-    )
-    if len(_damage_info_dict) > 0:
-        _log_print(f"    [DAMAGE DEBUG] 損傷情報辞書のキー一覧: {list(_damage_info_dict.keys())}")
+    if debug_log:
+        _log_print(
+            f"    [DAMAGE DEBUG] 要素名チェック: unique_name='{unique_name}', "
+            f"損傷情報辞書のキー数={len(damage_info_dict)}"
+        )
+        if len(damage_info_dict) > 0:
+            _log_print(f"    [DAMAGE DEBUG] 損傷情報辞書のキー一覧: {list(damage_info_dict.keys())}")
 
-    if unique_name in _damage_info_dict:
-        damage_data = _damage_info_dict[unique_name]
+    if unique_name in damage_info_dict:
+        damage_data = damage_info_dict[unique_name]
         print(f"    [損傷] {unique_name} に損傷情報を適用中...")
         _log_print(f"    [DAMAGE DEBUG] 損傷情報が見つかりました: {unique_name}")
 
@@ -713,7 +782,7 @@ def Add_shape_representation_in_Beam(
 
                 _log_print(f"    [IFC WARNING] 損傷情報のプロパティセット追加に失敗しました: {e}")
                 _log_print(f"    [IFC WARNING] トレースバック: {traceback.format_exc()}")
-    else:
+    elif debug_log:
         _log_print(f"    [DAMAGE DEBUG] 損傷情報が見つかりませんでした: '{unique_name}' は損傷情報辞書に存在しません")
 
     # 梁を橋梁スパンの一部としてリンクするIfcRelContainedInSpatialStructureを作成
@@ -724,10 +793,11 @@ def Add_shape_representation_in_Beam(
         RelatingStructure=bridge_span,  # オブジェクトが含まれる橋梁スパン（スパン）
         RelatedElements=[beam],  # 橋梁スパン内のオブジェクト（梁など）
     )
-    _log_print(
-        f"    [IFC DEBUG] IfcRelContainedInSpatialStructure作成完了: GlobalId={relation_guid}, RelatedElements数={len(relation.RelatedElements)}"
-    )
-    _log_print(f"    [IFC DEBUG] {NameBeam}のIFCエンティティ追加完了")
+    if debug_log:
+        _log_print(
+            f"    [IFC DEBUG] IfcRelContainedInSpatialStructure作成完了: GlobalId={relation_guid}, RelatedElements数={len(relation.RelatedElements)}"
+        )
+        _log_print(f"    [IFC DEBUG] {NameBeam}のIFCエンティティ追加完了")
 
 
 def extrude_profile_and_align(ifc_file, profile_points, Thick, pal1, pal2, pal3):
@@ -744,22 +814,22 @@ def extrude_profile_and_align(ifc_file, profile_points, Thick, pal1, pal2, pal3)
     profile = ifc_file.createIfcArbitraryClosedProfileDef("AREA", None, polyline)
     axis2placement = ifc_file.createIfcAxis2Placement3D(
         create_cartesian_point(ifc_file, pal1_list),
-        ifc_file.createIfcDirection(pal2_list),
-        ifc_file.createIfcDirection(pal3_list),
+        create_direction(ifc_file, pal2_list),
+        create_direction(ifc_file, pal3_list),
     )
     solid_obj = ifc_file.createIfcExtrudedAreaSolid(
-        profile, axis2placement, ifc_file.createIfcDirection([0.0, 0.0, 1.0]), Thick
+        profile, axis2placement, create_direction(ifc_file, [0.0, 0.0, 1.0]), Thick
     )
 
     return solid_obj
 
 
 def _pt2d(ifc, xy):
-    return ifc.createIfcCartesianPoint([float(xy[0]), float(xy[1])])
+    return create_cartesian_point(ifc, xy[:2])
 
 
 def _pt3d(ifc, xyz):
-    return ifc.createIfcCartesianPoint([float(xyz[0]), float(xyz[1]), float(xyz[2])])
+    return create_cartesian_point(ifc, xyz[:3])
 
 
 def sweep_profile_along_polyline(ifc_file, profile_points_2d, path_points_3d, fixed_reference=(0, 0, 1)):
@@ -784,7 +854,7 @@ def sweep_profile_along_polyline(ifc_file, profile_points_2d, path_points_3d, fi
     directrix = ifc_file.createIfcPolyline([_pt3d(ifc_file, p) for p in path_points_3d])
 
     # --- プロファイルの固定方向（FixedReference） ---
-    fixed_ref = ifc_file.createIfcDirection([float(x) for x in fixed_reference])
+    fixed_ref = create_direction(ifc_file, [float(x) for x in fixed_reference])
 
     # --- スイープソリッドの作成 ---
     swept = ifc_file.createIfcFixedReferenceSweptAreaSolid(
@@ -869,21 +939,21 @@ def Draw_Solid_Circle(ifc_file, pcen, dcir, pal1, pal2, pal3, Distance_extrude=5
     void_position1 = np.array(pal1)
     void_axis2placement1 = ifc_file.createIfcAxis2Placement3D(
         create_cartesian_point(ifc_file, void_position1),
-        ifc_file.createIfcDirection(pal2_list),
-        ifc_file.createIfcDirection(pal3_list),
+        create_direction(ifc_file, pal2_list),
+        create_direction(ifc_file, pal3_list),
     )
 
     if Distance_extrude == 50.1:
         SolidHole1 = ifc_file.createIfcExtrudedAreaSolid(
-            circle_profile, void_axis2placement1, ifc_file.createIfcDirection([0.0, 0.0, 1.0]), 50
+            circle_profile, void_axis2placement1, create_direction(ifc_file, [0.0, 0.0, 1.0]), 50
         )
         SolidHole2 = ifc_file.createIfcExtrudedAreaSolid(
-            circle_profile, void_axis2placement1, ifc_file.createIfcDirection([0.0, 0.0, 1.0]), -50
+            circle_profile, void_axis2placement1, create_direction(ifc_file, [0.0, 0.0, 1.0]), -50
         )
         main_solid = ifc_file.createIfcBooleanResult("UNION", SolidHole1, SolidHole2)
     else:
         main_solid = ifc_file.createIfcExtrudedAreaSolid(
-            circle_profile, void_axis2placement1, ifc_file.createIfcDirection([0.0, 0.0, 1.0]), Distance_extrude
+            circle_profile, void_axis2placement1, create_direction(ifc_file, [0.0, 0.0, 1.0]), Distance_extrude
         )
 
     return main_solid
@@ -935,15 +1005,15 @@ def Draw_Solid_Bolt(ifc_file, pcen, dhole, gap_cen_to_head, gap_cen_to_nut, pal1
         pal3_head_list = pal3_head_vector.tolist()
         bolt_axis2placement = ifc_file.createIfcAxis2Placement3D(
             create_cartesian_point(ifc_file, pal1_head_list),
-            ifc_file.createIfcDirection(pal2_head_list),
-            ifc_file.createIfcDirection(pal3_head_list),
+            create_direction(ifc_file, pal2_head_list),
+            create_direction(ifc_file, pal3_head_list),
         )
         # ボルトの頭部
         solid_head = ifc_file.createIfcExtrudedAreaSolid(
-            circle_head_profile, bolt_axis2placement, ifc_file.createIfcDirection([0.0, 0.0, 1.0]), hhead
+            circle_head_profile, bolt_axis2placement, create_direction(ifc_file, [0.0, 0.0, 1.0]), hhead
         )
         solid_shaft = ifc_file.createIfcExtrudedAreaSolid(
-            circle_shaft_profile, bolt_axis2placement, ifc_file.createIfcDirection([0.0, 0.0, -1.0]), hshaft
+            circle_shaft_profile, bolt_axis2placement, create_direction(ifc_file, [0.0, 0.0, -1.0]), hshaft
         )
 
         pal1_nut = DefMath.Point_on_parallel_line(pal1, pal1, pal2, -gap_cen_to_nut)
@@ -957,11 +1027,11 @@ def Draw_Solid_Bolt(ifc_file, pcen, dhole, gap_cen_to_head, gap_cen_to_nut, pal1
         # 下側のナット
         nut_axis2placement = ifc_file.createIfcAxis2Placement3D(
             create_cartesian_point(ifc_file, pal1_nut_list),
-            ifc_file.createIfcDirection(pal2_nut_list),
-            ifc_file.createIfcDirection(pal3_nut_list),
+            create_direction(ifc_file, pal2_nut_list),
+            create_direction(ifc_file, pal3_nut_list),
         )
         solid_nut = ifc_file.createIfcExtrudedAreaSolid(
-            circle_nut_profile, nut_axis2placement, ifc_file.createIfcDirection([0.0, 0.0, -1.0]), hnut
+            circle_nut_profile, nut_axis2placement, create_direction(ifc_file, [0.0, 0.0, -1.0]), hnut
         )
 
         # 各部分を結合
@@ -978,15 +1048,15 @@ def Draw_Solid_Bolt(ifc_file, pcen, dhole, gap_cen_to_head, gap_cen_to_nut, pal1
         pal3_head_list = pal3_head_vector.tolist()
         bolt_axis2placement = ifc_file.createIfcAxis2Placement3D(
             create_cartesian_point(ifc_file, pal1_head_list),
-            ifc_file.createIfcDirection(pal2_head_list),
-            ifc_file.createIfcDirection(pal3_head_list),
+            create_direction(ifc_file, pal2_head_list),
+            create_direction(ifc_file, pal3_head_list),
         )
         # ボルトの頭部
         solid_head = ifc_file.createIfcExtrudedAreaSolid(
-            circle_head_profile, bolt_axis2placement, ifc_file.createIfcDirection([0.0, 0.0, 1.0]), -hhead
+            circle_head_profile, bolt_axis2placement, create_direction(ifc_file, [0.0, 0.0, 1.0]), -hhead
         )
         solid_shaft = ifc_file.createIfcExtrudedAreaSolid(
-            circle_shaft_profile, bolt_axis2placement, ifc_file.createIfcDirection([0.0, 0.0, -1.0]), -hshaft
+            circle_shaft_profile, bolt_axis2placement, create_direction(ifc_file, [0.0, 0.0, -1.0]), -hshaft
         )
 
         pal1_nut = DefMath.Point_on_parallel_line(pal1, pal1, pal2, -gap_cen_to_nut)
@@ -1000,11 +1070,11 @@ def Draw_Solid_Bolt(ifc_file, pcen, dhole, gap_cen_to_head, gap_cen_to_nut, pal1
         # 下側のナット
         nut_axis2placement = ifc_file.createIfcAxis2Placement3D(
             create_cartesian_point(ifc_file, pal1_nut_list),
-            ifc_file.createIfcDirection(pal2_nut_list),
-            ifc_file.createIfcDirection(pal3_nut_list),
+            create_direction(ifc_file, pal2_nut_list),
+            create_direction(ifc_file, pal3_nut_list),
         )
         solid_nut = ifc_file.createIfcExtrudedAreaSolid(
-            circle_nut_profile, nut_axis2placement, ifc_file.createIfcDirection([0.0, 0.0, -1.0]), -hnut
+            circle_nut_profile, nut_axis2placement, create_direction(ifc_file, [0.0, 0.0, -1.0]), -hnut
         )
 
         # 各部分を結合
@@ -1014,6 +1084,117 @@ def Draw_Solid_Bolt(ifc_file, pcen, dhole, gap_cen_to_head, gap_cen_to_nut, pal1
     return complete_bolt
 
 
+def _bolt_representation_map(ifc_file, geom_context, dhole, gap_cen_to_head, gap_cen_to_nut, axis_length):
+    """
+    ボルト種類ごとの IfcRepresentationMap を返す
+
+    ボルト座標系（原点: 基準点、Z: ボルト軸、X: 参照方向）での形状を Draw_Solid_Bolt で作成する。
+    RunBridge の実行中は、穴径・頭側/ナット側の長さが同じボルトで1つのマップを共有する。
+
+    Args:
+        ifc_file: IFCファイルオブジェクト
+        geom_context: 幾何表現コンテキスト
+        dhole: 穴径
+        gap_cen_to_head: 基準点から頭部までの距離
+        gap_cen_to_nut: 基準点からナットまでの距離
+        axis_length: 基準点から軸方向の点までの距離
+
+    Returns:
+        IfcRepresentationMapエンティティ
+    """
+    ctx = _interning_context(ifc_file)
+    key = None
+    if ctx is not None:
+        # 頭部・ナットの押し出し方向は axis_length と各距離の大小で反転するため、その向きもキーに含める
+        key = (
+            "IfcRepresentationMap",
+            "Bolt",
+            _round_coordinates((dhole, gap_cen_to_head, gap_cen_to_nut), ctx.coordinate_precision),
+            axis_length > gap_cen_to_head,
+            axis_length > -gap_cen_to_nut,
+        )
+        representation_map = ctx.entity_cache.get(key)
+        if representation_map is not None:
+            return representation_map
+
+    solid_bolt = Draw_Solid_Bolt(
+        ifc_file,
+        (0.0, 0.0),
+        dhole,
+        gap_cen_to_head,
+        gap_cen_to_nut,
+        (0.0, 0.0, 0.0),
+        (0.0, 0.0, axis_length),
+        (100.0, 0.0, 0.0),
+    )
+    representation_map = ifc_file.createIfcRepresentationMap(
+        MappingOrigin=ifc_file.createIfcAxis2Placement3D(create_cartesian_point(ifc_file, (0.0, 0.0, 0.0))),
+        MappedRepresentation=ifc_file.createIfcShapeRepresentation(
+            ContextOfItems=geom_context,
+            RepresentationIdentifier="Body",
+            RepresentationType="CSG",
+            Items=[solid_bolt],
+        ),
+    )
+    if key is not None:
+        ctx.entity_cache[key] = representation_map
+    return representation_map
+
+
+def Draw_Mapped_Bolt(ifc_file, geom_context, pcen, dhole, gap_cen_to_head, gap_cen_to_nut, pal1, pal2, pal3):
+    """
+    ボルトの形状表現を作成する（Draw_Solid_Bolt と同じ位置・形状）
+
+    ボルトの形状はボルト種類ごとの IfcRepresentationMap を共有し、
+    各ボルトは配置を表す変換付きの IfcMappedItem として出力する。
+
+    Args:
+        ifc_file: IFCファイルオブジェクト
+        geom_context: 幾何表現コンテキスト
+        pcen: ボルト座標系でのボルト中心 [x, y]
+        dhole: 穴径
+        gap_cen_to_head: 基準点から頭部までの距離
+        gap_cen_to_nut: 基準点からナットまでの距離
+        pal1: ボルト座標系の基準点
+        pal2: ボルト軸方向の点
+        pal3: 参照方向（X軸）の点
+
+    Returns:
+        IfcShapeRepresentationエンティティ（RepresentationType='MappedRepresentation'）
+    """
+    pal1 = np.array(pal1, dtype=float)
+    pal2 = np.array(pal2, dtype=float)
+    pal3 = np.array(pal3, dtype=float)
+
+    # ボルト座標系（IfcAxis2Placement3D と同じく参照方向をボルト軸に直交化する）
+    axis_length = float(np.linalg.norm(pal2 - pal1))
+    axis_z = (pal2 - pal1) / axis_length
+    ref_vector = pal3 - pal1
+    axis_x = ref_vector - np.dot(ref_vector, axis_z) * axis_z
+    axis_x = axis_x / np.linalg.norm(axis_x)
+    axis_y = np.cross(axis_z, axis_x)
+    origin = pal1 + float(pcen[0]) * axis_x + float(pcen[1]) * axis_y
+
+    representation_map = _bolt_representation_map(
+        ifc_file, geom_context, dhole, gap_cen_to_head, gap_cen_to_nut, axis_length
+    )
+    transformation = ifc_file.createIfcCartesianTransformationOperator3D(
+        Axis1=create_direction(ifc_file, axis_x.tolist()),
+        Axis2=create_direction(ifc_file, axis_y.tolist()),
+        LocalOrigin=create_cartesian_point(ifc_file, origin.tolist()),
+        Scale=1.0,
+        Axis3=create_direction(ifc_file, axis_z.tolist()),
+    )
+    mapped_item = ifc_file.createIfcMappedItem(MappingSource=representation_map, MappingTarget=transformation)
+
+    return ifc_file.createIfcShapeRepresentation(
+        ContextOfItems=geom_context,
+        RepresentationIdentifier="Body",
+        RepresentationType="MappedRepresentation",
+        Items=[mapped_item],
+    )
+
+
 def create_ifc_polyline(ifc_file, points):
     # 点のリストから IfcPolyline を作成する
     # IfcCartesianPoint を作成
@@ -1056,47 +1237,3 @@ def union_all_solids(ifc_file, solids):
         result = ifc_file.createIfcBooleanResult("UNION", result, solid)
 
     return result
-
-
-def get_generated_element_names():
-    """
-    生成された要素名のリストを取得する
-
-    Returns:
-        list: 生成された要素名のリスト
-    """
-    return _generated_element_names.copy()
-
-
-def clear_generated_element_names():
-    """
-    生成された要素名のリストをクリアする
-    """
-    global _generated_element_names
-    _generated_element_names = []
-
-
-def load_damage_info(damage_info_dict):
-    """
-    損傷情報を読み込む
-
-    Args:
-        damage_info_dict: 要素名をキーとした損傷情報の辞書
-            {
-                "ElementName": [
-                    {"DamageType": "腐食損傷", "DamageLevel": "C"},
-                    ...
-                ],
-                ...
-            }
-    """
-    global _damage_info_dict
-    _damage_info_dict = damage_info_dict.copy()
-
-
-def clear_damage_info():
-    """
-    損傷情報をクリアする
-    """
-    global _damage_info_dict
-    _damage_info_dict = {}
@@ -10,21 +10,16 @@ from src.bridge_json_to_ifc.ifc_utils_new.components.DefPanel import (
     Check_break_mainpanle,
     Devide_Coord_FLG_mainpanel_break,
 )
-from src.bridge_json_to_ifc.ifc_utils_new.core import DefIFC, DefMath
+from src.bridge_json_to_ifc.ifc_utils_new.core import DefContext, DefIFC, DefMath
 from src.bridge_json_to_ifc.ifc_utils_new.utils.DefBridgeUtils import (
     Calculate_Extend,
     Calculate_Extend_Coord,
     Load_Coordinate_Panel,
 )
 
-# グローバル変数: ログファイル出力関数
-log_print_func = None
-
-
 def _log_print(*args, **kwargs):
     """ログファイル出力関数（DEBUG_MODE時のみ出力）"""
-    if log_print_func:
-        log_print_func(*args, **kwargs)
+    DefContext.log_print(*args, **kwargs)
 
 
 def get_non_duplicate_indices(arCoordLines, tolerance=0.01):
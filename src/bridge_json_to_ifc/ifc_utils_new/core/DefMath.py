@@ -747,79 +747,64 @@ def intersection_2Line_3D(p1, p2, d1, d2):
 
 
 def Offset_Face_2Line(Coord1_Base, Coord2_Base, Distance):
-    if Distance == 0:
-        Coord1_off = Coord1_Base.copy()
-        Coord2_off = Coord2_Base.copy()
-    else:
-        Coord1_off = Coord1_Base.copy()
-        Coord2_off = Coord2_Base.copy()
-        for i in range(0, len(Coord1_Base)):
-            if i == 0:
-                Point_Off = Offset_point(Coord1_Base[i], Coord2_Base[i], Coord1_Base[i + 1], Distance)
-                Coord1_off[i] = Point_Off
-
-                Point_Off = Offset_point(Coord2_Base[i], Coord1_Base[i], Coord2_Base[i + 1], -Distance)
-                Coord2_off[i] = Point_Off
+    """
+    2本の線で定義される面を法線方向にオフセットする
 
-            elif i == len(Coord1_Base) - 1:
-                Point_Off = Offset_point(Coord1_Base[i], Coord2_Base[i], Coord1_Base[i - 1], -Distance)
-                Coord1_off[i] = Point_Off
+    中間点では前後の面のオフセット面の交線から新しい点を求める（全点を配列でまとめて計算する）。
 
-                Point_Off = Offset_point(Coord2_Base[i], Coord1_Base[i], Coord2_Base[i - 1], Distance)
-                Coord2_off[i] = Point_Off
+    Args:
+        Coord1_Base: 線1の点の配列
+        Coord2_Base: 線2の点の配列
+        Distance: オフセット距離
 
-            else:
-                Ang1 = Angle_between_planes(
-                    Coord1_Base[i],
-                    Coord2_Base[i],
-                    Coord1_Base[i - 1],
-                    Coord1_Base[i],
-                    Coord2_Base[i],
-                    Coord1_Base[i + 1],
-                )
+    Returns:
+        tuple: (オフセットした線1, オフセットした線2)
+    """
+    Coord1_off = Coord1_Base.copy()
+    Coord2_off = Coord2_Base.copy()
+    if Distance == 0:
+        return Coord1_off, Coord2_off
+
+    A = _as_points(Coord1_Base)
+    B = _as_points(Coord2_Base)
+    n = len(A)
+    Coord1_new = np.empty((n, 3))
+    Coord2_new = np.empty((n, 3))
+
+    # 始点・終点
+    Coord1_new[0] = Offset_point(A[0], B[0], A[1], Distance)
+    Coord2_new[0] = Offset_point(B[0], A[0], B[1], -Distance)
+    Coord1_new[-1] = Offset_point(A[-1], B[-1], A[-2], -Distance)
+    Coord2_new[-1] = Offset_point(B[-1], A[-1], B[-2], Distance)
+
+    # 中間点（i: 各中間点, prev: i - 1, next: i + 1）
+    A_i, A_prev, A_next = A[1:-1], A[:-2], A[2:]
+    B_i, B_prev, B_next = B[1:-1], B[:-2], B[2:]
+    normal_prev = Normal_vector_batch(A_i, B_i, A_prev)
+    normal_next = Normal_vector_batch(A_i, B_i, A_next)
+    Ang1 = Angle_between_normals_batch(normal_prev, normal_next)
+    straight = ((np.abs(Ang1 - math.pi) < 0.000001) | np.isnan(Ang1))[:, None]
+
+    atc = A_i + Distance * normal_next
+    atc1 = A_i + -Distance * normal_prev
+    atc2 = Offset_point_batch(B_i, A_i, B_next, -Distance)
+    atc3 = Offset_point_batch(B_i, A_i, B_prev, Distance)
+    atc5 = Offset_point_batch(A_next, B_next, A_i, -Distance)
+    atc6 = Offset_point_batch(A_prev, B_prev, A_i, Distance)
+    atc7 = Intersection_line_plane_batch(atc1, atc3, atc6, atc, atc5)
+    atc8 = Intersection_line_plane_batch(atc, atc2, atc5, atc1, atc6)
+    Coord1_new[1:-1] = np.where(straight, atc, _mean_of_intersections(atc7, atc8, atc))
+
+    # 線2側（atc, atc1, atc2, atc3 は線1側と共通）
+    btc5 = Offset_point_batch(B_next, A_next, B_i, Distance)
+    btc6 = Offset_point_batch(B_prev, A_prev, B_i, -Distance)
+    btc7 = Intersection_line_plane_batch(atc3, atc1, btc6, atc2, btc5)
+    btc8 = Intersection_line_plane_batch(atc2, atc, btc5, atc3, btc6)
+    Coord2_new[1:-1] = np.where(straight, atc2, _mean_of_intersections(btc7, btc8, atc2))
 
-                atc = Offset_point(Coord1_Base[i], Coord2_Base[i], Coord1_Base[i + 1], Distance)
-                atc1 = Offset_point(Coord1_Base[i], Coord2_Base[i], Coord1_Base[i - 1], -Distance)
-                atc2 = Offset_point(Coord2_Base[i], Coord1_Base[i], Coord2_Base[i + 1], -Distance)
-                atc3 = Offset_point(Coord2_Base[i], Coord1_Base[i], Coord2_Base[i - 1], Distance)
-                atc5 = Offset_point(Coord1_Base[i + 1], Coord2_Base[i + 1], Coord1_Base[i], -Distance)
-                atc6 = Offset_point(Coord1_Base[i - 1], Coord2_Base[i - 1], Coord1_Base[i], Distance)
-
-                if abs(Ang1 - math.pi) < 0.000001 or math.isnan(Ang1):
-                    Coord1_off[i] = atc
-                else:
-                    atc7 = Intersection_line_plane(atc1, atc3, atc6, atc, atc5)
-                    atc8 = Intersection_line_plane(atc, atc2, atc5, atc1, atc6)
-                    # atc7またはatc8がNoneの場合の処理
-                    if atc7 is None and atc8 is None:
-                        Coord1_off[i] = atc  # デフォルトとしてatcを使用
-                    elif atc7 is None:
-                        Coord1_off[i] = atc8
-                    elif atc8 is None:
-                        Coord1_off[i] = atc7
-                    else:
-                        Coord1_off[i] = (atc7 + atc8) / 2
-
-                atc = Offset_point(Coord2_Base[i], Coord1_Base[i], Coord2_Base[i + 1], -Distance)
-                atc1 = Offset_point(Coord2_Base[i], Coord1_Base[i], Coord2_Base[i - 1], Distance)
-                atc2 = Offset_point(Coord1_Base[i], Coord2_Base[i], Coord1_Base[i + 1], Distance)
-                atc3 = Offset_point(Coord1_Base[i], Coord2_Base[i], Coord1_Base[i - 1], -Distance)
-                atc5 = Offset_point(Coord2_Base[i + 1], Coord1_Base[i + 1], Coord2_Base[i], Distance)
-                atc6 = Offset_point(Coord2_Base[i - 1], Coord1_Base[i - 1], Coord2_Base[i], -Distance)
-                if abs(Ang1 - math.pi) < 0.000001 or math.isnan(Ang1):
-                    Coord2_off[i] = atc
-                else:
-                    atc7 = Intersection_line_plane(atc1, atc3, atc6, atc, atc5)
-                    atc8 = Intersection_line_plane(atc, atc2, atc5, atc1, atc6)
-                    # atc7またはatc8がNoneの場合の処理
-                    if atc7 is None and atc8 is None:
-                        Coord2_off[i] = atc  # デフォルトとしてatcを使用
-                    elif atc7 is None:
-                        Coord2_off[i] = atc8
-                    elif atc8 is None:
-                        Coord2_off[i] = atc7
-                    else:
-                        Coord2_off[i] = (atc7 + atc8) / 2
+    for i in range(n):
+        Coord1_off[i] = Coord1_new[i]
+        Coord2_off[i] = Coord2_new[i]
 
     return Coord1_off, Coord2_off
 
@@ -1730,3 +1715,210 @@ def calculate_unit_vector_bridge(start_point, end_point):
     unit_vector = dir_vector / norm_dir
 
     return unit_vector
+
+
+# =============================================================================
+# 一括計算（点の配列をまとめて計算する）
+# 単一の点を扱う関数と同じ計算を配列演算で行う。引数は点 (3,) または点の配列 (N, 3) で、
+# 行数の異なる引数はブロードキャストする。交点がない行は None の代わりに NaN を返す
+# =============================================================================
+def _as_points(points, dim=3):
+    """点または点の配列を (N, dim) の float 配列にする（不足する座標は 0 を補い、余分な座標は除く）"""
+    points = np.atleast_2d(np.asarray(points, dtype=float))
+    if points.shape[1] < dim:
+        points = np.hstack([points, np.zeros((points.shape[0], dim - points.shape[1]))])
+    return points[:, :dim]
+
+
+def _as_column(values):
+    """スカラーまたは値の配列を (N, 1) の float 配列にする"""
+    return np.asarray(values, dtype=float).reshape(-1, 1)
+
+
+def Normal_vector_batch(p1, p2, p3):
+    """
+    平面 p1, p2, p3 の単位法線ベクトルを一括で計算する（Normal_vector の配列版）
+
+    Args:
+        p1, p2, p3: 平面を定義する点 (3,) または点の配列 (N, 3)
+
+    Returns:
+        単位法線ベクトルの配列 (N, 3)（3点が同一直線上の行はゼロベクトル）
+    """
+    p1, p2, p3 = _as_points(p1), _as_points(p2), _as_points(p3)
+    normal_vector = np.cross(p2 - p1, p3 - p1)
+    norm = np.linalg.norm(normal_vector, axis=1, keepdims=True)
+    valid = norm >= 1e-10
+    return np.where(valid, normal_vector / np.where(valid, norm, 1.0), 0.0)
+
+
+def Offset_point_batch(p1, p2, p3, distance):
+    """
+    点 p1 を平面 p1, p2, p3 の法線方向に移動した点を一括で計算する（Offset_point の配列版）
+
+    Args:
+        p1, p2, p3: 平面を定義する点 (3,) または点の配列 (N, 3)
+        distance: 移動距離（スカラーまたは (N,)）
+
+    Returns:
+        移動した点の配列 (N, 3)
+    """
+    return _as_points(p1) + _as_column(distance) * Normal_vector_batch(p1, p2, p3)
+
+
+def Point_on_line_batch(p1, p2, distance):
+    """
+    直線 p1-p2 上で p1 から指定距離の位置にある点を一括で計算する（Point_on_line の配列版）
+
+    Args:
+        p1, p2: 直線上の点 (3,) または点の配列 (N, 3)
+        distance: p1からの距離（スカラーまたは (N,)）
+
+    Returns:
+        点の配列 (N, 3)（p1 と p2 が同じ点の行は p1）
+    """
+    p1, p2 = _as_points(p1), _as_points(p2)
+    vector = p2 - p1
+    length = np.linalg.norm(vector, axis=1, keepdims=True)
+    valid = length >= 1e-10
+    t = _as_column(distance) / np.where(valid, length, 1.0)
+    return np.where(valid, p1 + t * vector, p1)
+
+
+def Point_on_parallel_line_batch(pbase, p1dir, p2dir, distance):
+    """
+    基準点から p1dir-p2dir 方向に指定距離の位置にある点を一括で計算する（Point_on_parallel_line の配列版）
+
+    Args:
+        pbase: 基準点 (3,) または点の配列 (N, 3)
+        p1dir, p2dir: 方向を定義する点 (3,) または点の配列 (N, 3)
+        distance: pbaseからの距離（スカラーまたは (N,)）
+
+    Returns:
+        点の配列 (N, 3)（p1dir と p2dir が同じ点の行は pbase）
+    """
+    pbase, p1dir, p2dir = _as_points(pbase), _as_points(p1dir), _as_points(p2dir)
+    direction_vector = p2dir - p1dir
+    norm_direction = np.linalg.norm(direction_vector, axis=1, keepdims=True)
+    valid = norm_direction >= 1e-10
+    direction_vector = direction_vector / np.where(valid, norm_direction, 1.0)
+    return np.where(valid, pbase + _as_column(distance) * direction_vector, pbase)
+
+
+def Offset_Line_batch(p1, p2, offset_distance):
+    """
+    2D直線 p1-p2 を法線方向に平行移動した直線を一括で計算する（Offset_Line の配列版）
+
+    Args:
+        p1, p2: 直線上の点 (2,) または点の配列 (N, 2)（3D座標の場合は XY を使う）
+        offset_distance: 移動距離（スカラーまたは (N,)）
+
+    Returns:
+        tuple: (移動した p1 の配列 (N, 2), 移動した p2 の配列 (N, 2))（p1 と p2 が同じ点の行は移動しない）
+    """
+    p1, p2 = _as_points(p1, 2), _as_points(p2, 2)
+    line_vector = p2 - p1
+    length = np.linalg.norm(line_vector, axis=1, keepdims=True)
+    valid = length >= 1e-10
+    unit_vector = line_vector / np.where(valid, length, 1.0)
+    normal_vector = np.stack([-unit_vector[:, 1], unit_vector[:, 0]], axis=1)
+    offset = _as_column(offset_distance) * normal_vector
+    return np.where(valid, p1 + offset, p1), np.where(valid, p2 + offset, p2)
+
+
+def Intersec_line_line_batch(p1, p2, p3, p4, eps=1e-4, as_segments=False):
+    """
+    2D直線 p1-p2 と p3-p4 の交点を一括で計算する（Intersec_line_line の配列版）
+
+    Args:
+        p1, p2: 直線1上の点 (2,) または点の配列 (N, 2)（3D座標の場合は XY を使う）
+        p3, p4: 直線2上の点 (2,) または点の配列 (N, 2)
+        eps: 直線の長さ・平行の判定の閾値
+        as_segments: Trueの場合、線分の範囲外の交点は除く
+
+    Returns:
+        交点の配列 (N, 2)（交点がない行は NaN）
+    """
+    p1, p2, p3, p4 = _as_points(p1, 2), _as_points(p2, 2), _as_points(p3, 2), _as_points(p4, 2)
+    v1 = p2 - p1
+    v2 = p4 - p3
+    det = v1[:, 0] * v2[:, 1] - v1[:, 1] * v2[:, 0]
+    valid = (np.linalg.norm(v1, axis=1) >= eps) & (np.linalg.norm(v2, axis=1) >= eps) & (np.abs(det) >= max(eps, 1e-10))
+    det = np.where(valid, det, 1.0)
+
+    r = p3 - p1
+    t = (r[:, 0] * v2[:, 1] - r[:, 1] * v2[:, 0]) / det
+    u = (r[:, 0] * v1[:, 1] - r[:, 1] * v1[:, 0]) / det
+    if as_segments:
+        valid &= (0 - eps <= t) & (t <= 1 + eps) & (0 - eps <= u) & (u <= 1 + eps)
+
+    return np.where(valid[:, None], p1 + t[:, None] * v1, np.nan)
+
+
+def Intersec_line_line_grid(p1, p2, p3, p4):
+    """
+    直線群1（p1-p2）の各直線と直線群2（p3-p4）の各直線の交点を計算する（ボルト孔の配置など）
+
+    Args:
+        p1, p2: 直線群1の点の配列 (N, 2)
+        p3, p4: 直線群2の点の配列 (M, 2)
+
+    Returns:
+        交点の配列 (N, M, 2)（[i, j] は Intersec_line_line(p1[i], p2[i], p3[j], p4[j])。交点がない組は NaN）
+    """
+    p1, p2, p3, p4 = _as_points(p1, 2), _as_points(p2, 2), _as_points(p3, 2), _as_points(p4, 2)
+    n, m = len(p1), len(p3)
+    p = Intersec_line_line_batch(
+        np.repeat(p1, m, axis=0), np.repeat(p2, m, axis=0), np.tile(p3, (n, 1)), np.tile(p4, (n, 1))
+    )
+    return p.reshape(n, m, 2)
+
+
+def Intersection_line_plane_batch(p1, p2, p3, d1, d2):
+    """
+    直線 d1-d2 と平面 p1, p2, p3 の交点を一括で計算する（Intersection_line_plane の配列版）
+
+    Args:
+        p1, p2, p3: 平面を定義する点 (3,) または点の配列 (N, 3)
+        d1, d2: 直線上の点 (3,) または点の配列 (N, 3)
+
+    Returns:
+        交点の配列 (N, 3)（直線と平面が平行な行は NaN）
+    """
+    normal_vector = Normal_vector_batch(p1, p2, p3)
+    p1, d1, d2 = _as_points(p1), _as_points(d1), _as_points(d2)
+    A, B, C = normal_vector[:, 0], normal_vector[:, 1], normal_vector[:, 2]
+    D = A * p1[:, 0] + B * p1[:, 1] + C * p1[:, 2]
+    line_dir = d2 - d1
+    t_numerator = D - (A * d1[:, 0] + B * d1[:, 1] + C * d1[:, 2])
+    t_denominator = A * line_dir[:, 0] + B * line_dir[:, 1] + C * line_dir[:, 2]
+
+    valid = t_denominator != 0
+    t = t_numerator / np.where(valid, t_denominator, 1.0)
+    return np.where(valid[:, None], d1 + t[:, None] * line_dir, np.nan)
+
+
+def Angle_between_normals_batch(n1, n2):
+    """
+    法線ベクトル n1 と n2 の間の角度を一括で計算する（Angle_between_planes の配列版）
+
+    Args:
+        n1, n2: 法線ベクトルの配列 (N, 3)（Normal_vector_batch の戻り値）
+
+    Returns:
+        角度の配列 (N,)（ラジアン。法線がゼロベクトルの行は 0）
+    """
+    norm_n1 = np.linalg.norm(n1, axis=1)
+    norm_n2 = np.linalg.norm(n2, axis=1)
+    valid = (norm_n1 >= 1e-10) & (norm_n2 >= 1e-10)
+    cos_theta = np.sum(n1 * n2, axis=1) / np.where(valid, norm_n1 * norm_n2, 1.0)
+    return np.where(valid, np.arccos(np.clip(cos_theta, -1.0, 1.0)), 0.0)
+
+
+def _mean_of_intersections(intersec1, intersec2, default):
+    """2つの交点の中点を返す（片方がない行はもう片方、両方ない行は default）"""
+    valid1 = ~np.isnan(intersec1).any(axis=1, keepdims=True)
+    valid2 = ~np.isnan(intersec2).any(axis=1, keepdims=True)
+    return np.where(
+        valid1 & valid2, (intersec1 + intersec2) / 2, np.where(valid1, intersec1, np.where(valid2, intersec2, default))
+    )
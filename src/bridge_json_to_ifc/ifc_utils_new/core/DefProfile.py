@@ -0,0 +1,119 @@
+"""
+IFCモデル生成のフェーズごとの計測
+BuildBridge のフェーズ（座標系設定・部材生成・IFCファイル保存など）ごとに処理時間・メモリ使用量・
+作成したIFCエンティティ数を記録し、JSONレポートとして出力する
+"""
+
+import cProfile
+import json
+import sys
+import time
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # Windows では最大常駐メモリを取得できない
+    resource = None
+
+
+def _peak_rss_mb():
+    """
+    プロセスの最大常駐メモリ（MB）を返す
+
+    Returns:
+        最大常駐メモリ（取得できない環境ではNone）
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss は Linux では KB、macOS では byte 単位
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+class PhaseProfiler:
+    """
+    BuildBridge のフェーズごとの計測結果を保持するクラス
+
+    メモリは Python のヒープだけでなく ifcopenshell のエンティティも含めるため、プロセスの
+    最大常駐メモリ（ピーク値）で記録する。ピーク値はそれまでのフェーズを含むプロセス全体の値のため、
+    フェーズ中にピークが更新されなかった場合の増加量は0になる。
+
+    Attributes:
+        ctx: 計測対象の BridgeContext
+        stats_path_func: フェーズ名から cProfile 統計の出力先を返す関数（None の場合は cProfile を使わない）
+        phases: フェーズごとの計測結果（辞書）のリスト
+        report_path: write_report で出力したJSONレポートのパス
+    """
+
+    def __init__(self, ctx, stats_path_func=None):
+        self.ctx = ctx
+        self.stats_path_func = stats_path_func
+        self.phases = []
+        self.report_path = None
+
+    def _entity_count(self):
+        return len(self.ctx.ifc_file.entity_names())
+
+    @contextmanager
+    def phase(self, name):
+        """
+        ブロック内の処理を1つのフェーズとして計測する
+
+        Args:
+            name: フェーズ名
+        """
+        entities_before = self._entity_count()
+        elements_before = len(self.ctx.generated_element_names)
+        rss_before = _peak_rss_mb()
+        profiler = cProfile.Profile() if self.stats_path_func is not None else None
+        start = time.perf_counter()
+        if profiler is not None:
+            profiler.enable()
+        try:
+            yield
+        finally:
+            if profiler is not None:
+                profiler.disable()
+            seconds = time.perf_counter() - start
+            rss_after = _peak_rss_mb()
+            stats_path = None
+            if profiler is not None:
+                stats_path = str(self.stats_path_func(name))
+                profiler.dump_stats(stats_path)
+            self.phases.append(
+                {
+                    "name": name,
+                    "seconds": seconds,
+                    "entities_created": self._entity_count() - entities_before,
+                    "elements_created": len(self.ctx.generated_element_names) - elements_before,
+                    "peak_rss_mb": rss_after,
+                    "peak_rss_increase_mb": None if rss_after is None else rss_after - rss_before,
+                    "cprofile_stats": stats_path,
+                }
+            )
+
+    def report(self):
+        """
+        計測結果のレポートを返す
+
+        Returns:
+            dict: 合計値とフェーズごとの計測結果
+        """
+        return {
+            "total_seconds": sum(phase["seconds"] for phase in self.phases),
+            "entity_count": self._entity_count(),
+            "element_count": len(self.ctx.generated_element_names),
+            "peak_rss_mb": _peak_rss_mb(),
+            "phases": self.phases,
+        }
+
+    def write_report(self, path):
+        """
+        計測結果のレポートをJSONファイルに出力する
+
+        Args:
+            path: 出力先のJSONファイルパス
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, ensure_ascii=False, indent=2)
+        self.report_path = str(path)
@@ -12,20 +12,15 @@ from src.bridge_json_to_ifc.ifc_utils_new.components.DefStiffener import (
     Calculate_SPL_SubPanel,
     Calculate_Vstiff_Subpanel,
 )
-from src.bridge_json_to_ifc.ifc_utils_new.core import DefIFC, DefMath
+from src.bridge_json_to_ifc.ifc_utils_new.core import DefContext, DefIFC, DefMath
 from src.bridge_json_to_ifc.ifc_utils_new.io import DefStrings
 from src.bridge_json_to_ifc.ifc_utils_new.utils.DefBridgeUtils import (
     Find_number_block_MainPanel,
 )
 
-# グローバル変数: ログファイル出力関数
-log_print_func = None
-
-
 def _log_print(*args, **kwargs):
     """ログファイル出力関数（DEBUG_MODE時のみ出力）"""
-    if log_print_func:
-        log_print_func(*args, **kwargs)
+    DefContext.log_print(*args, **kwargs)
 
 
 def Calculate_Part_SubPanel(
@@ -8,17 +8,12 @@ import math
 
 import numpy as np
 
-from src.bridge_json_to_ifc.ifc_utils_new.core import DefMath
+from src.bridge_json_to_ifc.ifc_utils_new.core import DefContext, DefMath
 from src.bridge_json_to_ifc.ifc_utils_new.io import DefStrings
 
-# グローバル変数: ログファイル出力関数（DefBridge.pyから設定される）
-log_print_func = None
-
-
 def _log_print(*args, **kwargs):
     """ログファイル出力関数（DEBUG_MODE時のみ出力）"""
-    if log_print_func:
-        log_print_func(*args, **kwargs)
+    DefContext.log_print(*args, **kwargs)
 
 
 # ------------------------Calculate Line------------------------
@@ -40,13 +35,7 @@ def Calculate_Line(name_new_line, Calculations, Senkei_data):
             typeCal = calculation["Type"]
             baseline = calculation["BaseLine"]
             distance = calculation["Distance"]
-            coordLineBase = []
-            for line in Senkei_data:
-                if line["Name"] == baseline:
-                    for point in line["Point"]:
-                        coorpoint = [point["X"], point["Y"], point["Z"]]
-                        coordLineBase.append(coorpoint)
-                    break
+            coordLineBase = Load_Coordinate_PolLine(Senkei_data, baseline)
 
             if typeCal == "OFFSET":
                 coordLineNew = DefMath.Offset_Polyline(coordLineBase, distance)
@@ -74,21 +63,8 @@ def Calculate_Line(name_new_line, Calculations, Senkei_data):
             baseline1 = calculation["BaseLine1"]
             baseline2 = calculation["BaseLine2"]
             baseline = baseline1
-            coordLine1Base = []
-            for line in Senkei_data:
-                if line["Name"] == baseline1:
-                    for point in line["Point"]:
-                        coorpoint = [point["X"], point["Y"], point["Z"]]
-                        coordLine1Base.append(coorpoint)
-                    break
-
-            coordLine2Base = []
-            for line in Senkei_data:
-                if line["Name"] == baseline2:
-                    for point in line["Point"]:
-                        coorpoint = [point["X"], point["Y"], point["Z"]]
-                        coordLine2Base.append(coorpoint)
-                    break
+            coordLine1Base = Load_Coordinate_PolLine(Senkei_data, baseline1)
+            coordLine2Base = Load_Coordinate_PolLine(Senkei_data, baseline2)
 
             coordLineNew = []
             for i in range(0, len(coordLine1Base)):
@@ -131,6 +107,114 @@ def Calculate_Line(name_new_line, Calculations, Senkei_data):
     return Senkei_data
 
 
+# ------------------------Senkei Index------------------------
+class SenkeiIndex:
+    """
+    線形データの (線形名, 断面点名) → 座標 の索引
+
+    線形ごとに全点の座標を NumPy 配列（点数×3）に、断面点名を行番号に対応付けて保持する。
+    同名の線形・断面点がある場合は先頭のものを使う（線形データを先頭から探索した場合と同じ）。
+    索引作成後に末尾へ追加された線形（Calculate_Line）は refresh で取り込む。
+    既存の線形・点の変更は反映されない。
+
+    Attributes:
+        source: 索引の元の線形データ
+        line_count: 索引に取り込んだ線形の数
+    """
+
+    def __init__(self, Senkei_data):
+        self.source = Senkei_data
+        self.line_count = 0
+        self._coords = {}
+        self._rows = {}
+        self.refresh()
+
+    def refresh(self):
+        """索引作成後に線形データの末尾に追加された線形を取り込む"""
+        for line in self.source[self.line_count :]:
+            name = line["Name"]
+            if name in self._coords:
+                continue
+            points = line["Point"]
+            self._coords[name] = np.array(
+                [[point["X"], point["Y"], point["Z"]] for point in points], dtype=float
+            ).reshape(-1, 3)
+            rows = {}
+            for i, point in enumerate(points):
+                rows.setdefault(point["Name"], i)
+            self._rows[name] = rows
+        self.line_count = len(self.source)
+
+    def polyline(self, NameLong):
+        """
+        線形の全点の座標を返す
+
+        Args:
+            NameLong: 線形名
+
+        Returns:
+            座標配列（点数×3）または None（線形がない場合）
+        """
+        return self._coords.get(NameLong)
+
+    def rows(self, NameLong, sec_names):
+        """
+        線形上の断面点の座標を断面点名の順に返す（線形上にない断面点は除く）
+
+        Args:
+            NameLong: 線形名
+            sec_names: 断面点名の配列
+
+        Returns:
+            座標配列（見つかった点数×3）または None（線形がない場合）
+        """
+        coords = self._coords.get(NameLong)
+        if coords is None:
+            return None
+        rows = self._rows[NameLong]
+        return coords[[rows[name] for name in sec_names if name in rows]]
+
+    def point(self, NameLong, NameSec):
+        """
+        線形上の断面点の座標を返す
+
+        Args:
+            NameLong: 線形名
+            NameSec: 断面点名
+
+        Returns:
+            座標 [X, Y, Z] の配列または None（見つからない場合）
+        """
+        row = self._rows.get(NameLong, {}).get(NameSec)
+        if row is None:
+            return None
+        return self._coords[NameLong][row]
+
+
+def Senkei_Index(Senkei_data):
+    """
+    線形データの索引を返す
+
+    実行中コンテキストでは BridgeContext に保持した索引を再利用し（1回の実行で1回だけ作成する）、
+    実行中コンテキストがない場合は毎回作成する。
+
+    Args:
+        Senkei_data: 線形データ
+
+    Returns:
+        SenkeiIndex
+    """
+    ctx = DefContext.current_context()
+    if ctx is None:
+        return SenkeiIndex(Senkei_data)
+    index = ctx.senkei_index
+    if index is None or index.source is not Senkei_data:
+        index = ctx.senkei_index = SenkeiIndex(Senkei_data)
+    elif index.line_count != len(Senkei_data):
+        index.refresh()
+    return index
+
+
 def Load_Coordinate_Panel(Senkei_data, line_panel, sec_panel):
     """
     パネルの座標を読み込む
@@ -143,19 +227,12 @@ def Load_Coordinate_Panel(Senkei_data, line_panel, sec_panel):
     Returns:
         座標線の配列（各線は点の配列）
     """
+    index = Senkei_Index(Senkei_data)
     coordLines = []
-    for i in range(0, len(line_panel)):
-        for line in Senkei_data:
-            if line["Name"] == line_panel[i]:
-                coordLine = []
-                for i_1 in range(0, len(sec_panel)):
-                    for point in line["Point"]:
-                        if point["Name"] == sec_panel[i_1]:
-                            coorpoint = [point["X"], point["Y"], point["Z"]]
-                            coordLine.append(coorpoint)
-                            break
-                coordLines.append(coordLine)
-                break
+    for name_line in line_panel:
+        coordLine = index.rows(name_line, sec_panel)
+        if coordLine is not None:
+            coordLines.append(coordLine.tolist())
 
     return coordLines
 
@@ -172,16 +249,8 @@ def Load_Coordinate_Point(Senkei_data, NameLong, NameSec):
     Returns:
         座標点 [X, Y, Z] または None（見つからない場合）
     """
-    CoordPoint = None
-    for line in Senkei_data:
-        if line["Name"] == NameLong:
-            for point in line["Point"]:
-                if point["Name"] == NameSec:
-                    CoordPoint = [point["X"], point["Y"], point["Z"]]
-                    break
-            if CoordPoint is not None:
-                break
-    return CoordPoint
+    CoordPoint = Senkei_Index(Senkei_data).point(NameLong, NameSec)
+    return None if CoordPoint is None else CoordPoint.tolist()
 
 
 def Load_Coordinate_PolLine(Senkei_data, NameLong):
@@ -195,14 +264,8 @@ def Load_Coordinate_PolLine(Senkei_data, NameLong):
     Returns:
         座標点の配列
     """
-    coordLine = []
-    for line in Senkei_data:
-        if line["Name"] == NameLong:
-            for point in line["Point"]:
-                coorpoint = [point["X"], point["Y"], point["Z"]]
-                coordLine.append(coorpoint)
-            break
-    return coordLine
+    coordLine = Senkei_Index(Senkei_data).polyline(NameLong)
+    return [] if coordLine is None else coordLine.tolist()
 
 
 def Calculate_points_Sub_Panel(Senkei_data, points, NameSec):
@@ -5,13 +5,16 @@ from __future__ import annotations
 import json
 from enum import StrEnum
 from pathlib import Path
+from typing import Any
 
 import fire
 
 from src.bridge_agentic_generate.config import app_config
 from src.bridge_agentic_generate.designer.models import BridgeDesign
 from src.bridge_agentic_generate.logger_config import logger
-from src.bridge_json_to_ifc.convert_senkei_json_to_ifc import convert_senkei_to_ifc
+from src.bridge_agentic_generate.stage_timer import Stage, stage
+from src.bridge_json_to_ifc.conversion_cache import ConversionCache, design_cache_key
+from src.bridge_json_to_ifc.convert_senkei_json_to_ifc import build_ifc_from_spec
 from src.bridge_json_to_ifc.convert_simple_to_senkei_json import convert_simple_to_senkei
 from src.bridge_json_to_ifc.senkei_models import SenkeiSpec
 
@@ -33,12 +36,31 @@ def save_senkei_json(senkei_spec: SenkeiSpec, output_path: Path) -> None:
     output_path.write_text(json_output, encoding="utf-8")
 
 
+def senkei_spec_dict(senkei_spec: SenkeiSpec) -> dict[str, Any]:
+    """SenkeiSpec を IFC 生成の入力辞書（Senkei JSON を読み込んだ場合と同じ構造）に変換する。
+
+    Args:
+        senkei_spec: 変換する SenkeiSpec オブジェクト。
+
+    Returns:
+        JSON 互換の辞書。
+    """
+    return senkei_spec.model_dump(mode="json", by_alias=True, exclude_none=True)
+
+
 def convert(
     bridge_design_path: str,
     senkei_json_path: str | None = None,
     ifc_output_path: str | None = None,
+    use_cache: bool = True,
+    cache_dir: str | None = None,
+    write_senkei_json: bool = True,
 ) -> None:
-    """BridgeDesign JSON を SenkeiSpec JSON に変換し、IFC を出力する。
+    """BridgeDesign JSON を SenkeiSpec に変換し、IFC を出力する。
+
+    IFC はメモリ上の SenkeiSpec から直接生成し、Senkei JSON は副出力として書き出す（write_senkei_json=False で省略）。
+    同じ設計（正規化 JSON と変換器のバージョンが同じ）を変換済みの場合は、
+    変換キャッシュ（省略時は app_config.conversion_cache_dir）から Senkei JSON / IFC をコピーする。
 
     Args:
         bridge_design_path:
@@ -47,6 +69,12 @@ def convert(
             中間の SenkeiSpec JSON 出力パス（省略時は data/generated_senkei_json/<stem>_senkei.json）
         ifc_output_path:
             IFC 出力パス（省略時は data/generated_ifc/<stem>.ifc）
+        use_cache:
+            変換キャッシュを使うかどうか
+        cache_dir:
+            変換キャッシュのディレクトリ（省略時は app_config.conversion_cache_dir）
+        write_senkei_json:
+            SenkeiSpec JSON を書き出すかどうか（False の場合 senkei_json_path は無視する）
     """
     design_file = Path(bridge_design_path)
     if not design_file.is_absolute() and design_file.parent == Path("."):
@@ -54,11 +82,13 @@ def convert(
 
     if not design_file.exists():
         raise FileNotFoundError(f"BridgeDesign JSON が見つかりません: {design_file}")
-    senkei_file = (
-        Path(senkei_json_path)
-        if senkei_json_path is not None
-        else app_config.generated_senkei_json_dir / f"{design_file.stem}{FileSuffixes.SENKEI}"
-    )
+    senkei_file: Path | None = None
+    if write_senkei_json:
+        senkei_file = (
+            Path(senkei_json_path)
+            if senkei_json_path is not None
+            else app_config.generated_senkei_json_dir / f"{design_file.stem}{FileSuffixes.SENKEI}"
+        )
     ifc_file = (
         Path(ifc_output_path)
         if ifc_output_path is not None
@@ -69,12 +99,27 @@ def convert(
         raw_data = json.load(file)
 
     design = BridgeDesign.model_validate(raw_data)
-    senkei = convert_simple_to_senkei(design)
-    save_senkei_json(senkei, senkei_file)
-    convert_senkei_to_ifc(senkei_file, ifc_file)
+    cache = ConversionCache(Path(cache_dir) if cache_dir else app_config.conversion_cache_dir) if use_cache else None
+    cache_key = design_cache_key(design)
+    if cache is not None and cache.restore(cache_key, senkei_file, ifc_file):
+        logger.info("BridgeDesign: %s (変換キャッシュを使用)", bridge_design_path)
+        return
+
+    # 既存の出力が他のファイル（以前のキャッシュなど）とハードリンクしている場合に備え、先に削除してから書き出す
+    if senkei_file is not None:
+        senkei_file.unlink(missing_ok=True)
+    ifc_file.unlink(missing_ok=True)
+    with stage(Stage.IFC):
+        senkei = convert_simple_to_senkei(design)
+        if senkei_file is not None:
+            save_senkei_json(senkei, senkei_file)
+        build_ifc_from_spec(senkei_spec_dict(senkei), ifc_file)
+    if cache is not None:
+        cache.save(cache_key, senkei_file, ifc_file)
 
     logger.info("BridgeDesign: %s", bridge_design_path)
-    logger.info("Senkei JSON: %s", senkei_file)
+    if senkei_file is not None:
+        logger.info("Senkei JSON: %s", senkei_file)
     logger.info("IFC: %s", ifc_file)
 
 
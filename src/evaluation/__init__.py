@@ -4,6 +4,7 @@ Designer + Judge ループの評価を行うための機能を提供する。
 """
 
 from src.evaluation.metrics import (
+    IncrementalMetrics,
     aggregate_metrics,
     calc_avg_iterations,
     calc_convergence_rate,
@@ -14,14 +15,18 @@ from src.evaluation.metrics import (
 from src.evaluation.models import (
     AggregatedMetrics,
     EvaluationCase,
+    ExecutionMode,
     TrialResult,
+    TrialUnit,
 )
 from src.evaluation.runner import EvaluationRunner
 
 __all__ = [
     # Models
     "EvaluationCase",
+    "ExecutionMode",
     "TrialResult",
+    "TrialUnit",
     "AggregatedMetrics",
     # Metrics
     "calc_first_pass_rate",
@@ -30,6 +35,7 @@ __all__ = [
     "calc_final_pass_rate",
     "calc_per_check_first_pass_rate",
     "aggregate_metrics",
+    "IncrementalMetrics",
     # Runner
     "EvaluationRunner",
 ]
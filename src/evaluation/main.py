@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from pathlib import Path
 
 import fire
@@ -9,10 +10,16 @@ import fire
 from src.bridge_agentic_generate.config import app_config
 from src.bridge_agentic_generate.llm_client import LlmModel
 from src.bridge_agentic_generate.logger_config import logger
-from src.evaluation.metrics import aggregate_metrics
-from src.evaluation.models import AggregatedMetrics, EvaluationCase, TrialResult
+from src.evaluation.metrics import aggregate_metrics_from_store
+from src.evaluation.models import AggregatedMetrics, EvaluationCase, ExecutionMode
 from src.evaluation.plot import generate_all_plots
 from src.evaluation.runner import EvaluationRunner
+from src.evaluation.store import ResultsStore, trial_filter
+
+# 評価全体で同時に実行する試行数
+DEFAULT_MAX_WORKERS = 16
+# 評価全体で共有する LLM の毎分リクエスト数の上限
+DEFAULT_REQUESTS_PER_MINUTE = 300.0
 
 # 評価ケース定義（EVALUATION.md より）
 DEFAULT_EVALUATION_CASES: list[EvaluationCase] = [
@@ -51,42 +58,42 @@ DEFAULT_EVALUATION_CASES: list[EvaluationCase] = [
 ]
 
 
-def _save_summary(
-    results: list[TrialResult],
-    metrics: AggregatedMetrics,
-    output_dir: Path,
-) -> None:
-    """集計結果を summary.json に保存する。
+def _save_summary(store: ResultsStore, output_dir: Path, case_ids: list[str]) -> AggregatedMetrics:
+    """結果ストアのうち今回の実行の試行を集計し、summary.json に保存する。
+
+    同じ出力ディレクトリに以前の実行（別のケース・試行数）の試行が残っていても集計に含めない。
 
     Args:
-        results: 全試行結果
-        metrics: 集計結果
+        store: 評価結果ストア
         output_dir: 出力ディレクトリ
-    """
-    # RAG あり/なしで分けて集計
-    results_rag_true = [r for r in results if r.use_rag]
-    results_rag_false = [r for r in results if not r.use_rag]
-    metrics_rag_true = aggregate_metrics(results_rag_true)
-    metrics_rag_false = aggregate_metrics(results_rag_false)
+        case_ids: 今回の実行の試行ID
 
+    Returns:
+        今回の実行の全試行の集計結果
+    """
+    where, params = trial_filter(case_ids=case_ids)
+    counts = {
+        row["use_rag"]: row["n"]
+        for row in store.query(f"SELECT use_rag, COUNT(*) AS n FROM trials {where} GROUP BY 1", params)
+    }
+    metrics = aggregate_metrics_from_store(store, case_ids=case_ids)
     summary = {
-        "total_trials": len(results),
+        "total_trials": sum(counts.values()),
         "overall": metrics.model_dump(),
         "rag_true": {
-            "total_trials": len(results_rag_true),
-            "metrics": metrics_rag_true.model_dump(),
+            "total_trials": counts.get(1, 0),
+            "metrics": aggregate_metrics_from_store(store, use_rag=True, case_ids=case_ids).model_dump(),
         },
         "rag_false": {
-            "total_trials": len(results_rag_false),
-            "metrics": metrics_rag_false.model_dump(),
+            "total_trials": counts.get(0, 0),
+            "metrics": aggregate_metrics_from_store(store, use_rag=False, case_ids=case_ids).model_dump(),
         },
     }
 
-    import json
-
     summary_path = output_dir / "summary.json"
     summary_path.write_text(json.dumps(summary, indent=2, ensure_ascii=False), encoding="utf-8")
     logger.info("Summary saved to %s", summary_path)
+    return metrics
 
 
 class EvaluationCLI:
@@ -96,6 +103,13 @@ class EvaluationCLI:
         # 全ケース実行
         uv run python -m src.evaluation.main run
 
+        # 同時実行数と LLM の毎分リクエスト数を指定して全ケース実行
+        uv run python -m src.evaluation.main run --max_workers 32 --requests_per_minute 500
+
+        # 中断した評価を再開（完了済みの試行はスキップ）。--force で全試行を再実行
+        uv run python -m src.evaluation.main run --output_dir data/evaluation_v5
+        uv run python -m src.evaluation.main run --output_dir data/evaluation_v5 --force
+
         # 単一ケースのテスト実行
         uv run python -m src.evaluation.main single_case --bridge_length_m 50 --total_width_m 10
 
@@ -109,23 +123,35 @@ class EvaluationCLI:
         model_name: LlmModel = LlmModel.GPT_5_1,
         max_iterations: int = 5,
         num_trials: int = 3,
-        max_workers: int = 3,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_concurrent_requests: int | None = None,
+        requests_per_minute: float | None = DEFAULT_REQUESTS_PER_MINUTE,
+        force: bool = False,
+        execution_mode: str = ExecutionMode.THREAD,
     ) -> None:
         """全評価ケースを実行する。
 
+        全ケース × RAG 条件 × 試行を1つのワーカープールで並列実行する。
+        成果物が揃った完了済みの試行はスキップし、保存済みの結果を集計に使う。
+
         Args:
             output_dir: 出力ディレクトリ（None の場合は data/evaluation/）
             model_name: 使用する LLM モデル名
             max_iterations: 修正ループの最大反復回数
             num_trials: 同一条件での試行回数
-            max_workers: 並列ワーカー数
+            max_workers: 並列ワーカー数（評価全体で同時に実行する試行数）
+            max_concurrent_requests: LLM の同時リクエスト数の上限（None の場合は無制限）
+            requests_per_minute: LLM の毎分リクエスト数の上限（None の場合は無制限）
+            force: True の場合、完了済みの試行も再実行する
+            execution_mode: 並列実行方式（thread / process。process は事前初期化済みのワーカープロセスで実行）
         """
         logger.info(
-            "EvaluationCLI.run: 開始 model=%s, max_iterations=%d, num_trials=%d, max_workers=%d",
+            "EvaluationCLI.run: 開始 model=%s, max_iterations=%d, num_trials=%d, max_workers=%d, rpm=%s",
             model_name,
             max_iterations,
             num_trials,
             max_workers,
+            requests_per_minute,
         )
 
         output_path = Path(output_dir) if output_dir else app_config.evaluation_dir
@@ -136,13 +162,16 @@ class EvaluationCLI:
             num_trials=num_trials,
             max_workers=max_workers,
             output_dir=output_path,
+            max_concurrent_requests=max_concurrent_requests,
+            requests_per_minute=requests_per_minute,
+            force=force,
+            execution_mode=ExecutionMode(execution_mode),
         )
 
         results = runner.run_all(cases=DEFAULT_EVALUATION_CASES)
 
-        # 集計
-        metrics = aggregate_metrics(results)
-        _save_summary(results, metrics, output_path)
+        # 集計（結果ストアのうち今回の実行の試行を SQL で集計）
+        metrics = _save_summary(runner.store, output_path, [result.case_id for result in results])
 
         # 結果表示
         logger.info("=== 評価結果 ===")
@@ -163,6 +192,7 @@ class EvaluationCLI:
         output_dir: str | None = None,
         model_name: str = "gpt-5.1",
         max_iterations: int = 5,
+        force: bool = False,
     ) -> None:
         """単一ケースのテスト実行。
 
@@ -173,6 +203,7 @@ class EvaluationCLI:
             output_dir: 出力ディレクトリ（None の場合は data/evaluation/）
             model_name: 使用する LLM モデル名
             max_iterations: 修正ループの最大反復回数
+            force: True の場合、完了済みの試行も再実行する
         """
         logger.info(
             "EvaluationCLI.single_case: L=%.0fm, B=%.0fm, use_rag=%s, model=%s",
@@ -196,6 +227,7 @@ class EvaluationCLI:
             num_trials=1,  # 単一ケースなので1回
             max_workers=1,
             output_dir=output_path,
+            force=force,
         )
 
         result = runner.run_single_trial(case=case, use_rag=use_rag, trial=1)
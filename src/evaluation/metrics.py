@@ -2,7 +2,17 @@
 
 from __future__ import annotations
 
-from src.evaluation.models import AggregatedMetrics, TrialResult
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Sequence
+
+import numpy as np
+
+from src.bridge_agentic_generate.stage_timer import Stage
+from src.evaluation.models import AggregatedMetrics, CaseCost, StageSummary, TrialResult
+
+if TYPE_CHECKING:
+    from src.evaluation.store import ResultsStore
 
 # 照査項目のキー
 CHECK_KEYS = ["deck", "bend", "shear", "deflection", "web_slenderness"]
@@ -90,6 +100,89 @@ def calc_per_check_first_pass_rate(results: list[TrialResult]) -> dict[str, floa
     return per_check_rates
 
 
+def _percentile(values: list[float], q: float) -> float:
+    """パーセンタイル（値が空の場合は 0.0）。"""
+    return float(np.percentile(values, q)) if values else 0.0
+
+
+def case_key(result: TrialResult) -> str:
+    """試行ID から評価ケースID（例: "L50_B10_rag_true_trial_1" → "L50_B10"）を取り出す。"""
+    return result.case_id.split("_rag_")[0]
+
+
+def calc_stage_summaries(results: list[TrialResult]) -> dict[str, StageSummary]:
+    """ステージ別の所要時間（p50/p95/合計）とトークン数を集計する。
+
+    パーセンタイルはそのステージを実行した試行の、試行あたりの所要時間の分布から求める。
+
+    Args:
+        results: 試行結果のリスト
+
+    Returns:
+        ステージ名 → StageSummary（計測値のないステージは含まない）
+    """
+    summaries: dict[str, StageSummary] = {}
+    for name in Stage:
+        stats = [r.stages[name] for r in results if name in r.stages]
+        if not stats:
+            continue
+        seconds = [s.seconds for s in stats]
+        summaries[str(name)] = StageSummary(
+            p50_s=_percentile(seconds, 50),
+            p95_s=_percentile(seconds, 95),
+            total_s=sum(seconds),
+            calls=sum(s.calls for s in stats),
+            input_tokens=sum(s.input_tokens for s in stats),
+            output_tokens=sum(s.output_tokens for s in stats),
+        )
+    return summaries
+
+
+def calc_case_costs(results: list[TrialResult]) -> dict[str, CaseCost]:
+    """評価ケースごとの所要時間・トークン数を集計する（所要時間を計測済みの試行のみ）。
+
+    Args:
+        results: 試行結果のリスト
+
+    Returns:
+        評価ケースID → CaseCost
+    """
+    grouped: dict[str, list[TrialResult]] = {}
+    for r in results:
+        if r.wall_time_s > 0:
+            grouped.setdefault(case_key(r), []).append(r)
+
+    costs: dict[str, CaseCost] = {}
+    for key, case_results in grouped.items():
+        wall_times = [r.wall_time_s for r in case_results]
+        stage_seconds: dict[str, float] = {}
+        for r in case_results:
+            for name, stats in r.stages.items():
+                stage_seconds[name] = stage_seconds.get(name, 0.0) + stats.seconds
+        costs[key] = CaseCost(
+            num_trials=len(case_results),
+            total_wall_time_s=sum(wall_times),
+            p50_wall_time_s=_percentile(wall_times, 50),
+            p95_wall_time_s=_percentile(wall_times, 95),
+            input_tokens=sum(s.input_tokens for r in case_results for s in r.stages.values()),
+            output_tokens=sum(s.output_tokens for r in case_results for s in r.stages.values()),
+            stage_seconds=stage_seconds,
+        )
+    return costs
+
+
+def _timing_metrics(results: list[TrialResult]) -> dict[str, Any]:
+    """AggregatedMetrics の所要時間・コスト関連のフィールドを計算する。"""
+    wall_times = [r.wall_time_s for r in results if r.wall_time_s > 0]
+    return {
+        "wall_time_p50_s": _percentile(wall_times, 50),
+        "wall_time_p95_s": _percentile(wall_times, 95),
+        "total_wall_time_s": sum(wall_times),
+        "stages": calc_stage_summaries(results),
+        "per_case": calc_case_costs(results),
+    }
+
+
 def aggregate_metrics(results: list[TrialResult]) -> AggregatedMetrics:
     """全指標を集計する。
 
@@ -105,4 +198,208 @@ def aggregate_metrics(results: list[TrialResult]) -> AggregatedMetrics:
         avg_iterations=calc_avg_iterations(results),
         final_pass_rate=calc_final_pass_rate(results),
         per_check_first_pass_rate=calc_per_check_first_pass_rate(results),
+        **_timing_metrics(results),
+    )
+
+
+def aggregate_metrics_from_store(
+    store: ResultsStore, use_rag: bool | None = None, case_ids: Sequence[str] | None = None
+) -> AggregatedMetrics:
+    """結果ストアを SQL で直接集計する（aggregate_metrics と同じ定義）。
+
+    合格率などは SQL で集計し、パーセンタイルを含む所要時間・コストは読み込んだ試行結果から計算する。
+
+    Args:
+        store: 評価結果ストア
+        use_rag: RAG 条件で絞り込む（None の場合は全件）
+        case_ids: 試行ID で絞り込む（None の場合は全件）
+
+    Returns:
+        集計結果（AggregatedMetrics）。結果が空の場合は全指標 0.0。
+    """
+    from src.evaluation.store import trial_filter
+
+    where, params = trial_filter(use_rag, case_ids)
+    per_check_sql = ", ".join(f"AVG(COALESCE(first_pass_{key}, 0)) AS first_pass_{key}" for key in CHECK_KEYS)
+    row = store.query(
+        "SELECT AVG(first_pass) AS first_pass_rate, AVG(converged) AS convergence_rate, "
+        "AVG(CASE WHEN converged THEN num_iterations END) AS avg_iterations, "
+        f"AVG(final_pass) AS final_pass_rate, {per_check_sql} FROM trials {where}",
+        params,
+    )[0]
+    return AggregatedMetrics(
+        first_pass_rate=row["first_pass_rate"] or 0.0,
+        convergence_rate=row["convergence_rate"] or 0.0,
+        avg_iterations=row["avg_iterations"] or 0.0,
+        final_pass_rate=row["final_pass_rate"] or 0.0,
+        per_check_first_pass_rate={key: row[f"first_pass_{key}"] or 0.0 for key in CHECK_KEYS},
+        **_timing_metrics(store.load_trial_results(use_rag=use_rag, case_ids=case_ids)),
     )
+
+
+class _RunningCounts:
+    """1つの RAG 条件の逐次集計用カウンタ。"""
+
+    def __init__(self) -> None:
+        self.num_trials = 0
+        self.first_pass = 0
+        self.converged = 0
+        self.converged_iterations = 0
+        self.final_pass = 0
+        self.per_check_first_pass = {key: 0 for key in CHECK_KEYS}
+
+    def add(self, result: TrialResult) -> None:
+        self.num_trials += 1
+        self.first_pass += result.first_pass
+        self.converged += result.converged
+        self.converged_iterations += result.num_iterations if result.converged else 0
+        self.final_pass += result.final_pass
+        for key in CHECK_KEYS:
+            self.per_check_first_pass[key] += result.per_check_first_pass.get(key, False)
+
+    def merged(self, other: _RunningCounts) -> _RunningCounts:
+        counts = _RunningCounts()
+        for part in (self, other):
+            counts.num_trials += part.num_trials
+            counts.first_pass += part.first_pass
+            counts.converged += part.converged
+            counts.converged_iterations += part.converged_iterations
+            counts.final_pass += part.final_pass
+            for key in CHECK_KEYS:
+                counts.per_check_first_pass[key] += part.per_check_first_pass[key]
+        return counts
+
+    def to_metrics(self) -> AggregatedMetrics:
+        n = self.num_trials
+        return AggregatedMetrics(
+            first_pass_rate=self.first_pass / n if n else 0.0,
+            convergence_rate=self.converged / n if n else 0.0,
+            avg_iterations=self.converged_iterations / self.converged if self.converged else 0.0,
+            final_pass_rate=self.final_pass / n if n else 0.0,
+            per_check_first_pass_rate={
+                key: count / n if n else 0.0 for key, count in self.per_check_first_pass.items()
+            },
+        )
+
+
+class IncrementalMetrics:
+    """試行結果を1件ずつ取り込み、指標と進捗を逐次更新する集計器（スレッドセーフ）。
+
+    aggregate_metrics と同じ定義の指標を、結果ファイルを読み直さずにカウンタの更新だけで求める。
+    所要時間・コストの集計（パーセンタイル）は含まない。
+    完了済みのためスキップした試行（再開時）は指標には含めるが、スループットと ETA の計算からは除く。
+    """
+
+    def __init__(self, total_trials: int, clock: Callable[[], float] = time.monotonic):
+        """初期化。
+
+        Args:
+            total_trials: 予定している試行数（進捗率・ETA の計算に使う）
+            clock: 経過時間の計測に使う時計（秒）
+        """
+        self.total_trials = total_trials
+        self._clock = clock
+        self._started_at = clock()
+        self._lock = threading.Lock()
+        self._counts = {True: _RunningCounts(), False: _RunningCounts()}
+        self._num_skipped = 0
+
+    def add(self, result: TrialResult, skipped: bool = False) -> None:
+        """試行結果を1件取り込む。
+
+        Args:
+            result: 試行結果
+            skipped: 完了済みのため実行せずに読み込んだ結果か
+        """
+        with self._lock:
+            self._counts[result.use_rag].add(result)
+            if skipped:
+                self._num_skipped += 1
+
+    @property
+    def num_completed(self) -> int:
+        """取り込んだ試行数。"""
+        return self._counts[True].num_trials + self._counts[False].num_trials
+
+    @property
+    def num_skipped(self) -> int:
+        """取り込んだ試行のうち、完了済みのためスキップした試行数。"""
+        return self._num_skipped
+
+    def metrics(self, use_rag: bool | None = None) -> AggregatedMetrics:
+        """現時点の集計結果を返す。
+
+        Args:
+            use_rag: RAG 条件で絞り込む（None の場合は全件）
+
+        Returns:
+            集計結果（AggregatedMetrics）
+        """
+        with self._lock:
+            if use_rag is None:
+                return self._counts[True].merged(self._counts[False]).to_metrics()
+            return self._counts[use_rag].to_metrics()
+
+    def elapsed_s(self) -> float:
+        """集計開始からの経過秒数。"""
+        return self._clock() - self._started_at
+
+    def trials_per_minute(self) -> float:
+        """開始からの平均スループット [試行/分]（スキップした試行は含めない）。"""
+        elapsed = self.elapsed_s()
+        return (self.num_completed - self.num_skipped) / elapsed * 60.0 if elapsed > 0 else 0.0
+
+    def eta_s(self) -> float | None:
+        """残り試行の推定所要時間 [秒]（スループットが未確定の場合は None）。"""
+        rate = self.trials_per_minute()
+        if rate <= 0:
+            return None
+        return max(self.total_trials - self.num_completed, 0) / rate * 60.0
+
+    def summary(self) -> dict[str, Any]:
+        """summary.json 用の辞書（全体・RAG あり/なし別の指標と進捗）を返す。"""
+        eta = self.eta_s()
+        return {
+            "total_trials": self.num_completed,
+            "overall": self.metrics().model_dump(),
+            "rag_true": {
+                "total_trials": self._counts[True].num_trials,
+                "metrics": self.metrics(use_rag=True).model_dump(),
+            },
+            "rag_false": {
+                "total_trials": self._counts[False].num_trials,
+                "metrics": self.metrics(use_rag=False).model_dump(),
+            },
+            "progress": {
+                "completed": self.num_completed,
+                "planned": self.total_trials,
+                "skipped": self.num_skipped,
+                "elapsed_s": round(self.elapsed_s(), 1),
+                "trials_per_minute": round(self.trials_per_minute(), 3),
+                "eta_s": None if eta is None else round(eta, 1),
+            },
+        }
+
+    def progress_line(self) -> str:
+        """コンソール表示用の1行の進捗（例: "37/192 (19%) skipped=5 first_pass=32.4% ... ETA 1h04m"）。"""
+        metrics = self.metrics()
+        done = self.num_completed
+        percent = done / self.total_trials * 100 if self.total_trials else 100.0
+        eta = self.eta_s()
+        return (
+            f"{done}/{self.total_trials} ({percent:.0f}%) skipped={self.num_skipped} "
+            f"first_pass={metrics.first_pass_rate:.1%} "
+            f"(rag={self.metrics(use_rag=True).first_pass_rate:.1%}, "
+            f"no_rag={self.metrics(use_rag=False).first_pass_rate:.1%}) "
+            f"converged={metrics.convergence_rate:.1%} final_pass={metrics.final_pass_rate:.1%} "
+            f"| {self.trials_per_minute():.2f} trials/min | ETA {_format_duration(eta)}"
+        )
+
+
+def _format_duration(seconds: float | None) -> str:
+    """秒数を "1h04m" / "12m30s" 形式にする（None は "--"）。"""
+    if seconds is None:
+        return "--"
+    minutes, secs = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h{minutes:02d}m" if hours else f"{minutes}m{secs:02d}s"
@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+from enum import StrEnum
+
 from pydantic import BaseModel, Field
 
+from src.bridge_agentic_generate.stage_timer import StageStats
+
 
 class EvaluationCase(BaseModel):
     """評価ケース定義。
@@ -19,6 +23,31 @@ class EvaluationCase(BaseModel):
     total_width_m: float = Field(..., description="幅員 [m]")
 
 
+class ExecutionMode(StrEnum):
+    """試行の並列実行方式。
+
+    - thread: 1プロセス内のスレッドプール（既定）
+    - process: forkserver（ない環境では spawn）で起動した事前初期化済みのワーカープロセス
+    """
+
+    THREAD = "thread"
+    PROCESS = "process"
+
+
+class TrialUnit(BaseModel):
+    """スケジューリングの単位（ケース × RAG 条件 × 試行番号）。
+
+    Attributes:
+        case: 評価ケース
+        use_rag: RAG使用有無
+        trial: 試行番号（1から開始）
+    """
+
+    case: EvaluationCase = Field(..., description="評価ケース")
+    use_rag: bool = Field(..., description="RAG使用有無")
+    trial: int = Field(..., description="試行番号（1から開始）")
+
+
 class TrialResult(BaseModel):
     """試行結果（1回分）。
 
@@ -36,6 +65,8 @@ class TrialResult(BaseModel):
         final_pass: 最終合格かどうか
         final_max_util: 最終の max_util
         per_check_first_pass: 照査項目別の初回合格
+        wall_time_s: 試行の所要時間 [s]（修正ループ + 成果物の保存）
+        stages: ステージ別の所要時間・トークン数
     """
 
     case_id: str = Field(..., description="試行ID（例: L50_B10_rag_true_trial_1）")
@@ -57,6 +88,53 @@ class TrialResult(BaseModel):
         ...,
         description="照査項目別の初回合格（deck/bend/shear/deflection/web_slenderness）",
     )
+    wall_time_s: float = Field(default=0.0, description="試行の所要時間 [s]（0 は未計測）")
+    stages: dict[str, StageStats] = Field(
+        default_factory=dict,
+        description="ステージ別の所要時間・トークン数（designer_llm/patch_plan_llm/embedding/judge/serialization/ifc）",
+    )
+
+
+class StageSummary(BaseModel):
+    """1ステージの試行横断の集計。
+
+    Attributes:
+        p50_s: 試行あたり所要時間の中央値 [s]（そのステージを実行した試行のみ）
+        p95_s: 試行あたり所要時間の95パーセンタイル [s]
+        total_s: 合計所要時間 [s]
+        calls: 合計実行回数
+        input_tokens: 合計入力トークン数
+        output_tokens: 合計出力トークン数
+    """
+
+    p50_s: float = Field(..., description="試行あたり所要時間の中央値 [s]")
+    p95_s: float = Field(..., description="試行あたり所要時間の95パーセンタイル [s]")
+    total_s: float = Field(..., description="合計所要時間 [s]")
+    calls: int = Field(..., description="合計実行回数")
+    input_tokens: int = Field(..., description="合計入力トークン数")
+    output_tokens: int = Field(..., description="合計出力トークン数")
+
+
+class CaseCost(BaseModel):
+    """評価ケース（橋長 × 幅員）ごとのコスト集計。
+
+    Attributes:
+        num_trials: 計測済みの試行数
+        total_wall_time_s: 合計所要時間 [s]
+        p50_wall_time_s: 試行あたり所要時間の中央値 [s]
+        p95_wall_time_s: 試行あたり所要時間の95パーセンタイル [s]
+        input_tokens: 合計入力トークン数
+        output_tokens: 合計出力トークン数
+        stage_seconds: ステージ別の合計所要時間 [s]
+    """
+
+    num_trials: int = Field(..., description="計測済みの試行数")
+    total_wall_time_s: float = Field(..., description="合計所要時間 [s]")
+    p50_wall_time_s: float = Field(..., description="試行あたり所要時間の中央値 [s]")
+    p95_wall_time_s: float = Field(..., description="試行あたり所要時間の95パーセンタイル [s]")
+    input_tokens: int = Field(..., description="合計入力トークン数")
+    output_tokens: int = Field(..., description="合計出力トークン数")
+    stage_seconds: dict[str, float] = Field(..., description="ステージ別の合計所要時間 [s]")
 
 
 class AggregatedMetrics(BaseModel):
@@ -68,6 +146,11 @@ class AggregatedMetrics(BaseModel):
         avg_iterations: 平均修正回数（収束ケースのみ）
         final_pass_rate: 最終合格率
         per_check_first_pass_rate: 照査項目別の初回合格率
+        wall_time_p50_s: 試行あたり所要時間の中央値 [s]（計測済みの試行のみ）
+        wall_time_p95_s: 試行あたり所要時間の95パーセンタイル [s]
+        total_wall_time_s: 合計所要時間 [s]
+        stages: ステージ別の所要時間・トークン数の集計
+        per_case: 評価ケース（例: "L50_B10"）ごとのコスト集計
     """
 
     first_pass_rate: float = Field(..., description="初回合格率")
@@ -78,3 +161,8 @@ class AggregatedMetrics(BaseModel):
         ...,
         description="照査項目別の初回合格率",
     )
+    wall_time_p50_s: float = Field(default=0.0, description="試行あたり所要時間の中央値 [s]")
+    wall_time_p95_s: float = Field(default=0.0, description="試行あたり所要時間の95パーセンタイル [s]")
+    total_wall_time_s: float = Field(default=0.0, description="合計所要時間 [s]")
+    stages: dict[str, StageSummary] = Field(default_factory=dict, description="ステージ別の集計")
+    per_case: dict[str, CaseCost] = Field(default_factory=dict, description="評価ケースごとのコスト集計")
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-import json
+import tempfile
 from collections import defaultdict
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Iterator
 
 import matplotlib.pyplot as plt
 import numpy as np
@@ -12,6 +14,7 @@ from pydantic import BaseModel, Field
 
 from src.bridge_agentic_generate.logger_config import logger
 from src.evaluation.models import TrialResult
+from src.evaluation.store import RESULTS_STORE_FILENAME, ResultsStore
 
 # 日本語フォント設定（macOS: Hiragino Sans, Windows: MS Gothic, Linux: IPAGothic）
 plt.rcParams["font.family"] = ["Hiragino Sans", "MS Gothic", "IPAGothic", "sans-serif"]
@@ -55,24 +58,34 @@ class HeatmapData(BaseModel):
     values: list[list[float | None]] = Field(..., description="合格率2次元配列")
 
 
-def load_trial_results(results_dir: Path) -> list[TrialResult]:
-    """results/ フォルダから全 TrialResult を読み込む。
+@contextmanager
+def open_results_store(data_dir: Path) -> Iterator[ResultsStore]:
+    """評価データの結果ストアを開く。
+
+    ストアがない（ストア導入前の）評価データの場合は、results/*.json から一時ディレクトリに構築する
+    （評価データのディレクトリには書き込まない。一時ストアはブロックを抜けると削除する）。
 
     Args:
-        results_dir: results/ ディレクトリのパス
+        data_dir: 評価データのルートディレクトリ
 
-    Returns:
-        全試行結果のリスト
+    Yields:
+        ResultsStore
+
+    Raises:
+        FileNotFoundError: ストアも results/ も存在しない場合
     """
-    results: list[TrialResult] = []
-    for json_path in results_dir.glob("*.json"):
-        try:
-            data = json.loads(json_path.read_text(encoding="utf-8"))
-            results.append(TrialResult(**data))
-        except Exception as e:
-            logger.warning("Failed to load %s: %s", json_path, e)
-    logger.info("Loaded %d trial results from %s", len(results), results_dir)
-    return results
+    store_path = data_dir / RESULTS_STORE_FILENAME
+    if store_path.exists():
+        yield ResultsStore(store_path)
+        return
+
+    results_dir = data_dir / "results"
+    if not results_dir.exists():
+        raise FileNotFoundError(f"Results store or directory not found: {store_path}, {results_dir}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        store = ResultsStore(Path(tmp_dir) / RESULTS_STORE_FILENAME)
+        store.import_results_dir(results_dir)
+        yield store
 
 
 def calc_pass_rate_by_length(results: list[TrialResult]) -> list[PassRateEntry]:
@@ -312,23 +325,18 @@ def generate_all_plots(data_dir: Path, output_dir: Path) -> None:
     """全グラフを生成する。
 
     Args:
-        data_dir: 評価データのルートディレクトリ（results/ を含む）
+        data_dir: 評価データのルートディレクトリ（results.sqlite または results/ を含む）
         output_dir: グラフ出力先ディレクトリ
     """
-    results_dir = data_dir / "results"
-    if not results_dir.exists():
-        raise FileNotFoundError(f"Results directory not found: {results_dir}")
-
-    results = load_trial_results(results_dir)
-    if not results:
+    # RAGあり/なしで絞り込んで読み込み
+    with open_results_store(data_dir) as store:
+        results_rag_true = store.load_trial_results(use_rag=True)
+        results_rag_false = store.load_trial_results(use_rag=False)
+    if not results_rag_true and not results_rag_false:
         raise ValueError("No trial results found")
 
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    # RAGあり/なしでフィルタリング
-    results_rag_true = [r for r in results if r.use_rag]
-    results_rag_false = [r for r in results if not r.use_rag]
-
     # 橋長別（RAGあり）
     length_entries_rag_true = calc_pass_rate_by_length(results_rag_true)
     plot_bar_chart(
@@ -398,7 +406,7 @@ def generate_all_plots(data_dir: Path, output_dir: Path) -> None:
     )
 
     # RAG有無別
-    rag_entries = calc_pass_rate_by_rag(results)
+    rag_entries = calc_pass_rate_by_rag(results_rag_true + results_rag_false)
     plot_bar_chart(
         entries=rag_entries,
         output_path=output_dir / "rag_first_pass.png",
@@ -2,30 +2,48 @@
 
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor
+import json
+import os
+import shutil
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import cached_property
 from pathlib import Path
+from typing import Any
+
+from openai import OpenAIError
+from pydantic import BaseModel, ValidationError
 
 from src.bridge_agentic_generate.config import app_config
-from src.bridge_agentic_generate.designer.models import DesignerInput
-from src.bridge_agentic_generate.designer.services import generate_design_with_rag_log
-from src.bridge_agentic_generate.judge.models import (
-    JudgeInput,
-    RepairIteration,
-    RepairLoopResult,
-)
-from src.bridge_agentic_generate.judge.services import (
-    apply_dependency_rules,
-    apply_patch_plan,
-    judge_v1,
+from src.bridge_agentic_generate.designer.models import BridgeDesign, DesignerContexts, DesignerInput, DesignerRagLog
+from src.bridge_agentic_generate.designer.services import (
+    CachedDesignContextProvider,
+    DesignContextProvider,
+    generate_design_with_rag_log,
 )
-from src.bridge_agentic_generate.llm_client import LlmModel
+from src.bridge_agentic_generate.judge.models import JudgeReport, RepairLoopResult
+from src.bridge_agentic_generate.llm_client import LlmModel, configure_rate_limit, get_llm_client
 from src.bridge_agentic_generate.logger_config import logger
 from src.bridge_agentic_generate.rag.embedding_config import TOP_K
-from src.evaluation.models import EvaluationCase, TrialResult
+from src.bridge_agentic_generate.repair_loop import GreedyRepairStepper, run_repair_engine
+from src.bridge_agentic_generate.stage_timer import Stage, record_stages, stage
+from src.evaluation.metrics import IncrementalMetrics
+from src.evaluation.models import EvaluationCase, ExecutionMode, TrialResult, TrialUnit
+from src.evaluation.store import RESULTS_STORE_FILENAME, ResultsStore
+from src.process_context import worker_context
 
 # 照査項目のキー
 CHECK_KEYS = ["deck", "bend", "shear", "deflection", "web_slenderness"]
 
+# 実行中に summary.json を書き直す間隔 [秒]
+DEFAULT_SUMMARY_INTERVAL_S = 30.0
+
+# process モードで forkserver が事前に import するモジュール（ワーカーは import 済みの状態で fork される）
+WORKER_PRELOAD_MODULES = ["src.evaluation.runner"]
+
+# process モードのワーカープロセス内のランナー（_init_process_worker で設定）
+_worker_runner: EvaluationRunner | None = None
+
 
 def _run_repair_loop(
     bridge_length_m: float,
@@ -34,9 +52,13 @@ def _run_repair_loop(
     use_rag: bool,
     top_k: int,
     max_iterations: int,
+    run_dir: Path | None = None,
+    context_provider: DesignContextProvider | None = None,
 ) -> RepairLoopResult:
     """Designer → Judge → (必要なら修正) のループを実行する。
 
+    ループ本体は run_repair_engine（greedy 戦略）。run_dir を指定するとチェックポイントから再開する。
+
     Args:
         bridge_length_m: 橋長 L [m]
         total_width_m: 幅員 B [m]
@@ -44,119 +66,90 @@ def _run_repair_loop(
         use_rag: RAG を使用するかどうか
         top_k: RAG で取得するチャンク数
         max_iterations: 最大反復回数
+        run_dir: チェックポイントのディレクトリ（None の場合は保存・再開しない）
+        context_provider: RAG コンテキストの取得関数（None の場合は毎回検索）
 
     Returns:
         RepairLoopResult: 全イテレーションの結果を含む結果オブジェクト
     """
-    iterations: list[RepairIteration] = []
-
-    # 1. 初期設計を生成
     inputs = DesignerInput(bridge_length_m=bridge_length_m, total_width_m=total_width_m)
-    result = generate_design_with_rag_log(
-        inputs=inputs,
-        top_k=top_k,
-        model_name=model_name,
-        use_rag=use_rag,
-    )
-    design = result.design
-    rag_log = result.rag_log
-    dependency_rules = result.dependency_rules
-
-    logger.info(
-        "_run_repair_loop: 初期設計生成完了 L=%.0fm, B=%.0fm, use_rag=%s (dependency_rules=%d件)",
-        bridge_length_m,
-        total_width_m,
-        use_rag,
-        len(dependency_rules),
+    return run_repair_engine(
+        initial_design=lambda: generate_design_with_rag_log(
+            inputs=inputs,
+            top_k=top_k,
+            model_name=model_name,
+            use_rag=use_rag,
+            context_provider=context_provider,
+        ),
+        stepper=GreedyRepairStepper(model_name=model_name),
+        max_iterations=max_iterations,
+        run_dir=run_dir,
+        log_prefix=f"_run_repair_loop[use_rag={use_rag}]",
+        run_params={
+            "bridge_length_m": bridge_length_m,
+            "total_width_m": total_width_m,
+            "use_rag": use_rag,
+            "top_k": top_k,
+        },
     )
 
-    # 2. Judge → 修正ループ
-    for iteration in range(max_iterations):
-        logger.info("_run_repair_loop: イテレーション %d/%d", iteration + 1, max_iterations)
 
-        # 照査
-        judge_input = JudgeInput(bridge_design=design)
-        report = judge_v1(judge_input, model=model_name)
+def _init_process_worker(
+    runner_kwargs: dict[str, Any],
+    max_concurrent_requests: int | None,
+    requests_per_minute: float | None,
+) -> None:
+    """ワーカープロセスを初期化する（ProcessPoolExecutor の initializer）。
 
-        # イテレーション結果を記録
-        iterations.append(
-            RepairIteration(
-                iteration=iteration,
-                design=design.model_copy(deep=True),
-                report=report,
-            )
-        )
+    ランナーを構築し、プロセス単位のレート制限を設定したうえで、LLM クライアントを事前にロードする。
+    RAG コンテキストは親プロセスが検索して渡すため、ワーカーは RAG インデックスをロードしない。
+    事前ロードの失敗は警告のみとし、実際の呼び出し時のエラーに任せる。
 
-        # 合格なら終了
-        if report.pass_fail:
-            logger.info(
-                "_run_repair_loop: 合格（max_util=%.3f, iteration=%d）",
-                report.utilization.max_util,
-                iteration + 1,
-            )
-            return RepairLoopResult(
-                converged=True,
-                iterations=iterations,
-                final_design=design,
-                final_report=report,
-                rag_log=rag_log,
-            )
-
-        # PatchPlan を適用
-        deck_thickness_required = report.diagnostics.deck_thickness_required
-        design = apply_patch_plan(
-            design=design,
-            patch_plan=report.patch_plan,
-            deck_thickness_required=deck_thickness_required,
-        )
+    Args:
+        runner_kwargs: EvaluationRunner のコンストラクタ引数
+        max_concurrent_requests: このプロセスの LLM 同時リクエスト数の上限
+        requests_per_minute: このプロセスの LLM 毎分リクエスト数の上限
+    """
+    global _worker_runner
+    _worker_runner = EvaluationRunner(**runner_kwargs)
+    configure_rate_limit(max_concurrent=max_concurrent_requests, requests_per_minute=requests_per_minute)
+    try:
+        get_llm_client()
+    except (OSError, OpenAIError) as e:
+        logger.warning("_init_process_worker: 事前ロードに失敗しました: %s", e)
 
-        # 依存関係ルールを適用
-        design = apply_dependency_rules(design=design, dependency_rules=dependency_rules)
 
-        logger.info(
-            "_run_repair_loop: PatchPlan 適用完了（%d アクション）",
-            len(report.patch_plan.actions),
-        )
+def _execute_unit_in_worker(unit: TrialUnit, contexts: DesignerContexts | None) -> tuple[TrialResult, bool]:
+    """ワーカープロセスで未完了の試行単位を1件実行する（完了済みかは親プロセスで確認済み）。
 
-    # 最大イテレーション後も収束しなかった場合
-    judge_input = JudgeInput(bridge_design=design)
-    final_report = judge_v1(judge_input, model=model_name)
+    Args:
+        unit: 試行単位
+        contexts: 親プロセスで検索したケースの RAG コンテキスト（RAG なしの試行は None）
 
-    iterations.append(
-        RepairIteration(
-            iteration=max_iterations,
-            design=design.model_copy(deep=True),
-            report=final_report,
-        )
-    )
+    Returns:
+        (試行結果, False)
+    """
+    if _worker_runner is None:
+        raise RuntimeError("_execute_unit_in_worker: ワーカーが初期化されていません")
 
-    if final_report.pass_fail:
-        logger.info("_run_repair_loop: 最終照査で合格")
-        return RepairLoopResult(
-            converged=True,
-            iterations=iterations,
-            final_design=design,
-            final_report=final_report,
-            rag_log=rag_log,
-        )
+    def _shared_contexts(inputs: DesignerInput, top_k: int) -> DesignerContexts:
+        if contexts is None:
+            raise RuntimeError("_execute_unit_in_worker: RAG コンテキストが渡されていません")
+        return contexts
 
-    logger.warning(
-        "_run_repair_loop: %d 回の修正で収束しませんでした。 max_util=%.3f, governing_check=%s",
-        max_iterations,
-        final_report.utilization.max_util,
-        final_report.utilization.governing_check,
-    )
-    return RepairLoopResult(
-        converged=False,
-        iterations=iterations,
-        final_design=design,
-        final_report=final_report,
-        rag_log=rag_log,
-    )
+    return _worker_runner._execute_trial(unit.case, unit.use_rag, unit.trial, context_provider=_shared_contexts), False
 
 
 class EvaluationRunner:
-    """評価バッチ実行（ThreadPoolExecutor で並列化）。"""
+    """評価バッチ実行。
+
+    全ケース × RAG 条件 × 試行を1つのワーカープールでスケジューリングする。
+    execution_mode=thread では ThreadPoolExecutor、process では forkserver（ない環境では spawn）の
+    ProcessPoolExecutor を使う。
+    LLM 呼び出しは llm_client の共有レート制限を通る（process ではプロセス数で等分する）。
+    RAG 検索は (橋長, 幅員) ごとに1回だけ行い、同じケースの全試行で共有する
+    （process では親プロセスで検索し、コンテキストをワーカーに渡す）。
+    """
 
     def __init__(
         self,
@@ -166,6 +159,11 @@ class EvaluationRunner:
         max_workers: int = 3,
         top_k: int = TOP_K,
         output_dir: Path | None = None,
+        max_concurrent_requests: int | None = None,
+        requests_per_minute: float | None = None,
+        force: bool = False,
+        execution_mode: ExecutionMode = ExecutionMode.THREAD,
+        summary_interval_s: float = DEFAULT_SUMMARY_INTERVAL_S,
     ):
         """初期化。
 
@@ -173,9 +171,14 @@ class EvaluationRunner:
             model_name: 使用する LLM モデル名
             max_iterations: 修正ループの最大反復回数
             num_trials: 同一条件での試行回数
-            max_workers: 並列ワーカー数
+            max_workers: 並列ワーカー数（同時に実行する試行数の上限）
             top_k: RAG で取得するチャンク数
             output_dir: 出力ディレクトリ（None の場合は app_config.evaluation_dir）
+            max_concurrent_requests: LLM の同時リクエスト数の上限（None の場合は無制限）
+            requests_per_minute: LLM の毎分リクエスト数の上限（None の場合は無制限）
+            force: True の場合、完了済みの試行も出力（design_logs を含む）・チェックポイントを破棄して再実行する
+            execution_mode: 並列実行方式（thread / process）
+            summary_interval_s: 実行中に summary.json を書き直す間隔 [秒]
         """
         self.model_name = model_name
         self.max_iterations = max_iterations
@@ -183,6 +186,17 @@ class EvaluationRunner:
         self.max_workers = max_workers
         self.top_k = top_k
         self.output_dir = output_dir or app_config.evaluation_dir
+        self.max_concurrent_requests = max_concurrent_requests
+        self.requests_per_minute = requests_per_minute
+        self.force = force
+        self.execution_mode = execution_mode
+        self.summary_interval_s = summary_interval_s
+        self.context_provider = CachedDesignContextProvider()
+
+    @cached_property
+    def store(self) -> ResultsStore:
+        """試行完了ごとに追記する結果ストア（output_dir/results.sqlite）。"""
+        return ResultsStore(self.output_dir / RESULTS_STORE_FILENAME)
 
     def _ensure_output_dirs(self) -> None:
         """出力ディレクトリを作成する。"""
@@ -193,6 +207,7 @@ class EvaluationRunner:
         (self.output_dir / "ifcs").mkdir(parents=True, exist_ok=True)
         (self.output_dir / "results").mkdir(parents=True, exist_ok=True)
         (self.output_dir / "design_logs").mkdir(parents=True, exist_ok=True)
+        (self.output_dir / "checkpoints").mkdir(parents=True, exist_ok=True)
 
     def _build_trial_id(self, case: EvaluationCase, use_rag: bool, trial: int) -> str:
         """試行ID を構築する。
@@ -208,6 +223,69 @@ class EvaluationRunner:
         rag_str = "rag_true" if use_rag else "rag_false"
         return f"{case.case_id}_{rag_str}_trial_{trial}"
 
+    def load_completed_trial(self, trial_id: str) -> TrialResult | None:
+        """完了済みの試行の TrialResult を読み込む。
+
+        design / judge / result / raglog と全イテレーションの design_logs が揃い、
+        すべて読み込める場合のみ完了とみなす。
+
+        Args:
+            trial_id: 試行ID
+
+        Returns:
+            TrialResult（未完了・破損している場合は None）
+        """
+        artifacts: list[tuple[Path, type[BaseModel]]] = [
+            (self.output_dir / "results" / f"{trial_id}.json", TrialResult),
+            (self.output_dir / "designs" / f"{trial_id}.json", BridgeDesign),
+            (self.output_dir / "judges" / f"{trial_id}.json", JudgeReport),
+            (self.output_dir / "raglogs" / f"{trial_id}.json", DesignerRagLog),
+        ]
+        try:
+            result_path, _ = artifacts[0]
+            trial_result = TrialResult.model_validate_json(result_path.read_text(encoding="utf-8"))
+            for path, model in artifacts[1:]:
+                model.model_validate_json(path.read_text(encoding="utf-8"))
+            design_logs_dir = self.output_dir / "design_logs" / trial_id
+            for iteration in range(trial_result.num_iterations + 1):
+                iter_design_path = design_logs_dir / f"{trial_id}_iter{iteration}.json"
+                BridgeDesign.model_validate_json(iter_design_path.read_text(encoding="utf-8"))
+        except (OSError, ValidationError) as e:
+            logger.debug("load_completed_trial: %s は未完了または破損 (%s)", trial_id, e)
+            return None
+        return trial_result
+
+    def _clear_trial_outputs(self, trial_id: str) -> None:
+        """試行の出力（成果物・各イテレーションの設計・チェックポイント・結果ストアの行）を削除する。
+
+        再実行のイテレーション数が前回より少ない場合に、前回の design_logs が残って混ざらないようにする。
+
+        Args:
+            trial_id: 試行ID
+        """
+        for dirname in ("results", "designs", "judges", "raglogs"):
+            (self.output_dir / dirname / f"{trial_id}.json").unlink(missing_ok=True)
+        shutil.rmtree(self.output_dir / "design_logs" / trial_id, ignore_errors=True)
+        shutil.rmtree(self.output_dir / "checkpoints" / trial_id, ignore_errors=True)
+        self.store.delete_trial(trial_id)
+
+    def _resume_completed_trial(self, trial_id: str) -> TrialResult | None:
+        """完了済みの試行の結果を読み込み、ストアに未登録なら登録する。
+
+        Args:
+            trial_id: 試行ID
+
+        Returns:
+            TrialResult（未完了・破損している場合は None）
+        """
+        completed = self.load_completed_trial(trial_id)
+        if completed is None:
+            return None
+        logger.info("run_single_trial: 完了済みのためスキップ %s", trial_id)
+        if not self.store.has_trial(trial_id):
+            self.store.append_trial(completed)
+        return completed
+
     def run_single_trial(
         self,
         case: EvaluationCase,
@@ -216,29 +294,73 @@ class EvaluationRunner:
     ) -> TrialResult:
         """1回の試行を実行（同期）。
 
+        成果物が揃った完了済みの試行は再実行せず、保存済みの TrialResult を返す（force=False の場合）。
+        未完了・破損した試行は修正ループのチェックポイントから再開する。
+
         Args:
             case: 評価ケース
             use_rag: RAG 使用有無
             trial: 試行番号
 
+        Returns:
+            TrialResult: 試行結果
+        """
+        # 完了済みならスキップ（force の場合は _execute_trial で前回の出力を破棄して最初から）
+        if not self.force:
+            completed = self._resume_completed_trial(self._build_trial_id(case, use_rag, trial))
+            if completed is not None:
+                return completed
+        return self._execute_trial(case, use_rag, trial)
+
+    def _execute_trial(
+        self,
+        case: EvaluationCase,
+        use_rag: bool,
+        trial: int,
+        context_provider: DesignContextProvider | None = None,
+    ) -> TrialResult:
+        """完了済みかの確認を済ませた試行を実行する。
+
+        force の場合は前回の出力・チェックポイントを破棄して最初から実行する。
+
+        Args:
+            case: 評価ケース
+            use_rag: RAG 使用有無
+            trial: 試行番号
+            context_provider: RAG コンテキストの取得関数（None の場合はランナーのキャッシュ）
+
         Returns:
             TrialResult: 試行結果
         """
         trial_id = self._build_trial_id(case, use_rag, trial)
+        if self.force:
+            self._clear_trial_outputs(trial_id)
+
         logger.info("run_single_trial: 開始 %s", trial_id)
+        if not self.force and self.store.has_trial(trial_id):
+            # 成果物が欠けた・壊れた試行の行は、再実行の結果で置き換えるため削除する
+            logger.warning("run_single_trial: 成果物が揃っていない試行の結果ストアの行を削除 %s", trial_id)
+            self.store.delete_trial(trial_id)
 
         # 出力ディレクトリ確保
         self._ensure_output_dirs()
 
-        # 修正ループ実行
-        loop_result = _run_repair_loop(
-            bridge_length_m=case.bridge_length_m,
-            total_width_m=case.total_width_m,
-            model_name=self.model_name,
-            use_rag=use_rag,
-            top_k=self.top_k,
-            max_iterations=self.max_iterations,
-        )
+        # 修正ループ実行（チェックポイントがあれば途中から再開）と成果物の保存。ステージ別の所要時間を計測する
+        started_at = time.perf_counter()
+        with record_stages() as recorder:
+            loop_result = _run_repair_loop(
+                bridge_length_m=case.bridge_length_m,
+                total_width_m=case.total_width_m,
+                model_name=self.model_name,
+                use_rag=use_rag,
+                top_k=self.top_k,
+                max_iterations=self.max_iterations,
+                run_dir=self.output_dir / "checkpoints" / trial_id,
+                context_provider=context_provider or self.context_provider,
+            )
+            with stage(Stage.SERIALIZATION):
+                self._save_trial_artifacts(trial_id, loop_result)
+        wall_time_s = time.perf_counter() - started_at
 
         # 初回結果を取得
         first_iteration = loop_result.iterations[0]
@@ -273,10 +395,14 @@ class EvaluationRunner:
             final_pass=final_report.pass_fail,
             final_max_util=final_utilization.max_util,
             per_check_first_pass=per_check_first_pass,
+            wall_time_s=wall_time_s,
+            stages=recorder.snapshot(),
         )
 
-        # 結果をファイルに保存
-        self._save_trial_results(trial_id, loop_result, trial_result)
+        # 試行結果をファイル・結果ストアに保存（results/*.json は最後に書く）
+        result_path = self.output_dir / "results" / f"{trial_id}.json"
+        result_path.write_text(trial_result.model_dump_json(indent=2, ensure_ascii=False), encoding="utf-8")
+        self.store.append_trial(trial_result, loop_result.iterations)
 
         logger.info(
             "run_single_trial: 完了 %s (converged=%s, num_iterations=%d, first_pass=%s, final_pass=%s)",
@@ -289,18 +415,16 @@ class EvaluationRunner:
 
         return trial_result
 
-    def _save_trial_results(
+    def _save_trial_artifacts(
         self,
         trial_id: str,
         loop_result: RepairLoopResult,
-        trial_result: TrialResult,
     ) -> None:
-        """試行結果をファイルに保存する。
+        """試行の成果物（最終設計・照査結果・RAGログ・各イテレーションの設計）をファイルに保存する。
 
         Args:
             trial_id: 試行ID
             loop_result: 修正ループ結果
-            trial_result: 試行結果
         """
         # BridgeDesign（最終設計）
         design_path = self.output_dir / "designs" / f"{trial_id}.json"
@@ -316,13 +440,6 @@ class EvaluationRunner:
             encoding="utf-8",
         )
 
-        # TrialResult（評価指標）
-        result_path = self.output_dir / "results" / f"{trial_id}.json"
-        result_path.write_text(
-            trial_result.model_dump_json(indent=2, ensure_ascii=False),
-            encoding="utf-8",
-        )
-
         # RAGログ（初期設計生成時のRAGコンテキスト）
         raglog_path = self.output_dir / "raglogs" / f"{trial_id}.json"
         raglog_path.write_text(
@@ -341,20 +458,175 @@ class EvaluationRunner:
             )
 
         logger.info(
-            "_save_trial_results: 保存完了 design=%s, judge=%s, result=%s, raglog=%s, design_logs=%s",
+            "_save_trial_artifacts: 保存完了 design=%s, judge=%s, raglog=%s, design_logs=%s",
             design_path,
             judge_path,
-            result_path,
             raglog_path,
             design_logs_dir,
         )
 
+    def build_units(self, cases: list[EvaluationCase]) -> list[TrialUnit]:
+        """全ケースの試行単位を決定的な順序（ケース順 → RAG あり/なし → 試行番号）で列挙する。
+
+        Args:
+            cases: 評価ケースのリスト
+
+        Returns:
+            list[TrialUnit]: 試行単位のリスト
+        """
+        return [
+            TrialUnit(case=case, use_rag=use_rag, trial=trial)
+            for case in cases
+            for use_rag in (True, False)
+            for trial in range(1, self.num_trials + 1)
+        ]
+
+    def run_units(self, units: list[TrialUnit]) -> list[TrialResult]:
+        """試行単位を1つのワーカープールで並列実行する。
+
+        同時に実行する試行数は max_workers、LLM 呼び出しは共有レート制限で制限する。
+        結果は完了順ではなく units の順で返す。いずれかの試行が失敗した場合は、
+        未着手の試行をキャンセルして例外を送出する。
+        試行が完了するたびに指標を逐次集計して進捗行をログに出し、
+        summary.json を summary_interval_s ごと（と最後）に書き直す。
+        完了済みのためスキップした試行は、スループットと ETA の計算から除いて別に数える。
+
+        Args:
+            units: 試行単位のリスト
+
+        Returns:
+            list[TrialResult]: units と同じ順序の試行結果
+        """
+        logger.info(
+            "run_units: 開始 %d 試行 (max_workers=%d, execution_mode=%s)",
+            len(units),
+            self.max_workers,
+            self.execution_mode,
+        )
+
+        results: list[TrialResult | None] = [None] * len(units)
+        progress = IncrementalMetrics(total_trials=len(units))
+        last_summary_at = time.monotonic()
+        if self.execution_mode == ExecutionMode.PROCESS:
+            executor: Executor = self._create_process_pool(units)
+        else:
+            configure_rate_limit(
+                max_concurrent=self.max_concurrent_requests,
+                requests_per_minute=self.requests_per_minute,
+            )
+            executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            futures = {self._submit_unit(executor, unit): index for index, unit in enumerate(units)}
+            for future in as_completed(futures):
+                result, skipped = future.result()
+                results[futures[future]] = result
+                progress.add(result, skipped=skipped)
+                logger.info("run_units: %s", progress.progress_line())
+                if time.monotonic() - last_summary_at >= self.summary_interval_s:
+                    self._write_progress_summary(progress)
+                    last_summary_at = time.monotonic()
+            self._write_progress_summary(progress)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        logger.info("run_units: 完了 %d 試行", len(units))
+        return [result for result in results if result is not None]
+
+    def _write_progress_summary(self, progress: IncrementalMetrics) -> None:
+        """逐次集計の結果で summary.json を書き直す（一時ファイル経由で置き換える）。"""
+        summary_path = self.output_dir / "summary.json"
+        summary_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = summary_path.with_name(f"{summary_path.name}.tmp")
+        tmp_path.write_text(json.dumps(progress.summary(), indent=2, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_path, summary_path)
+
+    def _submit_unit(self, executor: Executor, unit: TrialUnit) -> Future[tuple[TrialResult, bool]]:
+        """試行単位を executor に投入する。
+
+        process の場合は、完了済みかの確認と RAG 検索（ケースごとに1回、ランナーのキャッシュを共有）を
+        親プロセスで行い、完了済みの試行は投入せずに完了済みの Future を返す。
+        """
+        if not isinstance(executor, ProcessPoolExecutor):
+            return executor.submit(self._run_unit, unit)
+
+        if not self.force:
+            completed = self._resume_completed_trial(self._build_trial_id(unit.case, unit.use_rag, unit.trial))
+            if completed is not None:
+                future: Future[tuple[TrialResult, bool]] = Future()
+                future.set_result((completed, True))
+                return future
+        contexts = None
+        if unit.use_rag:
+            inputs = DesignerInput(bridge_length_m=unit.case.bridge_length_m, total_width_m=unit.case.total_width_m)
+            contexts = self.context_provider(inputs, self.top_k)
+        return executor.submit(_execute_unit_in_worker, unit, contexts)
+
+    def _run_unit(self, unit: TrialUnit) -> tuple[TrialResult, bool]:
+        """試行単位を1件実行する。
+
+        Args:
+            unit: 試行単位
+
+        Returns:
+            (試行結果, 完了済みのためスキップしたか)
+        """
+        if not self.force:
+            completed = self._resume_completed_trial(self._build_trial_id(unit.case, unit.use_rag, unit.trial))
+            if completed is not None:
+                return completed, True
+        return self._execute_trial(unit.case, unit.use_rag, unit.trial), False
+
+    def _create_process_pool(self, units: list[TrialUnit]) -> ProcessPoolExecutor:
+        """事前初期化済みワーカーのプロセスプールを作成する。
+
+        ワーカーは WORKER_PRELOAD_MODULES を import 済みの forkserver から fork され
+        （forkserver がない環境では spawn で起動し）、initializer で LLM クライアントを
+        ロードしてから試行を受け付ける。
+        LLM のレート制限はプロセスごとに持つため、上限をプロセス数で等分する。
+        同時リクエスト数の上限がワーカー数より小さい場合は、プロセス数をその上限に合わせる。
+
+        Args:
+            units: 実行する試行単位
+
+        Returns:
+            ProcessPoolExecutor
+        """
+        num_processes = max(1, min(self.max_workers, len(units)))
+        if self.max_concurrent_requests is not None:
+            num_processes = max(1, min(num_processes, self.max_concurrent_requests))
+        max_concurrent = (
+            None if self.max_concurrent_requests is None else max(1, self.max_concurrent_requests // num_processes)
+        )
+        requests_per_minute = None if self.requests_per_minute is None else self.requests_per_minute / num_processes
+        runner_kwargs = {
+            "model_name": self.model_name,
+            "max_iterations": self.max_iterations,
+            "num_trials": self.num_trials,
+            "max_workers": 1,
+            "top_k": self.top_k,
+            "output_dir": self.output_dir,
+            "force": self.force,
+        }
+        logger.info(
+            "_create_process_pool: %d プロセス (max_concurrent=%s, requests_per_minute=%s / プロセス)",
+            num_processes,
+            max_concurrent,
+            requests_per_minute,
+        )
+
+        return ProcessPoolExecutor(
+            max_workers=num_processes,
+            mp_context=worker_context(WORKER_PRELOAD_MODULES),
+            initializer=_init_process_worker,
+            initargs=(runner_kwargs, max_concurrent, requests_per_minute),
+        )
+
     def run_case(
         self,
         case: EvaluationCase,
         use_rag: bool,
     ) -> list[TrialResult]:
-        """1ケース×1条件を num_trials 回並列実行（ThreadPoolExecutor）。
+        """1ケース×1条件を num_trials 回並列実行する。
 
         Args:
             case: 評価ケース
@@ -363,21 +635,8 @@ class EvaluationRunner:
         Returns:
             list[TrialResult]: 試行結果のリスト
         """
-        logger.info(
-            "run_case: 開始 %s, use_rag=%s, num_trials=%d",
-            case.case_id,
-            use_rag,
-            self.num_trials,
-        )
-
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            futures = [
-                executor.submit(self.run_single_trial, case, use_rag, trial) for trial in range(1, self.num_trials + 1)
-            ]
-            results = [f.result() for f in futures]
-
-        logger.info("run_case: 完了 %s, use_rag=%s", case.case_id, use_rag)
-        return results
+        units = [TrialUnit(case=case, use_rag=use_rag, trial=trial) for trial in range(1, self.num_trials + 1)]
+        return self.run_units(units)
 
     def run_all(
         self,
@@ -385,8 +644,8 @@ class EvaluationRunner:
     ) -> list[TrialResult]:
         """全ケースを実行（RAG あり/なし両方）。
 
-        ケース間は順次実行（API レート制限考慮）。
-        同一条件（ケース×RAG条件）内で ThreadPoolExecutor で並列実行。
+        全ケース × RAG 条件 × 試行を1つのワーカープールで並列実行する。
+        結果の順序はケース順 → RAG あり/なし → 試行番号で、実行順に依存しない。
 
         Args:
             cases: 評価ケースのリスト
@@ -395,17 +654,6 @@ class EvaluationRunner:
             list[TrialResult]: 全試行結果のリスト
         """
         logger.info("run_all: 開始 %d ケース", len(cases))
-
-        all_results: list[TrialResult] = []
-
-        for case in cases:
-            # RAG あり
-            results_rag_true = self.run_case(case, use_rag=True)
-            all_results.extend(results_rag_true)
-
-            # RAG なし
-            results_rag_false = self.run_case(case, use_rag=False)
-            all_results.extend(results_rag_false)
-
+        all_results = self.run_units(self.build_units(cases))
         logger.info("run_all: 完了 %d 試行", len(all_results))
         return all_results
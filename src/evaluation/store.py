@@ -0,0 +1,326 @@
+"""評価結果の列指向ストア（SQLite）。
+
+試行ごとの TrialResult と、イテレーションごとの util・断面寸法を1つの SQLite ファイルに追記する。
+行は上書きしない（同じ試行ID の追記はエラー）。再実行する試行の行は delete_trial で明示的に削除する。
+results/*.json を1件ずつ読み込む代わりに、集計・グラフ出力はこのストアを SQL で直接参照する。
+
+テーブル:
+    trials        試行1件 = 1行（TrialResult を照査項目ごとの列に展開）
+    iterations    試行 × イテレーション = 1行（util・合否・主要断面寸法）
+    trial_stages  試行 × ステージ = 1行（所要時間・トークン数）
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Sequence
+
+from pydantic import ValidationError
+
+from src.bridge_agentic_generate.judge.models import RepairIteration
+from src.bridge_agentic_generate.logger_config import logger
+from src.bridge_agentic_generate.stage_timer import StageStats
+from src.evaluation.metrics import CHECK_KEYS
+from src.evaluation.models import TrialResult
+
+# ストアのファイル名（評価出力ディレクトリ直下）
+RESULTS_STORE_FILENAME = "results.sqlite"
+
+# iterations テーブルの断面寸法列 → BridgeDesign 内のパス
+SECTION_COLUMNS: dict[str, str] = {
+    "web_height": "sections.girder_standard.web_height",
+    "web_thickness": "sections.girder_standard.web_thickness",
+    "top_flange_width": "sections.girder_standard.top_flange_width",
+    "top_flange_thickness": "sections.girder_standard.top_flange_thickness",
+    "bottom_flange_width": "sections.girder_standard.bottom_flange_width",
+    "bottom_flange_thickness": "sections.girder_standard.bottom_flange_thickness",
+    "num_girders": "dimensions.num_girders",
+    "girder_spacing": "dimensions.girder_spacing",
+    "num_panels": "dimensions.num_panels",
+    "deck_thickness": "components.deck.thickness",
+}
+
+_TRIAL_COLUMNS = [
+    "case_id",
+    "bridge_length_m",
+    "total_width_m",
+    "use_rag",
+    "trial",
+    "converged",
+    "num_iterations",
+    "first_pass",
+    "first_max_util",
+    "final_pass",
+    "final_max_util",
+    *[f"first_util_{key}" for key in CHECK_KEYS],
+    *[f"first_pass_{key}" for key in CHECK_KEYS],
+    "wall_time_s",
+]
+
+_ITERATION_COLUMNS = [
+    "case_id",
+    "iteration",
+    "pass_fail",
+    "max_util",
+    "governing_check",
+    *[f"util_{key}" for key in CHECK_KEYS],
+    "crossbeam_layout_ok",
+    "num_actions",
+    *SECTION_COLUMNS,
+]
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS trials (
+    case_id TEXT PRIMARY KEY,
+    bridge_length_m REAL NOT NULL,
+    total_width_m REAL NOT NULL,
+    use_rag INTEGER NOT NULL,
+    trial INTEGER NOT NULL,
+    converged INTEGER NOT NULL,
+    num_iterations INTEGER NOT NULL,
+    first_pass INTEGER NOT NULL,
+    first_max_util REAL NOT NULL,
+    final_pass INTEGER NOT NULL,
+    final_max_util REAL NOT NULL,
+    {", ".join(f"first_util_{key} REAL" for key in CHECK_KEYS)},
+    {", ".join(f"first_pass_{key} INTEGER" for key in CHECK_KEYS)},
+    wall_time_s REAL NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS iterations (
+    case_id TEXT NOT NULL,
+    iteration INTEGER NOT NULL,
+    pass_fail INTEGER NOT NULL,
+    max_util REAL NOT NULL,
+    governing_check TEXT NOT NULL,
+    {", ".join(f"util_{key} REAL NOT NULL" for key in CHECK_KEYS)},
+    crossbeam_layout_ok INTEGER NOT NULL,
+    num_actions INTEGER NOT NULL,
+    {", ".join(f"{column} REAL" for column in SECTION_COLUMNS)},
+    PRIMARY KEY (case_id, iteration)
+);
+CREATE TABLE IF NOT EXISTS trial_stages (
+    case_id TEXT NOT NULL,
+    stage TEXT NOT NULL,
+    seconds REAL NOT NULL,
+    calls INTEGER NOT NULL,
+    input_tokens INTEGER NOT NULL,
+    output_tokens INTEGER NOT NULL,
+    PRIMARY KEY (case_id, stage)
+);
+"""
+
+
+def _get_path(obj: Any, path: str) -> Any:
+    """ドット区切りのパスで属性を辿る。"""
+    for name in path.split("."):
+        obj = getattr(obj, name)
+    return obj
+
+
+class ResultsStore:
+    """評価結果の SQLite ストア（スレッドセーフ）。
+
+    書き込みは試行単位のトランザクションで行う。
+    """
+
+    def __init__(self, path: Path):
+        """初期化。テーブルがなければ作成する。
+
+        Args:
+            path: SQLite ファイルのパス
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock, closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            # 所要時間の計測を追加する前に作成されたストアには列を追加する
+            trial_columns = {row[1] for row in conn.execute("PRAGMA table_info(trials)")}
+            if "wall_time_s" not in trial_columns:
+                conn.execute("ALTER TABLE trials ADD COLUMN wall_time_s REAL NOT NULL DEFAULT 0")
+
+    def _connect(self) -> sqlite3.Connection:
+        """接続を開く（WAL では synchronous=NORMAL でもコミット済みの行は失われない）。"""
+        conn = sqlite3.connect(self.path, timeout=30.0)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def append_trial(self, trial_result: TrialResult, iterations: list[RepairIteration] | None = None) -> None:
+        """試行1件（とそのイテレーション）を追記する。
+
+        Args:
+            trial_result: 試行結果
+            iterations: 修正ループの各イテレーション（None の場合は trials のみ）
+
+        Raises:
+            sqlite3.IntegrityError: 同じ試行ID の行がすでにある場合（置き換える場合は先に delete_trial を呼ぶ）
+        """
+        trial_row = [
+            trial_result.case_id,
+            trial_result.bridge_length_m,
+            trial_result.total_width_m,
+            trial_result.use_rag,
+            trial_result.trial,
+            trial_result.converged,
+            trial_result.num_iterations,
+            trial_result.first_pass,
+            trial_result.first_max_util,
+            trial_result.final_pass,
+            trial_result.final_max_util,
+            *[trial_result.first_utilization.get(key) for key in CHECK_KEYS],
+            *[trial_result.per_check_first_pass.get(key) for key in CHECK_KEYS],
+            trial_result.wall_time_s,
+        ]
+        stage_rows = [
+            [trial_result.case_id, name, stats.seconds, stats.calls, stats.input_tokens, stats.output_tokens]
+            for name, stats in trial_result.stages.items()
+        ]
+        iteration_rows = [
+            [
+                trial_result.case_id,
+                it.iteration,
+                it.report.pass_fail,
+                it.report.utilization.max_util,
+                it.report.utilization.governing_check,
+                *[getattr(it.report.utilization, key) for key in CHECK_KEYS],
+                it.report.diagnostics.crossbeam_layout_ok,
+                len(it.report.patch_plan.actions),
+                *[_get_path(it.design, path) for path in SECTION_COLUMNS.values()],
+            ]
+            for it in iterations or []
+        ]
+
+        with self._lock, closing(self._connect()) as conn, conn:
+            conn.execute(
+                f"INSERT INTO trials ({', '.join(_TRIAL_COLUMNS)}) VALUES ({', '.join('?' * len(_TRIAL_COLUMNS))})",
+                trial_row,
+            )
+            conn.executemany("INSERT INTO trial_stages VALUES (?, ?, ?, ?, ?, ?)", stage_rows)
+            if iterations is not None:
+                conn.executemany(
+                    f"INSERT INTO iterations ({', '.join(_ITERATION_COLUMNS)}) "
+                    f"VALUES ({', '.join('?' * len(_ITERATION_COLUMNS))})",
+                    iteration_rows,
+                )
+
+    def delete_trial(self, case_id: str) -> None:
+        """試行ID の行（trials・iterations・trial_stages）を削除する（再実行の前に呼ぶ）。"""
+        with self._lock, closing(self._connect()) as conn, conn:
+            for table in ("trials", "iterations", "trial_stages"):
+                conn.execute(f"DELETE FROM {table} WHERE case_id = ?", (case_id,))
+
+    def has_trial(self, case_id: str) -> bool:
+        """試行ID の行が存在するかを返す。"""
+        return bool(self.query("SELECT 1 FROM trials WHERE case_id = ?", (case_id,)))
+
+    def query(self, sql: str, params: tuple[Any, ...] = ()) -> list[sqlite3.Row]:
+        """SQL を実行して全行を返す。
+
+        Args:
+            sql: SELECT 文
+            params: プレースホルダの値
+
+        Returns:
+            sqlite3.Row のリスト（列名でアクセスできる）
+        """
+        with closing(self._connect()) as conn:
+            conn.row_factory = sqlite3.Row
+            return conn.execute(sql, params).fetchall()
+
+    def load_trial_results(
+        self, use_rag: bool | None = None, case_ids: Sequence[str] | None = None
+    ) -> list[TrialResult]:
+        """TrialResult を試行ID 順で読み込む。
+
+        Args:
+            use_rag: RAG 条件で絞り込む（None の場合は全件）
+            case_ids: 試行ID で絞り込む（None の場合は全件）
+
+        Returns:
+            TrialResult のリスト
+        """
+        where, params = trial_filter(use_rag, case_ids)
+        rows = self.query(f"SELECT * FROM trials {where} ORDER BY case_id", params)
+        stages: dict[str, dict[str, StageStats]] = {}
+        for stage_row in self.query(
+            f"SELECT * FROM trial_stages WHERE case_id IN (SELECT case_id FROM trials {where})", params
+        ):
+            stages.setdefault(stage_row["case_id"], {})[stage_row["stage"]] = StageStats(
+                seconds=stage_row["seconds"],
+                calls=stage_row["calls"],
+                input_tokens=stage_row["input_tokens"],
+                output_tokens=stage_row["output_tokens"],
+            )
+        return [
+            TrialResult(
+                case_id=row["case_id"],
+                bridge_length_m=row["bridge_length_m"],
+                total_width_m=row["total_width_m"],
+                use_rag=bool(row["use_rag"]),
+                trial=row["trial"],
+                converged=bool(row["converged"]),
+                num_iterations=row["num_iterations"],
+                first_pass=bool(row["first_pass"]),
+                first_max_util=row["first_max_util"],
+                first_utilization={
+                    key: row[f"first_util_{key}"] for key in CHECK_KEYS if row[f"first_util_{key}"] is not None
+                },
+                final_pass=bool(row["final_pass"]),
+                final_max_util=row["final_max_util"],
+                per_check_first_pass={
+                    key: bool(row[f"first_pass_{key}"]) for key in CHECK_KEYS if row[f"first_pass_{key}"] is not None
+                },
+                wall_time_s=row["wall_time_s"],
+                stages=stages.get(row["case_id"], {}),
+            )
+            for row in rows
+        ]
+
+    def import_results_dir(self, results_dir: Path) -> int:
+        """results/*.json（ストア導入前の評価出力）を trials テーブルに取り込む。
+
+        Args:
+            results_dir: results/ ディレクトリのパス
+
+        Returns:
+            取り込んだ件数
+        """
+        count = 0
+        for json_path in sorted(results_dir.glob("*.json")):
+            try:
+                trial_result = TrialResult.model_validate(json.loads(json_path.read_text(encoding="utf-8")))
+            except (json.JSONDecodeError, ValidationError) as e:
+                logger.warning("import_results_dir: 読み込み失敗 %s: %s", json_path, e)
+                continue
+            self.append_trial(trial_result)
+            count += 1
+        logger.info("import_results_dir: %d 件を %s に取り込み", count, self.path)
+        return count
+
+
+def trial_filter(use_rag: bool | None = None, case_ids: Sequence[str] | None = None) -> tuple[str, tuple[Any, ...]]:
+    """trials テーブルを RAG 条件・試行ID で絞り込む WHERE 句とパラメータを返す。
+
+    Args:
+        use_rag: RAG 条件（None の場合は絞り込まない）
+        case_ids: 試行ID（None の場合は絞り込まない）
+
+    Returns:
+        (WHERE 句, パラメータ) のタプル
+    """
+    conditions: list[str] = []
+    params: list[Any] = []
+    if use_rag is not None:
+        conditions.append("use_rag = ?")
+        params.append(int(use_rag))
+    if case_ids is not None:
+        conditions.append(f"case_id IN ({', '.join('?' * len(case_ids))})")
+        params.extend(case_ids)
+    if not conditions:
+        return "", ()
+    return f"WHERE {' AND '.join(conditions)}", tuple(params)
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import os
 import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -10,19 +12,29 @@ from fire import Fire
 from pydantic import BaseModel
 
 from src.bridge_agentic_generate.config import app_config
-from src.bridge_agentic_generate.judge.models import RepairLoopResult
+from src.bridge_agentic_generate.designer.library import load_design_library
+from src.bridge_agentic_generate.designer.models import BridgeDesign, WarmStartMode
+from src.bridge_agentic_generate.judge.models import RepairLoopResult, RepairStrategy
+from src.bridge_agentic_generate.judge.planner import DEFAULT_BEAM_WIDTH, DEFAULT_HORIZON
+from src.bridge_agentic_generate.judge.prompts import DEFAULT_NUM_CANDIDATES
 from src.bridge_agentic_generate.judge.report import generate_repair_report
 from src.bridge_agentic_generate.llm_client import LlmModel
 from src.bridge_agentic_generate.logger_config import logger
 from src.bridge_agentic_generate.main import run_single_case, run_with_repair_loop
 from src.bridge_agentic_generate.rag.embedding_config import TOP_K
+from src.bridge_json_to_ifc.conversion_cache import copy_atomic, design_cache_key
 from src.bridge_json_to_ifc.run_convert import FileSuffixes
 from src.bridge_json_to_ifc.run_convert import convert as bridge_convert
+from src.process_context import worker_context
 
 DEFAULT_BRIDGE_LENGTH_M = 40.0
 DEFAULT_TOTAL_WIDTH_M = 10.0
 DEFAULT_JUDGE_ENABLED = True
 DEFAULT_MAX_ITERATIONS = 5
+# Senkei JSON / IFC 変換を並列実行するプロセス数の上限
+DEFAULT_EXPORT_WORKERS = min(os.cpu_count() or 1, 8)
+# 変換ワーカー用の forkserver が事前に import するモジュール（forkserver がない環境では spawn で起動）
+EXPORT_PRELOAD_MODULES = ["src.bridge_json_to_ifc.run_convert"]
 
 
 class RunResult(BaseModel):
@@ -47,10 +59,10 @@ class RunWithRepairResult(BaseModel):
         num_iterations: 実行されたイテレーション数
         iteration_design_jsons: 各イテレーションの設計JSONパスのリスト
         iteration_judge_jsons: 各イテレーションの照査結果JSONパスのリスト
-        iteration_senkei_jsons: 各イテレーションの SenkeiSpec JSON パスのリスト
+        iteration_senkei_jsons: 各イテレーションの SenkeiSpec JSON パスのリスト（書き出さない場合は空）
         iteration_ifcs: 各イテレーションの IFC パスのリスト
         final_design_json: 最終設計のJSONパス
-        final_senkei_json: 最終設計の SenkeiSpec JSON のパス
+        final_senkei_json: 最終設計の SenkeiSpec JSON のパス（書き出さない場合は None）
         final_ifc: 最終設計の IFC ファイルのパス
         raglog_json: RAG ログの JSON パス
         report_md: 修正ループレポート（Markdown）のパス
@@ -63,7 +75,7 @@ class RunWithRepairResult(BaseModel):
     iteration_senkei_jsons: list[str]
     iteration_ifcs: list[str]
     final_design_json: str
-    final_senkei_json: str
+    final_senkei_json: str | None
     final_ifc: str
     raglog_json: str
     report_md: str
@@ -199,21 +211,82 @@ class _SavedIterationPaths(BaseModel):
     senkei_jsons: list[str]
     ifcs: list[str]
     final_design_json: str
-    final_senkei_json: str
+    final_senkei_json: str | None
     final_ifc: str
     raglog_json: str
     report_md: str
 
 
+def _convert_designs(jobs: list[tuple[Path, Path | None, Path]], max_workers: int = DEFAULT_EXPORT_WORKERS) -> None:
+    """複数の BridgeDesign JSON を Senkei JSON / IFC に変換する。
+
+    内容が同じ設計（最終設計と最後のイテレーションなど）は1回だけ変換し、残りは変換結果をコピーする。
+    変換は互いに独立した CPU バウンド処理のため、プロセスプールで並列に実行し、ジョブ順に完了を待つ。
+    max_workers が 1 以下、または変換が1件のみの場合は同じプロセスで順に変換する。
+
+    Args:
+        jobs: (BridgeDesign JSON, Senkei JSON, IFC) のパスのリスト（Senkei JSON が None のジョブは IFC のみ出力する）
+        max_workers: 並列実行するプロセス数の上限
+    """
+    # 設計内容のハッシュで重複を除く（キー → 最初のジョブ）
+    unique_jobs: dict[str, tuple[Path, Path | None, Path]] = {}
+    duplicates: list[tuple[tuple[Path, Path | None, Path], tuple[Path, Path | None, Path]]] = []
+    for job in jobs:
+        key = design_cache_key(BridgeDesign.model_validate_json(job[0].read_text(encoding="utf-8")))
+        # Senkei JSON の要否が異なる場合は別ジョブとして扱う
+        key = f"{key}:{job[1] is not None}"
+        if key in unique_jobs:
+            duplicates.append((unique_jobs[key], job))
+        else:
+            unique_jobs[key] = job
+
+    cache_dir = str(app_config.conversion_cache_dir)
+    if max_workers <= 1 or len(unique_jobs) <= 1:
+        for design_path, senkei_path, ifc_path in unique_jobs.values():
+            bridge_convert(
+                str(design_path),
+                str(senkei_path) if senkei_path is not None else None,
+                str(ifc_path),
+                cache_dir=cache_dir,
+                write_senkei_json=senkei_path is not None,
+            )
+    else:
+        context = worker_context(EXPORT_PRELOAD_MODULES)
+        with ProcessPoolExecutor(max_workers=min(max_workers, len(unique_jobs)), mp_context=context) as executor:
+            futures = [
+                executor.submit(
+                    bridge_convert,
+                    str(design_path),
+                    str(senkei_path) if senkei_path is not None else None,
+                    str(ifc_path),
+                    cache_dir=cache_dir,
+                    write_senkei_json=senkei_path is not None,
+                )
+                for design_path, senkei_path, ifc_path in unique_jobs.values()
+            ]
+            for future in futures:
+                future.result()
+
+    for (_, src_senkei, src_ifc), (_, senkei_path, ifc_path) in duplicates:
+        if src_senkei is not None and senkei_path is not None:
+            copy_atomic(src_senkei, senkei_path)
+        copy_atomic(src_ifc, ifc_path)
+        logger.info("Reused identical design conversion %s → %s", src_ifc, ifc_path)
+
+
 def _save_repair_loop_results(
     loop_result: RepairLoopResult,
     base_name: str,
+    export_workers: int = DEFAULT_EXPORT_WORKERS,
+    write_senkei_json: bool = True,
 ) -> _SavedIterationPaths:
     """修正ループの結果を保存し、各イテレーションの IFC も生成する。
 
     Args:
         loop_result: 修正ループの結果
         base_name: ファイル名のベース部分
+        export_workers: IFC 変換を並列実行するプロセス数の上限
+        write_senkei_json: 中間の SenkeiSpec JSON も保存するかどうか（IFC は SenkeiSpec から直接生成する）
 
     Returns:
         _SavedIterationPaths: 保存されたファイルパスの情報
@@ -236,13 +309,14 @@ def _save_repair_loop_results(
     iteration_judge_paths: list[str] = []
     iteration_senkei_paths: list[str] = []
     iteration_ifc_paths: list[str] = []
+    convert_jobs: list[tuple[Path, Path | None, Path]] = []
 
     # 各イテレーションの結果を保存
     for iteration in loop_result.iterations:
         iter_suffix = f"_iter{iteration.iteration}"
         design_path = simple_json_dir / f"{base_name}{iter_suffix}.json"
         judge_path = judge_json_dir / f"{base_name}{iter_suffix}_judge.json"
-        senkei_path = senkei_json_dir / f"{base_name}{iter_suffix}{FileSuffixes.SENKEI}"
+        senkei_path = senkei_json_dir / f"{base_name}{iter_suffix}{FileSuffixes.SENKEI}" if write_senkei_json else None
         ifc_path = ifc_dir / f"{base_name}{iter_suffix}{FileSuffixes.IFC}"
 
         # Design JSON を保存
@@ -255,30 +329,34 @@ def _save_repair_loop_results(
             iteration.report.model_dump_json(indent=2, ensure_ascii=False),
             encoding="utf-8",
         )
-        # IFC に変換
-        bridge_convert(str(design_path), str(senkei_path), str(ifc_path))
+        # IFC 変換はまとめて並列に行う
+        convert_jobs.append((design_path, senkei_path, ifc_path))
 
         iteration_design_paths.append(str(design_path))
         iteration_judge_paths.append(str(judge_path))
-        iteration_senkei_paths.append(str(senkei_path))
+        if senkei_path is not None:
+            iteration_senkei_paths.append(str(senkei_path))
         iteration_ifc_paths.append(str(ifc_path))
 
         logger.info("Saved iteration %d design to %s", iteration.iteration, design_path)
         logger.info("Saved iteration %d judge to %s", iteration.iteration, judge_path)
-        logger.info("Saved iteration %d IFC to %s", iteration.iteration, ifc_path)
 
     # 最終設計を保存
     final_design_path = simple_json_dir / f"{base_name}_final.json"
-    final_senkei_path = senkei_json_dir / f"{base_name}_final{FileSuffixes.SENKEI}"
+    final_senkei_path = senkei_json_dir / f"{base_name}_final{FileSuffixes.SENKEI}" if write_senkei_json else None
     final_ifc_path = ifc_dir / f"{base_name}_final{FileSuffixes.IFC}"
 
     final_design_path.write_text(
         loop_result.final_design.model_dump_json(indent=2, ensure_ascii=False),
         encoding="utf-8",
     )
-    bridge_convert(str(final_design_path), str(final_senkei_path), str(final_ifc_path))
-
+    convert_jobs.append((final_design_path, final_senkei_path, final_ifc_path))
     logger.info("Saved final design to %s", final_design_path)
+
+    # 全イテレーション + 最終設計の IFC を並列に変換
+    _convert_designs(convert_jobs, max_workers=export_workers)
+    for ifc_path in iteration_ifc_paths:
+        logger.info("Saved iteration IFC to %s", ifc_path)
     logger.info("Saved final IFC to %s", final_ifc_path)
 
     # RAG ログを保存
@@ -300,7 +378,7 @@ def _save_repair_loop_results(
         senkei_jsons=iteration_senkei_paths,
         ifcs=iteration_ifc_paths,
         final_design_json=str(final_design_path),
-        final_senkei_json=str(final_senkei_path),
+        final_senkei_json=str(final_senkei_path) if final_senkei_path is not None else None,
         final_ifc=str(final_ifc_path),
         raglog_json=str(raglog_path),
         report_md=str(report_path),
@@ -313,6 +391,15 @@ def run_with_repair(
     model_name: str | LlmModel = LlmModel.GPT_5_MINI,
     top_k: int = TOP_K,
     max_iterations: int = DEFAULT_MAX_ITERATIONS,
+    num_candidates: int = DEFAULT_NUM_CANDIDATES,
+    warm_start: str | WarmStartMode = WarmStartMode.OFF,
+    design_library_path: str | None = None,
+    repair_strategy: str | RepairStrategy = RepairStrategy.GREEDY,
+    beam_width: int = DEFAULT_BEAM_WIDTH,
+    horizon: int = DEFAULT_HORIZON,
+    run_dir: str | None = None,
+    export_workers: int = DEFAULT_EXPORT_WORKERS,
+    write_senkei_json: bool = True,
 ) -> RunWithRepairResult:
     """Designer → Judge → 修正ループを実行し、途中経過をすべて保存してIFCまで出力する。
 
@@ -325,10 +412,25 @@ def run_with_repair(
         model_name: 使用する LLM モデル名。デフォルトは LlmModel.GPT_5_MINI。
         top_k: RAG 検索時の取得件数。デフォルトは TOP_K。
         max_iterations: 最大反復回数。デフォルトは DEFAULT_MAX_ITERATIONS。
+        num_candidates: 1イテレーションで評価する PatchPlan 候補数。デフォルトは DEFAULT_NUM_CANDIDATES。
+        warm_start: 設計ライブラリによるウォームスタートの利用方法（off / replace / candidate）。
+        design_library_path: 設計ライブラリ JSON のパス。指定しない場合は app_config.design_library_path。
+        repair_strategy: 修正戦略（greedy / beam）。beam は LLM をシード生成に1回だけ使うビームサーチ。
+        beam_width: beam 戦略で各深さに残す候補数。デフォルトは DEFAULT_BEAM_WIDTH。
+        horizon: beam 戦略で先読みする手数。デフォルトは DEFAULT_HORIZON。
+        run_dir: 修正ループのチェックポイントのディレクトリ。既存のチェックポイントがあれば途中から再開する。
+        export_workers: 各イテレーションの IFC 変換を並列実行するプロセス数。デフォルトは DEFAULT_EXPORT_WORKERS。
+        write_senkei_json: 中間の SenkeiSpec JSON も保存するかどうか。False の場合は IFC のみ出力する。
 
     Returns:
         RunWithRepairResult: 実行結果（途中経過のパスを含む）
     """
+    warm_start_mode = WarmStartMode(warm_start)
+    design_library = None
+    if warm_start_mode != WarmStartMode.OFF:
+        library_path = Path(design_library_path) if design_library_path else app_config.design_library_path
+        design_library = load_design_library(library_path)
+
     # 修正ループを実行
     loop_result = run_with_repair_loop(
         bridge_length_m=bridge_length_m,
@@ -336,6 +438,13 @@ def run_with_repair(
         model_name=_coerce_model(model_name),
         top_k=top_k,
         max_iterations=max_iterations,
+        num_candidates=num_candidates,
+        design_library=design_library,
+        warm_start=warm_start_mode,
+        repair_strategy=RepairStrategy(repair_strategy),
+        beam_width=beam_width,
+        horizon=horizon,
+        run_dir=Path(run_dir) if run_dir else None,
     )
 
     # ファイル名のベース部分を生成
@@ -346,6 +455,8 @@ def run_with_repair(
     saved_paths = _save_repair_loop_results(
         loop_result=loop_result,
         base_name=base_name,
+        export_workers=export_workers,
+        write_senkei_json=write_senkei_json,
     )
 
     logger.info(
@@ -380,6 +491,15 @@ class CLI:
 
         # Designer → Judge → 修正ループ → IFC（途中経過をすべて保存）
         uv run python -m src.main run_with_repair --bridge_length_m=50 --total_width_m=10
+
+        # 収束設計ライブラリの近傍設計から開始（Designer の LLM 呼び出しなし）
+        uv run python -m src.main run_with_repair --bridge_length_m=50 --total_width_m=10 --warm_start=replace
+
+        # ビームサーチで修正列を探索（LLM はシード生成に1回のみ）
+        uv run python -m src.main run_with_repair --bridge_length_m=50 --total_width_m=10 --repair_strategy=beam
+
+        # チェックポイントを保存し、中断した場合は同じ run_dir で再実行して途中から再開
+        uv run python -m src.main run_with_repair --bridge_length_m=50 --total_width_m=10 --run_dir=data/runs/L50_B10
     """
 
     def run(
@@ -410,6 +530,15 @@ class CLI:
         model_name: LlmModel = LlmModel.GPT_5_1,
         top_k: int = TOP_K,
         max_iterations: int = DEFAULT_MAX_ITERATIONS,
+        num_candidates: int = DEFAULT_NUM_CANDIDATES,
+        warm_start: WarmStartMode = WarmStartMode.OFF,
+        design_library_path: str | None = None,
+        repair_strategy: RepairStrategy = RepairStrategy.GREEDY,
+        beam_width: int = DEFAULT_BEAM_WIDTH,
+        horizon: int = DEFAULT_HORIZON,
+        run_dir: str | None = None,
+        export_workers: int = DEFAULT_EXPORT_WORKERS,
+        write_senkei_json: bool = True,
     ) -> RunWithRepairResult:
         """Designer → Judge → 修正ループ → IFC を実行する（各イテレーションの IFC も生成）。"""
         return run_with_repair(
@@ -418,6 +547,15 @@ class CLI:
             model_name=model_name,
             top_k=top_k,
             max_iterations=max_iterations,
+            num_candidates=num_candidates,
+            warm_start=warm_start,
+            design_library_path=design_library_path,
+            repair_strategy=repair_strategy,
+            beam_width=beam_width,
+            horizon=horizon,
+            run_dir=run_dir,
+            export_workers=export_workers,
+            write_senkei_json=write_senkei_json,
         )
 
 
@@ -0,0 +1,32 @@
+"""ワーカープロセスの起動方式の選択。
+
+forkserver が使える環境（Linux・macOS）では、事前に import したモジュールを引き継いでワーカーを起動する。
+forkserver がない環境（Windows）では spawn で起動する（ワーカーごとにモジュールを import し直す）。
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+from multiprocessing.context import BaseContext
+from typing import Sequence
+
+# ワーカーの起動方式（優先順）
+FORKSERVER_START_METHOD = "forkserver"
+FALLBACK_START_METHOD = "spawn"
+
+
+def worker_context(preload_modules: Sequence[str] = ()) -> BaseContext:
+    """ProcessPoolExecutor に渡すマルチプロセスのコンテキストを返す。
+
+    Args:
+        preload_modules: forkserver が事前に import するモジュール（spawn の場合は使わない）
+
+    Returns:
+        forkserver が使える場合は forkserver、使えない場合は spawn のコンテキスト
+    """
+    if FORKSERVER_START_METHOD not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context(FALLBACK_START_METHOD)
+    context = multiprocessing.get_context(FORKSERVER_START_METHOD)
+    if preload_modules:
+        context.set_forkserver_preload(list(preload_modules))
+    return context
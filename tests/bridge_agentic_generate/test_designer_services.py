@@ -0,0 +1,141 @@
+"""bridge_agentic_generate.designer.services のテスト。"""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+from src.bridge_agentic_generate.designer.models import (
+    BridgeDesign,
+    Components,
+    CrossbeamSection,
+    Deck,
+    DesignerInput,
+    DesignerOutput,
+    DesignRule,
+    Dimensions,
+    GirderSection,
+    Sections,
+)
+from src.bridge_agentic_generate.designer.services import (
+    CachedDesignContextProvider,
+    generate_design_with_rag_log,
+)
+from src.bridge_agentic_generate.llm_client import LlmModel
+from src.bridge_agentic_generate.rag.embedding_config import IndexChunk, SearchResult
+
+SERVICES = "src.bridge_agentic_generate.designer.services"
+
+
+def _designer_output(rule_id: str) -> DesignerOutput:
+    """固定の設計を返す DesignerOutput。"""
+    design = BridgeDesign(
+        dimensions=Dimensions(
+            bridge_length=30000.0,
+            total_width=10000.0,
+            num_girders=4,
+            girder_spacing=2667.0,
+            panel_length=5000.0,
+            num_panels=6,
+        ),
+        sections=Sections(
+            girder_standard=GirderSection(
+                web_height=1500.0,
+                web_thickness=16.0,
+                top_flange_width=350.0,
+                top_flange_thickness=25.0,
+                bottom_flange_width=450.0,
+                bottom_flange_thickness=30.0,
+            ),
+            crossbeam_standard=CrossbeamSection(
+                total_height=1200.0,
+                web_thickness=10.0,
+                flange_width=280.0,
+                flange_thickness=12.0,
+            ),
+        ),
+        components=Components(deck=Deck(thickness=217.0)),
+    )
+    return DesignerOutput(
+        reasoning=f"reasoning {rule_id}",
+        rules=[DesignRule(rule_id=rule_id, category="other", summary="test")],
+        bridge_design=design,
+    )
+
+
+def _search_text(query: str, client: object, top_k: int) -> list[SearchResult]:
+    """検索のスタブ（遅延を入れて同時呼び出しを起こしやすくする）。"""
+    time.sleep(0.01)
+    chunk = IndexChunk(id=query, source="doc.pdf", section="", page=0, text=query)
+    return [SearchResult(chunk=chunk, score=0.9)]
+
+
+@pytest.fixture
+def mocked_rag():
+    """search_text・LLM をモックする。"""
+    outputs = iter(_designer_output(f"R{i}") for i in range(100))
+    with (
+        patch(f"{SERVICES}.search_text", side_effect=_search_text) as search_text,
+        patch(f"{SERVICES}.get_llm_client", return_value=MagicMock()),
+        patch(f"{SERVICES}.call_llm_with_structured_output", side_effect=lambda **_: next(outputs)),
+    ):
+        yield search_text
+
+
+class TestCachedDesignContextProvider:
+    """CachedDesignContextProvider のテスト。"""
+
+    def test_retrieves_once_per_case(self, mocked_rag: MagicMock) -> None:
+        """同じケースの複数試行（並列含む）で RAG 検索が1回分（5クエリ）しか走らないこと。"""
+        provider = CachedDesignContextProvider()
+        inputs = DesignerInput(bridge_length_m=30.0, total_width_m=10.0)
+        lock = threading.Lock()
+        results = []
+
+        def _trial() -> None:
+            result = generate_design_with_rag_log(
+                inputs=inputs, top_k=3, model_name=LlmModel.GPT_5_1, context_provider=provider
+            )
+            with lock:
+                results.append(result)
+
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            for future in [executor.submit(_trial) for _ in range(6)]:
+                future.result()
+
+        assert mocked_rag.call_count == 5
+        assert len({tuple(hit.text for hit in r.rag_log.hits) for r in results}) == 1
+
+        generate_design_with_rag_log(
+            inputs=DesignerInput(bridge_length_m=50.0, total_width_m=10.0),
+            top_k=3,
+            model_name=LlmModel.GPT_5_1,
+            context_provider=provider,
+        )
+        assert mocked_rag.call_count == 10
+
+    def test_rag_logs_are_independent(self, mocked_rag: MagicMock) -> None:
+        """共有コンテキストでも試行ごとの RAG ログ（reasoning・rules）は独立していること。"""
+        provider = CachedDesignContextProvider()
+        inputs = DesignerInput(bridge_length_m=30.0, total_width_m=10.0)
+
+        first = generate_design_with_rag_log(
+            inputs=inputs, top_k=3, model_name=LlmModel.GPT_5_1, context_provider=provider
+        )
+        second = generate_design_with_rag_log(
+            inputs=inputs, top_k=3, model_name=LlmModel.GPT_5_1, context_provider=provider
+        )
+
+        assert first.rag_log.reasoning == "reasoning R0"
+        assert second.rag_log.reasoning == "reasoning R1"
+        assert [rule.rule_id for rule in first.rag_log.rules] == ["R0"]
+        assert provider(inputs, 3).rag_log.reasoning == ""
+
+    def test_without_provider_searches_every_time(self, mocked_rag: MagicMock) -> None:
+        inputs = DesignerInput(bridge_length_m=30.0, total_width_m=10.0)
+        for _ in range(2):
+            generate_design_with_rag_log(inputs=inputs, top_k=3, model_name=LlmModel.GPT_5_1)
+        assert mocked_rag.call_count == 10
@@ -0,0 +1,252 @@
+"""bridge_agentic_generate.designer.library のテスト。"""
+
+from __future__ import annotations
+
+import math
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from src.bridge_agentic_generate.designer.library import (
+    build_design_library,
+    build_warm_start_design,
+    find_nearest_entry,
+    scale_design,
+)
+from src.bridge_agentic_generate.designer.models import (
+    BridgeDesign,
+    Components,
+    CrossbeamSection,
+    Deck,
+    DependencyRule,
+    DesignerInput,
+    DesignerRagLog,
+    DesignLibrary,
+    DesignLibraryEntry,
+    DesignResult,
+    Dimensions,
+    GirderSection,
+    Sections,
+    WarmStartMode,
+)
+from src.bridge_agentic_generate.judge.models import JudgeInput, JudgeReport, PatchPlan
+from src.bridge_agentic_generate.judge.services import judge_v1_lightweight
+from src.bridge_agentic_generate.main import generate_initial_design
+
+
+def _converged_design(bridge_length: float, total_width: float, num_girders: int) -> BridgeDesign:
+    """合格する設計を作成する。"""
+    overhang = 1000.0
+    girder_spacing = (total_width - 2 * overhang) / (num_girders - 1)
+    num_panels = 5
+    return BridgeDesign(
+        dimensions=Dimensions(
+            bridge_length=bridge_length,
+            total_width=total_width,
+            num_girders=num_girders,
+            girder_spacing=girder_spacing,
+            panel_length=bridge_length / num_panels,
+            num_panels=num_panels,
+        ),
+        sections=Sections(
+            girder_standard=GirderSection(
+                web_height=2000.0,
+                web_thickness=20.0,
+                top_flange_width=500.0,
+                top_flange_thickness=40.0,
+                bottom_flange_width=600.0,
+                bottom_flange_thickness=50.0,
+            ),
+            crossbeam_standard=CrossbeamSection(
+                total_height=1600.0,
+                web_thickness=12.0,
+                flange_width=350.0,
+                flange_thickness=16.0,
+            ),
+        ),
+        components=Components(deck=Deck(thickness=230.0)),
+    )
+
+
+def _report(pass_fail: bool) -> JudgeReport:
+    """指定した合否の JudgeReport を作成する。"""
+    design = _converged_design(30000.0, 10000.0, 4)
+    utilization, diagnostics = judge_v1_lightweight(JudgeInput(bridge_design=design))
+    return JudgeReport(
+        pass_fail=pass_fail,
+        utilization=utilization,
+        diagnostics=diagnostics,
+        patch_plan=PatchPlan(actions=[]),
+    )
+
+
+def _entry(bridge_length_m: float, total_width_m: float, source: str) -> DesignLibraryEntry:
+    """ライブラリエントリを作成する。"""
+    return DesignLibraryEntry(
+        bridge_length_m=bridge_length_m,
+        total_width_m=total_width_m,
+        design=_converged_design(bridge_length_m * 1000, total_width_m * 1000, 4),
+        final_max_util=0.9,
+        source=source,
+    )
+
+
+@pytest.fixture
+def library() -> DesignLibrary:
+    """L, B の異なる3件の収束設計を持つライブラリ。"""
+    return DesignLibrary(
+        entries=[
+            _entry(20.0, 8.0, "L20_B8"),
+            _entry(30.0, 10.0, "L30_B10"),
+            _entry(50.0, 10.0, "L50_B10"),
+        ]
+    )
+
+
+class TestFindNearestEntry:
+    """find_nearest_entry のテスト。"""
+
+    def test_nearest_by_relative_distance(self, library: DesignLibrary) -> None:
+        assert find_nearest_entry(library, 32.0, 10.0).source == "L30_B10"
+        assert find_nearest_entry(library, 45.0, 10.0).source == "L50_B10"
+
+    def test_empty_library(self) -> None:
+        assert find_nearest_entry(DesignLibrary(), 30.0, 10.0) is None
+
+
+class TestScaleDesign:
+    """scale_design のテスト。"""
+
+    def test_scaled_layout_is_consistent(self, library: DesignLibrary) -> None:
+        """スケーリング後も幅員・横桁配置の整合が取れていること。"""
+        entry = library.entries[1]
+        design = scale_design(entry, 36.0, 12.0)
+        dims = design.dimensions
+
+        overhang = (dims.total_width - (dims.num_girders - 1) * dims.girder_spacing) / 2
+        assert dims.bridge_length == 36000.0
+        assert dims.total_width == 12000.0
+        assert overhang == pytest.approx(1000.0)
+        assert dims.panel_length * dims.num_panels == pytest.approx(dims.bridge_length)
+        assert dims.panel_length <= entry.design.dimensions.panel_length
+
+        _, diagnostics = judge_v1_lightweight(JudgeInput(bridge_design=design))
+        assert diagnostics.crossbeam_layout_ok
+        assert design.components.deck.thickness >= diagnostics.deck_thickness_required
+
+    def test_web_height_scales_with_length(self, library: DesignLibrary) -> None:
+        entry = library.entries[1]
+        design = scale_design(entry, 45.0, 10.0)
+        assert design.sections.girder_standard.web_height == pytest.approx(3000.0)
+        assert design.sections.crossbeam_standard.total_height == pytest.approx(2400.0)
+
+    def test_flange_area_scales_with_length_and_spacing(self, library: DesignLibrary) -> None:
+        """フランジ幅・厚さがともに √(L·b の比) でスケーリングされること。"""
+        entry = library.entries[1]
+        design = scale_design(entry, 45.0, 10.0)
+        girder = design.sections.girder_standard
+        ratio = 1.5**0.5
+        assert girder.bottom_flange_width == pytest.approx(math.ceil(600.0 * ratio / 10) * 10)
+        assert girder.bottom_flange_thickness == math.ceil(50.0 * ratio)
+        assert girder.top_flange_width == pytest.approx(math.ceil(500.0 * ratio / 10) * 10)
+
+    def test_applies_dependency_rules(self, library: DesignLibrary) -> None:
+        entry = library.entries[1].model_copy(
+            update={
+                "dependency_rules": [
+                    DependencyRule(
+                        rule_id="D1",
+                        target_field="sections.crossbeam_standard.total_height",
+                        source_field="sections.girder_standard.web_height",
+                        factor=0.7,
+                    )
+                ]
+            }
+        )
+        design = scale_design(entry, 45.0, 10.0)
+        assert design.sections.crossbeam_standard.total_height == pytest.approx(2100.0)
+
+
+class TestBuildWarmStartDesign:
+    """build_warm_start_design のテスト。"""
+
+    def test_in_range(self, library: DesignLibrary) -> None:
+        result = build_warm_start_design(library, DesignerInput(bridge_length_m=36.0, total_width_m=12.0))
+        assert result is not None
+        assert result.design.dimensions.bridge_length == 36000.0
+
+    @pytest.mark.parametrize(
+        ("bridge_length_m", "total_width_m"),
+        [
+            (9.0, 8.0),  # 橋長比が下限未満
+            (90.0, 18.0),  # 適用支間長 80m 超過
+            (20.0, 3.5),  # 幅員比が下限未満
+        ],
+    )
+    def test_out_of_range_returns_none(
+        self, library: DesignLibrary, bridge_length_m: float, total_width_m: float
+    ) -> None:
+        """スケーリング結果が適用範囲外ならウォームスタートしないこと。"""
+        inputs = DesignerInput(bridge_length_m=bridge_length_m, total_width_m=total_width_m)
+        assert build_warm_start_design(library, inputs) is None
+
+
+class TestBuildDesignLibrary:
+    """build_design_library のテスト。"""
+
+    def test_builds_from_evaluation_dir(self, tmp_path: Path) -> None:
+        """合格した試行のみ登録されること。"""
+        for sub in ("designs", "judges", "raglogs"):
+            (tmp_path / sub).mkdir()
+        design_json = _converged_design(30000.0, 10000.0, 4).model_dump_json()
+        (tmp_path / "designs" / "ok.json").write_text(design_json, encoding="utf-8")
+        (tmp_path / "judges" / "ok.json").write_text(_report(pass_fail=True).model_dump_json(), encoding="utf-8")
+        (tmp_path / "raglogs" / "ok.json").write_text(
+            DesignerRagLog(query="q", top_k=0, hits=[]).model_dump_json(), encoding="utf-8"
+        )
+        (tmp_path / "designs" / "ng.json").write_text(design_json, encoding="utf-8")
+        (tmp_path / "judges" / "ng.json").write_text(_report(pass_fail=False).model_dump_json(), encoding="utf-8")
+
+        library = build_design_library([tmp_path])
+
+        assert [e.source for e in library.entries] == [f"{tmp_path.name}/ok"]
+        assert library.entries[0].bridge_length_m == 30.0
+
+
+class TestGenerateInitialDesign:
+    """generate_initial_design のテスト。"""
+
+    def test_replace_skips_designer(self, library: DesignLibrary) -> None:
+        inputs = DesignerInput(bridge_length_m=35.0, total_width_m=10.0)
+        with patch("src.bridge_agentic_generate.main.generate_design_with_rag_log") as mock_designer:
+            result = generate_initial_design(
+                inputs=inputs,
+                top_k=5,
+                model_name="gpt-5-mini",
+                design_library=library,
+                warm_start=WarmStartMode.REPLACE,
+            )
+        mock_designer.assert_not_called()
+        assert result.design.dimensions.bridge_length == 35000.0
+        assert result.rag_log.query == "design_library"
+
+    def test_candidate_prefers_passing_library_design(self, library: DesignLibrary) -> None:
+        """Designer の設計が不合格でライブラリ設計が合格なら、ライブラリ設計を採用すること。"""
+        inputs = DesignerInput(bridge_length_m=20.0, total_width_m=8.0)
+        failing = _converged_design(20000.0, 8000.0, 4)
+        failing.sections.girder_standard.web_height = 600.0
+        designer_result = DesignResult(design=failing, rag_log=DesignerRagLog(query="test", top_k=5, hits=[]))
+
+        with patch(
+            "src.bridge_agentic_generate.main.generate_design_with_rag_log",
+            return_value=designer_result,
+        ):
+            result = generate_initial_design(
+                inputs=inputs,
+                top_k=5,
+                model_name="gpt-5-mini",
+                design_library=library,
+                warm_start=WarmStartMode.CANDIDATE,
+            )
+        assert result.rag_log.query == "design_library"
+        assert result.design.sections.girder_standard.web_height == pytest.approx(2000.0)
@@ -0,0 +1,65 @@
+"""bridge_agentic_generate.llm_client のテスト。"""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from src.bridge_agentic_generate.llm_client import LlmRateLimiter
+
+# スレッドの起床の遅れとして許容する時間 [s]
+SPACING_JITTER_S = 0.02
+
+
+class TestLlmRateLimiter:
+    """LlmRateLimiter のテスト。"""
+
+    def test_limits_concurrency(self) -> None:
+        """同時実行数が max_concurrent を超えないこと。"""
+        limiter = LlmRateLimiter(max_concurrent=2)
+        lock = threading.Lock()
+        active = 0
+        peak = 0
+
+        def _call() -> None:
+            nonlocal active, peak
+            with limiter.acquire():
+                with lock:
+                    active += 1
+                    peak = max(peak, active)
+                time.sleep(0.02)
+                with lock:
+                    active -= 1
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for future in [executor.submit(_call) for _ in range(8)]:
+                future.result()
+
+        assert peak == 2
+
+    def test_spaces_request_starts(self) -> None:
+        """requests_per_minute に応じて開始時刻が等間隔に均されること。"""
+        limiter = LlmRateLimiter(requests_per_minute=1200)  # 50ms 間隔
+        starts: list[float] = []
+
+        def _call() -> None:
+            with limiter.acquire():
+                starts.append(time.monotonic())
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            for future in [executor.submit(_call) for _ in range(4)]:
+                future.result()
+
+        # 連続する開始の間隔は 50ms から起床の揺らぎ（SPACING_JITTER_S）を引いた値以上
+        starts.sort()
+        gaps = [later - earlier for earlier, later in zip(starts, starts[1:])]
+        assert min(gaps) >= 0.05 - SPACING_JITTER_S
+        assert starts[-1] - starts[0] >= 3 * 0.05 - SPACING_JITTER_S
+
+    def test_invalid_arguments(self) -> None:
+        with pytest.raises(ValueError):
+            LlmRateLimiter(max_concurrent=0)
+        with pytest.raises(ValueError):
+            LlmRateLimiter(requests_per_minute=0)
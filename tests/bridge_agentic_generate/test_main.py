@@ -25,6 +25,7 @@ from src.bridge_agentic_generate.judge.models import (
     PatchAction,
     PatchActionOp,
     PatchPlan,
+    RepairStrategy,
     Utilization,
 )
 from src.bridge_agentic_generate.main import run_with_repair_loop
@@ -253,7 +254,7 @@ class TestRunWithRepairLoop:
                 return_value=mock_design_result,
             ),
             patch(
-                "src.bridge_agentic_generate.main.judge_v1",
+                "src.bridge_agentic_generate.repair_loop.judge_v1",
                 return_value=_create_passing_report(),
             ) as mock_judge,
         ):
@@ -287,7 +288,7 @@ class TestRunWithRepairLoop:
                 return_value=mock_design_result,
             ),
             patch(
-                "src.bridge_agentic_generate.main.judge_v1",
+                "src.bridge_agentic_generate.repair_loop.judge_v1",
                 side_effect=judge_results,
             ) as mock_judge,
         ):
@@ -319,7 +320,7 @@ class TestRunWithRepairLoop:
                 return_value=mock_design_result,
             ),
             patch(
-                "src.bridge_agentic_generate.main.judge_v1",
+                "src.bridge_agentic_generate.repair_loop.judge_v1",
                 return_value=_create_failing_report(),
             ),
         ):
@@ -359,11 +360,11 @@ class TestRunWithRepairLoop:
                 return_value=mock_design_result,
             ),
             patch(
-                "src.bridge_agentic_generate.main.judge_v1",
+                "src.bridge_agentic_generate.repair_loop.judge_v1",
                 side_effect=judge_results,
             ),
             patch(
-                "src.bridge_agentic_generate.main.apply_patch_plan",
+                "src.bridge_agentic_generate.repair_loop.apply_patch_plan",
                 side_effect=mock_apply_fn,
             ) as mock_apply,
         ):
@@ -376,3 +377,31 @@ class TestRunWithRepairLoop:
 
         # apply_patch_plan が1回呼ばれること
         assert mock_apply.call_count == 1
+
+    def test_beam_strategy_converges_without_llm_repair(self, failing_design: BridgeDesign) -> None:
+        """beam 戦略では LLM の修正呼び出しなしで収束し、シード要求は1回以内であること。"""
+        mock_design_result = DesignResult(
+            design=failing_design,
+            rag_log=DesignerRagLog(query="test", top_k=5, hits=[]),
+        )
+
+        with (
+            patch(
+                "src.bridge_agentic_generate.main.generate_design_with_rag_log",
+                return_value=mock_design_result,
+            ),
+            patch("src.bridge_agentic_generate.repair_loop.request_seed_plans", return_value=[]) as mock_seed,
+            patch("src.bridge_agentic_generate.repair_loop.judge_v1") as mock_judge,
+        ):
+            result = run_with_repair_loop(
+                bridge_length_m=50.0,
+                total_width_m=12.0,
+                model_name="gpt-5-mini",
+                max_iterations=5,
+                repair_strategy=RepairStrategy.BEAM,
+            )
+
+        mock_judge.assert_not_called()
+        assert mock_seed.call_count <= 1
+        assert result.converged is True
+        assert result.final_report.pass_fail is True
@@ -0,0 +1,48 @@
+"""bridge_agentic_generate.rag.search のテスト。"""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from src.bridge_agentic_generate.llm_client import LlmRateLimiter
+from src.bridge_agentic_generate.rag.embedding_config import EmbeddingModel
+from src.bridge_agentic_generate.rag.search import _embed_query
+
+
+class TestEmbedQuery:
+    """_embed_query のテスト。"""
+
+    def test_goes_through_shared_rate_limiter(self) -> None:
+        """Embeddings API の呼び出しも共有レート制限の同時実行数に従うこと。"""
+        lock = threading.Lock()
+        active = 0
+        peak = 0
+
+        def _create(model: str, input: str) -> SimpleNamespace:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+            return SimpleNamespace(data=[SimpleNamespace(embedding=[0.0, 1.0])], usage=None)
+
+        client = MagicMock()
+        client.embeddings.create.side_effect = _create
+        limiter = LlmRateLimiter(max_concurrent=1)
+        with (
+            patch("src.bridge_agentic_generate.rag.search.get_rate_limiter", return_value=limiter),
+            ThreadPoolExecutor(max_workers=4) as executor,
+        ):
+            model = EmbeddingModel.TEXT_EMBEDDING_3_SMALL
+            futures = [executor.submit(_embed_query, f"q{i}", client, model) for i in range(4)]
+            vectors = [future.result() for future in futures]
+
+        assert peak == 1
+        assert client.embeddings.create.call_count == 4
+        assert vectors[0].tolist() == [0.0, 1.0]
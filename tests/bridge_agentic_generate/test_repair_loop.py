@@ -0,0 +1,196 @@
+"""bridge_agentic_generate.repair_loop のテスト。"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from src.bridge_agentic_generate.designer.models import (
+    BridgeDesign,
+    Components,
+    CrossbeamSection,
+    Deck,
+    DependencyRule,
+    DesignerRagLog,
+    DesignResult,
+    Dimensions,
+    GirderSection,
+    Sections,
+)
+from src.bridge_agentic_generate.judge.models import (
+    JudgeInput,
+    JudgeReport,
+    PatchAction,
+    PatchActionOp,
+    PatchPlan,
+)
+from src.bridge_agentic_generate.judge.services import apply_patch_plan, judge_v1_lightweight
+from src.bridge_agentic_generate.repair_loop import run_repair_engine
+
+
+@pytest.fixture
+def design_result() -> DesignResult:
+    """数回の修正では合格しない設計（L=30m, 腹板高 600mm）。"""
+    design = BridgeDesign(
+        dimensions=Dimensions(
+            bridge_length=30000.0,
+            total_width=10000.0,
+            num_girders=4,
+            girder_spacing=2667.0,
+            panel_length=5000.0,
+            num_panels=6,
+        ),
+        sections=Sections(
+            girder_standard=GirderSection(
+                web_height=600.0,
+                web_thickness=16.0,
+                top_flange_width=350.0,
+                top_flange_thickness=25.0,
+                bottom_flange_width=450.0,
+                bottom_flange_thickness=30.0,
+            ),
+            crossbeam_standard=CrossbeamSection(
+                total_height=480.0,
+                web_thickness=10.0,
+                flange_width=280.0,
+                flange_thickness=12.0,
+            ),
+        ),
+        components=Components(deck=Deck(thickness=217.0)),
+    )
+    return DesignResult(
+        design=design,
+        rag_log=DesignerRagLog(query="test", top_k=5, hits=[]),
+        dependency_rules=[
+            DependencyRule(
+                rule_id="D1",
+                target_field="sections.crossbeam_standard.total_height",
+                source_field="sections.girder_standard.web_height",
+                factor=0.8,
+            )
+        ],
+    )
+
+
+class _WebHeightStepper:
+    """毎イテレーション腹板高を 200mm 増やす決定論的な戦略。"""
+
+    def __init__(self, fail_on_apply: int | None = None):
+        self.fail_on_apply = fail_on_apply
+        self.judged_iterations: list[int] = []
+
+    def params(self) -> dict[str, Any]:
+        return {"delta_mm": 200.0}
+
+    def judge(
+        self,
+        design: BridgeDesign,
+        dependency_rules: list[DependencyRule],
+        iteration: int,
+        final: bool,
+    ) -> JudgeReport:
+        self.judged_iterations.append(iteration)
+        utilization, diagnostics = judge_v1_lightweight(JudgeInput(bridge_design=design))
+        action = PatchAction(
+            op=PatchActionOp.INCREASE_WEB_HEIGHT,
+            path="sections.girder_standard.web_height",
+            delta_mm=200.0,
+            reason="test",
+        )
+        return JudgeReport(
+            pass_fail=utilization.max_util <= 1.0,
+            utilization=utilization,
+            diagnostics=diagnostics,
+            patch_plan=PatchPlan(actions=[action]),
+        )
+
+    def apply(
+        self,
+        design: BridgeDesign,
+        report: JudgeReport,
+        dependency_rules: list[DependencyRule],
+    ) -> BridgeDesign:
+        if self.judged_iterations[-1] == self.fail_on_apply:
+            raise RuntimeError("simulated crash")
+        return apply_patch_plan(design, report.patch_plan, verbose=False)
+
+
+class TestRunRepairEngine:
+    """run_repair_engine のテスト。"""
+
+    def test_writes_checkpoints(self, design_result: DesignResult, tmp_path: Path) -> None:
+        """初期設計と各イテレーションのチェックポイントが保存されること。"""
+        result = run_repair_engine(lambda: design_result, _WebHeightStepper(), max_iterations=3, run_dir=tmp_path)
+
+        assert result.converged is False
+        assert [it.iteration for it in result.iterations] == [0, 1, 2, 3]
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "initial.json",
+            "iter_000.json",
+            "iter_001.json",
+            "iter_002.json",
+            "iter_003.json",
+        ]
+
+    def test_resumes_after_crash(self, design_result: DesignResult, tmp_path: Path) -> None:
+        """途中で落ちた場合、初期設計を再生成せず最後に完了したイテレーションの次から再開すること。"""
+        with pytest.raises(RuntimeError):
+            run_repair_engine(
+                lambda: design_result, _WebHeightStepper(fail_on_apply=2), max_iterations=3, run_dir=tmp_path
+            )
+
+        initial_design = MagicMock()
+        stepper = _WebHeightStepper()
+        resumed = run_repair_engine(initial_design, stepper, max_iterations=3, run_dir=tmp_path)
+        uninterrupted = run_repair_engine(lambda: design_result, _WebHeightStepper(), max_iterations=3)
+
+        initial_design.assert_not_called()
+        assert stepper.judged_iterations == [2, 3]
+        assert resumed.final_design == uninterrupted.final_design
+        assert resumed.final_design.sections.girder_standard.web_height == pytest.approx(1200.0)
+        assert len(resumed.iterations) == 4
+
+    def test_completed_run_is_not_rejudged(self, design_result: DesignResult, tmp_path: Path) -> None:
+        """終了済みの run_dir では照査を呼ばずに結果を返すこと。"""
+        first = run_repair_engine(lambda: design_result, _WebHeightStepper(), max_iterations=2, run_dir=tmp_path)
+
+        stepper = _WebHeightStepper()
+        again = run_repair_engine(MagicMock(), stepper, max_iterations=2, run_dir=tmp_path)
+
+        assert stepper.judged_iterations == []
+        assert again == first
+
+    def test_restarts_when_max_iterations_differ(self, design_result: DesignResult, tmp_path: Path) -> None:
+        """max_iterations が異なる終了済みの run_dir は再利用せず、初期設計から作り直すこと。"""
+        run_repair_engine(lambda: design_result, _WebHeightStepper(), max_iterations=2, run_dir=tmp_path)
+
+        initial_design = MagicMock(return_value=design_result)
+        stepper = _WebHeightStepper()
+        result = run_repair_engine(initial_design, stepper, max_iterations=3, run_dir=tmp_path)
+
+        initial_design.assert_called_once()
+        assert stepper.judged_iterations == [0, 1, 2, 3]
+        assert [it.iteration for it in result.iterations] == [0, 1, 2, 3]
+        assert len(list(tmp_path.glob("iter_*.json"))) == 4
+
+    def test_restarts_when_inputs_differ(self, design_result: DesignResult, tmp_path: Path) -> None:
+        """初期設計の入力（run_params）が異なる場合、途中のチェックポイントから再開しないこと。"""
+        with pytest.raises(RuntimeError):
+            run_repair_engine(
+                lambda: design_result,
+                _WebHeightStepper(fail_on_apply=1),
+                max_iterations=3,
+                run_dir=tmp_path,
+                run_params={"bridge_length_m": 30.0},
+            )
+
+        initial_design = MagicMock(return_value=design_result)
+        stepper = _WebHeightStepper()
+        run_repair_engine(
+            initial_design, stepper, max_iterations=3, run_dir=tmp_path, run_params={"bridge_length_m": 40.0}
+        )
+
+        initial_design.assert_called_once()
+        assert stepper.judged_iterations == [0, 1, 2, 3]
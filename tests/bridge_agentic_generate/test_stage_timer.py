@@ -0,0 +1,104 @@
+"""bridge_agentic_generate.stage_timer のテスト。"""
+
+from __future__ import annotations
+
+import contextvars
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from src.bridge_agentic_generate.stage_timer import Stage, add_tokens, record_stages, stage, stage_scope
+
+
+class TestStageTimer:
+    """record_stages / stage / add_tokens のテスト。"""
+
+    def test_nested_stage_excludes_child_time(self) -> None:
+        """外側のステージには内側のステージの時間を含めないこと。"""
+        with record_stages() as recorder:
+            with stage(Stage.JUDGE):
+                time.sleep(0.02)
+                with stage(Stage.PATCH_PLAN_LLM):
+                    time.sleep(0.05)
+                    add_tokens(100, 20)
+
+        stats = recorder.snapshot()
+        assert list(stats) == ["patch_plan_llm", "judge"]
+        assert stats["patch_plan_llm"].seconds >= 0.05
+        assert 0.02 <= stats["judge"].seconds < 0.05
+        assert (stats["patch_plan_llm"].input_tokens, stats["patch_plan_llm"].output_tokens) == (100, 20)
+        assert stats["judge"].input_tokens == 0
+
+    def test_propagates_to_threads_with_copied_context(self) -> None:
+        """copy_context().run で投入したスレッドの計測が同じ記録先に集計されること。"""
+
+        def _call() -> None:
+            with stage(Stage.EMBEDDING):
+                add_tokens(10)
+
+        with record_stages() as recorder, ThreadPoolExecutor(max_workers=4) as executor:
+            for future in [executor.submit(contextvars.copy_context().run, _call) for _ in range(4)]:
+                future.result()
+
+        assert recorder.snapshot()["embedding"].calls == 4
+        assert recorder.snapshot()["embedding"].input_tokens == 40
+
+    def test_parallel_children_are_subtracted_from_parent(self) -> None:
+        """別スレッドで並列に終わった子区間の時間をすべて外側のステージから差し引くこと。"""
+
+        def _call() -> None:
+            with stage(Stage.EMBEDDING):
+                time.sleep(0.02)
+
+        with record_stages() as recorder, ThreadPoolExecutor(max_workers=8) as executor:
+            with stage(Stage.JUDGE):
+                for future in [executor.submit(contextvars.copy_context().run, _call) for _ in range(8)]:
+                    future.result()
+
+        stats = recorder.snapshot()
+        assert stats["embedding"].calls == 8
+        assert stats["judge"].seconds == 0.0
+
+    def test_drops_stages_finished_after_scope(self) -> None:
+        """stage_scope を抜けた後に終わった区間（打ち切ったスレッド）は記録しないこと。"""
+        release = threading.Event()
+
+        def _call(wait: bool) -> None:
+            with stage(Stage.PATCH_PLAN_LLM):
+                if wait:
+                    release.wait(timeout=5.0)
+                add_tokens(10)
+
+        with record_stages() as recorder, ThreadPoolExecutor(max_workers=2) as executor:
+            with stage(Stage.JUDGE):
+                with stage_scope():
+                    executor.submit(contextvars.copy_context().run, _call, False).result()
+                    abandoned = executor.submit(contextvars.copy_context().run, _call, True)
+            release.set()
+            abandoned.result()
+
+        stats = recorder.snapshot()
+        assert stats["patch_plan_llm"].calls == 1
+        assert stats["patch_plan_llm"].input_tokens == 10
+
+    def test_recorders_are_isolated(self) -> None:
+        """並列の試行ごとに record_stages の記録先が分かれること。"""
+
+        def _trial(num_calls: int) -> int:
+            with record_stages() as recorder:
+                for _ in range(num_calls):
+                    with stage(Stage.JUDGE):
+                        pass
+            return recorder.snapshot()[Stage.JUDGE].calls
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            assert list(executor.map(_trial, [1, 2, 3])) == [1, 2, 3]
+
+    def test_noop_without_recorder(self) -> None:
+        with stage(Stage.IFC):
+            add_tokens(5)
+
+    @pytest.mark.parametrize("stage_name", list(Stage))
+    def test_stage_values_are_snake_case(self, stage_name: Stage) -> None:
+        assert stage_name.value == stage_name.name.lower()
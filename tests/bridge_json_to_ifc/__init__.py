@@ -0,0 +1 @@
+"""Bridge JSON to IFC tests package."""
@@ -0,0 +1,116 @@
+"""bridge_json_to_ifc.benchmark のテスト。"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from src.bridge_json_to_ifc.benchmark import (
+    BenchmarkCase,
+    BenchmarkReport,
+    BenchmarkResult,
+    benchmark_cases,
+    benchmark_design,
+    compare_reports,
+    load_report,
+    run_benchmark,
+    save_report,
+    scaling_exponents,
+)
+
+
+def _result(case_id: str, entity_count: int, ifc_seconds: float) -> BenchmarkResult:
+    """エンティティ数と所要時間だけを指定した計測結果。"""
+    return BenchmarkResult(
+        case=BenchmarkCase(case_id=case_id, num_girders=3, num_panels=4, span_m=20.0),
+        senkei_seconds=0.0,
+        ifc_seconds=ifc_seconds,
+        phase_seconds={"_generate_main_panels": ifc_seconds / 2},
+        phase_entities={"_generate_main_panels": entity_count // 2},
+        entity_count=entity_count,
+        element_count=0,
+        file_size_bytes=0,
+    )
+
+
+def _report(results: list[BenchmarkResult]) -> BenchmarkReport:
+    return BenchmarkReport(created_at="", repeats=1, results=results, scaling=scaling_exponents(results))
+
+
+class TestCases:
+    """ベンチマークケース・設計のテスト。"""
+
+    def test_grid_order_and_ids(self) -> None:
+        """主桁本数 → パネル数 → 支間長の順にケースを並べること。"""
+        cases = benchmark_cases([3, 6], [4], [20.0, 40.5])
+
+        assert [case.case_id for case in cases] == ["G3_P4_L20", "G3_P4_L40.5", "G6_P4_L20", "G6_P4_L40.5"]
+        assert len(benchmark_cases()) == 100
+
+    def test_design_scales_with_case(self) -> None:
+        """全幅・パネル長・桁高がケースに合わせて決まること。"""
+        design = benchmark_design(BenchmarkCase(case_id="G4_P8_L40", num_girders=4, num_panels=8, span_m=40.0))
+
+        assert design.dimensions.total_width == 2500.0 * 3 + 2000.0
+        assert design.dimensions.panel_length == 5000.0
+        assert design.sections.girder_standard.web_height == 2000.0
+        assert design.sections.crossbeam_standard.total_height == 1600.0
+
+
+class TestScaling:
+    """スケーリング指数・ベースライン比較のテスト。"""
+
+    @pytest.mark.parametrize("power", [1.0, 2.0])
+    def test_exponent_matches_power_law(self, power: float) -> None:
+        """所要時間がエンティティ数の power 乗に比例する場合、傾きが power になること。"""
+        exponents = scaling_exponents([_result(f"C{n}", n, 1e-6 * n**power) for n in (1000, 4000, 16000)])
+
+        assert exponents["total"] == pytest.approx(power)
+        assert exponents["_generate_main_panels"] == pytest.approx(power)
+
+    def test_exponent_needs_enough_points(self) -> None:
+        """エンティティ数の異なるケースが足りない場合は傾きを返さないこと。"""
+        assert scaling_exponents([_result("A", 1000, 1.0), _result("B", 1000, 2.0), _result("C", 2000, 3.0)]) == {}
+
+    def test_compare_reports(self, tmp_path: Path) -> None:
+        """エンティティ数の変化・所要時間と指数の増加を検出し、保存した結果を読み込めること。"""
+        baseline = _report([_result(f"C{n}", n, 1e-4 * n) for n in (1000, 4000, 16000)])
+        save_report(baseline, tmp_path / "baseline.json")
+        baseline = load_report(tmp_path / "baseline.json")
+
+        assert compare_reports(baseline, baseline) == []
+
+        current = _report([_result("C1000", 1001, 0.1), _result("C4000", 4000, 0.4), _result("C16000", 16000, 16.0)])
+        findings = compare_reports(current, baseline)
+
+        assert [finding.split(":")[0] for finding in findings] == [
+            "C1000",
+            "C16000",
+            "total",
+            "_generate_main_panels",
+        ]
+
+
+class TestRunBenchmark:
+    """小さなグリッドでのベンチマーク実行のテスト。"""
+
+    @pytest.mark.parametrize("isolate", [False, True])
+    def test_runs_cases(self, tmp_path: Path, isolate: bool) -> None:
+        """各ケースを IFC まで変換し、パネル数に応じてエンティティ数が増えること。"""
+        report = run_benchmark(benchmark_cases([3], [2, 4], [10.0]), tmp_path, isolate=isolate)
+
+        small, large = report.results
+        assert [result.case.case_id for result in report.results] == ["G3_P2_L10", "G3_P4_L10"]
+        assert 0 < small.entity_count < large.entity_count
+        assert small.file_size_bytes > 0
+        assert large.ifc_seconds == pytest.approx(sum(large.phase_seconds.values()))
+        assert "_save_ifc_file" in large.phase_seconds
+
+    def test_isolated_runs_without_forkserver(self, tmp_path: Path) -> None:
+        """forkserver がない環境（Windows）でも spawn のワーカーでケースを実行できること。"""
+        with patch("multiprocessing.get_all_start_methods", return_value=["spawn"]):
+            report = run_benchmark(benchmark_cases([3], [2], [10.0]), tmp_path, isolate=True)
+
+        assert [result.case.case_id for result in report.results] == ["G3_P2_L10"]
+        assert report.results[0].entity_count > 0
@@ -0,0 +1,138 @@
+"""bridge_json_to_ifc.conversion_cache のテスト。"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+
+from src.bridge_agentic_generate.designer.models import (
+    BridgeDesign,
+    Components,
+    CrossbeamSection,
+    Deck,
+    Dimensions,
+    GirderSection,
+    Sections,
+)
+from src.bridge_json_to_ifc.conversion_cache import CACHE_IFC_FILENAME, ConversionCache, design_cache_key
+
+
+def _design(deck_thickness: float = 220.0) -> BridgeDesign:
+    return BridgeDesign(
+        dimensions=Dimensions(
+            bridge_length=20000.0,
+            total_width=8000.0,
+            num_girders=4,
+            girder_spacing=2000.0,
+            panel_length=5000.0,
+            num_panels=4,
+        ),
+        sections=Sections(
+            girder_standard=GirderSection(
+                web_height=1600.0,
+                web_thickness=20.0,
+                top_flange_width=500.0,
+                top_flange_thickness=40.0,
+                bottom_flange_width=600.0,
+                bottom_flange_thickness=50.0,
+            ),
+            crossbeam_standard=CrossbeamSection(
+                total_height=1280.0,
+                web_thickness=12.0,
+                flange_width=350.0,
+                flange_thickness=16.0,
+            ),
+        ),
+        components=Components(deck=Deck(thickness=deck_thickness)),
+    )
+
+
+class TestDesignCacheKey:
+    """design_cache_key のテスト。"""
+
+    def test_ignores_key_order(self) -> None:
+        """JSON のキー順が違っても同じ設計なら同じキーになること。"""
+        design = _design()
+        raw = design.model_dump(mode="json")
+        reordered = BridgeDesign.model_validate(json.loads(json.dumps(dict(reversed(list(raw.items()))))))
+
+        assert design_cache_key(reordered) == design_cache_key(design)
+
+    def test_changes_with_design(self) -> None:
+        assert design_cache_key(_design(230.0)) != design_cache_key(_design())
+
+
+class TestConversionCache:
+    """ConversionCache のテスト。"""
+
+    def test_save_and_restore(self, tmp_path: Path) -> None:
+        """登録した変換結果を出力先に復元でき、出力先をその場で編集してもキャッシュは変わらないこと。"""
+        cache = ConversionCache(tmp_path / "cache")
+        key = design_cache_key(_design())
+        senkei_path, ifc_path = tmp_path / "a_senkei.json", tmp_path / "a.ifc"
+        senkei_path.write_text("senkei", encoding="utf-8")
+        ifc_path.write_text("ifc", encoding="utf-8")
+
+        assert cache.restore(key, tmp_path / "b_senkei.json", tmp_path / "b.ifc") is False
+        cache.save(key, senkei_path, ifc_path)
+        assert cache.restore(key, tmp_path / "b_senkei.json", tmp_path / "b.ifc") is True
+
+        assert (tmp_path / "b.ifc").read_text(encoding="utf-8") == "ifc"
+        with (tmp_path / "b.ifc").open("a", encoding="utf-8") as file:
+            file.write(" edited")
+        assert cache.restore(key, tmp_path / "c_senkei.json", tmp_path / "c.ifc") is True
+        assert (tmp_path / "c.ifc").read_text(encoding="utf-8") == "ifc"
+
+    def test_ifc_only_entry(self, tmp_path: Path) -> None:
+        """IFC のみの登録は IFC のみの復元にだけヒットし、Senkei JSON を要求する復元ではミスすること。"""
+        cache = ConversionCache(tmp_path / "cache")
+        key = design_cache_key(_design())
+        ifc_path = tmp_path / "a.ifc"
+        ifc_path.write_text("ifc", encoding="utf-8")
+
+        cache.save(key, None, ifc_path)
+
+        assert cache.restore(key, tmp_path / "b_senkei.json", tmp_path / "b.ifc") is False
+        assert cache.restore(key, None, tmp_path / "c.ifc") is True
+        assert (tmp_path / "c.ifc").read_text(encoding="utf-8") == "ifc"
+
+
+def _save_entry(cache: ConversionCache, tmp_path: Path, deck_thickness: float, size: int, age_s: float) -> str:
+    """size バイトの IFC を登録し、最終使用時刻を age_s 秒前にしたエントリのキーを返す。"""
+    key = design_cache_key(_design(deck_thickness))
+    ifc_path = tmp_path / f"{deck_thickness:.0f}.ifc"
+    ifc_path.write_bytes(b"x" * size)
+    cache.save(key, None, ifc_path)
+    used_at = time.time() - age_s
+    os.utime(cache.cache_dir / key[:2] / key / CACHE_IFC_FILENAME, (used_at, used_at))
+    return key
+
+
+class TestConversionCacheEviction:
+    """ConversionCache の削除（期限・サイズ上限）のテスト。"""
+
+    def test_evicts_expired_entries(self, tmp_path: Path) -> None:
+        """最後に使われてから max_age_s を過ぎたエントリは次の登録で削除されること。"""
+        cache = ConversionCache(tmp_path / "cache", max_age_s=3600.0)
+        old = _save_entry(cache, tmp_path, 220.0, size=10, age_s=7200.0)
+        recent = _save_entry(cache, tmp_path, 230.0, size=10, age_s=60.0)
+        new = _save_entry(cache, tmp_path, 240.0, size=10, age_s=0.0)
+
+        assert not cache.contains(old, with_senkei=False)
+        assert cache.contains(recent, with_senkei=False)
+        assert cache.contains(new, with_senkei=False)
+
+    def test_evicts_least_recently_used_over_size_limit(self, tmp_path: Path) -> None:
+        """合計サイズが max_bytes を超えたら、最後に使われたのが古いエントリから削除すること。"""
+        cache = ConversionCache(tmp_path / "cache", max_bytes=250)
+        first = _save_entry(cache, tmp_path, 220.0, size=100, age_s=300.0)
+        second = _save_entry(cache, tmp_path, 230.0, size=100, age_s=200.0)
+        # 取り出すと最終使用時刻が更新され、削除の対象から外れる
+        assert cache.restore(first, None, tmp_path / "restored.ifc") is True
+        third = _save_entry(cache, tmp_path, 240.0, size=100, age_s=0.0)
+
+        assert cache.contains(first, with_senkei=False)
+        assert not cache.contains(second, with_senkei=False)
+        assert cache.contains(third, with_senkei=False)
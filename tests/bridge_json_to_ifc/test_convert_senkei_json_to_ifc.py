@@ -0,0 +1,174 @@
+"""bridge_json_to_ifc.convert_senkei_json_to_ifc のテスト。"""
+
+from __future__ import annotations
+
+import json
+import pstats
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import ifcopenshell
+from src.bridge_agentic_generate.designer.models import (
+    BridgeDesign,
+    Components,
+    CrossbeamSection,
+    Deck,
+    Dimensions,
+    GirderSection,
+    Sections,
+)
+from src.bridge_json_to_ifc.convert_senkei_json_to_ifc import build_ifc_from_spec, convert_senkei_to_ifc
+from src.bridge_json_to_ifc.convert_simple_to_senkei_json import convert_simple_to_senkei
+from src.bridge_json_to_ifc.ifc_utils_new.core import DefContext
+from src.bridge_json_to_ifc.run_convert import save_senkei_json, senkei_spec_dict
+
+
+def _design(num_girders: int) -> BridgeDesign:
+    """主桁本数だけを変えた設計。"""
+    return BridgeDesign(
+        dimensions=Dimensions(
+            bridge_length=20000.0,
+            total_width=8000.0,
+            num_girders=num_girders,
+            girder_spacing=8000.0 / num_girders,
+            panel_length=5000.0,
+            num_panels=4,
+        ),
+        sections=Sections(
+            girder_standard=GirderSection(
+                web_height=1600.0,
+                web_thickness=20.0,
+                top_flange_width=500.0,
+                top_flange_thickness=40.0,
+                bottom_flange_width=600.0,
+                bottom_flange_thickness=50.0,
+            ),
+            crossbeam_standard=CrossbeamSection(
+                total_height=1280.0,
+                web_thickness=12.0,
+                flange_width=350.0,
+                flange_thickness=16.0,
+            ),
+        ),
+        components=Components(deck=Deck(thickness=220.0)),
+    )
+
+
+def _senkei_json(directory: Path, num_girders: int) -> Path:
+    """Senkei JSON を directory に書き出してパスを返す。"""
+    path = directory / "bridge_senkei.json"
+    save_senkei_json(convert_simple_to_senkei(_design(num_girders)), path)
+    return path
+
+
+def _beam_names(ifc_path: Path) -> list[str]:
+    return sorted(beam.Name for beam in ifcopenshell.open(str(ifc_path)).by_type("IfcBeam"))
+
+
+def _damage_psets(ifc_path: Path) -> int:
+    ifc = ifcopenshell.open(str(ifc_path))
+    return sum(1 for pset in ifc.by_type("IfcPropertySet") if pset.Name == "Pset_DamageInformation")
+
+
+def _damage_info(element_name: str) -> dict:
+    """damage_info.json と同じ構造の損傷情報（1要素）。"""
+    return {
+        "DamageInformation": [
+            {"ElementName": element_name, "DamageItems": [{"DamageType": "腐食", "DamageLevel": "C"}]}
+        ]
+    }
+
+
+class TestConvertSenkeiToIfc:
+    """convert_senkei_to_ifc のテスト。"""
+
+    def test_concurrent_conversions_do_not_share_state(self, tmp_path: Path) -> None:
+        """別スレッドで同時に変換しても、要素数・要素名が逐次変換と一致すること。"""
+        inputs = {n: _senkei_json(tmp_path / f"g{n}", n) for n in (3, 4, 5)}
+        serial = {n: convert_senkei_to_ifc(path, path.with_suffix(".serial.ifc")) for n, path in inputs.items()}
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = {
+                n: executor.submit(convert_senkei_to_ifc, path, path.with_suffix(".ifc")) for n, path in inputs.items()
+            }
+            concurrent = {n: future.result() for n, future in futures.items()}
+
+        assert concurrent == serial
+        assert len(set(serial.values())) == 3
+        for path in inputs.values():
+            assert _beam_names(path.with_suffix(".ifc")) == _beam_names(path.with_suffix(".serial.ifc"))
+        assert DefContext.current_context() is None
+
+    def test_damage_info_is_per_run(self, tmp_path: Path) -> None:
+        """損傷情報は damage_info.json のある入力の変換にだけ適用されること。"""
+        damaged = _senkei_json(tmp_path / "damaged", 4)
+        clean = _senkei_json(tmp_path / "clean", 4)
+        convert_senkei_to_ifc(clean, clean.with_suffix(".ifc"))
+        element_name = _beam_names(clean.with_suffix(".ifc"))[0]
+        (damaged.parent / "damage_info.json").write_text(json.dumps(_damage_info(element_name)), encoding="utf-8")
+
+        convert_senkei_to_ifc(damaged, damaged.with_suffix(".ifc"))
+        convert_senkei_to_ifc(clean, clean.with_suffix(".again.ifc"))
+
+        assert _damage_psets(damaged.with_suffix(".ifc")) == 1
+        assert _damage_psets(clean.with_suffix(".again.ifc")) == 0
+
+    def test_profile_report(self, tmp_path: Path) -> None:
+        """profile_stats=True ではフェーズごとの計測レポートと cProfile 統計を IFC と同じ場所に出力すること。"""
+        senkei_path = _senkei_json(tmp_path, 3)
+        convert_senkei_to_ifc(senkei_path, tmp_path / "plain.ifc")
+        element_count = convert_senkei_to_ifc(senkei_path, tmp_path / "bridge.ifc", profile_stats=True)
+
+        report = json.loads((tmp_path / "bridge.profile.json").read_text(encoding="utf-8"))
+        phases = report["phases"]
+        assert [phase["name"] for phase in phases] == [
+            "_setup_coordinate_system",
+            "_process_calculate_lines",
+            "_generate_main_panels",
+            "_generate_sub_panels",
+            "_generate_taikeikou",
+            "_generate_yokokou",
+            "_generate_yokogeta",
+            "_generate_shouban_and_guardrail",
+            "_generate_bearing",
+            "_save_ifc_file",
+        ]
+        assert report["element_count"] == element_count == sum(phase["elements_created"] for phase in phases)
+        assert report["entity_count"] == len(list(ifcopenshell.open(str(tmp_path / "bridge.ifc"))))
+        assert phases[2]["entities_created"] > 0
+        assert report["total_seconds"] == sum(phase["seconds"] for phase in phases)
+        for phase in phases:
+            assert pstats.Stats(phase["cprofile_stats"]).total_calls > 0
+        assert not list(tmp_path.glob("plain*.json"))
+
+
+class TestBuildIfcFromSpec:
+    """build_ifc_from_spec のテスト。"""
+
+    def test_matches_file_based_conversion(self, tmp_path: Path) -> None:
+        """メモリ上の SenkeiSpec から、JSON ファイル経由と同じ要素の IFC を生成し、入力を変更しないこと。"""
+        senkei_path = _senkei_json(tmp_path, 4)
+        spec = senkei_spec_dict(convert_simple_to_senkei(_design(4)))
+        original = json.loads(json.dumps(spec))
+
+        from_file = convert_senkei_to_ifc(senkei_path, tmp_path / "from_file.ifc")
+        in_memory = build_ifc_from_spec(spec, tmp_path / "out" / "in_memory.ifc")
+
+        assert in_memory == from_file
+        assert _beam_names(tmp_path / "out" / "in_memory.ifc") == _beam_names(tmp_path / "from_file.ifc")
+        assert spec == original
+        assert spec == json.loads(senkei_path.read_text(encoding="utf-8"))
+        assert not list((tmp_path / "out").glob("*.json"))
+
+    def test_applies_damage_info(self, tmp_path: Path) -> None:
+        """damage_info 引数の損傷情報が適用されること（出力先の damage_info.json は参照しない）。"""
+        spec = senkei_spec_dict(convert_simple_to_senkei(_design(3)))
+        build_ifc_from_spec(spec, tmp_path / "clean.ifc")
+        element_name = _beam_names(tmp_path / "clean.ifc")[0]
+        (tmp_path / "damage_info.json").write_text(json.dumps(_damage_info(element_name)), encoding="utf-8")
+
+        build_ifc_from_spec(spec, tmp_path / "ignored.ifc")
+        build_ifc_from_spec(spec, tmp_path / "damaged.ifc", damage_info=_damage_info(element_name))
+
+        assert _damage_psets(tmp_path / "ignored.ifc") == 0
+        assert _damage_psets(tmp_path / "damaged.ifc") == 1
@@ -0,0 +1,52 @@
+"""bridge_json_to_ifc.ifc_utils_new.utils.DefBridgeUtils のテスト。"""
+
+from __future__ import annotations
+
+from src.bridge_json_to_ifc.ifc_utils_new.core import DefContext
+from src.bridge_json_to_ifc.ifc_utils_new.utils import DefBridgeUtils
+
+
+def _line(name: str, points: list[tuple[str, float, float, float]]) -> dict:
+    return {"Name": name, "Point": [{"Name": p, "X": x, "Y": y, "Z": z} for p, x, y, z in points]}
+
+
+def _senkei() -> list[dict]:
+    return [
+        _line("TG1", [("S1", 0.0, 0.0, 10.0), ("S2", 5000.0, 0.0, 10.5), ("S3", 10000.0, 0.0, 11.0)]),
+        _line("BG1", [("S1", 0.0, 0.0, -1590.0), ("S2", 5000.0, 0.0, -1589.5), ("S3", 10000.0, 0.0, -1589.0)]),
+        _line("TG1", [("S1", 1.0, 1.0, 1.0)]),
+    ]
+
+
+class TestLoadCoordinate:
+    """Load_Coordinate_* の線形データの索引を使った参照のテスト。"""
+
+    def test_lookups(self) -> None:
+        """線形名・断面点名の順に座標を返し、見つからない線形・断面点は除くこと（同名の線形は先頭を使う）。"""
+        senkei = _senkei()
+
+        assert DefBridgeUtils.Load_Coordinate_Panel(senkei, ["BG1", "XX", "TG1"], ["S3", "S4", "S1"]) == [
+            [[10000.0, 0.0, -1589.0], [0.0, 0.0, -1590.0]],
+            [[10000.0, 0.0, 11.0], [0.0, 0.0, 10.0]],
+        ]
+        assert DefBridgeUtils.Load_Coordinate_Point(senkei, "TG1", "S2") == [5000.0, 0.0, 10.5]
+        assert DefBridgeUtils.Load_Coordinate_Point(senkei, "BG1", "S4") is None
+        assert DefBridgeUtils.Load_Coordinate_Point(senkei, "XX", "S1") is None
+        assert DefBridgeUtils.Load_Coordinate_PolLine(senkei, "TG1")[1:] == [[5000.0, 0.0, 10.5], [10000.0, 0.0, 11.0]]
+        assert DefBridgeUtils.Load_Coordinate_PolLine(senkei, "XX") == []
+
+    def test_index_is_built_once_per_context(self) -> None:
+        """実行中コンテキストでは索引を再利用し、Calculate_Line で追加された線形を取り込むこと。"""
+        senkei = _senkei()
+        ctx = DefContext.BridgeContext(None, None, None, {}, "")
+        with DefContext.activate(ctx):
+            DefBridgeUtils.Load_Coordinate_Point(senkei, "TG1", "S1")
+            index = ctx.senkei_index
+            DefBridgeUtils.Calculate_Line("MID1", [{"Type": "MID", "BaseLine1": "TG1", "BaseLine2": "BG1"}], senkei)
+            point = DefBridgeUtils.Load_Coordinate_Point(senkei, "MID1", "P2")
+            coords = DefBridgeUtils.Load_Coordinate_PolLine(senkei, "TG1")
+
+        assert ctx.senkei_index is index
+        assert point == [5000.0, 0.0, (10.5 - 1589.5) / 2]
+        coords[0][0] = -1.0
+        assert DefBridgeUtils.Load_Coordinate_PolLine(senkei, "TG1")[0] == [0.0, 0.0, 10.0]
@@ -0,0 +1,189 @@
+"""bridge_json_to_ifc.ifc_utils_new.core.DefIFC のテスト。"""
+
+from __future__ import annotations
+
+import copy
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import ifcopenshell
+import ifcopenshell.geom
+import numpy as np
+from src.bridge_agentic_generate.designer.models import (
+    BridgeDesign,
+    Components,
+    CrossbeamSection,
+    Deck,
+    Dimensions,
+    GirderSection,
+    Sections,
+)
+from src.bridge_json_to_ifc.convert_simple_to_senkei_json import convert_simple_to_senkei
+from src.bridge_json_to_ifc.ifc_utils_new.core import DefBridge, DefContext, DefIFC
+from src.bridge_json_to_ifc.run_convert import senkei_spec_dict
+
+
+def _context(ifc_file: ifcopenshell.file, **kwargs) -> DefContext.BridgeContext:
+    return DefContext.BridgeContext(ifc_file, None, None, {}, "", **kwargs)
+
+
+def _spec() -> dict:
+    design = BridgeDesign(
+        dimensions=Dimensions(
+            bridge_length=20000.0,
+            total_width=8000.0,
+            num_girders=3,
+            girder_spacing=2600.0,
+            panel_length=5000.0,
+            num_panels=4,
+        ),
+        sections=Sections(
+            girder_standard=GirderSection(
+                web_height=1600.0,
+                web_thickness=20.0,
+                top_flange_width=500.0,
+                top_flange_thickness=40.0,
+                bottom_flange_width=600.0,
+                bottom_flange_thickness=50.0,
+            ),
+            crossbeam_standard=CrossbeamSection(
+                total_height=1280.0,
+                web_thickness=12.0,
+                flange_width=350.0,
+                flange_thickness=16.0,
+            ),
+        ),
+        components=Components(deck=Deck(thickness=220.0)),
+    )
+    return senkei_spec_dict(convert_simple_to_senkei(design))
+
+
+def _world_vertices(ifc_file: ifcopenshell.file, beam_name: str) -> np.ndarray:
+    """部材の三角形分割後の頂点（グローバル座標）。"""
+    settings = ifcopenshell.geom.settings()
+    settings.set("use-world-coords", True)
+    beam = next(beam for beam in ifc_file.by_type("IfcBeam") if beam.Name == beam_name)
+    return np.array(ifcopenshell.geom.create_shape(settings, beam).geometry.verts).reshape(-1, 3)
+
+
+def _beam_points(ifc_path: Path) -> dict[str, set[tuple[float, ...]]]:
+    """部材名 → 形状に含まれる点座標の集合。"""
+    ifc = ifcopenshell.open(str(ifc_path))
+    points: dict[str, set[tuple[float, ...]]] = {}
+    for beam in ifc.by_type("IfcBeam"):
+        points.setdefault(beam.Name, set()).update(
+            tuple(e.Coordinates) for e in ifc.traverse(beam.Representation) if e.is_a("IfcCartesianPoint")
+        )
+    return points
+
+
+class TestEntityInterning:
+    """IfcCartesianPoint / IfcDirection の共有のテスト。"""
+
+    def test_shares_entities_with_same_rounded_coordinates(self) -> None:
+        """丸めた座標が同じ点・方向は同じエンティティを返し、点と方向は別に管理すること。"""
+        ifc_file = ifcopenshell.file(schema="IFC4X3")
+        with DefContext.activate(_context(ifc_file, coordinate_precision=3)):
+            point = DefIFC.create_cartesian_point(ifc_file, [1.0, 2.0, 3.0])
+            assert DefIFC.create_cartesian_point(ifc_file, ("1.0001", 2, 3.0)) is point
+            assert DefIFC.create_cartesian_point(ifc_file, [1.0, 2.0, 3.01]) is not point
+            assert DefIFC.create_cartesian_point(ifc_file, [-0.0, 0.0]) is DefIFC.create_cartesian_point(
+                ifc_file, [0.0, 0.0]
+            )
+            direction = DefIFC.create_direction(ifc_file, [0.0, 0.0, 1.0])
+            assert DefIFC.create_direction(ifc_file, [0.0, -0.0, 1.0]) is direction
+            assert DefIFC.create_direction(ifc_file, [1.0, 2.0, 3.0]) is not point
+
+        assert len(ifc_file.by_type("IfcCartesianPoint")) == 3
+        assert len(ifc_file.by_type("IfcDirection")) == 2
+
+    def test_creates_new_entities_without_context(self) -> None:
+        """実行中コンテキストがない場合・別のIFCファイル・共有無効の場合は毎回作成すること。"""
+        ifc_file = ifcopenshell.file(schema="IFC4X3")
+        other_file = ifcopenshell.file(schema="IFC4X3")
+        assert DefIFC.create_cartesian_point(ifc_file, [1, 2, 3]) != DefIFC.create_cartesian_point(ifc_file, [1, 2, 3])
+        with DefContext.activate(_context(other_file)):
+            DefIFC.create_direction(ifc_file, [0, 0, 1])
+            DefIFC.create_direction(ifc_file, [0, 0, 1])
+        with DefContext.activate(_context(ifc_file, intern_entities=False)):
+            DefIFC.create_direction(ifc_file, [0, 0, 1])
+
+        assert len(ifc_file.by_type("IfcCartesianPoint")) == 2
+        assert len(ifc_file.by_type("IfcDirection")) == 3
+        assert not other_file.by_type("IfcDirection")
+
+    def test_build_bridge_geometry_is_unchanged(self, tmp_path: Path) -> None:
+        """共有の有無で各部材の点座標は変わらず、点の数だけが減ること。"""
+        spec = _spec()
+        DefBridge.BuildBridge(copy.deepcopy(spec), f"{tmp_path}/", str(tmp_path / "interned.ifc"))
+        DefBridge.BuildBridge(copy.deepcopy(spec), f"{tmp_path}/", str(tmp_path / "plain.ifc"), intern_entities=False)
+
+        assert _beam_points(tmp_path / "interned.ifc") == _beam_points(tmp_path / "plain.ifc")
+        interned = ifcopenshell.open(str(tmp_path / "interned.ifc"))
+        plain = ifcopenshell.open(str(tmp_path / "plain.ifc"))
+        assert len(interned.by_type("IfcCartesianPoint")) < len(plain.by_type("IfcCartesianPoint")) / 2
+        assert (tmp_path / "interned.ifc").stat().st_size < (tmp_path / "plain.ifc").stat().st_size
+
+
+class TestDebugLogging:
+    """デバッグモードでない場合にログのメッセージを作成しないことのテスト。"""
+
+    def test_log_enabled_only_in_debug_mode(self) -> None:
+        """ログ出力はデバッグモードでログ出力関数がある場合のみ有効になること。"""
+        log_func = MagicMock()
+        assert not DefContext.log_enabled()
+        with DefContext.activate(_context(None, log_print_func=log_func)):
+            assert not DefContext.log_enabled()
+        with DefContext.activate(_context(None, debug_mode=True, log_print_func=log_func)):
+            assert DefContext.log_enabled()
+            DefContext.log_print("message")
+
+        log_func.assert_called_once_with("message")
+
+    def test_skips_messages_when_disabled(self) -> None:
+        """デバッグモードでない場合は部材の追加でログ出力関数を呼ばないこと。"""
+        ifc_file, bridge_span, geom_context = DefIFC.SetupIFC()
+        points = [[[0.0, 0.0, 0.0], [0.0, 100.0, 0.0]], [[1000.0, 0.0, 0.0], [1000.0, 100.0, 0.0]]]
+        top = [[[x, y, 10.0] for x, y, _ in line] for line in points]
+
+        for debug_mode in (False, True):
+            with (
+                DefContext.activate(_context(ifc_file, debug_mode=debug_mode, log_print_func=MagicMock())),
+                patch.object(DefIFC, "_log_print") as mock_log,
+            ):
+                solid = DefIFC.Create_brep_from_box_points(ifc_file, points, top)
+                representation = ifc_file.createIfcShapeRepresentation(geom_context, "Body", "Brep", [solid])
+                DefIFC.Add_shape_representation_in_Beam(ifc_file, bridge_span, representation, f"beam_{debug_mode}")
+            assert mock_log.called is debug_mode
+
+
+class TestMappedBolt:
+    """Draw_Mapped_Bolt のテスト。"""
+
+    def test_matches_solid_bolt_and_shares_map_per_type(self) -> None:
+        """Draw_Solid_Bolt と同じ形状になり、ボルト種類ごとに IfcRepresentationMap を1つだけ作成すること。"""
+        ifc_file, bridge_span, geom_context = DefIFC.SetupIFC()
+        pal1 = np.array([1200.0, -350.0, 80.0])
+        axis = np.array([0.3, -0.4, 0.866])
+        pal2 = pal1 + 100 * axis / np.linalg.norm(axis)
+        pal3 = pal1 + np.array([100.0, 20.0, 0.0])
+        bolts = [((0.0, 0.0), 25.0, 30.0), ((75.0, -40.0), 25.0, 30.0), ((150.0, 60.0), 21.0, 28.0)]
+
+        with DefContext.activate(DefContext.BridgeContext(ifc_file, bridge_span, geom_context, {}, "")):
+            for i, (pcen, gap_head, gap_nut) in enumerate(bolts):
+                solid = DefIFC.Draw_Solid_Bolt(ifc_file, pcen, 26.5, gap_head, gap_nut, pal1, pal2, pal3)
+                representation = ifc_file.createIfcShapeRepresentation(geom_context, "Body", "Brep", [solid])
+                DefIFC.Add_shape_representation_in_Beam(ifc_file, bridge_span, representation, f"solid{i}")
+                mapped = DefIFC.Draw_Mapped_Bolt(
+                    ifc_file, geom_context, pcen, 26.5, gap_head, gap_nut, pal1, pal2, pal3
+                )
+                DefIFC.Add_shape_representation_in_Beam(ifc_file, bridge_span, mapped, f"mapped{i}")
+
+        assert len(ifc_file.by_type("IfcRepresentationMap")) == 2
+        assert len(ifc_file.by_type("IfcMappedItem")) == 3
+        for i in range(len(bolts)):
+            solid_vertices = _world_vertices(ifc_file, f"solid{i}")
+            mapped_vertices = _world_vertices(ifc_file, f"mapped{i}")
+            distances = np.linalg.norm(solid_vertices[:, None, :] - mapped_vertices[None, :, :], axis=2)
+            assert distances.min(axis=1).max() < 1e-3
+            assert distances.min(axis=0).max() < 1e-3
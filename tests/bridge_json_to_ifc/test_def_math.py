@@ -0,0 +1,103 @@
+"""bridge_json_to_ifc.ifc_utils_new.core.DefMath の一括計算のテスト。"""
+
+from __future__ import annotations
+
+import numpy as np
+from src.bridge_json_to_ifc.ifc_utils_new.components import DefBracing, DefStiffener
+from src.bridge_json_to_ifc.ifc_utils_new.core import DefMath
+
+
+def _or_nan(point: np.ndarray | None, dim: int) -> np.ndarray:
+    return np.full(dim, np.nan) if point is None else np.asarray(point, dtype=float)
+
+
+class TestBatchKernels:
+    """*_batch が単一の点を扱う関数と同じ結果を返すことのテスト。"""
+
+    def test_matches_single_point_functions(self) -> None:
+        """各行の結果が単一の点の関数と一致し、退化した行は同じ扱い（None は NaN）になること。"""
+        rng = np.random.default_rng(0)
+        p1, p2, p3, p4, p5 = rng.normal(0.0, 1000.0, (5, 50, 3))
+        p2[:5] = p1[:5]  # 同じ点（長さ0の直線・退化した平面）
+        p4[5:10, :2] = p3[5:10, :2] + (p2[5:10, :2] - p1[5:10, :2])  # 平行な2D直線
+        distance = rng.normal(0.0, 300.0, 50)
+
+        np.testing.assert_allclose(
+            DefMath.Point_on_line_batch(p1, p2, distance),
+            [DefMath.Point_on_line(*args) for args in zip(p1, p2, distance)],
+        )
+        np.testing.assert_allclose(
+            DefMath.Point_on_parallel_line_batch(p3, p1, p2, distance),
+            [DefMath.Point_on_parallel_line(*args) for args in zip(p3, p1, p2, distance)],
+        )
+        np.testing.assert_allclose(
+            DefMath.Normal_vector_batch(p1, p2, p3), [DefMath.Normal_vector(*args) for args in zip(p1, p2, p3)]
+        )
+        np.testing.assert_allclose(
+            DefMath.Offset_point_batch(p1, p2, p3, distance),
+            [DefMath.Offset_point(*args) for args in zip(p1, p2, p3, distance)],
+        )
+        np.testing.assert_allclose(
+            np.hstack(DefMath.Offset_Line_batch(p1, p2, distance)),
+            [np.hstack(DefMath.Offset_Line(*args)) for args in zip(p1, p2, distance)],
+        )
+        for as_segments in (False, True):
+            np.testing.assert_allclose(
+                DefMath.Intersec_line_line_batch(p1, p2, p3, p4, as_segments=as_segments),
+                [
+                    _or_nan(DefMath.Intersec_line_line(*args, as_segments=as_segments), 2)
+                    for args in zip(p1, p2, p3, p4)
+                ],
+            )
+        np.testing.assert_allclose(
+            DefMath.Intersection_line_plane_batch(p1, p2, p3, p4, p5),
+            [_or_nan(DefMath.Intersection_line_plane(*args), 3) for args in zip(p1, p2, p3, p4, p5)],
+            atol=1e-6,
+        )
+
+    def test_broadcasts_single_points(self) -> None:
+        """点 (3,) は各行にブロードキャストし、2D の点は Z=0 として扱うこと。"""
+        points = DefMath.Point_on_line_batch([0, 0], [10, 0, 0], [1.0, 2.5, 4.0])
+
+        np.testing.assert_allclose(points, [[1.0, 0.0, 0.0], [2.5, 0.0, 0.0], [4.0, 0.0, 0.0]])
+        grid = DefMath.Intersec_line_line_grid([[0, 0], [5, 0]], [[0, 1], [5, 1]], [[0, 2], [0, 3]], [[1, 2], [1, 3]])
+        np.testing.assert_allclose(grid, [[[0, 2], [0, 3]], [[5, 2], [5, 3]]])
+
+    def test_offset_face_matches_plane_offset(self) -> None:
+        """平らな面は全点が法線方向に移動し、折れた面の中間点は前後のオフセット面の交線上にあること。"""
+        top = [[0.0, 0.0, 0.0], [5000.0, 0.0, 0.0], [10000.0, 0.0, 0.0]]
+        bottom = [[0.0, 0.0, -1500.0], [5000.0, 0.0, -1500.0], [10000.0, 0.0, -1500.0]]
+        top_off, bottom_off = DefMath.Offset_Face_2Line(top, bottom, 12.0)
+
+        normal = DefMath.Normal_vector(top[0], bottom[0], top[1])
+        np.testing.assert_allclose(top_off, np.array(top) + 12.0 * normal)
+        np.testing.assert_allclose(bottom_off, np.array(bottom) + 12.0 * normal)
+
+        bent_top = [[0.0, 0.0, 0.0], [5000.0, 500.0, 0.0], [10000.0, 0.0, 0.0]]
+        bent_bottom = [[0.0, 0.0, -1500.0], [5000.0, 500.0, -1500.0], [10000.0, 0.0, -1500.0]]
+        bent_top_off, _ = DefMath.Offset_Face_2Line(bent_top, bent_bottom, 12.0)
+        for p_prev, p_next in ((bent_top[0], bent_top[1]), (bent_top[2], bent_top[1])):
+            normal = DefMath.Normal_vector(p_prev, p_next, [p_prev[0], p_prev[1], -1500.0])
+            distance = abs(np.dot(np.asarray(bent_top_off[1]) - p_prev, normal))
+            np.testing.assert_allclose(distance, 12.0)
+
+
+class TestHoleCoordinates:
+    """ボルト孔の中心の計算のテスト。"""
+
+    def test_taikeikou_hole_grid(self) -> None:
+        """縦線ごとに横線との交点を返すこと。"""
+        holes = DefBracing.Caculate_Coord_Hole_Taikeikou((24.5, "75/75", "100/60"), [0.0, 0.0, 0.0], "TL")
+
+        np.testing.assert_allclose(holes, [[[-100, -75], [-100, -150]], [[-160, -75], [-160, -150]]])
+
+    def test_spl_hole_centers(self) -> None:
+        """SPLの孔中心を列（PL）ごとに行（PJ）の順に返すこと。"""
+        infor = {"Thick": 9, "Mat": "SM400", "Side": "A", "Ang": "90/90", "GLine": "P"}
+        result = (infor, [75, 75], [40, 80], [40, 80], [40, 40, 40, 40], [24.5, 24.5], ["A", "HY"])
+
+        left, right = DefStiffener.Calculate_Coord_Hole_SPL([0.0, 0.0], result, 150)
+
+        rows = [0, -75, -150]
+        np.testing.assert_allclose(left, [[x, y] for x in (-40, -120) for y in rows], atol=1e-9)
+        np.testing.assert_allclose(right, [[x, y] for x in (40, 120) for y in rows], atol=1e-9)
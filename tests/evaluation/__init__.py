@@ -0,0 +1 @@
+"""Evaluation tests package."""
@@ -0,0 +1,49 @@
+"""evaluation.main のテスト。"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from src.evaluation.main import _save_summary
+from src.evaluation.models import TrialResult
+from src.evaluation.store import ResultsStore
+
+
+def _trial(case_id: str, use_rag: bool, first_pass: bool) -> TrialResult:
+    """TrialResult を作成する。"""
+    return TrialResult(
+        case_id=case_id,
+        bridge_length_m=30.0,
+        total_width_m=10.0,
+        use_rag=use_rag,
+        trial=1,
+        converged=True,
+        num_iterations=0 if first_pass else 2,
+        first_pass=first_pass,
+        first_max_util=0.9 if first_pass else 1.2,
+        first_utilization={},
+        final_pass=True,
+        final_max_util=0.9,
+        per_check_first_pass={},
+    )
+
+
+class TestSaveSummary:
+    """_save_summary のテスト。"""
+
+    def test_aggregates_only_current_run(self, tmp_path: Path) -> None:
+        """同じ出力ディレクトリに残った以前の実行の試行を集計に含めないこと。"""
+        store = ResultsStore(tmp_path / "results.sqlite")
+        store.append_trial(_trial("L99_B10_rag_true_trial_1", True, False))
+        current = [_trial("L20_B8_rag_true_trial_1", True, True), _trial("L20_B8_rag_false_trial_1", False, True)]
+        for trial in current:
+            store.append_trial(trial)
+
+        metrics = _save_summary(store, tmp_path, [trial.case_id for trial in current])
+
+        summary = json.loads((tmp_path / "summary.json").read_text(encoding="utf-8"))
+        assert metrics.first_pass_rate == 1.0
+        assert summary["total_trials"] == 2
+        assert summary["rag_true"]["total_trials"] == summary["rag_false"]["total_trials"] == 1
+        assert summary["rag_true"]["metrics"]["first_pass_rate"] == 1.0
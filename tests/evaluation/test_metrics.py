@@ -0,0 +1,145 @@
+"""evaluation.metrics のテスト。"""
+
+from __future__ import annotations
+
+import pytest
+from src.bridge_agentic_generate.stage_timer import StageStats
+from src.evaluation.metrics import CHECK_KEYS, IncrementalMetrics, aggregate_metrics
+from src.evaluation.models import TrialResult
+
+
+def _results() -> list[TrialResult]:
+    """合否・収束の組み合わせが異なる試行結果。"""
+    results = []
+    for i in range(7):
+        use_rag = i % 2 == 0
+        converged = i != 3
+        results.append(
+            TrialResult(
+                case_id=f"L{20 + i}_B10_rag_{str(use_rag).lower()}_trial_1",
+                bridge_length_m=20 + i,
+                total_width_m=10,
+                use_rag=use_rag,
+                trial=1,
+                converged=converged,
+                num_iterations=i % 3,
+                first_pass=i % 3 == 0,
+                first_max_util=1.0,
+                first_utilization={},
+                final_pass=converged,
+                final_max_util=0.9,
+                per_check_first_pass={key: (i + j) % 2 == 0 for j, key in enumerate(CHECK_KEYS)},
+            )
+        )
+    return results
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestIncrementalMetrics:
+    """IncrementalMetrics のテスト。"""
+
+    @pytest.mark.parametrize("use_rag", [None, True, False])
+    def test_matches_aggregate_metrics(self, use_rag: bool | None) -> None:
+        """逐次集計の結果が aggregate_metrics の全件集計と一致すること。"""
+        results = _results()
+        incremental = IncrementalMetrics(total_trials=len(results))
+        for result in results:
+            incremental.add(result)
+
+        expected = aggregate_metrics([r for r in results if use_rag is None or r.use_rag == use_rag])
+        actual = incremental.metrics(use_rag=use_rag)
+
+        rates = {"first_pass_rate", "convergence_rate", "avg_iterations", "final_pass_rate"}
+        assert actual.model_dump(include=rates) == pytest.approx(expected.model_dump(include=rates))
+        assert actual.per_check_first_pass_rate == pytest.approx(expected.per_check_first_pass_rate)
+
+    def test_throughput_and_eta(self) -> None:
+        """スループットと ETA が経過時間から計算されること。"""
+        clock = _FakeClock()
+        incremental = IncrementalMetrics(total_trials=10, clock=clock)
+        assert incremental.eta_s() is None
+        assert "ETA --" in incremental.progress_line()
+
+        clock.now = 120.0
+        for result in _results()[:4]:
+            incremental.add(result)
+
+        assert incremental.trials_per_minute() == pytest.approx(2.0)
+        assert incremental.eta_s() == pytest.approx(180.0)
+        assert incremental.progress_line().startswith("4/10 (40%) skipped=0 first_pass=50.0%")
+        assert incremental.progress_line().endswith("| 2.00 trials/min | ETA 3m00s")
+
+        summary = incremental.summary()
+        assert summary["total_trials"] == 4
+        assert summary["rag_true"]["total_trials"] == 2
+        assert summary["progress"] == {
+            "completed": 4,
+            "planned": 10,
+            "skipped": 0,
+            "elapsed_s": 120.0,
+            "trials_per_minute": 2.0,
+            "eta_s": 180.0,
+        }
+
+    def test_skipped_trials_excluded_from_throughput(self) -> None:
+        """完了済みのためスキップした試行は指標に含め、スループットと ETA の計算からは除くこと。"""
+        clock = _FakeClock()
+        incremental = IncrementalMetrics(total_trials=10, clock=clock)
+        results = _results()
+        for result in results[:4]:
+            incremental.add(result, skipped=True)
+        assert incremental.trials_per_minute() == 0.0
+        assert incremental.eta_s() is None
+
+        clock.now = 60.0
+        for result in results[4:6]:
+            incremental.add(result)
+
+        assert incremental.num_completed == 6
+        assert incremental.num_skipped == 4
+        assert incremental.trials_per_minute() == pytest.approx(2.0)
+        assert incremental.eta_s() == pytest.approx(120.0)
+        assert incremental.progress_line().startswith("6/10 (60%) skipped=4 ")
+        assert incremental.summary()["progress"]["skipped"] == 4
+
+
+class TestTimingMetrics:
+    """所要時間・コスト集計のテスト。"""
+
+    def test_stage_percentiles_and_per_case_cost(self) -> None:
+        """ステージ別 p50/p95・ケース別の所要時間とトークン数が集計されること。"""
+        results = []
+        for i in range(1, 5):
+            result = _results()[0].model_copy(
+                update={
+                    "case_id": f"L{20 + (i % 2)}_B10_rag_true_trial_{i}",
+                    "trial": i,
+                    "wall_time_s": float(i),
+                    "stages": {
+                        "designer_llm": StageStats(seconds=float(i), calls=1, input_tokens=100, output_tokens=10),
+                    },
+                }
+            )
+            results.append(result)
+        results.append(_results()[1])  # 所要時間を計測していない古い試行
+
+        metrics = aggregate_metrics(results)
+
+        assert metrics.wall_time_p50_s == pytest.approx(2.5)
+        assert metrics.wall_time_p95_s == pytest.approx(3.85)
+        assert metrics.total_wall_time_s == pytest.approx(10.0)
+        designer = metrics.stages["designer_llm"]
+        assert (designer.p50_s, designer.total_s, designer.calls) == (pytest.approx(2.5), pytest.approx(10.0), 4)
+        assert (designer.input_tokens, designer.output_tokens) == (400, 40)
+        assert sorted(metrics.per_case) == ["L20_B10", "L21_B10"]
+        assert metrics.per_case["L21_B10"].num_trials == 2
+        assert metrics.per_case["L21_B10"].total_wall_time_s == pytest.approx(4.0)
+        assert metrics.per_case["L21_B10"].input_tokens == 200
+        assert metrics.per_case["L21_B10"].stage_seconds == {"designer_llm": pytest.approx(4.0)}
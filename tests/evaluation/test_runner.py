@@ -0,0 +1,359 @@
+"""evaluation.runner のテスト。"""
+
+from __future__ import annotations
+
+import json
+import random
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from src.bridge_agentic_generate.designer.models import (
+    BridgeDesign,
+    Components,
+    CrossbeamSection,
+    Deck,
+    DesignerContexts,
+    DesignerInput,
+    DesignerRagLog,
+    Dimensions,
+    GirderSection,
+    Sections,
+)
+from src.bridge_agentic_generate.designer.services import CachedDesignContextProvider
+from src.bridge_agentic_generate.judge.models import (
+    JudgeInput,
+    JudgeReport,
+    PatchPlan,
+    RepairIteration,
+    RepairLoopResult,
+)
+from src.bridge_agentic_generate.judge.services import judge_v1_lightweight
+from src.bridge_agentic_generate.stage_timer import Stage, add_tokens, stage
+from src.evaluation import runner as runner_module
+from src.evaluation.models import EvaluationCase, ExecutionMode, TrialResult
+from src.evaluation.runner import EvaluationRunner, _execute_unit_in_worker, _init_process_worker
+
+
+def _trial_result(case: EvaluationCase, use_rag: bool, trial: int) -> TrialResult:
+    """ダミーの TrialResult を作成する。"""
+    rag_str = "rag_true" if use_rag else "rag_false"
+    return TrialResult(
+        case_id=f"{case.case_id}_{rag_str}_trial_{trial}",
+        bridge_length_m=case.bridge_length_m,
+        total_width_m=case.total_width_m,
+        use_rag=use_rag,
+        trial=trial,
+        converged=True,
+        num_iterations=0,
+        first_pass=True,
+        first_max_util=0.9,
+        first_utilization={},
+        final_pass=True,
+        final_max_util=0.9,
+        per_check_first_pass={},
+    )
+
+
+def _loop_result() -> RepairLoopResult:
+    """初回合格の RepairLoopResult を作成する。"""
+    design = BridgeDesign(
+        dimensions=Dimensions(
+            bridge_length=20000.0,
+            total_width=8000.0,
+            num_girders=4,
+            girder_spacing=2000.0,
+            panel_length=5000.0,
+            num_panels=4,
+        ),
+        sections=Sections(
+            girder_standard=GirderSection(
+                web_height=2000.0,
+                web_thickness=20.0,
+                top_flange_width=500.0,
+                top_flange_thickness=40.0,
+                bottom_flange_width=600.0,
+                bottom_flange_thickness=50.0,
+            ),
+            crossbeam_standard=CrossbeamSection(
+                total_height=1600.0,
+                web_thickness=12.0,
+                flange_width=350.0,
+                flange_thickness=16.0,
+            ),
+        ),
+        components=Components(deck=Deck(thickness=220.0)),
+    )
+    utilization, diagnostics = judge_v1_lightweight(JudgeInput(bridge_design=design))
+    report = JudgeReport(
+        pass_fail=True,
+        utilization=utilization,
+        diagnostics=diagnostics,
+        patch_plan=PatchPlan(actions=[]),
+    )
+    return RepairLoopResult(
+        converged=True,
+        iterations=[RepairIteration(iteration=0, design=design, report=report)],
+        final_design=design,
+        final_report=report,
+        rag_log=DesignerRagLog(query="test", top_k=5, hits=[]),
+    )
+
+
+@pytest.fixture
+def cases() -> list[EvaluationCase]:
+    """3ケース。"""
+    return [
+        EvaluationCase(case_id="L20_B8", bridge_length_m=20, total_width_m=8),
+        EvaluationCase(case_id="L30_B10", bridge_length_m=30, total_width_m=10),
+        EvaluationCase(case_id="L40_B10", bridge_length_m=40, total_width_m=10),
+    ]
+
+
+class TestRunAll:
+    """EvaluationRunner.run_all のテスト。"""
+
+    def test_schedules_all_units_concurrently_in_deterministic_order(
+        self, cases: list[EvaluationCase], tmp_path: Path
+    ) -> None:
+        """ケース・RAG 条件をまたいで max_workers まで並列実行し、結果は決定的な順序で返すこと。"""
+        runner = EvaluationRunner(num_trials=2, max_workers=6, output_dir=tmp_path)
+        lock = threading.Lock()
+        active = 0
+        peak = 0
+
+        def _fake_trial(case: EvaluationCase, use_rag: bool, trial: int) -> TrialResult:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(random.uniform(0.02, 0.05))
+            with lock:
+                active -= 1
+            return _trial_result(case, use_rag, trial)
+
+        with patch.object(runner, "_execute_trial", side_effect=_fake_trial):
+            results = runner.run_all(cases)
+
+        assert [r.case_id for r in results] == [
+            f"{case.case_id}_{rag}_trial_{trial}"
+            for case in cases
+            for rag in ("rag_true", "rag_false")
+            for trial in (1, 2)
+        ]
+        # 1ケース×1条件の試行数（2）を超えて、ケース・条件をまたいで並列実行されること
+        assert runner.num_trials < peak <= 6
+
+    def test_writes_progress_summary(self, cases: list[EvaluationCase], tmp_path: Path) -> None:
+        """完了した試行から逐次集計した summary.json を書き出すこと。"""
+        runner = EvaluationRunner(output_dir=tmp_path, num_trials=2, summary_interval_s=0.0)
+        with patch.object(runner, "_execute_trial", side_effect=_trial_result):
+            results = runner.run_all(cases)
+
+        summary = json.loads((tmp_path / "summary.json").read_text(encoding="utf-8"))
+        assert summary["total_trials"] == len(results) == 12
+        assert summary["overall"]["first_pass_rate"] == pytest.approx(1.0)
+        assert summary["progress"]["completed"] == summary["progress"]["planned"] == 12
+
+    def test_propagates_trial_failure(self, cases: list[EvaluationCase], tmp_path: Path) -> None:
+        runner = EvaluationRunner(num_trials=1, max_workers=2, output_dir=tmp_path)
+        with (
+            patch.object(runner, "_execute_trial", side_effect=RuntimeError("boom")),
+            pytest.raises(RuntimeError),
+        ):
+            runner.run_all(cases)
+
+
+class TestStageTiming:
+    """試行ごとのステージ計測のテスト。"""
+
+    def test_records_wall_time_and_stages(self, cases: list[EvaluationCase], tmp_path: Path) -> None:
+        """修正ループ内のステージと成果物の保存時間が試行結果とストアに記録されること。"""
+
+        def _fake_loop(*args, **kwargs) -> RepairLoopResult:
+            with stage(Stage.DESIGNER_LLM):
+                add_tokens(1200, 300)
+                time.sleep(0.01)
+            return _loop_result()
+
+        runner = EvaluationRunner(output_dir=tmp_path)
+        with patch("src.evaluation.runner._run_repair_loop", side_effect=_fake_loop):
+            result = runner.run_single_trial(cases[0], use_rag=True, trial=1)
+
+        assert result.wall_time_s >= 0.01
+        assert list(result.stages) == ["designer_llm", "serialization"]
+        assert result.stages["designer_llm"].input_tokens == 1200
+        assert result.stages["designer_llm"].output_tokens == 300
+        assert runner.store.load_trial_results() == [result]
+
+
+class TestSkipCompleted:
+    """完了済み試行のスキップ（再開）のテスト。"""
+
+    def test_skips_completed_trial(self, cases: list[EvaluationCase], tmp_path: Path) -> None:
+        """成果物が揃った試行は再実行せず、保存済みの結果を返すこと。"""
+        runner = EvaluationRunner(output_dir=tmp_path)
+        with patch("src.evaluation.runner._run_repair_loop", return_value=_loop_result()) as mock_loop:
+            first = runner.run_single_trial(cases[0], use_rag=True, trial=1)
+            second = runner.run_single_trial(cases[0], use_rag=True, trial=1)
+
+        assert mock_loop.call_count == 1
+        assert second == first
+        assert runner.store.load_trial_results() == [first]
+        assert len(runner.store.query("SELECT * FROM iterations")) == 1
+
+    def test_counts_skipped_trials_in_progress(self, cases: list[EvaluationCase], tmp_path: Path) -> None:
+        """再開時に完了済みの試行を summary.json の進捗でスキップとして数えること。"""
+        runner = EvaluationRunner(output_dir=tmp_path, num_trials=1, summary_interval_s=0.0)
+        units = runner.build_units(cases[:1])
+        with patch("src.evaluation.runner._run_repair_loop", return_value=_loop_result()):
+            runner.run_units(units[:1])
+            results = runner.run_units(units)
+
+        progress = json.loads((tmp_path / "summary.json").read_text(encoding="utf-8"))["progress"]
+        assert len(results) == progress["completed"] == 2
+        assert progress["skipped"] == 1
+
+    def test_checks_completion_once_per_unit(self, cases: list[EvaluationCase], tmp_path: Path) -> None:
+        """run_units は試行単位ごとに完了済みかを1回だけ確認すること。"""
+        runner = EvaluationRunner(output_dir=tmp_path, num_trials=1)
+        units = runner.build_units(cases[:1])
+        with (
+            patch("src.evaluation.runner._run_repair_loop", return_value=_loop_result()),
+            patch.object(runner, "load_completed_trial", wraps=runner.load_completed_trial) as mock_load,
+        ):
+            runner.run_units(units)
+
+        assert mock_load.call_count == len(units)
+
+    def test_reruns_missing_or_corrupt_trial(self, cases: list[EvaluationCase], tmp_path: Path) -> None:
+        """成果物が欠けている・壊れている試行は再実行すること。"""
+        runner = EvaluationRunner(output_dir=tmp_path)
+        with patch("src.evaluation.runner._run_repair_loop", return_value=_loop_result()) as mock_loop:
+            result = runner.run_single_trial(cases[0], use_rag=True, trial=1)
+            (tmp_path / "design_logs" / result.case_id / f"{result.case_id}_iter0.json").unlink()
+            runner.run_single_trial(cases[0], use_rag=True, trial=1)
+            (tmp_path / "judges" / f"{result.case_id}.json").write_text("{", encoding="utf-8")
+            runner.run_single_trial(cases[0], use_rag=True, trial=1)
+
+        assert mock_loop.call_count == 3
+        timing = {"wall_time_s", "stages"}
+        assert runner.load_completed_trial(result.case_id).model_dump(exclude=timing) == result.model_dump(
+            exclude=timing
+        )
+
+    def test_force_reruns_completed_trial(self, cases: list[EvaluationCase], tmp_path: Path) -> None:
+        """force=True の場合は完了済みの試行も前回の出力・チェックポイントを破棄して再実行すること。"""
+        trial_id = "L20_B8_rag_false_trial_1"
+        with patch("src.evaluation.runner._run_repair_loop", return_value=_loop_result()) as mock_loop:
+            EvaluationRunner(output_dir=tmp_path).run_single_trial(cases[0], use_rag=False, trial=1)
+            checkpoint_dir = tmp_path / "checkpoints" / trial_id
+            checkpoint_dir.mkdir(parents=True, exist_ok=True)
+            stale_log = tmp_path / "design_logs" / trial_id / f"{trial_id}_iter3.json"
+            stale_log.write_text("{}", encoding="utf-8")
+            EvaluationRunner(output_dir=tmp_path, force=True).run_single_trial(cases[0], use_rag=False, trial=1)
+
+        assert mock_loop.call_count == 2
+        assert not checkpoint_dir.exists()
+        assert sorted(path.name for path in (tmp_path / "design_logs" / trial_id).iterdir()) == [
+            f"{trial_id}_iter0.json"
+        ]
+
+
+class TestProcessMode:
+    """execution_mode=process のテスト。"""
+
+    @pytest.mark.parametrize("start_method", ["forkserver", "spawn"])
+    def test_runs_units_in_worker_processes(
+        self, cases: list[EvaluationCase], tmp_path: Path, start_method: str
+    ) -> None:
+        """プロセスプールで実行し、結果を units の順で返すこと（forkserver がない環境では spawn で起動）。
+
+        ワーカーでは LLM をモックできないため、全試行を事前に完了させ、親プロセスでの読み込みを確かめる。
+        """
+        thread_runner = EvaluationRunner(output_dir=tmp_path, num_trials=2)
+        units = thread_runner.build_units(cases[:2])
+        with patch("src.evaluation.runner._run_repair_loop", return_value=_loop_result()):
+            expected = thread_runner.run_units(units)
+
+        runner = EvaluationRunner(
+            output_dir=tmp_path,
+            num_trials=2,
+            max_workers=2,
+            execution_mode=ExecutionMode.PROCESS,
+        )
+        with (
+            patch("src.evaluation.runner._run_repair_loop", side_effect=AssertionError("rerun")),
+            patch("multiprocessing.get_all_start_methods", return_value=[start_method]),
+        ):
+            results = runner.run_units(units)
+
+        assert results == expected
+
+    def test_searches_rag_once_per_case_in_parent(self, cases: list[EvaluationCase], tmp_path: Path) -> None:
+        """RAG 検索は親プロセスでケースごとに1回だけ行い、そのコンテキストを RAG ありの試行に渡すこと。"""
+        searched: list[tuple[float, float]] = []
+
+        def _search(inputs: DesignerInput, top_k: int) -> DesignerContexts:
+            searched.append((inputs.bridge_length_m, inputs.total_width_m))
+            return DesignerContexts(
+                dimensions=f"L={inputs.bridge_length_m}",
+                rag_log=DesignerRagLog(query="q", top_k=top_k, hits=[]),
+            )
+
+        runner = EvaluationRunner(output_dir=tmp_path, num_trials=2, execution_mode=ExecutionMode.PROCESS)
+        runner.context_provider = CachedDesignContextProvider(provider=_search)
+        executor = MagicMock(spec=ProcessPoolExecutor)
+        units = runner.build_units(cases[:2])
+        for unit in units:
+            runner._submit_unit(executor, unit)
+
+        assert searched == [(c.bridge_length_m, c.total_width_m) for c in cases[:2]]
+        submitted = [call.args for call in executor.submit.call_args_list]
+        assert [args[1] for args in submitted] == units
+        assert all(args[0] is _execute_unit_in_worker for args in submitted)
+        for unit, (_, _, contexts) in zip(units, submitted):
+            if unit.use_rag:
+                assert contexts.dimensions == f"L={unit.case.bridge_length_m}"
+            else:
+                assert contexts is None
+
+    def test_worker_uses_contexts_from_parent(
+        self, cases: list[EvaluationCase], tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """ワーカーは親プロセスから渡された RAG コンテキストで試行を実行すること。"""
+        contexts = DesignerContexts(rag_log=DesignerRagLog(query="q", top_k=5, hits=[]))
+        monkeypatch.setattr(runner_module, "_worker_runner", None)
+        with patch("src.evaluation.runner.get_llm_client"):
+            _init_process_worker({"output_dir": tmp_path}, None, None)
+        unit = EvaluationRunner(output_dir=tmp_path, num_trials=1).build_units(cases[:1])[0]
+
+        with patch("src.evaluation.runner._run_repair_loop", return_value=_loop_result()) as mock_loop:
+            result, skipped = _execute_unit_in_worker(unit, contexts)
+
+        provider = mock_loop.call_args.kwargs["context_provider"]
+        inputs = DesignerInput(bridge_length_m=unit.case.bridge_length_m, total_width_m=unit.case.total_width_m)
+        assert provider(inputs, 5) is contexts
+        assert skipped is False
+        assert result.case_id == f"{unit.case.case_id}_rag_true_trial_1"
+
+    def test_splits_rate_limit_across_processes(self, cases: list[EvaluationCase], tmp_path: Path) -> None:
+        """レート制限をプロセス数で等分し、同時リクエスト数の上限でプロセス数を抑えること。"""
+        runner = EvaluationRunner(
+            output_dir=tmp_path,
+            max_workers=8,
+            max_concurrent_requests=4,
+            requests_per_minute=120.0,
+            execution_mode=ExecutionMode.PROCESS,
+        )
+        with patch("src.evaluation.runner.ProcessPoolExecutor") as mock_pool:
+            runner._create_process_pool(runner.build_units(cases))
+
+        kwargs = mock_pool.call_args.kwargs
+        assert kwargs["max_workers"] == 4
+        runner_kwargs, max_concurrent, requests_per_minute = kwargs["initargs"]
+        assert (max_concurrent, requests_per_minute) == (1, 30.0)
+        assert runner_kwargs["output_dir"] == tmp_path
@@ -0,0 +1,190 @@
+"""evaluation.store のテスト。"""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+from src.bridge_agentic_generate.designer.models import (
+    BridgeDesign,
+    Components,
+    CrossbeamSection,
+    Deck,
+    Dimensions,
+    GirderSection,
+    Sections,
+)
+from src.bridge_agentic_generate.judge.models import JudgeInput, JudgeReport, PatchPlan, RepairIteration
+from src.bridge_agentic_generate.judge.services import judge_v1_lightweight
+from src.bridge_agentic_generate.stage_timer import StageStats
+from src.evaluation.metrics import aggregate_metrics, aggregate_metrics_from_store
+from src.evaluation.models import TrialResult
+from src.evaluation.plot import open_results_store
+from src.evaluation.store import ResultsStore
+
+
+def _trial(case_id: str, use_rag: bool, first_pass: bool, converged: bool, num_iterations: int) -> TrialResult:
+    """TrialResult を作成する。"""
+    return TrialResult(
+        case_id=case_id,
+        bridge_length_m=30.0,
+        total_width_m=10.0,
+        use_rag=use_rag,
+        trial=1,
+        converged=converged,
+        num_iterations=num_iterations,
+        first_pass=first_pass,
+        first_max_util=0.9 if first_pass else 1.2,
+        first_utilization={"deck": 0.8, "bend": 1.2, "shear": 0.4, "deflection": 0.9, "web_slenderness": 0.7},
+        final_pass=converged,
+        final_max_util=0.95 if converged else 1.05,
+        per_check_first_pass={
+            "deck": True,
+            "bend": first_pass,
+            "shear": True,
+            "deflection": True,
+            "web_slenderness": True,
+        },
+        wall_time_s=10.0 + num_iterations,
+        stages={
+            "designer_llm": StageStats(seconds=4.0, calls=1, input_tokens=3000, output_tokens=800),
+            "judge": StageStats(seconds=0.1 * (num_iterations + 1), calls=num_iterations + 1),
+        },
+    )
+
+
+def _iterations() -> list[RepairIteration]:
+    """イテレーション1件（腹板高 2000mm の設計）。"""
+    design = BridgeDesign(
+        dimensions=Dimensions(
+            bridge_length=30000.0,
+            total_width=10000.0,
+            num_girders=4,
+            girder_spacing=2667.0,
+            panel_length=5000.0,
+            num_panels=6,
+        ),
+        sections=Sections(
+            girder_standard=GirderSection(
+                web_height=2000.0,
+                web_thickness=20.0,
+                top_flange_width=500.0,
+                top_flange_thickness=40.0,
+                bottom_flange_width=600.0,
+                bottom_flange_thickness=50.0,
+            ),
+            crossbeam_standard=CrossbeamSection(
+                total_height=1600.0,
+                web_thickness=12.0,
+                flange_width=350.0,
+                flange_thickness=16.0,
+            ),
+        ),
+        components=Components(deck=Deck(thickness=230.0)),
+    )
+    utilization, diagnostics = judge_v1_lightweight(JudgeInput(bridge_design=design))
+    report = JudgeReport(
+        pass_fail=utilization.max_util <= 1.0,
+        utilization=utilization,
+        diagnostics=diagnostics,
+        patch_plan=PatchPlan(actions=[]),
+    )
+    return [RepairIteration(iteration=0, design=design, report=report)]
+
+
+@pytest.fixture
+def trials() -> list[TrialResult]:
+    """RAG あり/なしの試行結果。"""
+    return [
+        _trial("a_rag_true_trial_1", True, True, True, 0),
+        _trial("b_rag_true_trial_1", True, False, True, 3),
+        _trial("c_rag_false_trial_1", False, False, False, 5),
+        _trial("d_rag_false_trial_1", False, False, True, 2),
+    ]
+
+
+class TestResultsStore:
+    """ResultsStore のテスト。"""
+
+    def test_round_trip(self, trials: list[TrialResult], tmp_path: Path) -> None:
+        store = ResultsStore(tmp_path / "results.sqlite")
+        for trial in trials:
+            store.append_trial(trial)
+
+        assert store.load_trial_results() == trials
+        assert store.load_trial_results(use_rag=False) == trials[2:]
+
+    def test_metrics_match_list_aggregation(self, trials: list[TrialResult], tmp_path: Path) -> None:
+        """SQL 集計が aggregate_metrics と一致すること。"""
+        store = ResultsStore(tmp_path / "results.sqlite")
+        for trial in trials:
+            store.append_trial(trial)
+
+        for use_rag in (None, True, False):
+            expected = aggregate_metrics([t for t in trials if use_rag is None or t.use_rag == use_rag])
+            actual = aggregate_metrics_from_store(store, use_rag=use_rag)
+            nested = {"per_check_first_pass_rate", "stages", "per_case"}
+            assert actual.per_check_first_pass_rate == pytest.approx(expected.per_check_first_pass_rate)
+            assert actual.stages == expected.stages
+            assert actual.per_case == expected.per_case
+            assert actual.model_dump(exclude=nested) == pytest.approx(expected.model_dump(exclude=nested))
+
+    def test_filters_by_case_ids(self, trials: list[TrialResult], tmp_path: Path) -> None:
+        """試行ID で絞り込んだ読み込み・集計が、その試行だけの集計と一致すること。"""
+        store = ResultsStore(tmp_path / "results.sqlite")
+        for trial in trials:
+            store.append_trial(trial)
+        case_ids = [trials[0].case_id, trials[2].case_id]
+
+        assert store.load_trial_results(case_ids=case_ids) == [trials[0], trials[2]]
+        assert store.load_trial_results(use_rag=True, case_ids=case_ids) == [trials[0]]
+        expected = aggregate_metrics([trials[0], trials[2]])
+        actual = aggregate_metrics_from_store(store, case_ids=case_ids)
+        assert actual.first_pass_rate == pytest.approx(expected.first_pass_rate)
+        assert actual.convergence_rate == pytest.approx(expected.convergence_rate)
+
+    def test_empty_store_metrics(self, tmp_path: Path) -> None:
+        metrics = aggregate_metrics_from_store(ResultsStore(tmp_path / "results.sqlite"))
+        assert metrics.first_pass_rate == 0.0
+        assert metrics.avg_iterations == 0.0
+
+    def test_append_does_not_overwrite(self, trials: list[TrialResult], tmp_path: Path) -> None:
+        """同じ試行ID の追記はエラーとし、既存の行を上書きしないこと。"""
+        store = ResultsStore(tmp_path / "results.sqlite")
+        store.append_trial(trials[0], _iterations())
+        rerun = trials[0].model_copy(update={"first_pass": False})
+
+        with pytest.raises(sqlite3.IntegrityError):
+            store.append_trial(rerun)
+
+        assert store.load_trial_results() == [trials[0]]
+        assert len(store.query("SELECT * FROM iterations")) == 1
+
+    def test_iterations_are_replaced_on_rerun(self, trials: list[TrialResult], tmp_path: Path) -> None:
+        """delete_trial してから書き込むと、行が重複せず置き換わること。"""
+        store = ResultsStore(tmp_path / "results.sqlite")
+        iterations = _iterations()
+        store.append_trial(trials[0], iterations)
+        store.delete_trial(trials[0].case_id)
+        store.append_trial(trials[0], iterations)
+
+        rows = store.query("SELECT case_id, iteration, web_height, governing_check FROM iterations")
+        assert [tuple(row) for row in rows] == [
+            ("a_rag_true_trial_1", 0, 2000.0, iterations[0].report.utilization.governing_check)
+        ]
+        assert len(store.load_trial_results()) == 1
+
+    def test_plot_builds_store_from_legacy_results(self, trials: list[TrialResult], tmp_path: Path) -> None:
+        """ストアがない評価データは results/*.json から一時ストアを構築し、評価データには書き込まないこと。"""
+        results_dir = tmp_path / "results"
+        results_dir.mkdir()
+        for trial in trials:
+            (results_dir / f"{trial.case_id}.json").write_text(trial.model_dump_json(), encoding="utf-8")
+        (results_dir / "broken.json").write_text("{", encoding="utf-8")
+
+        with open_results_store(tmp_path) as store:
+            assert store.load_trial_results() == trials
+
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["results"]
+        assert not store.path.exists()
@@ -0,0 +1,203 @@
+"""修正計画のビームサーチ（planner）のテスト。"""
+
+from __future__ import annotations
+
+import pytest
+from src.bridge_agentic_generate.designer.models import (
+    BridgeDesign,
+    Components,
+    CrossbeamSection,
+    Deck,
+    DependencyRule,
+    Dimensions,
+    GirderSection,
+    Sections,
+)
+from src.bridge_agentic_generate.judge.models import (
+    JudgeInput,
+    PatchAction,
+    PatchActionOp,
+    PatchPlan,
+)
+from src.bridge_agentic_generate.judge.planner import (
+    apply_repair_step,
+    build_expansion_plans,
+    build_sensitivity_plans,
+    plan_repair_sequence,
+)
+from src.bridge_agentic_generate.judge.services import (
+    calc_util_sensitivities,
+    evaluate_utilization,
+    judge_v1_lightweight,
+)
+
+
+@pytest.fixture
+def failing_design() -> BridgeDesign:
+    """たわみ・曲げが不合格となる設計。"""
+    return BridgeDesign(
+        dimensions=Dimensions(
+            bridge_length=30000.0,
+            total_width=10000.0,
+            num_girders=4,
+            girder_spacing=2667.0,
+            panel_length=5000.0,
+            num_panels=6,
+        ),
+        sections=Sections(
+            girder_standard=GirderSection(
+                web_height=1400.0,
+                web_thickness=16.0,
+                top_flange_width=350.0,
+                top_flange_thickness=25.0,
+                bottom_flange_width=450.0,
+                bottom_flange_thickness=30.0,
+            ),
+            crossbeam_standard=CrossbeamSection(
+                total_height=1120.0,
+                web_thickness=10.0,
+                flange_width=280.0,
+                flange_thickness=12.0,
+            ),
+        ),
+        components=Components(deck=Deck(thickness=217.0)),
+    )
+
+
+@pytest.fixture
+def dependency_rules() -> list[DependencyRule]:
+    """横桁高さを主桁腹板高さに連動させるルール。"""
+    return [
+        DependencyRule(
+            rule_id="D1",
+            target_field="sections.crossbeam_standard.total_height",
+            source_field="sections.girder_standard.web_height",
+            factor=0.8,
+        )
+    ]
+
+
+def _replay(design: BridgeDesign, plans: list[PatchPlan], dependency_rules: list[DependencyRule]) -> BridgeDesign:
+    """修正列を順に適用する。"""
+    for plan in plans:
+        design = apply_repair_step(design, plan, dependency_rules)
+    return design
+
+
+class TestBuildExpansionPlans:
+    """build_expansion_plans のテスト。"""
+
+    def test_skips_deck_and_layout_when_ok(self, failing_design: BridgeDesign) -> None:
+        """床版厚・横桁配置が OK なら、それらの操作は展開しないこと。"""
+        util = evaluate_utilization(JudgeInput(bridge_design=failing_design))
+        ops = {plan.actions[0].op for plan in build_expansion_plans(util.values)}
+
+        assert PatchActionOp.SET_DECK_THICKNESS_TO_REQUIRED not in ops
+        assert PatchActionOp.FIX_CROSSBEAM_LAYOUT not in ops
+        assert PatchActionOp.INCREASE_WEB_HEIGHT in ops
+
+    def test_includes_layout_fix_when_ng(self, failing_design: BridgeDesign) -> None:
+        dims = failing_design.dimensions.model_copy(update={"num_panels": 5})
+        util = evaluate_utilization(JudgeInput(bridge_design=failing_design.model_copy(update={"dimensions": dims})))
+        ops = {plan.actions[0].op for plan in build_expansion_plans(util.values)}
+        assert PatchActionOp.FIX_CROSSBEAM_LAYOUT in ops
+
+
+class TestPlanRepairSequence:
+    """plan_repair_sequence のテスト。"""
+
+    def test_finds_converging_sequence(
+        self, failing_design: BridgeDesign, dependency_rules: list[DependencyRule]
+    ) -> None:
+        """合格する修正列を返し、再適用すると予測どおり合格すること。"""
+        sequence = plan_repair_sequence(failing_design, dependency_rules, horizon=3)
+
+        assert sequence.converged is True
+        assert 1 <= len(sequence.plans) <= 3
+
+        repaired = _replay(failing_design, sequence.plans, dependency_rules)
+        util = evaluate_utilization(JudgeInput(bridge_design=repaired))
+        assert util.pass_fail
+        assert util.max_util == pytest.approx(sequence.predicted_utilization.max_util)
+        assert repaired.sections.crossbeam_standard.total_height == pytest.approx(
+            repaired.sections.girder_standard.web_height * 0.8
+        )
+
+    def test_returns_best_effort_within_horizon(self, failing_design: BridgeDesign) -> None:
+        """horizon 内で合格しない場合は max_util が最小の修正列を返すこと。"""
+        girder = failing_design.sections.girder_standard.model_copy(update={"web_height": 600.0})
+        weak = failing_design.model_copy(
+            update={"sections": failing_design.sections.model_copy(update={"girder_standard": girder})}
+        )
+        initial = evaluate_utilization(JudgeInput(bridge_design=weak))
+
+        sequence = plan_repair_sequence(weak, [], horizon=1)
+
+        assert sequence.converged is False
+        assert len(sequence.plans) == 1
+        assert sequence.predicted_utilization.max_util < initial.max_util
+
+    def test_seed_plan_is_used(self, failing_design: BridgeDesign) -> None:
+        """単独アクションでは1手で合格しないとき、1手で合格するシードの複数アクション案を採用すること。"""
+        girder = failing_design.sections.girder_standard.model_copy(update={"web_height": 1300.0})
+        design = failing_design.model_copy(
+            update={"sections": failing_design.sections.model_copy(update={"girder_standard": girder})}
+        )
+        seed = PatchPlan(
+            actions=[
+                PatchAction(
+                    op=PatchActionOp.INCREASE_WEB_HEIGHT,
+                    path="sections.girder_standard.web_height",
+                    delta_mm=500.0,
+                    reason="seed",
+                ),
+                PatchAction(
+                    op=PatchActionOp.INCREASE_BOTTOM_FLANGE_THICKNESS,
+                    path="sections.girder_standard.bottom_flange_thickness",
+                    delta_mm=6.0,
+                    reason="seed",
+                ),
+                PatchAction(
+                    op=PatchActionOp.INCREASE_TOP_FLANGE_THICKNESS,
+                    path="sections.girder_standard.top_flange_thickness",
+                    delta_mm=6.0,
+                    reason="seed",
+                ),
+            ]
+        )
+        assert plan_repair_sequence(design, [], horizon=1).converged is False
+        assert evaluate_utilization(JudgeInput(bridge_design=_replay(design, [seed], []))).pass_fail
+
+        sequence = plan_repair_sequence(design, [], seed_plans=[seed], horizon=3)
+
+        assert sequence.converged is True
+        assert sequence.plans == [seed]
+
+    def test_sensitivity_plans_converge_in_one_step(self, failing_design: BridgeDesign) -> None:
+        """単独アクションでは1手で合格しないとき、util 感度からの推定変更量で1手で合格すること。"""
+        girder = failing_design.sections.girder_standard.model_copy(update={"web_height": 1300.0})
+        design = failing_design.model_copy(
+            update={"sections": failing_design.sections.model_copy(update={"girder_standard": girder})}
+        )
+        judge_input = JudgeInput(bridge_design=design)
+        utilization, diagnostics = judge_v1_lightweight(judge_input)
+        sensitivities = calc_util_sensitivities(judge_input, utilization, diagnostics)
+
+        plans = build_sensitivity_plans(design, utilization, sensitivities)
+        sequence = plan_repair_sequence(design, [], horizon=1, sensitivities=sensitivities)
+
+        assert plan_repair_sequence(design, [], horizon=1).converged is False
+        assert all(1 <= len(plan.actions) <= 3 for plan in plans)
+        assert sequence.converged is True
+        assert sequence.plans[0] in plans
+
+    def test_already_passing(self, failing_design: BridgeDesign) -> None:
+        repaired = _replay(failing_design, plan_repair_sequence(failing_design, []).plans, [])
+        sequence = plan_repair_sequence(repaired, [])
+        assert sequence.converged is True
+        assert sequence.plans == []
+        assert sequence.num_evaluations == 0
+
+    def test_invalid_beam_width(self, failing_design: BridgeDesign) -> None:
+        with pytest.raises(ValueError):
+            plan_repair_sequence(failing_design, [], beam_width=0)
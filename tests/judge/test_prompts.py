@@ -0,0 +1,291 @@
+"""Judge プロンプト層（PatchPlan 複数候補生成）のテスト。"""
+
+from __future__ import annotations
+
+import threading
+from unittest.mock import patch
+
+import pytest
+from src.bridge_agentic_generate.designer.models import (
+    BridgeDesign,
+    Components,
+    CrossbeamSection,
+    Deck,
+    Dimensions,
+    GirderSection,
+    Sections,
+)
+from src.bridge_agentic_generate.judge.models import (
+    EvaluatedCandidate,
+    JudgeInput,
+    PatchAction,
+    PatchActionOp,
+    PatchPlan,
+    PatchPlanCandidate,
+    PatchPlanCandidates,
+)
+from src.bridge_agentic_generate.judge.prompts import (
+    MAX_CANDIDATES_PER_REQUEST,
+    TARGET_MAX_UTIL,
+    _split_candidate_counts,
+    build_repair_system_prompt,
+    build_repair_user_prompt,
+    generate_patch_plan,
+)
+from src.bridge_agentic_generate.judge.services import (
+    _calculate_utilization_and_diagnostics,
+    build_repair_context,
+)
+from src.bridge_agentic_generate.llm_client import LlmModel
+from src.bridge_agentic_generate.stage_timer import Stage, add_tokens, record_stages, stage
+
+
+@pytest.fixture
+def failing_design() -> BridgeDesign:
+    """たわみ・曲げが不合格となる設計。"""
+    return BridgeDesign(
+        dimensions=Dimensions(
+            bridge_length=30000.0,
+            total_width=10000.0,
+            num_girders=4,
+            girder_spacing=2667.0,
+            panel_length=5000.0,
+            num_panels=6,
+        ),
+        sections=Sections(
+            girder_standard=GirderSection(
+                web_height=1400.0,
+                web_thickness=16.0,
+                top_flange_width=350.0,
+                top_flange_thickness=25.0,
+                bottom_flange_width=450.0,
+                bottom_flange_thickness=30.0,
+            ),
+            crossbeam_standard=CrossbeamSection(
+                total_height=1120.0,
+                web_thickness=10.0,
+                flange_width=280.0,
+                flange_thickness=12.0,
+            ),
+        ),
+        components=Components(deck=Deck(thickness=217.0)),
+    )
+
+
+def _candidate(op: PatchActionOp, delta_mm: float, summary: str) -> PatchPlanCandidate:
+    """アクション1件の候補を作成する。"""
+    return PatchPlanCandidate(
+        plan=PatchPlan(actions=[PatchAction(op=op, path="sections.girder_standard", delta_mm=delta_mm, reason="test")]),
+        approach_summary=summary,
+    )
+
+
+def _run_generate(
+    design: BridgeDesign,
+    responses: list[PatchPlanCandidates],
+    num_candidates: int,
+) -> tuple[PatchPlan, list[EvaluatedCandidate], int]:
+    """LLM 応答をモックして generate_patch_plan を実行する。"""
+    judge_input = JudgeInput(bridge_design=design)
+    utilization, diagnostics, _ = _calculate_utilization_and_diagnostics(judge_input)
+    context = build_repair_context(judge_input, utilization, diagnostics, diagnostics.deck_thickness_required)
+    with patch(
+        "src.bridge_agentic_generate.judge.prompts.call_llm_with_structured_output",
+        side_effect=responses,
+    ) as mock_llm:
+        plan, evaluated = generate_patch_plan(
+            context=context,
+            model=LlmModel.GPT_5_MINI,
+            design=design,
+            judge_input_base=judge_input,
+            num_candidates=num_candidates,
+        )
+    return plan, evaluated, mock_llm.call_count
+
+
+class TestSplitCandidateCounts:
+    """_split_candidate_counts のテスト。"""
+
+    def test_single_request(self) -> None:
+        """上限以下なら1リクエストにまとめること。"""
+        assert _split_candidate_counts(3) == [3]
+        assert _split_candidate_counts(MAX_CANDIDATES_PER_REQUEST) == [MAX_CANDIDATES_PER_REQUEST]
+
+    def test_balanced_split(self) -> None:
+        """上限を超える場合は均等に分割すること。"""
+        assert _split_candidate_counts(7) == [4, 3]
+        assert _split_candidate_counts(12) == [4, 4, 4]
+
+    def test_raises_on_zero(self) -> None:
+        """0 以下は ValueError。"""
+        with pytest.raises(ValueError):
+            _split_candidate_counts(0)
+
+
+class TestBuildRepairSystemPrompt:
+    """build_repair_system_prompt のテスト。"""
+
+    def test_candidate_count_in_prompt(self) -> None:
+        """要求候補数がプロンプトに反映されること。"""
+        prompt = build_repair_system_prompt(4)
+        assert "4案を提示" in prompt
+        assert "PatchPlanCandidates（4案のリスト）" in prompt
+
+
+class TestBuildRepairUserPrompt:
+    """build_repair_user_prompt のテスト。"""
+
+    def test_lists_sensitivity_estimates_for_exceeded_checks(self, failing_design: BridgeDesign) -> None:
+        """target_util を超えた util についてのみ推定必要変更量が列挙されること。"""
+        judge_input = JudgeInput(bridge_design=failing_design)
+        utilization, diagnostics, _ = _calculate_utilization_and_diagnostics(judge_input)
+        context = build_repair_context(judge_input, utilization, diagnostics, diagnostics.deck_thickness_required)
+
+        prompt = build_repair_user_prompt(context)
+
+        assert f"- deflection ({utilization.deflection:.4f}): increase_web_height +" in prompt
+        assert "increase_num_girders +1 → " in prompt
+        assert f"- bend ({utilization.bend:.4f}):" in prompt
+        assert "- shear (" not in prompt
+
+
+class TestGeneratePatchPlan:
+    """generate_patch_plan のテスト。"""
+
+    def test_selects_best_across_requests(self, failing_design: BridgeDesign) -> None:
+        """複数リクエストの候補から max_util 最小の案を選ぶこと。"""
+        small = PatchPlanCandidates(
+            candidates=[
+                _candidate(PatchActionOp.INCREASE_WEB_THICKNESS, 2.0, "web_t+2"),
+                _candidate(PatchActionOp.INCREASE_TOP_FLANGE_WIDTH, 50.0, "tf_w+50"),
+                _candidate(PatchActionOp.INCREASE_TOP_FLANGE_THICKNESS, 2.0, "tf_t+2"),
+                _candidate(PatchActionOp.INCREASE_BOTTOM_FLANGE_WIDTH, 50.0, "bf_w+50"),
+            ]
+        )
+        large = PatchPlanCandidates(
+            candidates=[
+                _candidate(PatchActionOp.INCREASE_WEB_HEIGHT, 100.0, "web_h+100"),
+                _candidate(PatchActionOp.INCREASE_WEB_HEIGHT, 200.0, "web_h+200"),
+                _candidate(PatchActionOp.INCREASE_BOTTOM_FLANGE_THICKNESS, 2.0, "bf_t+2"),
+            ]
+        )
+
+        plan, evaluated, call_count = _run_generate(failing_design, [small, large], num_candidates=7)
+
+        assert call_count == 2
+        assert len(evaluated) == 7
+        best = min(evaluated, key=lambda e: e.simulated_max_util)
+        assert plan == best.candidate.plan
+
+    def test_failed_request_does_not_discard_others(self, failing_design: BridgeDesign) -> None:
+        """一部のリクエストが失敗しても、残りのリクエストの候補から選ぶこと。"""
+        candidates = PatchPlanCandidates(
+            candidates=[
+                _candidate(PatchActionOp.INCREASE_WEB_THICKNESS, 2.0, "web_t+2"),
+                _candidate(PatchActionOp.INCREASE_BOTTOM_FLANGE_THICKNESS, 2.0, "bf_t+2"),
+            ]
+        )
+
+        plan, evaluated, call_count = _run_generate(
+            failing_design, [RuntimeError("rate limited"), candidates], num_candidates=MAX_CANDIDATES_PER_REQUEST + 1
+        )
+
+        assert call_count == 2
+        assert [e.candidate for e in evaluated] == candidates.candidates
+        assert plan == max(evaluated, key=lambda e: e.improvement).candidate.plan
+
+    def test_raises_when_all_requests_fail(self, failing_design: BridgeDesign) -> None:
+        """全リクエストが失敗した場合は例外を送出すること。"""
+        with pytest.raises(RuntimeError, match="rate limited"):
+            _run_generate(
+                failing_design,
+                [RuntimeError("rate limited"), RuntimeError("rate limited")],
+                num_candidates=MAX_CANDIDATES_PER_REQUEST + 1,
+            )
+
+    def test_stops_early_when_target_reached(self, failing_design: BridgeDesign) -> None:
+        """目標 max_util 以下の候補が見つかれば残りのリクエストを待たないこと。"""
+        sufficient = PatchPlanCandidates(
+            candidates=[
+                _candidate(PatchActionOp.INCREASE_WEB_HEIGHT, 500.0, "web_h+500"),
+            ]
+        )
+        judge_input = JudgeInput(bridge_design=failing_design)
+        utilization, diagnostics, _ = _calculate_utilization_and_diagnostics(judge_input)
+        context = build_repair_context(judge_input, utilization, diagnostics, diagnostics.deck_thickness_required)
+
+        lock = threading.Lock()
+        release = threading.Event()
+        calls: list[int] = []
+
+        def fake_request(full_prompt: str, model: LlmModel) -> PatchPlanCandidates:
+            with lock:
+                calls.append(len(calls))
+                is_first = len(calls) == 1
+            if is_first:
+                return sufficient
+            # 2件目は打ち切られるまで応答しない
+            release.wait(timeout=5.0)
+            raise TimeoutError("not awaited")
+
+        with patch(
+            "src.bridge_agentic_generate.judge.prompts.request_candidates",
+            side_effect=fake_request,
+        ):
+            plan, evaluated = generate_patch_plan(
+                context=context,
+                model=LlmModel.GPT_5_MINI,
+                design=failing_design,
+                judge_input_base=judge_input,
+                num_candidates=MAX_CANDIDATES_PER_REQUEST + 1,
+            )
+        release.set()
+
+        assert len(evaluated) == 1
+        assert evaluated[0].simulated_max_util <= TARGET_MAX_UTIL
+        assert plan.actions[0].delta_mm == 500.0
+
+    def test_abandoned_request_is_not_recorded(self, failing_design: BridgeDesign) -> None:
+        """打ち切ったリクエストが後から終わっても、そのステージ時間・トークン数を記録しないこと。"""
+        sufficient = PatchPlanCandidates(candidates=[_candidate(PatchActionOp.INCREASE_WEB_HEIGHT, 500.0, "web_h+500")])
+        judge_input = JudgeInput(bridge_design=failing_design)
+        utilization, diagnostics, _ = _calculate_utilization_and_diagnostics(judge_input)
+        context = build_repair_context(judge_input, utilization, diagnostics, diagnostics.deck_thickness_required)
+
+        lock = threading.Lock()
+        release = threading.Event()
+        abandoned_done = threading.Event()
+        calls: list[int] = []
+
+        def fake_request(full_prompt: str, model: LlmModel) -> PatchPlanCandidates:
+            with lock:
+                calls.append(len(calls))
+                is_first = len(calls) == 1
+            with stage(Stage.PATCH_PLAN_LLM):
+                if is_first:
+                    add_tokens(100, 10)
+                    return sufficient
+                try:
+                    release.wait(timeout=5.0)
+                    add_tokens(1000, 100)
+                finally:
+                    abandoned_done.set()
+            raise TimeoutError("not awaited")
+
+        with (
+            record_stages() as recorder,
+            patch("src.bridge_agentic_generate.judge.prompts.request_candidates", side_effect=fake_request),
+        ):
+            generate_patch_plan(
+                context=context,
+                model=LlmModel.GPT_5_MINI,
+                design=failing_design,
+                judge_input_base=judge_input,
+                num_candidates=MAX_CANDIDATES_PER_REQUEST + 1,
+            )
+            release.set()
+            assert abandoned_done.wait(timeout=5.0)
+
+        stats = recorder.snapshot()["patch_plan_llm"]
+        assert stats.calls == 1
+        assert (stats.input_tokens, stats.output_tokens) == (100, 10)
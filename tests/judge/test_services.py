@@ -23,17 +23,21 @@ from src.bridge_agentic_generate.designer.models import (
 from src.bridge_agentic_generate.judge.models import (
     GoverningCheck,
     JudgeInput,
+    MaterialsSteel,
     NotApplicableError,
     PatchAction,
     PatchActionOp,
     PatchPlan,
     SteelGrade,
+    UtilSensitivities,
     get_fy,
 )
 from src.bridge_agentic_generate.judge.services import (
     P1_M_KN_M2,
     P1_V_KN_M2,
     P2_KN_M2,
+    SECTION_SENSITIVITY_FIELDS,
+    UTIL_CHECK_FIELDS,
     WEB_SLENDERNESS_DIVISOR_SM400,
     WEB_SLENDERNESS_DIVISOR_SM490,
     apply_dependency_rules,
@@ -49,6 +53,9 @@ from src.bridge_agentic_generate.judge.services import (
     calc_overhang,
     calc_required_deck_thickness,
     calc_tributary_width,
+    calc_util_sensitivities,
+    estimate_delta_to_target,
+    evaluate_utilization,
     get_min_web_thickness,
     judge_v1,
     judge_v1_lightweight,
@@ -727,6 +734,7 @@ class TestJudgeV1:
 
         # PatchPlan が空であること
         assert len(report.patch_plan.actions) == 0
+        assert report.sensitivities is None
 
     def test_judge_v1_with_failing_design(self) -> None:
         """不合格の設計で PatchPlan が生成されること。"""
@@ -789,6 +797,11 @@ class TestJudgeV1:
         # PatchPlan にアクションがあること
         assert len(report.patch_plan.actions) > 0
 
+        # 修正プロンプトと同じ util 感度が JudgeReport にも載ること
+        assert report.sensitivities is not None
+        assert mock_generate.call_args.kwargs["context"].sensitivities == report.sensitivities
+        assert report.sensitivities.web_height.deflection < 0
+
     def test_judge_v1_crossbeam_layout_check(self) -> None:
         """横桁配置チェックが機能すること。"""
         # panel_length * num_panels != bridge_length となる設計
@@ -1566,3 +1579,193 @@ class TestWebSlendernessCheck:
         assert diagnostics.web_thickness_min_required == pytest.approx(10.0)
         # util = 10 / 10 = 1.0
         assert utilization.web_slenderness == pytest.approx(1.0)
+
+
+# =============================================================================
+# 単体テスト: util 感度（解析微分）
+# =============================================================================
+
+
+def _utils_of(design: BridgeDesign) -> dict[str, float]:
+    """設計の各 util を辞書で返す。"""
+    utilization, _ = judge_v1_lightweight(JudgeInput(bridge_design=design))
+    return {check: getattr(utilization, check) for check in UTIL_CHECK_FIELDS}
+
+
+def _sensitivities_of(design: BridgeDesign) -> UtilSensitivities:
+    """設計の util 感度を返す。"""
+    judge_input = JudgeInput(bridge_design=design)
+    utilization, diagnostics = judge_v1_lightweight(judge_input)
+    return calc_util_sensitivities(judge_input, utilization, diagnostics)
+
+
+class TestUtilSensitivities:
+    """calc_util_sensitivities のテスト（中心差分・再評価との比較）。"""
+
+    @pytest.fixture
+    def design(self, sample_bridge_design: BridgeDesign) -> BridgeDesign:
+        """降伏点の板厚区分の境界から離した設計。"""
+        girder = sample_bridge_design.sections.girder_standard.model_copy(update={"web_thickness": 14.0})
+        return sample_bridge_design.model_copy(
+            update={"sections": sample_bridge_design.sections.model_copy(update={"girder_standard": girder})}
+        )
+
+    @pytest.mark.parametrize("field", SECTION_SENSITIVITY_FIELDS)
+    def test_section_derivatives_match_finite_difference(self, design: BridgeDesign, field: str) -> None:
+        """断面寸法の感度が中心差分と一致すること。"""
+        eps = 0.01
+        girder = design.sections.girder_standard
+
+        def perturbed(delta: float) -> BridgeDesign:
+            new_girder = girder.model_copy(update={field: getattr(girder, field) + delta})
+            return design.model_copy(
+                update={"sections": design.sections.model_copy(update={"girder_standard": new_girder})}
+            )
+
+        derivatives = getattr(_sensitivities_of(design), field)
+        plus, minus = _utils_of(perturbed(eps)), _utils_of(perturbed(-eps))
+
+        for check in UTIL_CHECK_FIELDS:
+            expected = (plus[check] - minus[check]) / (2 * eps)
+            assert getattr(derivatives, check) == pytest.approx(expected, rel=1e-4, abs=1e-9), check
+
+    def test_num_girders_is_one_girder_step(self, design: BridgeDesign) -> None:
+        """主桁本数の感度が、apply_patch_plan で1本増やした設計との util の差分と一致すること。"""
+        plan = PatchPlan(
+            actions=[
+                PatchAction(
+                    op=PatchActionOp.INCREASE_NUM_GIRDERS, path="dimensions.num_girders", delta_mm=1.0, reason="test"
+                )
+            ]
+        )
+        before, after = _utils_of(design), _utils_of(apply_patch_plan(design, plan))
+        step = _sensitivities_of(design).num_girders
+
+        for check in UTIL_CHECK_FIELDS:
+            assert getattr(step, check) == pytest.approx(after[check] - before[check]), check
+
+    def test_signs(self, design: BridgeDesign) -> None:
+        """断面を大きくすると曲げ・たわみ util が下がり、主桁を増やすと床版 util が下がること。"""
+        sensitivities = _sensitivities_of(design)
+
+        assert sensitivities.web_height.bend < 0
+        assert sensitivities.web_height.deflection < 0
+        assert sensitivities.web_height.web_slenderness > 0
+        assert sensitivities.web_thickness.shear < 0
+        assert sensitivities.bottom_flange_thickness.bend < 0
+        assert sensitivities.num_girders.deck < 0
+        assert sensitivities.num_girders.bend < 0
+
+    def test_not_computed_by_lightweight_judge(self, design: BridgeDesign) -> None:
+        """照査結果には感度を含めないこと（修正プロンプト用の RepairContext でのみ計算する）。"""
+        _, diagnostics = judge_v1_lightweight(JudgeInput(bridge_design=design))
+
+        assert "sensitivities" not in diagnostics.model_dump()
+
+
+class TestEstimateDeltaToTarget:
+    """estimate_delta_to_target のテスト。"""
+
+    def test_power_law_estimate(self) -> None:
+        """util ∝ p^-2 のとき、正確な変更量を返すこと。"""
+        # util = 1.5·(p/1000)^-2 → ∂util/∂p = -2·1.5/1000
+        delta = estimate_delta_to_target(1.5, -2 * 1.5 / 1000, current_value=1000.0, target=0.96)
+        assert delta == pytest.approx(1000.0 * (1.5 / 0.96) ** 0.5 - 1000.0)
+
+    def test_already_below_target(self) -> None:
+        assert estimate_delta_to_target(0.9, -0.001, current_value=1000.0, target=0.98) == 0.0
+
+    def test_not_reducible(self) -> None:
+        assert estimate_delta_to_target(1.2, 0.0, current_value=1000.0) is None
+        assert estimate_delta_to_target(1.2, 0.002, current_value=1000.0) is None
+
+    def test_one_step_reaches_target(self, sample_bridge_design: BridgeDesign) -> None:
+        """推定した web_height 増分の1回適用で、たわみ util が目標付近に到達すること。"""
+        utilization, _ = judge_v1_lightweight(JudgeInput(bridge_design=sample_bridge_design))
+        delta = estimate_delta_to_target(
+            utilization.deflection,
+            _sensitivities_of(sample_bridge_design).web_height.deflection,
+            current_value=sample_bridge_design.sections.girder_standard.web_height,
+            target=0.98,
+        )
+        assert delta is not None and delta > 0
+
+        patched = apply_patch_plan(
+            sample_bridge_design,
+            PatchPlan(
+                actions=[
+                    PatchAction(
+                        op=PatchActionOp.INCREASE_WEB_HEIGHT,
+                        path="sections.girder_standard.web_height",
+                        delta_mm=delta,
+                        reason="test",
+                    )
+                ]
+            ),
+        )
+        assert _utils_of(patched)["deflection"] == pytest.approx(0.98, abs=0.03)
+
+
+# =============================================================================
+# 単体テスト: evaluate_utilization（高速版）
+# =============================================================================
+
+
+class TestEvaluateUtilization:
+    """evaluate_utilization が judge_v1_lightweight と一致することのテスト。"""
+
+    @pytest.mark.parametrize(
+        ("dims_update", "grade"),
+        [
+            ({}, SteelGrade.SM490),
+            ({}, SteelGrade.SM400),
+            ({"num_girders": 2, "girder_spacing": 6000.0}, SteelGrade.SM490),
+            ({"num_girders": 6, "girder_spacing": 1600.0}, SteelGrade.SM490),
+            ({"num_panels": 5}, SteelGrade.SM490),
+            ({"bridge_length": 8000.0, "panel_length": 4000.0, "num_panels": 2}, SteelGrade.SM490),
+        ],
+    )
+    def test_matches_full_judge(
+        self, sample_bridge_design: BridgeDesign, dims_update: dict[str, float], grade: SteelGrade
+    ) -> None:
+        """全 util・governing_check・横桁配置の判定が一致すること。"""
+        design = sample_bridge_design.model_copy(
+            update={"dimensions": sample_bridge_design.dimensions.model_copy(update=dims_update)}
+        )
+        judge_input = JudgeInput(bridge_design=design, materials_steel=MaterialsSteel(grade=grade))
+
+        utilization, diagnostics = judge_v1_lightweight(judge_input)
+        values = evaluate_utilization(judge_input).values
+
+        assert values.to_utilization().model_dump() == pytest.approx(utilization.model_dump())
+        assert values.governing_check == utilization.governing_check
+        assert values.crossbeam_layout_ok == diagnostics.crossbeam_layout_ok
+        assert values.pass_fail == (utilization.max_util <= 1.0 and diagnostics.crossbeam_layout_ok)
+
+    def test_lazy_diagnostics_match_full_judge(self, sample_bridge_design: BridgeDesign) -> None:
+        """diagnostics は初回アクセス時に作成・キャッシュされ、judge_v1_lightweight と一致すること。"""
+        judge_input = JudgeInput(bridge_design=sample_bridge_design)
+        _, expected = judge_v1_lightweight(judge_input)
+
+        with patch(
+            "src.bridge_agentic_generate.judge.services.calc_girder_load_effects",
+            wraps=calc_girder_load_effects,
+        ) as mock_load_effects:
+            evaluation = evaluate_utilization(judge_input)
+            assert mock_load_effects.call_count == 0
+            diagnostics = evaluation.diagnostics
+            assert evaluation.diagnostics is diagnostics
+            assert mock_load_effects.call_count == 1
+
+        assert diagnostics.load_effects == expected.load_effects
+        assert diagnostics.model_dump(exclude={"load_effects"}) == pytest.approx(
+            expected.model_dump(exclude={"load_effects"})
+        )
+
+    def test_not_applicable_span(self, sample_bridge_design: BridgeDesign) -> None:
+        """L > 80m は NotApplicableError。"""
+        design = sample_bridge_design.model_copy(
+            update={"dimensions": sample_bridge_design.dimensions.model_copy(update={"bridge_length": 90000.0})}
+        )
+        with pytest.raises(NotApplicableError):
+            evaluate_utilization(JudgeInput(bridge_design=design))
@@ -0,0 +1,152 @@
+"""src.main（生成から IFC までの CLI）のテスト。"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from src.bridge_agentic_generate.config import app_config
+from src.bridge_agentic_generate.designer.models import (
+    BridgeDesign,
+    Components,
+    CrossbeamSection,
+    Deck,
+    DesignerRagLog,
+    Dimensions,
+    GirderSection,
+    Sections,
+)
+from src.bridge_agentic_generate.judge.models import (
+    JudgeInput,
+    JudgeReport,
+    PatchPlan,
+    RepairIteration,
+    RepairLoopResult,
+)
+from src.bridge_agentic_generate.judge.services import judge_v1_lightweight
+from src.bridge_json_to_ifc.convert_senkei_json_to_ifc import build_ifc_from_spec
+from src.main import _save_repair_loop_results
+
+
+def _design(web_height: float) -> BridgeDesign:
+    """腹板高だけを変えた設計。"""
+    return BridgeDesign(
+        dimensions=Dimensions(
+            bridge_length=20000.0,
+            total_width=8000.0,
+            num_girders=4,
+            girder_spacing=2000.0,
+            panel_length=5000.0,
+            num_panels=4,
+        ),
+        sections=Sections(
+            girder_standard=GirderSection(
+                web_height=web_height,
+                web_thickness=20.0,
+                top_flange_width=500.0,
+                top_flange_thickness=40.0,
+                bottom_flange_width=600.0,
+                bottom_flange_thickness=50.0,
+            ),
+            crossbeam_standard=CrossbeamSection(
+                total_height=web_height * 0.8,
+                web_thickness=12.0,
+                flange_width=350.0,
+                flange_thickness=16.0,
+            ),
+        ),
+        components=Components(deck=Deck(thickness=220.0)),
+    )
+
+
+@pytest.fixture
+def loop_result() -> RepairLoopResult:
+    """3イテレーションの修正ループ結果。"""
+    iterations = []
+    for i, web_height in enumerate([1600.0, 1800.0, 2000.0]):
+        design = _design(web_height)
+        utilization, diagnostics = judge_v1_lightweight(JudgeInput(bridge_design=design))
+        report = JudgeReport(
+            pass_fail=utilization.max_util <= 1.0,
+            utilization=utilization,
+            diagnostics=diagnostics,
+            patch_plan=PatchPlan(actions=[]),
+        )
+        iterations.append(RepairIteration(iteration=i, design=design, report=report))
+    return RepairLoopResult(
+        converged=iterations[-1].report.pass_fail,
+        iterations=iterations,
+        final_design=iterations[-1].design,
+        final_report=iterations[-1].report,
+        rag_log=DesignerRagLog(query="test", top_k=5, hits=[]),
+    )
+
+
+@pytest.fixture
+def tmp_app_config(tmp_path: Path):
+    """出力先を tmp_path に向けた app_config。"""
+    config = app_config.model_copy(
+        update={
+            "generated_simple_bridge_json_dir": tmp_path / "simple",
+            "generated_judge_json_dir": tmp_path / "judge",
+            "generated_senkei_json_dir": tmp_path / "senkei",
+            "generated_bridge_raglog_json_dir": tmp_path / "raglog",
+            "generated_ifc_dir": tmp_path / "ifc",
+            "generated_report_md_dir": tmp_path / "report",
+            "conversion_cache_dir": tmp_path / "cache",
+        }
+    )
+    with patch("src.main.app_config", config):
+        yield config
+
+
+class TestSaveRepairLoopResults:
+    """_save_repair_loop_results のテスト。"""
+
+    @pytest.mark.parametrize("start_method", ["forkserver", "spawn"])
+    def test_exports_all_iterations_in_parallel(
+        self, loop_result: RepairLoopResult, tmp_app_config, start_method: str
+    ) -> None:
+        """全イテレーション + 最終設計の Senkei JSON / IFC がプロセスプールで生成され、順序どおりに返ること。
+
+        forkserver がない環境（Windows）では spawn のワーカーで変換する。
+        """
+        with patch("multiprocessing.get_all_start_methods", return_value=[start_method]):
+            saved = _save_repair_loop_results(loop_result, base_name="design", export_workers=2)
+
+        assert [Path(p).name for p in saved.ifcs] == ["design_iter0.ifc", "design_iter1.ifc", "design_iter2.ifc"]
+        for path in [*saved.senkei_jsons, *saved.ifcs, saved.final_senkei_json, saved.final_ifc]:
+            assert Path(path).stat().st_size > 0
+        assert "IFC4" in Path(saved.final_ifc).read_text(encoding="utf-8")[:2000]
+
+    def test_serial_export(self, loop_result: RepairLoopResult, tmp_app_config) -> None:
+        """export_workers=1 では同じプロセスで順に変換すること。"""
+        with patch("src.main.ProcessPoolExecutor") as mock_pool:
+            saved = _save_repair_loop_results(loop_result, base_name="design", export_workers=1)
+
+        mock_pool.assert_not_called()
+        assert all(Path(path).exists() for path in [*saved.ifcs, saved.final_ifc])
+
+    def test_identical_designs_are_converted_once(self, loop_result: RepairLoopResult, tmp_app_config) -> None:
+        """同じ内容の設計はジオメトリを1回だけ生成し、2回目以降は変換キャッシュを使うこと。"""
+        with patch("src.bridge_json_to_ifc.run_convert.build_ifc_from_spec", wraps=build_ifc_from_spec) as mock_convert:
+            saved = _save_repair_loop_results(loop_result, base_name="design", export_workers=1)
+            assert mock_convert.call_count == 3  # 最終設計は iter2 と同じ
+            again = _save_repair_loop_results(loop_result, base_name="again", export_workers=1)
+            assert mock_convert.call_count == 3  # すべてキャッシュヒット
+
+        assert Path(saved.final_ifc).read_bytes() == Path(saved.ifcs[-1]).read_bytes()
+        assert Path(again.ifcs[0]).read_bytes() == Path(saved.ifcs[0]).read_bytes()
+        assert Path(again.final_senkei_json).read_text(encoding="utf-8") == Path(saved.senkei_jsons[-1]).read_text(
+            encoding="utf-8"
+        )
+
+    def test_skips_senkei_json(self, loop_result: RepairLoopResult, tmp_app_config) -> None:
+        """write_senkei_json=False では Senkei JSON を書き出さずに IFC だけを生成すること。"""
+        saved = _save_repair_loop_results(loop_result, base_name="design", export_workers=1, write_senkei_json=False)
+
+        assert saved.senkei_jsons == []
+        assert saved.final_senkei_json is None
+        assert not list(tmp_app_config.generated_senkei_json_dir.glob("*.json"))
+        assert all(Path(path).stat().st_size > 0 for path in [*saved.ifcs, saved.final_ifc])
@@ -0,0 +1,25 @@
+"""src.process_context のテスト。"""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from src.process_context import worker_context
+
+
+class TestWorkerContext:
+    """worker_context のテスト。"""
+
+    def test_uses_forkserver_when_available(self) -> None:
+        with patch("multiprocessing.get_all_start_methods", return_value=["fork", "spawn", "forkserver"]):
+            assert worker_context(["json"]).get_start_method() == "forkserver"
+
+    def test_falls_back_to_spawn(self) -> None:
+        """forkserver がない環境（Windows）では spawn を返し、事前 import は設定しないこと。"""
+        with (
+            patch("multiprocessing.get_all_start_methods", return_value=["spawn"]),
+            patch("multiprocessing.context.ForkServerContext.set_forkserver_preload") as mock_preload,
+        ):
+            assert worker_context(["json"]).get_start_method() == "spawn"
+
+        mock_preload.assert_not_called()